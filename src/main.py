@@ -25,6 +25,7 @@ from .models.palette_model import PaletteColorUpdated
 from .models.palette_model import PaletteRemoved
 from .models.palette_model import PaletteUpdated
 from .screens.rename_screen import RenameScreen
+from .utils.accessibility_index import AccessibilityIndexRegistry
 from .utils.error_handler import handle_error
 from .utils.error_handler import logger
 from .widgets.color.color_wheel import ColorWheel
@@ -65,6 +66,7 @@ class PaletteMilkerApp(App):
         Binding("1", "view_palette", "Palette view"),
         Binding("2", "view_color_picker", "Color picker"),
         Binding("3", "view_export", "Export options"),
+        Binding("4", "view_accessibility", "Accessibility"),
         Binding("escape", "pop_screen", "Back", show=False, priority=True),
         # === Palette Management ===
         Binding("ctrl+s", "save_palette", "Save palette"),
@@ -106,6 +108,9 @@ class PaletteMilkerApp(App):
         # Create application state manager
         self.app_state = ApplicationState(self)
 
+        # Contrast matrices per palette, kept current as colors are edited
+        self.accessibility_indices = AccessibilityIndexRegistry()
+
     def _setup_error_handling(self) -> None:
         """Set up centralized error handling."""
         # App logger is already initialized in __init__
@@ -294,7 +299,7 @@ class PaletteMilkerApp(App):
             current_color = color_wheel.selected_color
 
             # Add the color to the active palette
-            active_palette.add_color(current_color)
+            self.app_state.palette_collection.add_color(active_palette.palette_id, current_color)
 
             # Notify success
             self.notify(f"Added color {current_color}", severity="information")
@@ -332,7 +337,7 @@ class PaletteMilkerApp(App):
 
             # Remove the active color
             index = palette_model.active_color_index
-            removed_color = active_palette.remove_color(index)
+            removed_color = self.app_state.palette_collection.remove_color(active_palette.palette_id, index)
 
             if removed_color:
                 # Adjust the active color index if needed
@@ -403,6 +408,18 @@ class PaletteMilkerApp(App):
         # Create and switch to the export screen
         self.switch_screen(ExportScreen())
 
+    def action_view_accessibility(self) -> None:
+        """Switch to the accessibility checker for the active palette."""
+        from .screens.accessibility_screen import AccessibilityScreen
+
+        active_palette = self.app_state.get_active_palette()
+        if not active_palette:
+            self.notify("No active palette", severity="warning")
+            return
+
+        index = self.accessibility_indices.get(active_palette)
+        self.switch_screen(AccessibilityScreen(active_palette, index=index))
+
     def action_rename_palette(self) -> None:
         """Rename the current palette."""
         active_palette = self.app_state.get_active_palette()
@@ -667,7 +684,7 @@ class PaletteMilkerApp(App):
         try:
             # Rename the active palette
             new_name = message.name
-            active_palette.name = new_name  # Direct attribute update
+            self.app_state.palette_collection.rename_palette(active_palette.palette_id, new_name)
 
             # Notify success
             self.notify(f"Renamed palette to: {new_name}", severity="information")
@@ -725,6 +742,7 @@ class PaletteMilkerApp(App):
         Args:
             message: The PaletteRemoved message
         """
+        self.accessibility_indices.discard(message.palette_id)
         self._update_palette_ui()
 
     def on_palette_color_updated(self, message: PaletteColorUpdated) -> None:
@@ -733,6 +751,8 @@ class PaletteMilkerApp(App):
         Args:
             message: The PaletteColorUpdated message
         """
+        # Recompute only the edited color's contrast row and column
+        self.accessibility_indices.on_palette_color_updated(message)
         self._update_palette_ui()
 
     def _update_palette_ui(self) -> None:
@@ -17,6 +17,7 @@ from typing import Union
 from textual.message import Message
 
 from .color_model import Color
+from .palette_journal import PaletteJournal
 from .palette_model import Palette
 from .palette_model import PaletteCollection
 from .palette_model import PaletteModel
@@ -107,21 +108,20 @@ class ApplicationState:
         if self.app:
             self.palette_model.bind_to_app(self.app)
 
+    @staticmethod
+    def _palettes_file() -> Path:
+        """Get the palette snapshot file; its journal lives next to it."""
+        return Path(__file__).parent.parent / "data" / "palettes.json"
+
     def _create_default_palette_collection(self) -> PaletteCollection:
-        """Create a default palette collection with sample palettes."""
-        # Define data paths
-        data_dir = Path(__file__).parent.parent / "data"
-        palettes_file = data_dir / "palettes.json"
+        """Open the journaled palette collection, or create one with sample palettes."""
+        palettes_file = self._palettes_file()
 
-        try:
-            # Attempt to load palettes from file
-            if palettes_file.exists():
-                palette_collection = PaletteCollection.load_from_file(str(palettes_file))
-                if palette_collection:
-                    self.logger.info(f"Loaded palette collection from {palettes_file}")
-                    return palette_collection
-        except Exception as e:
-            self.logger.error(f"Error loading palette collection: {e}")
+        # Attempt to load palettes from the snapshot and its journal
+        if PaletteJournal(palettes_file).exists():
+            palette_collection = PaletteCollection.open_journal(str(palettes_file))
+            self.logger.info(f"Opened palette collection from {palettes_file}")
+            return palette_collection
 
         # Create sample palettes if loading fails
         default_palette = Palette(
@@ -136,9 +136,12 @@ class ApplicationState:
             "Sunset", ["#FF7700", "#FF5500", "#FF0000", "#DD0000", "#AA0000", "#880000", "#550000", "#220000"]
         )
 
-        # Create collection with the sample palettes
+        # Create collection with the sample palettes and start journaling its changes
+        palette_collection = PaletteCollection([default_palette, monochrome_palette, sunset_palette])
+        palettes_file.parent.mkdir(parents=True, exist_ok=True)
+        palette_collection.attach_journal(str(palettes_file))
         self.logger.info("Created default palette collection")
-        return PaletteCollection([default_palette, monochrome_palette, sunset_palette])
+        return palette_collection
 
     # Properties for state values
     @property
@@ -229,21 +232,26 @@ class ApplicationState:
 
     def save_palettes(self) -> bool:
         """
-        Save the current palette collection to file.
+        Make sure the current palette collection is persisted.
+
+        Changes to a journaled collection are appended to its journal as they
+        happen, so nothing is rewritten here; a collection that is not
+        journaled yet gets a snapshot and starts journaling.
 
         Returns:
             Boolean indicating success or failure
         """
+        if self.palette_collection.journaled:
+            return True
+
         try:
-            # Save the current palette collection
-            data_dir = Path(__file__).parent.parent / "data"
-            palettes_file = data_dir / "palettes.json"
+            palettes_file = self._palettes_file()
 
             # Create directory if it doesn't exist
-            data_dir.mkdir(parents=True, exist_ok=True)
+            palettes_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Save the palettes
-            success = self.palette_collection.save_to_file(str(palettes_file))
+            # Write a snapshot and journal further changes
+            success = self.palette_collection.attach_journal(str(palettes_file))
 
             if success:
                 self.logger.info(f"Saved palette collection to {palettes_file}")
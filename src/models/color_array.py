@@ -0,0 +1,516 @@
+"""
+Color array model for the Milky Color Suite.
+
+This module defines the ColorArray class, a NumPy-backed container for
+running color conversions and adjustments over many colors at once.
+"""
+
+from typing import TYPE_CHECKING
+from typing import Iterator
+from typing import List
+from typing import Sequence
+from typing import Union
+from typing import overload
+
+import numpy as np
+
+from .color_model import FLOAT_ERROR
+from .color_model import OPAQUE
+from .color_model import Color
+from .color_model import parse_color_string
+from .color_spaces import lab_to_rgb_array
+from .color_spaces import oklab_to_oklch_array
+from .color_spaces import oklab_to_rgb_array
+from .color_spaces import oklch_to_oklab_array
+from .color_spaces import rgb_to_lab_array
+from .color_spaces import rgb_to_oklab_array
+
+
+if TYPE_CHECKING:
+    from .palette_model import Palette
+    from .palette_model import PaletteCollection
+
+
+# Packed colors are always stored little-endian so the byte layout is B, G, R, A
+PACKED_DTYPE = np.dtype("<u4")
+
+
+def _quantize(values: np.ndarray) -> np.ndarray:
+    """
+    Quantize normalized channel values to 8-bit integers.
+
+    Args:
+        values: Array of channel values in range 0.0-1.0
+
+    Returns:
+        Array of uint8 channel values
+    """
+    return np.clip(np.floor(values * 255.0 + 0.5 - FLOAT_ERROR), 0, 255).astype(np.uint8)
+
+
+def rgb_to_hsl(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert normalized RGB rows to normalized HSL rows.
+
+    Args:
+        rgb: (N, 3) float array with values in range 0.0-1.0
+
+    Returns:
+        (N, 3) array of hue, saturation and lightness in range 0.0-1.0,
+        float64 for float64 input and float32 otherwise
+    """
+    rgb = np.asarray(rgb)
+    rgb = rgb.astype(np.result_type(rgb.dtype, np.float32), copy=False)
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    vmax = rgb.max(axis=1)
+    vmin = rgb.min(axis=1)
+    diff = vmax - vmin
+    vsum = vmax + vmin
+    lightness = vsum / 2
+
+    chromatic = diff > 0
+    safe_diff = np.where(chromatic, diff, 1.0)
+    denominator = np.where(lightness < 0.5, vsum, 2.0 - vsum)
+    saturation = np.where(chromatic, diff / np.where(chromatic, denominator, 1.0), 0.0)
+
+    hue = np.where(
+        r == vmax, (g - b) / safe_diff, np.where(g == vmax, 2.0 + (b - r) / safe_diff, 4.0 + (r - g) / safe_diff)
+    )
+    hue = np.where(chromatic, (hue / 6.0) % 1.0, 0.0)
+
+    return np.stack([hue, saturation, lightness], axis=1).astype(rgb.dtype, copy=False)
+
+
+def hsl_to_rgb(hsl: np.ndarray) -> np.ndarray:
+    """
+    Convert normalized HSL rows to normalized RGB rows.
+
+    Saturation and lightness are clamped to 0.0-1.0; hue wraps around.
+
+    Args:
+        hsl: (N, 3) float array of hue, saturation and lightness
+
+    Returns:
+        (N, 3) array with values in range 0.0-1.0, float64 for float64
+        input and float32 otherwise
+    """
+    hsl = np.asarray(hsl)
+    hsl = hsl.astype(np.result_type(hsl.dtype, np.float32), copy=False)
+    hue = hsl[:, 0:1] % 1.0
+    saturation = np.clip(hsl[:, 1:2], 0.0, 1.0)
+    lightness = np.clip(hsl[:, 2:3], 0.0, 1.0)
+
+    chroma = saturation * np.minimum(lightness, 1.0 - lightness)
+    k = (np.array([0.0, 8.0, 4.0], dtype=hsl.dtype) + hue * 12.0) % 12.0
+    return (lightness - chroma * np.clip(np.minimum(k - 3.0, 9.0 - k), -1.0, 1.0)).astype(hsl.dtype, copy=False)
+
+
+class ColorArray:
+    """
+    A batch of colors stored as a contiguous NumPy buffer.
+
+    The canonical state is a uint32 array of packed 0xAARRGGBB values, the
+    same representation used by Color, so converting between the two never
+    re-parses anything. The (N, 3) uint8 ``rgb`` view shares memory with it.
+    """
+
+    __slots__ = ("_packed",)
+
+    def __init__(self, packed: Union[np.ndarray, Sequence[int]]) -> None:
+        """
+        Initialize a ColorArray from packed ARGB values.
+
+        Args:
+            packed: Packed 0xAARRGGBB integers, as returned by ``Color.packed``
+
+        Raises:
+            ValueError: If the input is not one-dimensional
+        """
+        array = np.asarray(packed)
+        if array.dtype != PACKED_DTYPE:
+            array = array.astype(PACKED_DTYPE)
+        if array.ndim != 1:
+            raise ValueError(f"Packed colors must be one-dimensional, got shape {array.shape}")
+        # Channel views reinterpret the buffer as bytes, which needs contiguous memory
+        self._packed = np.ascontiguousarray(array)
+
+    @classmethod
+    def from_rgb(cls, rgb: np.ndarray, alpha: Union[np.ndarray, int, None] = None) -> "ColorArray":
+        """
+        Create a ColorArray from an (N, 3) array of RGB values.
+
+        Args:
+            rgb: uint8 values in range 0-255, or float values in range 0.0-1.0
+            alpha: Optional uint8 alpha values (scalar or per color); opaque by default
+
+        Returns:
+            A ColorArray instance
+
+        Raises:
+            ValueError: If the array does not have shape (N, 3)
+        """
+        rgb = np.asarray(rgb)
+        if rgb.ndim != 2 or rgb.shape[1] != 3:
+            raise ValueError(f"RGB data must have shape (N, 3), got {rgb.shape}")
+        if rgb.dtype != np.uint8:
+            rgb = _quantize(rgb) if np.issubdtype(rgb.dtype, np.floating) else np.clip(rgb, 0, 255).astype(np.uint8)
+
+        channels = np.empty((len(rgb), 4), dtype=np.uint8)
+        channels[:, 2::-1] = rgb
+        channels[:, 3] = OPAQUE if alpha is None else alpha
+        return cls(channels.view(PACKED_DTYPE).reshape(-1))
+
+    @classmethod
+    def from_lab(cls, lab: np.ndarray) -> "ColorArray":
+        """
+        Create a ColorArray from CIELAB (D65) values, clipping out-of-gamut colors.
+
+        Args:
+            lab: (N, 3) float array of (L, a, b)
+
+        Returns:
+            A ColorArray instance
+        """
+        return cls.from_rgb(lab_to_rgb_array(lab))
+
+    @classmethod
+    def from_oklab(cls, oklab: np.ndarray) -> "ColorArray":
+        """
+        Create a ColorArray from OKLab values, clipping out-of-gamut colors.
+
+        Args:
+            oklab: (N, 3) float array of (L, a, b)
+
+        Returns:
+            A ColorArray instance
+        """
+        return cls.from_rgb(oklab_to_rgb_array(oklab))
+
+    @classmethod
+    def from_oklch(cls, oklch: np.ndarray) -> "ColorArray":
+        """
+        Create a ColorArray from OKLCH values, clipping out-of-gamut colors.
+
+        Args:
+            oklch: (N, 3) float array of (L, C, h) with hue in degrees
+
+        Returns:
+            A ColorArray instance
+        """
+        return cls.from_oklab(oklch_to_oklab_array(oklch))
+
+    @classmethod
+    def from_hex(cls, values: Sequence[str]) -> "ColorArray":
+        """
+        Create a ColorArray from hex color strings.
+
+        Plain "#rrggbb" input is decoded in a single pass; anything else
+        (short hex, alpha hex, named colors) goes through the cached parser.
+
+        Args:
+            values: Color strings
+
+        Returns:
+            A ColorArray instance
+
+        Raises:
+            ValueError: If any value is not a valid color
+        """
+        if all(len(value) == 7 and value[0] == "#" for value in values):
+            try:
+                raw = bytes.fromhex("".join(value[1:] for value in values))
+            except ValueError:
+                pass
+            else:
+                return cls.from_rgb(np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3))
+        return cls(np.fromiter((parse_color_string(value) for value in values), dtype=PACKED_DTYPE, count=len(values)))
+
+    @classmethod
+    def from_colors(cls, colors: Sequence[Color]) -> "ColorArray":
+        """
+        Create a ColorArray from Color instances.
+
+        Args:
+            colors: Color instances
+
+        Returns:
+            A ColorArray instance
+        """
+        return cls(np.fromiter((color.packed for color in colors), dtype=PACKED_DTYPE, count=len(colors)))
+
+    @classmethod
+    def from_palette(cls, palette: "Palette") -> "ColorArray":
+        """
+        Create a ColorArray from the colors of a palette.
+
+        Args:
+            palette: Palette to read colors from
+
+        Returns:
+            A ColorArray instance
+        """
+        return cls.from_colors(palette.colors)
+
+    @classmethod
+    def from_collection(cls, collection: "PaletteCollection") -> "ColorArray":
+        """
+        Create a ColorArray holding every color of every palette in a collection.
+
+        Colors are laid out palette by palette in collection order.
+
+        Args:
+            collection: Palette collection to read colors from
+
+        Returns:
+            A ColorArray instance
+        """
+        return cls.from_colors([color for palette in collection for color in palette])
+
+    @property
+    def packed(self) -> np.ndarray:
+        """
+        Get the packed ARGB values.
+
+        Returns:
+            (N,) uint32 array
+        """
+        return self._packed
+
+    @property
+    def rgb(self) -> np.ndarray:
+        """
+        Get the RGB channels as a view onto the packed buffer.
+
+        Returns:
+            (N, 3) uint8 array with values in range 0-255
+        """
+        return self._packed.view(np.uint8).reshape(-1, 4)[:, 2::-1]
+
+    @property
+    def alpha(self) -> np.ndarray:
+        """
+        Get the alpha channel as a view onto the packed buffer.
+
+        Returns:
+            (N,) uint8 array with values in range 0-255
+        """
+        return self._packed.view(np.uint8).reshape(-1, 4)[:, 3]
+
+    @property
+    def rgb_float(self) -> np.ndarray:
+        """
+        Get the RGB channels in 0.0-1.0 range.
+
+        Returns:
+            (N, 3) float32 array
+        """
+        return self.rgb.astype(np.float32) / np.float32(255.0)
+
+    def to_hex(self) -> List[str]:
+        """
+        Get the colors as hex strings.
+
+        Returns:
+            List of hex color strings (e.g., "#ffffff")
+        """
+        return [f"#{value:06x}" for value in (self._packed & 0xFFFFFF).tolist()]
+
+    def to_hsl(self) -> np.ndarray:
+        """
+        Get the colors as HSL values.
+
+        Returns:
+            (N, 3) float32 array of hue, saturation and lightness in range 0.0-1.0
+        """
+        return rgb_to_hsl(self.rgb_float)
+
+    def to_hsv(self) -> np.ndarray:
+        """
+        Get the colors as HSV values.
+
+        Returns:
+            (N, 3) float32 array of hue, saturation and value in range 0.0-1.0
+        """
+        rgb = self.rgb_float
+        value = rgb.max(axis=1)
+        diff = value - rgb.min(axis=1)
+        hsl = rgb_to_hsl(rgb)
+        saturation = np.where(value > 0, diff / np.where(value > 0, value, 1.0), 0.0)
+        return np.stack([hsl[:, 0], saturation, value], axis=1).astype(np.float32)
+
+    def to_cmyk(self) -> np.ndarray:
+        """
+        Get the colors as CMYK values.
+
+        Returns:
+            (N, 4) float32 array of cyan, magenta, yellow and key in range 0.0-1.0
+        """
+        rgb = self.rgb_float
+        key = 1.0 - rgb.max(axis=1)
+        scale = np.where(key < 1.0, 1.0 - key, 1.0)[:, None]
+        cmy = np.where(key[:, None] < 1.0, (1.0 - rgb - key[:, None]) / scale, 0.0)
+        return np.concatenate([cmy, key[:, None]], axis=1).astype(np.float32)
+
+    def to_lab(self) -> np.ndarray:
+        """
+        Get the colors as CIELAB (D65) values.
+
+        Returns:
+            (N, 3) float32 array of (L, a, b) with L in range 0-100
+        """
+        return rgb_to_lab_array(self.rgb).astype(np.float32)
+
+    def to_oklab(self) -> np.ndarray:
+        """
+        Get the colors as OKLab values.
+
+        Returns:
+            (N, 3) float32 array of (L, a, b) with L in range 0.0-1.0
+        """
+        return rgb_to_oklab_array(self.rgb).astype(np.float32)
+
+    def to_oklch(self) -> np.ndarray:
+        """
+        Get the colors as OKLCH values.
+
+        Returns:
+            (N, 3) float32 array of (L, C, h) with hue in degrees
+        """
+        return oklab_to_oklch_array(rgb_to_oklab_array(self.rgb)).astype(np.float32)
+
+    def _hsl64(self) -> np.ndarray:
+        """
+        Get the colors as float64 HSL values for round-tripping adjustments.
+
+        Returns:
+            (N, 3) float64 array of hue, saturation and lightness in range 0.0-1.0
+        """
+        return rgb_to_hsl(self.rgb / 255.0)
+
+    def _with_hsl(self, hsl: np.ndarray) -> "ColorArray":
+        """
+        Build a new ColorArray from HSL values, keeping the current alpha.
+
+        Args:
+            hsl: (N, 3) float array of hue, saturation and lightness
+
+        Returns:
+            A new ColorArray instance
+        """
+        return ColorArray.from_rgb(hsl_to_rgb(hsl), alpha=self.alpha)
+
+    def lighten(self, amount: Union[float, np.ndarray] = 0.1, space: str = "hsl") -> "ColorArray":
+        """
+        Get lighter versions of every color.
+
+        Args:
+            amount: Amount to lighten by (0.0-1.0), either one value or an (N,) array
+                with one amount per color
+            space: Color space to adjust lightness in: "hsl" or the
+                perceptually uniform "oklch"
+
+        Returns:
+            A new ColorArray instance
+
+        Raises:
+            ValueError: If the color space is not supported
+        """
+        if space == "oklch":
+            oklab = rgb_to_oklab_array(self.rgb)
+            # Shifting L in OKLab leaves chroma and hue untouched, as in OKLCH
+            oklab[:, 0] = np.clip(oklab[:, 0] + amount, 0.0, 1.0)
+            return ColorArray.from_rgb(oklab_to_rgb_array(oklab), alpha=self.alpha)
+        if space != "hsl":
+            raise ValueError(f"Unsupported color space: {space}")
+        hsl = self._hsl64()
+        hsl[:, 2] += amount
+        return self._with_hsl(hsl)
+
+    def darken(self, amount: Union[float, np.ndarray] = 0.1, space: str = "hsl") -> "ColorArray":
+        """
+        Get darker versions of every color.
+
+        Args:
+            amount: Amount to darken by (0.0-1.0), either one value or an (N,) array
+                with one amount per color
+            space: Color space to adjust lightness in: "hsl" or the
+                perceptually uniform "oklch"
+
+        Returns:
+            A new ColorArray instance
+
+        Raises:
+            ValueError: If the color space is not supported
+        """
+        return self.lighten(-amount, space)
+
+    def saturate(self, amount: float = 0.1) -> "ColorArray":
+        """
+        Get more saturated versions of every color.
+
+        Args:
+            amount: Amount to saturate by (0.0-1.0)
+
+        Returns:
+            A new ColorArray instance
+        """
+        hsl = self._hsl64()
+        hsl[:, 1] += amount
+        return self._with_hsl(hsl)
+
+    def desaturate(self, amount: float = 0.1) -> "ColorArray":
+        """
+        Get less saturated versions of every color.
+
+        Args:
+            amount: Amount to desaturate by (0.0-1.0)
+
+        Returns:
+            A new ColorArray instance
+        """
+        return self.saturate(-amount)
+
+    def to_colors(self) -> List[Color]:
+        """
+        Get the colors as Color instances.
+
+        Returns:
+            List of Color instances
+        """
+        return [Color.from_packed(value) for value in self._packed.tolist()]
+
+    def __len__(self) -> int:
+        """Get the number of colors in the array."""
+        return len(self._packed)
+
+    @overload
+    def __getitem__(self, index: int) -> Color: ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> "ColorArray": ...
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> Union[Color, "ColorArray"]:
+        """Get a single Color, a ColorArray for a slice (a view unless strided), or for an index or mask array."""
+        if isinstance(index, (slice, np.ndarray)):
+            return ColorArray(self._packed[index])
+        return Color.from_packed(int(self._packed[index]))
+
+    def __iter__(self) -> Iterator[Color]:
+        """
+        Iterate over the colors in the array.
+
+        Returns:
+            Iterator over Color instances
+        """
+        return iter(self.to_colors())
+
+    def __eq__(self, other: object) -> bool:
+        """Check if two color arrays hold the same colors."""
+        if not isinstance(other, ColorArray):
+            return NotImplemented
+
+        return bool(np.array_equal(self._packed, other._packed))
+
+    def __repr__(self) -> str:
+        """Detailed string representation of the color array."""
+        return f"ColorArray({len(self)} colors)"
@@ -6,18 +6,56 @@ color data throughout the application.
 """
 
 import re
+import threading
+from collections import OrderedDict
 from enum import Enum
 from enum import auto
+from functools import lru_cache
+from numbers import Integral
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import NamedTuple
+from typing import Optional
 from typing import Tuple
 from typing import Union
-from typing import cast
 
 # This requires the 'colour' package: pip install colour
 from colour import Color as ColourColor
 
+from .color_spaces import lab_to_rgb
+from .color_spaces import oklab_to_oklch
+from .color_spaces import oklab_to_rgb
+from .color_spaces import oklch_to_oklab
+from .color_spaces import rgb_to_lab
+from .color_spaces import rgb_to_oklab
+
+
+# Tolerance used when validating normalized components (matches the colour package)
+FLOAT_ERROR = 0.0000005
+
+# Alpha channel value stored for fully opaque colors
+OPAQUE = 0xFF
+
+# Maximum number of distinct color strings kept in the parse cache
+PARSE_CACHE_SIZE = 65536
+
+# Maximum number of shared colors kept by Color.intern; the least recently used are dropped first
+INTERN_TABLE_SIZE = 4096
+
+# Shared Color instances keyed by packed value, filled by Color.intern, oldest first
+_INTERNED: "OrderedDict[int, Color]" = OrderedDict()
+
+# Guards _INTERNED, whose lookup, reorder and eviction must not interleave across threads
+_INTERN_LOCK = threading.Lock()
+
+# Characters accepted in hex color digits
+HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# Functional notations: rgb(255, 255, 255) and hsl(360, 100%, 100%)
+RGB_PATTERN = re.compile(r"rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)")
+HSL_PATTERN = re.compile(r"hsl\(\s*(\d+)\s*,\s*(\d+)%\s*,\s*(\d+)%\s*\)")
+
 
 class ColorFormat(Enum):
     """Supported color formats."""
@@ -27,22 +65,299 @@ class ColorFormat(Enum):
     HSL = auto()
     HSV = auto()
     CMYK = auto()
+    LAB = auto()
+    OKLAB = auto()
+    OKLCH = auto()
 
     def __str__(self) -> str:
         """Return string representation of the color format."""
         return self.name
 
 
+class ParseCacheInfo(NamedTuple):
+    """Statistics of the color string parse cache."""
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+def _unit_to_byte(value: float) -> int:
+    """
+    Quantize a normalized channel value to an 8-bit integer.
+
+    Args:
+        value: Channel value in range 0.0-1.0
+
+    Returns:
+        Channel value in range 0-255
+    """
+    return int(value * 255 + 0.5 - FLOAT_ERROR)
+
+
+def _pack(r: int, g: int, b: int, a: int = OPAQUE) -> int:
+    """
+    Pack 8-bit channels into a single 0xAARRGGBB integer.
+
+    Args:
+        r: Red channel (0-255)
+        g: Green channel (0-255)
+        b: Blue channel (0-255)
+        a: Alpha channel (0-255)
+
+    Returns:
+        Packed ARGB integer
+    """
+    return (a << 24) | (r << 16) | (g << 8) | b
+
+
+def _pack_unit(r: float, g: float, b: float, a: float = 1.0) -> int:
+    """
+    Validate and pack normalized channels into a 0xAARRGGBB integer.
+
+    Args:
+        r: Red channel (0.0-1.0)
+        g: Green channel (0.0-1.0)
+        b: Blue channel (0.0-1.0)
+        a: Alpha channel (0.0-1.0)
+
+    Returns:
+        Packed ARGB integer
+
+    Raises:
+        ValueError: If any channel is outside the 0.0-1.0 range
+    """
+    for name, v in (("Red", r), ("Green", g), ("Blue", b), ("Alpha", a)):
+        if not (-FLOAT_ERROR <= v <= 1 + FLOAT_ERROR):
+            raise ValueError(f"{name} must be between 0 and 1. You provided {v!r}.")
+    return _pack(_unit_to_byte(r), _unit_to_byte(g), _unit_to_byte(b), _unit_to_byte(a))
+
+
+def _rgb_to_hsl(r: float, g: float, b: float) -> Tuple[float, float, float]:
+    """
+    Convert normalized RGB to normalized HSL.
+
+    Args:
+        r: Red channel (0.0-1.0)
+        g: Green channel (0.0-1.0)
+        b: Blue channel (0.0-1.0)
+
+    Returns:
+        HSL tuple with values in range 0.0-1.0
+    """
+    vmax = max(r, g, b)
+    vmin = min(r, g, b)
+    diff = vmax - vmin
+    vsum = vmax + vmin
+    lightness = vsum / 2
+
+    if diff < FLOAT_ERROR:
+        return (0.0, 0.0, lightness)
+
+    s = diff / vsum if lightness < 0.5 else diff / (2.0 - vsum)
+
+    if r == vmax:
+        h = (g - b) / diff
+    elif g == vmax:
+        h = 2.0 + (b - r) / diff
+    else:
+        h = 4.0 + (r - g) / diff
+
+    return ((h / 6.0) % 1.0, s, lightness)
+
+
+def _hue_to_channel(v1: float, v2: float, hue: float) -> float:
+    """
+    Compute a single RGB channel from HSL intermediates.
+
+    Args:
+        v1: Lower chroma bound
+        v2: Upper chroma bound
+        hue: Hue offset for the channel (any value, wrapped to 0.0-1.0)
+
+    Returns:
+        Channel value in range 0.0-1.0
+    """
+    hue %= 1.0
+    if 6 * hue < 1:
+        return v1 + (v2 - v1) * 6 * hue
+    if 2 * hue < 1:
+        return v2
+    if 3 * hue < 2:
+        return v1 + (v2 - v1) * ((2.0 / 3) - hue) * 6
+    return v1
+
+
+def _hsl_to_rgb(h: float, s: float, lightness: float) -> Tuple[float, float, float]:
+    """
+    Convert normalized HSL to normalized RGB.
+
+    Args:
+        h: Hue (any value, wrapped to 0.0-1.0)
+        s: Saturation (0.0-1.0)
+        lightness: Lightness (0.0-1.0)
+
+    Returns:
+        RGB tuple with values in range 0.0-1.0
+
+    Raises:
+        ValueError: If saturation or lightness are outside the 0.0-1.0 range
+    """
+    if not (-FLOAT_ERROR <= s <= 1 + FLOAT_ERROR):
+        raise ValueError("Saturation must be between 0 and 1.")
+    if not (-FLOAT_ERROR <= lightness <= 1 + FLOAT_ERROR):
+        raise ValueError("Lightness must be between 0 and 1.")
+
+    if s == 0:
+        return (lightness, lightness, lightness)
+
+    v2 = lightness * (1.0 + s) if lightness < 0.5 else (lightness + s) - (s * lightness)
+    v1 = 2.0 * lightness - v2
+
+    return (
+        _hue_to_channel(v1, v2, h + (1.0 / 3)),
+        _hue_to_channel(v1, v2, h),
+        _hue_to_channel(v1, v2, h - (1.0 / 3)),
+    )
+
+
+def _normalize(value: float, scale: float) -> float:
+    """
+    Normalize a dictionary component to the 0.0-1.0 range.
+
+    Components above 1 are taken to be on the given scale (e.g. 255 for RGB
+    channels, 360 for hue, 100 for percentages); others are already normalized.
+
+    Args:
+        value: Raw component value
+        scale: Full-scale value of the component
+
+    Returns:
+        Normalized component
+    """
+    return value / scale if value > 1 else float(value)
+
+
+def parse_hex(value: str) -> int:
+    """
+    Parse a "#rgb", "#rrggbb" or "#rrggbbaa" string without regex.
+
+    Args:
+        value: Hex color string, including the leading "#"
+
+    Returns:
+        Packed ARGB integer
+
+    Raises:
+        AttributeError: If the string is not a 3, 6 or 8 digit hex value
+    """
+    length = len(value)
+    if value[:1] != "#" or length not in (4, 7, 9) or not HEX_DIGITS.issuperset(value[1:]):
+        raise AttributeError(f"{value!r} is not in web format. Need 3, 6 or 8 hex digit.")
+
+    if length == 7:
+        return (OPAQUE << 24) | int(value[1:], 16)
+    if length == 9:
+        rgba = int(value[1:], 16)
+        return ((rgba & 0xFF) << 24) | (rgba >> 8)
+
+    r, g, b = int(value[1], 16), int(value[2], 16), int(value[3], 16)
+    return _pack(r * 17, g * 17, b * 17)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_color_string(value: str) -> int:
+    """
+    Parse any supported color string into a packed ARGB integer.
+
+    Hex strings take a hand-written fast path; functional rgb()/hsl()
+    notations use regex, and anything else is resolved as a named color.
+    Results are memoized in a bounded, thread-safe LRU cache keyed on the
+    raw string, so repeated parses of the same value are dictionary lookups.
+
+    Args:
+        value: Color string (e.g., "#FFFFFF", "rgb(255, 255, 255)", "red")
+
+    Returns:
+        Packed ARGB integer
+
+    Raises:
+        ValueError: If the color string is invalid
+        AttributeError: If a "#" string is not a 3, 6 or 8 digit hex value
+    """
+    if value[:1] == "#":
+        return parse_hex(value)
+
+    rgb_match = RGB_PATTERN.match(value)
+    if rgb_match:
+        r, g, b = map(int, rgb_match.groups())
+        return _pack_unit(r / 255, g / 255, b / 255)
+
+    hsl_match = HSL_PATTERN.match(value)
+    if hsl_match:
+        h, s, lightness = map(int, hsl_match.groups())
+        return _pack_unit(*_hsl_to_rgb(h / 360, s / 100, lightness / 100))
+
+    # Default: try as a named color
+    try:
+        return int(ColourColor(value).hex_l[1:], 16) | (OPAQUE << 24)
+    except ValueError as e:
+        raise ValueError(f"Invalid color string: {value}") from e
+
+
+def parse_cache_info() -> ParseCacheInfo:
+    """
+    Get statistics for the color string parse cache.
+
+    Returns:
+        Named tuple of (hits, misses, maxsize, currsize)
+    """
+    return ParseCacheInfo(*parse_color_string.cache_info())
+
+
+def clear_parse_cache() -> None:
+    """Clear the color string parse cache and reset its counters."""
+    parse_color_string.cache_clear()
+
+
+def intern_table_size() -> int:
+    """
+    Get the number of colors held by the intern table.
+
+    Returns:
+        Number of interned colors
+    """
+    return len(_INTERNED)
+
+
+def clear_intern_table() -> None:
+    """Drop every interned color; existing instances stay valid."""
+    with _INTERN_LOCK:
+        _INTERNED.clear()
+
+
+def _clamp_unit(value: float) -> float:
+    """Clamp a normalized component to the 0.0-1.0 range."""
+    return 0.0 if value < 0.0 else min(value, 1.0)
+
+
 class Color:
     """
     Represents a color in the Milky Color Suite.
 
-    This class wraps the colour.Color class and provides additional
-    functionality for handling different color formats and conversions.
+    The canonical state is a single packed 0xAARRGGBB integer; every other
+    representation (hex, RGB, HSL, HSV, CMYK) is derived from it on demand.
+    The colour package is only consulted to resolve named colors.
+
+    Colors are immutable and hash by their packed value, so they can be used
+    in sets and as dictionary keys.
     """
 
-    # Define type for _color attribute
-    _color: ColourColor
+    __slots__ = ("_value",)
+
+    # Packed 0xAARRGGBB value
+    _value: int
 
     def __init__(self, value: Union[str, Tuple[Any, ...], List[Any], Dict[str, Any], "Color"]) -> None:
         """
@@ -55,17 +370,120 @@ class Color:
             ValueError: If the color value is invalid
         """
         if isinstance(value, Color):
-            self._color = value._color
+            packed = value._value
         elif isinstance(value, str):
-            self._color = self._from_string(value)
+            packed = self._from_string(value)
         elif isinstance(value, (tuple, list)) and len(value) in (3, 4):
-            self._color = self._from_rgb_tuple(value)
+            packed = self._from_rgb_tuple(value)
         elif isinstance(value, dict):
-            self._color = self._from_dict(value)
+            packed = self._from_dict(value)
         else:
             raise ValueError(f"Unsupported color value: {value}")
+        object.__setattr__(self, "_value", packed)
+
+    @classmethod
+    def from_packed(cls, value: int) -> "Color":
+        """
+        Create a Color directly from a packed integer without any parsing.
 
-    def _from_string(self, value: str) -> ColourColor:
+        Args:
+            value: Packed 0xAARRGGBB integer, as returned by ``packed``
+
+        Returns:
+            A Color instance
+
+        Raises:
+            ValueError: If the value does not fit in 32 bits
+        """
+        if not 0 <= value <= 0xFFFFFFFF:
+            raise ValueError(f"Packed color out of range: {value!r}")
+        color = object.__new__(cls)
+        object.__setattr__(color, "_value", value)
+        return color
+
+    @classmethod
+    def intern(cls, value: Union[str, Tuple[Any, ...], List[Any], Dict[str, Any], "Color"]) -> "Color":
+        """
+        Get the shared instance for a color, creating it on first use.
+
+        Interned colors with the same packed value are the same object, so
+        palettes that repeat a color only hold it once. The table keeps at
+        most INTERN_TABLE_SIZE colors and drops the least recently used one
+        when full; dropped colors stay valid but are no longer shared. The
+        table is locked, so concurrent callers get the same instance.
+
+        Args:
+            value: Any value accepted by the Color constructor
+
+        Returns:
+            The interned Color instance
+
+        Raises:
+            ValueError: If the color value is invalid
+        """
+        color = value if isinstance(value, Color) else cls(value)
+        with _INTERN_LOCK:
+            shared = _INTERNED.get(color._value)
+            if shared is not None:
+                _INTERNED.move_to_end(color._value)
+                return shared
+            _INTERNED[color._value] = color
+            if len(_INTERNED) > INTERN_TABLE_SIZE:
+                _INTERNED.popitem(last=False)
+        return color
+
+    @classmethod
+    def from_lab(cls, lightness: float, a: float, b: float) -> "Color":
+        """
+        Create a Color from CIELAB (D65) components.
+
+        Out-of-gamut values are clipped to the sRGB cube.
+
+        Args:
+            lightness: L component (0-100)
+            a: a component
+            b: b component
+
+        Returns:
+            A Color instance
+        """
+        return cls.from_packed(_pack(*lab_to_rgb(lightness, a, b)))
+
+    @classmethod
+    def from_oklab(cls, lightness: float, a: float, b: float) -> "Color":
+        """
+        Create a Color from OKLab components.
+
+        Out-of-gamut values are clipped to the sRGB cube.
+
+        Args:
+            lightness: L component (0.0-1.0)
+            a: a component
+            b: b component
+
+        Returns:
+            A Color instance
+        """
+        return cls.from_packed(_pack(*oklab_to_rgb(lightness, a, b)))
+
+    @classmethod
+    def from_oklch(cls, lightness: float, chroma: float, hue: float) -> "Color":
+        """
+        Create a Color from OKLCH components.
+
+        Out-of-gamut values are clipped to the sRGB cube.
+
+        Args:
+            lightness: L component (0.0-1.0)
+            chroma: C component
+            hue: Hue in degrees
+
+        Returns:
+            A Color instance
+        """
+        return cls.from_oklab(*oklch_to_oklab(lightness, chroma, hue))
+
+    def _from_string(self, value: str) -> int:
         """
         Create a Color instance from a string.
 
@@ -73,30 +491,15 @@ class Color:
             value: Color string (e.g., "#FFFFFF", "rgb(255, 255, 255)")
 
         Returns:
-            A ColourColor instance
+            Packed ARGB integer
 
         Raises:
             ValueError: If the color string is invalid
+            AttributeError: If a "#" string is not a 3, 6 or 8 digit hex value
         """
-        # Check RGB format: rgb(255, 255, 255)
-        rgb_match = re.match(r"rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)", value)
-        if rgb_match:
-            r, g, b = map(int, rgb_match.groups())
-            return ColourColor(rgb=(r / 255, g / 255, b / 255))
+        return parse_color_string(value)
 
-        # Check HSL format: hsl(360, 100%, 100%)
-        hsl_match = re.match(r"hsl\(\s*(\d+)\s*,\s*(\d+)%\s*,\s*(\d+)%\s*\)", value)
-        if hsl_match:
-            h, s, lightness = map(int, hsl_match.groups())
-            return ColourColor(hsl=(h / 360, s / 100, lightness / 100))
-
-        # Default: try as hex or named color
-        try:
-            return ColourColor(value)
-        except ValueError as e:
-            raise ValueError(f"Invalid color string: {value}") from e
-
-    def _from_rgb_tuple(self, value: Union[Tuple[Union[int, float], ...], List[Union[int, float]]]) -> ColourColor:
+    def _from_rgb_tuple(self, value: Union[Tuple[Union[int, float], ...], List[Union[int, float]]]) -> int:
         """
         Create a Color instance from an RGB tuple.
 
@@ -105,26 +508,22 @@ class Color:
                   with values in range 0-255 or 0.0-1.0
 
         Returns:
-            A ColourColor instance
+            Packed ARGB integer
 
         Raises:
             ValueError: If the RGB tuple is invalid
         """
-        # Check if values are in 0-255 range
-        if any(isinstance(v, int) and v > 1 for v in value):
-            # Convert to 0.0-1.0 range
-            # Explicitly cast to ensure type safety
-            components = [v / 255 if isinstance(v, int) and v > 1 else float(v) for v in value[:3]]
-        else:
-            # Explicitly cast to ensure type safety
-            components = [float(v) for v in value[:3]]
-        rgb = (components[0], components[1], components[2])
+        # Integer components above 1 mean the whole tuple is in 0-255 range
+        byte_scale = any(isinstance(v, Integral) and v > 1 for v in value)
+        components = [v / 255 if byte_scale and isinstance(v, Integral) else float(v) for v in value]
+        if len(components) == 3:
+            components.append(1.0)
         try:
-            return ColourColor(rgb=rgb)
+            return _pack_unit(*components)
         except ValueError as e:
             raise ValueError(f"Invalid RGB values: {value}") from e
 
-    def _from_dict(self, value: Dict[str, Union[int, float]]) -> ColourColor:
+    def _from_dict(self, value: Dict[str, Union[int, float]]) -> int:
         """
         Create a Color instance from a dictionary.
 
@@ -132,24 +531,24 @@ class Color:
             value: Dictionary with color components (e.g., {"r": 255, "g": 255, "b": 255})
 
         Returns:
-            A ColourColor instance
+            Packed ARGB integer
 
         Raises:
             ValueError: If the dictionary is invalid
         """
         if all(k in value for k in ("r", "g", "b")):
             # RGB format
-            r = value["r"] / 255 if isinstance(value["r"], int) and value["r"] > 1 else value["r"]
-            g = value["g"] / 255 if isinstance(value["g"], int) and value["g"] > 1 else value["g"]
-            b = value["b"] / 255 if isinstance(value["b"], int) and value["b"] > 1 else value["b"]
-            return ColourColor(rgb=(r, g, b))
+            r = _normalize(value["r"], 255)
+            g = _normalize(value["g"], 255)
+            b = _normalize(value["b"], 255)
+            return _pack_unit(r, g, b)
 
         elif all(k in value for k in ("h", "s", "l")):
             # HSL format
-            h = value["h"] / 360 if isinstance(value["h"], int) and value["h"] > 1 else value["h"]
-            s = value["s"] / 100 if isinstance(value["s"], int) and value["s"] > 1 else value["s"]
-            lightness = value["l"] / 100 if isinstance(value["l"], int) and value["l"] > 1 else value["l"]
-            return ColourColor(hsl=(h, s, lightness))
+            h = _normalize(value["h"], 360)
+            s = _normalize(value["s"], 100)
+            lightness = _normalize(value["l"], 100)
+            return _pack_unit(*_hsl_to_rgb(h, s, lightness))
 
         # HSV format - convert to RGB
         elif all(k in value for k in ("h", "s", "v")):
@@ -158,20 +557,20 @@ class Color:
         else:
             raise ValueError(f"Invalid color dictionary: {value}")
 
-    def _convert_to_rgb(self, value: Dict[str, Union[int, float]]) -> ColourColor:
+    def _convert_to_rgb(self, value: Dict[str, Union[int, float]]) -> int:
         """
-        Convert HSV dictionary to RGB ColourColor.
+        Convert HSV dictionary to a packed RGB value.
 
         Args:
             value: Dictionary with HSV components (e.g., {"h": 360, "s": 100, "v": 100})
 
         Returns:
-            A ColourColor instance in RGB format
+            Packed ARGB integer
         """
         # HSV format - convert to RGB first
-        h = value["h"] / 360 if isinstance(value["h"], int) and value["h"] > 1 else value["h"]
-        s = value["s"] / 100 if isinstance(value["s"], int) and value["s"] > 1 else value["s"]
-        v = value["v"] / 100 if isinstance(value["v"], int) and value["v"] > 1 else value["v"]
+        h = _normalize(value["h"], 360)
+        s = _normalize(value["s"], 100)
+        v = _normalize(value["v"], 100)
 
         # HSV to RGB conversion
         h_i = int(h * 6)
@@ -193,7 +592,27 @@ class Color:
         else:
             r, g, b = v, p, q
 
-        return ColourColor(rgb=(r, g, b))
+        return _pack_unit(r, g, b)
+
+    @property
+    def packed(self) -> int:
+        """
+        Get the canonical packed value of the color.
+
+        Returns:
+            Packed 0xAARRGGBB integer
+        """
+        return self._value
+
+    @property
+    def alpha(self) -> float:
+        """
+        Get the alpha channel of the color.
+
+        Returns:
+            Alpha value in range 0.0-1.0
+        """
+        return (self._value >> 24) / 255
 
     @property
     def hex(self) -> str:
@@ -203,7 +622,7 @@ class Color:
         Returns:
             Hex color string (e.g., "#FFFFFF")
         """
-        return cast(str, self._color.hex_l)
+        return f"#{self._value & 0xFFFFFF:06x}"
 
     @property
     def rgb(self) -> Tuple[int, int, int]:
@@ -213,8 +632,8 @@ class Color:
         Returns:
             RGB tuple with values in range 0-255
         """
-        r, g, b = self._color.rgb
-        return (int(r * 255), int(g * 255), int(b * 255))
+        value = self._value
+        return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
 
     @property
     def rgb_float(self) -> Tuple[float, float, float]:
@@ -224,8 +643,8 @@ class Color:
         Returns:
             RGB tuple with values in range 0.0-1.0
         """
-        r, g, b = self._color.rgb
-        return (r, g, b)
+        value = self._value
+        return (((value >> 16) & 0xFF) / 255, ((value >> 8) & 0xFF) / 255, (value & 0xFF) / 255)
 
     @property
     def hsl(self) -> Tuple[int, int, int]:
@@ -235,8 +654,8 @@ class Color:
         Returns:
             HSL tuple with values in range 0-360, 0-100, 0-100
         """
-        h, s, lightness = self._color.hsl
-        return (int(h * 360), int(s * 100), int(lightness * 100))
+        h, s, lightness = self.hsl_float
+        return (round(h * 360) % 360, round(s * 100), round(lightness * 100))
 
     @property
     def hsl_float(self) -> Tuple[float, float, float]:
@@ -246,8 +665,7 @@ class Color:
         Returns:
             HSL tuple with values in range 0.0-1.0
         """
-        h, s, lightness = self._color.hsl
-        return (h, s, lightness)
+        return _rgb_to_hsl(*self.rgb_float)
 
     @property
     def hsv(self) -> Tuple[int, int, int]:
@@ -313,6 +731,36 @@ class Color:
 
         return (c_int, m_int, y_int, k_int)
 
+    @property
+    def lab(self) -> Tuple[float, float, float]:
+        """
+        Get the color as CIELAB (D65) values.
+
+        Returns:
+            (L, a, b) tuple with L in range 0-100
+        """
+        return rgb_to_lab(*self.rgb)
+
+    @property
+    def oklab(self) -> Tuple[float, float, float]:
+        """
+        Get the color as OKLab values.
+
+        Returns:
+            (L, a, b) tuple with L in range 0.0-1.0
+        """
+        return rgb_to_oklab(*self.rgb)
+
+    @property
+    def oklch(self) -> Tuple[float, float, float]:
+        """
+        Get the color as OKLCH values.
+
+        Returns:
+            (L, C, h) tuple with L in range 0.0-1.0 and hue in degrees
+        """
+        return oklab_to_oklch(*self.oklab)
+
     def get_format(self, format_type: ColorFormat) -> Union[str, Tuple[int, ...], Tuple[float, ...]]:
         """
         Get the color in the specified format.
@@ -333,6 +781,12 @@ class Color:
             return self.hsv
         elif format_type == ColorFormat.CMYK:
             return self.cmyk
+        elif format_type == ColorFormat.LAB:
+            return self.lab
+        elif format_type == ColorFormat.OKLAB:
+            return self.oklab
+        elif format_type == ColorFormat.OKLCH:
+            return self.oklch
         else:
             raise ValueError(f"Unsupported color format: {format_type}")
 
@@ -349,6 +803,21 @@ class Color:
         alpha_hex = hex(int(alpha * 255))[2:].zfill(2)
         return f"{self.hex}{alpha_hex}"
 
+    def _from_hsl_float(self, h: float, s: float, lightness: float) -> "Color":
+        """
+        Build a new color from normalized HSL, keeping this color's alpha.
+
+        Args:
+            h: Hue (any value, wrapped to 0.0-1.0)
+            s: Saturation, clamped to 0.0-1.0
+            lightness: Lightness, clamped to 0.0-1.0
+
+        Returns:
+            A new Color instance
+        """
+        r, g, b = _hsl_to_rgb(h, _clamp_unit(s), _clamp_unit(lightness))
+        return Color.from_packed(_pack(_unit_to_byte(r), _unit_to_byte(g), _unit_to_byte(b), self._value >> 24))
+
     def analogous(self, count: int = 3, angle: float = 30) -> List["Color"]:
         """
         Get analogous colors.
@@ -419,35 +888,58 @@ class Color:
             Color({"h": h3, "s": s, "l": lightness}),
         ]
 
-    def lighten(self, amount: float = 0.1) -> "Color":
+    def _with_oklch_lightness(self, amount: float) -> "Color":
+        """
+        Shift the OKLCH lightness, keeping chroma, hue and alpha.
+
+        Args:
+            amount: Lightness offset (OKLab L units, 0.0-1.0 scale)
+
+        Returns:
+            A new Color instance
+        """
+        lightness, chroma, hue = self.oklch
+        color = Color.from_oklch(_clamp_unit(lightness + amount), chroma, hue)
+        return Color.from_packed((color._value & 0xFFFFFF) | (self._value & 0xFF000000))
+
+    def lighten(self, amount: float = 0.1, space: str = "hsl") -> "Color":
         """
         Get a lighter version of the color.
 
         Args:
             amount: Amount to lighten by (0.0-1.0)
+            space: Color space to adjust lightness in: "hsl" or the
+                perceptually uniform "oklch"
 
         Returns:
             Lightened color
-        """
-        new_color = ColourColor(self.hex)
-        new_color.luminance += amount
 
-        return Color(new_color.hex_l)
+        Raises:
+            ValueError: If the color space is not supported
+        """
+        if space == "oklch":
+            return self._with_oklch_lightness(amount)
+        if space != "hsl":
+            raise ValueError(f"Unsupported color space: {space}")
+        h, s, lightness = self.hsl_float
+        return self._from_hsl_float(h, s, lightness + amount)
 
-    def darken(self, amount: float = 0.1) -> "Color":
+    def darken(self, amount: float = 0.1, space: str = "hsl") -> "Color":
         """
         Get a darker version of the color.
 
         Args:
             amount: Amount to darken by (0.0-1.0)
+            space: Color space to adjust lightness in: "hsl" or the
+                perceptually uniform "oklch"
 
         Returns:
             Darkened color
-        """
-        new_color = ColourColor(self.hex)
-        new_color.luminance -= amount
 
-        return Color(new_color.hex_l)
+        Raises:
+            ValueError: If the color space is not supported
+        """
+        return self.lighten(-amount, space)
 
     def saturate(self, amount: float = 0.1) -> "Color":
         """
@@ -459,10 +951,8 @@ class Color:
         Returns:
             Saturated color
         """
-        new_color = ColourColor(self.hex)
-        new_color.saturation += amount
-
-        return Color(new_color.hex_l)
+        h, s, lightness = self.hsl_float
+        return self._from_hsl_float(h, s + amount, lightness)
 
     def desaturate(self, amount: float = 0.1) -> "Color":
         """
@@ -474,10 +964,8 @@ class Color:
         Returns:
             Desaturated color
         """
-        new_color = ColourColor(self.hex)
-        new_color.saturation -= amount
-
-        return Color(new_color.hex_l)
+        h, s, lightness = self.hsl_float
+        return self._from_hsl_float(h, s - amount, lightness)
 
     def __str__(self) -> str:
         """String representation of the color."""
@@ -492,4 +980,28 @@ class Color:
         if not isinstance(other, Color):
             return NotImplemented
 
-        return self.hex.lower() == other.hex.lower()
+        return self._value == other._value
+
+    def __hash__(self) -> int:
+        """Hash the color by its packed value, consistent with equality."""
+        return hash(self._value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject attribute assignment; colors are immutable."""
+        raise AttributeError(f"Color is immutable, cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject attribute deletion; colors are immutable."""
+        raise AttributeError(f"Color is immutable, cannot delete {name!r}")
+
+    def __reduce__(self) -> Tuple[Any, Tuple[int]]:
+        """Pickle and copy colors through their packed value."""
+        return (Color.from_packed, (self._value,))
+
+    def __copy__(self) -> "Color":
+        """Return self; an immutable color needs no copy."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Color":
+        """Return self; an immutable color needs no copy."""
+        return self
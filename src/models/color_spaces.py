@@ -0,0 +1,359 @@
+"""
+Perceptual color space conversions for the Milky Color Suite.
+
+This module converts 8-bit sRGB to and from CIELAB (D65), OKLab and OKLCH,
+both for single colors (pure Python, used by Color) and for (N, 3) batches
+(NumPy, used by ColorArray). The sRGB transfer function is never evaluated
+per channel: decoding uses a 256-entry lookup table and encoding snaps
+linear values back to the nearest 8-bit code with a table of thresholds.
+"""
+
+import math
+from bisect import bisect_left
+from typing import Tuple
+
+import numpy as np
+
+
+def _srgb_to_linear(value: float) -> float:
+    """
+    Apply the sRGB decoding transfer function to one channel.
+
+    Args:
+        value: Gamma-encoded channel value in range 0.0-1.0
+
+    Returns:
+        Linear-light channel value in range 0.0-1.0
+    """
+    return value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value: float) -> float:
+    """
+    Apply the sRGB encoding transfer function to one channel.
+
+    Args:
+        value: Linear-light channel value in range 0.0-1.0
+
+    Returns:
+        Gamma-encoded channel value in range 0.0-1.0
+    """
+    return value * 12.92 if value <= 0.0031308 else 1.055 * value ** (1 / 2.4) - 0.055
+
+
+# Linear-light value of every 8-bit sRGB code
+SRGB_TO_LINEAR: Tuple[float, ...] = tuple(_srgb_to_linear(code / 255) for code in range(256))
+SRGB_TO_LINEAR_LUT = np.array(SRGB_TO_LINEAR, dtype=np.float64)
+
+# Linear-light value halfway (in sRGB) between consecutive 8-bit codes; a linear
+# value maps to code k when it lies between thresholds k-1 and k
+LINEAR_THRESHOLDS: Tuple[float, ...] = tuple(_srgb_to_linear((code + 0.5) / 255) for code in range(255))
+LINEAR_THRESHOLDS_LUT = np.array(LINEAR_THRESHOLDS, dtype=np.float64)
+
+# Linear sRGB to CIE XYZ (D65)
+RGB_TO_XYZ = np.array(
+    [
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ]
+)
+XYZ_TO_RGB = np.linalg.inv(RGB_TO_XYZ)
+
+# D65 reference white
+WHITE_D65 = np.array([0.95047, 1.0, 1.08883])
+
+# OKLab matrices (Björn Ottosson, 2020)
+RGB_TO_LMS = np.array(
+    [
+        [0.4122214708, 0.5363325363, 0.0514459929],
+        [0.2119034982, 0.6806995451, 0.1073969566],
+        [0.0883024619, 0.2817188376, 0.6299787005],
+    ]
+)
+LMS_TO_OKLAB = np.array(
+    [
+        [0.2104542553, 0.7936177850, -0.0040720468],
+        [1.9779984951, -2.4285922050, 0.4505937099],
+        [0.0259040371, 0.7827717662, -0.8086757660],
+    ]
+)
+OKLAB_TO_LMS = np.linalg.inv(LMS_TO_OKLAB)
+LMS_TO_RGB = np.linalg.inv(RGB_TO_LMS)
+
+# CIELAB companding constants
+LAB_EPSILON = (6 / 29) ** 3
+LAB_KAPPA = 1 / (3 * (6 / 29) ** 2)
+
+# Plain tuples of the matrices for the scalar path
+_RGB_TO_XYZ = tuple(map(tuple, RGB_TO_XYZ.tolist()))
+_XYZ_TO_RGB = tuple(map(tuple, XYZ_TO_RGB.tolist()))
+_WHITE_D65 = tuple(WHITE_D65.tolist())
+_RGB_TO_LMS = tuple(map(tuple, RGB_TO_LMS.tolist()))
+_LMS_TO_OKLAB = tuple(map(tuple, LMS_TO_OKLAB.tolist()))
+_OKLAB_TO_LMS = tuple(map(tuple, OKLAB_TO_LMS.tolist()))
+_LMS_TO_RGB = tuple(map(tuple, LMS_TO_RGB.tolist()))
+
+
+def _mul(matrix: Tuple[Tuple[float, ...], ...], x: float, y: float, z: float) -> Tuple[float, float, float]:
+    """Multiply a 3x3 matrix by a column vector."""
+    return (
+        matrix[0][0] * x + matrix[0][1] * y + matrix[0][2] * z,
+        matrix[1][0] * x + matrix[1][1] * y + matrix[1][2] * z,
+        matrix[2][0] * x + matrix[2][1] * y + matrix[2][2] * z,
+    )
+
+
+def linear_to_byte(value: float) -> int:
+    """
+    Quantize a linear-light channel value to the nearest 8-bit sRGB code.
+
+    Args:
+        value: Linear-light channel value (clipped to 0.0-1.0)
+
+    Returns:
+        sRGB channel value in range 0-255
+    """
+    return bisect_left(LINEAR_THRESHOLDS, value)
+
+
+def _lab_f(t: float) -> float:
+    """CIELAB forward companding function."""
+    return t ** (1 / 3) if t > LAB_EPSILON else t * LAB_KAPPA + 4 / 29
+
+
+def _lab_f_inv(t: float) -> float:
+    """CIELAB inverse companding function."""
+    return t**3 if t > 6 / 29 else (t - 4 / 29) / LAB_KAPPA
+
+
+def _cbrt(value: float) -> float:
+    """Real cube root that keeps the sign of negative values."""
+    return math.copysign(abs(value) ** (1 / 3), value)
+
+
+def rgb_to_lab(r: int, g: int, b: int) -> Tuple[float, float, float]:
+    """
+    Convert 8-bit sRGB to CIELAB (D65).
+
+    Args:
+        r: Red channel (0-255)
+        g: Green channel (0-255)
+        b: Blue channel (0-255)
+
+    Returns:
+        (L, a, b) with L in range 0-100
+    """
+    x, y, z = _mul(_RGB_TO_XYZ, SRGB_TO_LINEAR[r], SRGB_TO_LINEAR[g], SRGB_TO_LINEAR[b])
+    fx = _lab_f(x / _WHITE_D65[0])
+    fy = _lab_f(y / _WHITE_D65[1])
+    fz = _lab_f(z / _WHITE_D65[2])
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+def lab_to_rgb(lightness: float, a: float, b: float) -> Tuple[int, int, int]:
+    """
+    Convert CIELAB (D65) to 8-bit sRGB, clipping out-of-gamut colors.
+
+    Args:
+        lightness: L component (0-100)
+        a: a component
+        b: b component
+
+    Returns:
+        RGB tuple with values in range 0-255
+    """
+    fy = (lightness + 16) / 116
+    x = _WHITE_D65[0] * _lab_f_inv(fy + a / 500)
+    y = _WHITE_D65[1] * _lab_f_inv(fy)
+    z = _WHITE_D65[2] * _lab_f_inv(fy - b / 200)
+    red, green, blue = _mul(_XYZ_TO_RGB, x, y, z)
+    return (linear_to_byte(red), linear_to_byte(green), linear_to_byte(blue))
+
+
+def rgb_to_oklab(r: int, g: int, b: int) -> Tuple[float, float, float]:
+    """
+    Convert 8-bit sRGB to OKLab.
+
+    Args:
+        r: Red channel (0-255)
+        g: Green channel (0-255)
+        b: Blue channel (0-255)
+
+    Returns:
+        (L, a, b) with L in range 0.0-1.0
+    """
+    lms = _mul(_RGB_TO_LMS, SRGB_TO_LINEAR[r], SRGB_TO_LINEAR[g], SRGB_TO_LINEAR[b])
+    return _mul(_LMS_TO_OKLAB, _cbrt(lms[0]), _cbrt(lms[1]), _cbrt(lms[2]))
+
+
+def oklab_to_rgb(lightness: float, a: float, b: float) -> Tuple[int, int, int]:
+    """
+    Convert OKLab to 8-bit sRGB, clipping out-of-gamut colors.
+
+    Args:
+        lightness: L component (0.0-1.0)
+        a: a component
+        b: b component
+
+    Returns:
+        RGB tuple with values in range 0-255
+    """
+    lms = _mul(_OKLAB_TO_LMS, lightness, a, b)
+    red, green, blue = _mul(_LMS_TO_RGB, lms[0] ** 3, lms[1] ** 3, lms[2] ** 3)
+    return (linear_to_byte(red), linear_to_byte(green), linear_to_byte(blue))
+
+
+def oklab_to_oklch(lightness: float, a: float, b: float) -> Tuple[float, float, float]:
+    """
+    Convert OKLab to its cylindrical form OKLCH.
+
+    Args:
+        lightness: L component (0.0-1.0)
+        a: a component
+        b: b component
+
+    Returns:
+        (L, C, h) with hue in degrees in range 0-360
+    """
+    return (lightness, math.hypot(a, b), math.degrees(math.atan2(b, a)) % 360)
+
+
+def oklch_to_oklab(lightness: float, chroma: float, hue: float) -> Tuple[float, float, float]:
+    """
+    Convert OKLCH to OKLab.
+
+    Args:
+        lightness: L component (0.0-1.0)
+        chroma: C component
+        hue: Hue in degrees
+
+    Returns:
+        (L, a, b)
+    """
+    radians = math.radians(hue)
+    return (lightness, chroma * math.cos(radians), chroma * math.sin(radians))
+
+
+def rgb_to_linear_array(rgb: np.ndarray) -> np.ndarray:
+    """
+    Decode (N, 3) uint8 sRGB to linear light through the lookup table.
+
+    Args:
+        rgb: (N, 3) uint8 array
+
+    Returns:
+        (N, 3) float64 array of linear-light values
+    """
+    return SRGB_TO_LINEAR_LUT[rgb]
+
+
+def linear_to_rgb_array(linear: np.ndarray) -> np.ndarray:
+    """
+    Encode linear light to the nearest 8-bit sRGB codes through the threshold table.
+
+    Args:
+        linear: (N, 3) float array of linear-light values (clipped to 0.0-1.0)
+
+    Returns:
+        (N, 3) uint8 array
+    """
+    return np.searchsorted(LINEAR_THRESHOLDS_LUT, linear).astype(np.uint8)
+
+
+def _lab_f_array(t: np.ndarray) -> np.ndarray:
+    """Vectorized CIELAB forward companding function."""
+    return np.where(t > LAB_EPSILON, np.cbrt(t), t * LAB_KAPPA + 4 / 29)
+
+
+def _lab_f_inv_array(t: np.ndarray) -> np.ndarray:
+    """Vectorized CIELAB inverse companding function."""
+    return np.where(t > 6 / 29, t**3, (t - 4 / 29) / LAB_KAPPA)
+
+
+def rgb_to_lab_array(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert (N, 3) uint8 sRGB to CIELAB (D65).
+
+    Args:
+        rgb: (N, 3) uint8 array
+
+    Returns:
+        (N, 3) float64 array of (L, a, b)
+    """
+    f = _lab_f_array(rgb_to_linear_array(rgb) @ (RGB_TO_XYZ.T / WHITE_D65))
+    return np.stack([116 * f[:, 1] - 16, 500 * (f[:, 0] - f[:, 1]), 200 * (f[:, 1] - f[:, 2])], axis=1)
+
+
+def lab_to_rgb_array(lab: np.ndarray) -> np.ndarray:
+    """
+    Convert CIELAB (D65) to (N, 3) uint8 sRGB, clipping out-of-gamut colors.
+
+    Args:
+        lab: (N, 3) float array of (L, a, b)
+
+    Returns:
+        (N, 3) uint8 array
+    """
+    lab = np.asarray(lab, dtype=np.float64)
+    fy = (lab[:, 0] + 16) / 116
+    f = np.stack([fy + lab[:, 1] / 500, fy, fy - lab[:, 2] / 200], axis=1)
+    return linear_to_rgb_array((_lab_f_inv_array(f) * WHITE_D65) @ XYZ_TO_RGB.T)
+
+
+def rgb_to_oklab_array(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert (N, 3) uint8 sRGB to OKLab.
+
+    Args:
+        rgb: (N, 3) uint8 array
+
+    Returns:
+        (N, 3) float64 array of (L, a, b)
+    """
+    return np.cbrt(rgb_to_linear_array(rgb) @ RGB_TO_LMS.T) @ LMS_TO_OKLAB.T
+
+
+def oklab_to_rgb_array(oklab: np.ndarray) -> np.ndarray:
+    """
+    Convert OKLab to (N, 3) uint8 sRGB, clipping out-of-gamut colors.
+
+    Args:
+        oklab: (N, 3) float array of (L, a, b)
+
+    Returns:
+        (N, 3) uint8 array
+    """
+    lms = np.asarray(oklab, dtype=np.float64) @ OKLAB_TO_LMS.T
+    return linear_to_rgb_array((lms**3) @ LMS_TO_RGB.T)
+
+
+def oklab_to_oklch_array(oklab: np.ndarray) -> np.ndarray:
+    """
+    Convert (N, 3) OKLab rows to OKLCH.
+
+    Args:
+        oklab: (N, 3) float array of (L, a, b)
+
+    Returns:
+        (N, 3) float64 array of (L, C, h) with hue in degrees
+    """
+    oklab = np.asarray(oklab, dtype=np.float64)
+    chroma = np.hypot(oklab[:, 1], oklab[:, 2])
+    hue = np.degrees(np.arctan2(oklab[:, 2], oklab[:, 1])) % 360
+    return np.stack([oklab[:, 0], chroma, hue], axis=1)
+
+
+def oklch_to_oklab_array(oklch: np.ndarray) -> np.ndarray:
+    """
+    Convert (N, 3) OKLCH rows to OKLab.
+
+    Args:
+        oklch: (N, 3) float array of (L, C, h) with hue in degrees
+
+    Returns:
+        (N, 3) float64 array of (L, a, b)
+    """
+    oklch = np.asarray(oklch, dtype=np.float64)
+    radians = np.radians(oklch[:, 2])
+    return np.stack([oklch[:, 0], oklch[:, 1] * np.cos(radians), oklch[:, 1] * np.sin(radians)], axis=1)
@@ -0,0 +1,308 @@
+"""
+Append-only journal persistence for palette collections.
+
+Rewriting the whole palettes file on every edit makes save time grow with the
+collection. A PaletteJournal instead appends each edit as one small JSON line
+next to a snapshot file, and only rewrites the snapshot when compacting.
+Loading reads the snapshot and replays the journal on top of it.
+
+Snapshots hold ``{"palettes": [...], "sequence": n}``; every journal record
+carries a sequence number, so records already folded into the snapshot are
+skipped if a compaction was interrupted before the journal was cleared.
+A torn last line from an interrupted append is dropped on load.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+
+# Configure logging
+logger = logging.getLogger("palette_journal")
+
+# Suffix appended to the snapshot path to name its journal
+JOURNAL_SUFFIX = ".journal"
+
+# Suffix appended to files moved aside because they could not be loaded
+CORRUPT_SUFFIX = ".corrupt"
+
+# Records appended before compaction is due
+DEFAULT_COMPACT_EVERY = 500
+
+# Record operations and the fields each one needs besides "op" and "seq"
+JOURNAL_OPS = {
+    "add": ("palette",),
+    "remove": ("id",),
+    "update_color": ("id", "index", "color"),
+    "add_color": ("id", "color"),
+    "remove_color": ("id", "index"),
+    "rename": ("id", "name"),
+    "update": ("id", "fields"),
+    "clear": (),
+}
+
+
+def _check_record(record: Any) -> None:
+    """
+    Validate the structure of a journal record.
+
+    Args:
+        record: Decoded journal line
+
+    Raises:
+        ValueError: If the record has an unknown operation or misses a field
+    """
+    if not isinstance(record, dict) or record.get("op") not in JOURNAL_OPS or not isinstance(record.get("seq"), int):
+        raise ValueError(f"Invalid journal record: {record!r}")
+    missing = [field for field in JOURNAL_OPS[record["op"]] if field not in record]
+    if missing:
+        raise ValueError(f"Journal record {record['op']!r} is missing {', '.join(missing)}")
+    palette = record.get("palette")
+    if record["op"] == "add" and not (isinstance(palette, dict) and "id" in palette and "colors" in palette):
+        raise ValueError(f"Journal record 'add' needs a palette with an id and colors, got {palette!r}")
+
+
+def apply_record(palettes: Dict[str, Dict[str, Any]], record: Dict[str, Any]) -> None:
+    """
+    Apply one journal record to palette dictionaries keyed by ID.
+
+    Adding an existing ID replaces that palette in place; edits to palettes
+    or slots that do not exist are ignored.
+
+    Args:
+        palettes: Palette dictionaries keyed by ID, in collection order; updated in place
+        record: Journal record
+
+    Raises:
+        ValueError: If the record is invalid
+    """
+    _check_record(record)
+    op = record["op"]
+    if op == "add":
+        palette = record["palette"]
+        palettes[palette["id"]] = dict(palette, colors=list(palette["colors"]))
+    elif op == "remove":
+        palettes.pop(record["id"], None)
+    elif op == "clear":
+        palettes.clear()
+    elif record["id"] in palettes:
+        palette = palettes[record["id"]]
+        if op == "rename":
+            palette["name"] = record["name"]
+        elif op == "update":
+            palette.update(record["fields"])
+        elif op == "add_color":
+            palette["colors"].append(record["color"])
+        elif not 0 <= record["index"] < len(palette["colors"]):
+            return
+        elif op == "remove_color":
+            del palette["colors"][record["index"]]
+        else:
+            palette["colors"][record["index"]] = record["color"]
+
+
+class PaletteJournal:
+    """
+    Snapshot file plus an append-only journal of palette edits.
+
+    Callers append one record per edit and call ``compact`` with their
+    current palettes when ``needs_compaction`` is set, which keeps each save
+    independent of the collection size while bounding the replay on load.
+    """
+
+    def __init__(self, file_path: Union[str, Path], compact_every: int = DEFAULT_COMPACT_EVERY) -> None:
+        """
+        Initialize the journal.
+
+        Args:
+            file_path: Snapshot file; the journal lives next to it with JOURNAL_SUFFIX
+            compact_every: Number of appended records after which compaction is due
+
+        Raises:
+            ValueError: If compact_every is not positive
+        """
+        if compact_every < 1:
+            raise ValueError(f"Compaction interval must be positive, got {compact_every}")
+        self.file_path = Path(file_path)
+        self.journal_path = self.file_path.with_name(self.file_path.name + JOURNAL_SUFFIX)
+        self.compact_every = compact_every
+        self._sequence = 0
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Get the number of records appended since the last snapshot."""
+        return self._pending
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Check whether enough records have piled up to write a new snapshot."""
+        return self._pending >= self.compact_every
+
+    def exists(self) -> bool:
+        """Check whether a snapshot or a journal is on disk."""
+        return self.file_path.exists() or self.journal_path.exists()
+
+    def set_aside(self) -> List[Path]:
+        """
+        Move the snapshot and journal aside after they failed to load.
+
+        Each file is renamed with CORRUPT_SUFFIX, replacing an earlier one, so
+        that the next snapshot does not overwrite data that may be recovered
+        by hand. The journal starts over empty.
+
+        Returns:
+            New paths of the files that were moved
+
+        Raises:
+            OSError: If a file cannot be renamed
+        """
+        moved = []
+        for path in (self.file_path, self.journal_path):
+            if path.exists():
+                target = path.with_name(path.name + CORRUPT_SUFFIX)
+                os.replace(path, target)
+                moved.append(target)
+                logger.warning(f"Moved unreadable palette data to {target}")
+        self._sequence = 0
+        self._pending = 0
+        return moved
+
+    def load(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load the snapshot and replay the journal on top of it.
+
+        A snapshot may also be a bare list of palettes, as written before
+        journaling. Replay stops at the first unreadable record, and the
+        journal is cut back to the last good record so later appends stay
+        readable.
+
+        Returns:
+            Palette dictionaries in collection order, or None if nothing is on disk
+
+        Raises:
+            OSError: If a file cannot be read
+            ValueError: If the snapshot is not valid palette data
+        """
+        if not self.exists():
+            return None
+
+        palettes: Dict[str, Dict[str, Any]] = {}
+        snapshot_sequence = 0
+        if self.file_path.exists():
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                snapshot_sequence = int(data.get("sequence", 0))
+                data = data.get("palettes")
+            if not isinstance(data, list):
+                raise ValueError(f"Invalid palette snapshot: {self.file_path}")
+            for palette in data:
+                apply_record(palettes, {"op": "add", "seq": 0, "palette": palette})
+
+        self._sequence = snapshot_sequence
+        self._pending = 0
+        if self.journal_path.exists():
+            valid_size = 0
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        logger.warning(f"Dropped an incomplete record at the end of {self.journal_path}")
+                        break
+                    try:
+                        record = json.loads(line)
+                        if record["seq"] > snapshot_sequence:
+                            apply_record(palettes, record)
+                            self._pending += 1
+                        self._sequence = max(self._sequence, record["seq"])
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.warning(f"Stopped replaying {self.journal_path} at a bad record: {e}")
+                        break
+                    valid_size += len(line)
+            if valid_size < self.journal_path.stat().st_size:
+                os.truncate(self.journal_path, valid_size)
+
+        return list(palettes.values())
+
+    def append(self, op: str, **fields: Any) -> None:
+        """
+        Append one record to the journal.
+
+        Args:
+            op: Operation, one of JOURNAL_OPS
+            **fields: Fields of the operation
+
+        Raises:
+            OSError: If the journal cannot be written
+            ValueError: If the record is invalid
+        """
+        record = {"seq": self._sequence + 1, "op": op, **fields}
+        _check_record(record)
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(line)
+        self._sequence += 1
+        self._pending += 1
+
+    def add(self, palette: Dict[str, Any]) -> None:
+        """Record a palette being added, or replaced if its ID exists."""
+        self.append("add", palette=palette)
+
+    def remove(self, palette_id: str) -> None:
+        """Record a palette being removed."""
+        self.append("remove", id=palette_id)
+
+    def update_color(self, palette_id: str, index: int, color: str) -> None:
+        """Record one color slot of a palette being changed."""
+        self.append("update_color", id=palette_id, index=index, color=color)
+
+    def add_color(self, palette_id: str, color: str) -> None:
+        """Record a color being appended to a palette."""
+        self.append("add_color", id=palette_id, color=color)
+
+    def remove_color(self, palette_id: str, index: int) -> None:
+        """Record one color slot being removed from a palette."""
+        self.append("remove_color", id=palette_id, index=index)
+
+    def rename(self, palette_id: str, name: str) -> None:
+        """Record a palette being renamed."""
+        self.append("rename", id=palette_id, name=name)
+
+    def update(self, palette_id: str, fields: Dict[str, Any]) -> None:
+        """Record other fields of a palette being changed."""
+        self.append("update", id=palette_id, fields=fields)
+
+    def clear(self) -> None:
+        """Record every palette being removed."""
+        self.append("clear")
+
+    def compact(self, palettes: List[Dict[str, Any]]) -> None:
+        """
+        Write the current palettes as a new snapshot and empty the journal.
+
+        The snapshot is written to a temporary file and moved into place, so
+        an interruption leaves either the old or the new snapshot; records it
+        already contains are skipped on the next load by sequence number.
+
+        Args:
+            palettes: Current palette dictionaries, in collection order
+
+        Raises:
+            OSError: If the files cannot be written
+        """
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.file_path.with_name(f"{self.file_path.name}.{os.getpid()}.tmp")
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({"palettes": palettes, "sequence": self._sequence}, f, indent=2)
+        os.replace(temporary, self.file_path)
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+        self._pending = 0
+        logger.info(f"Compacted palette journal into {self.file_path}")
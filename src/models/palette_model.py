@@ -15,11 +15,15 @@ from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Union
 
 from textual.message import Message
 
 from .color_model import Color
+from .palette_journal import DEFAULT_COMPACT_EVERY
+from .palette_journal import PaletteJournal
 
 
 # Configure logging
@@ -94,7 +98,7 @@ class Palette:
     """
 
     def __init__(
-        self, name: str, colors: Optional[List[Union[str, Color]]] = None, palette_id: Optional[str] = None
+        self, name: str, colors: Optional[Sequence[Union[str, Color]]] = None, palette_id: Optional[str] = None
     ) -> None:
         """
         Initialize a Palette instance.
@@ -114,11 +118,11 @@ class Palette:
                 if isinstance(color, Color):
                     self._colors.append(color)
                 else:
-                    self._colors.append(Color(color))
+                    self._colors.append(Color.intern(color))
 
         # Ensure palette has at least 8 colors
         while len(self._colors) < 8:
-            self._colors.append(Color("#FFFFFF"))
+            self._colors.append(Color.intern("#FFFFFF"))
 
     @property
     def colors(self) -> List[Color]:
@@ -150,7 +154,7 @@ class Palette:
         if isinstance(color, Color):
             self._colors.append(color)
         else:
-            self._colors.append(Color(color))
+            self._colors.append(Color.intern(color))
 
     def remove_color(self, index: int) -> Optional[Color]:
         """
@@ -176,7 +180,7 @@ class Palette:
             True if the color was updated, False otherwise
         """
         if 0 <= index < len(self._colors):
-            self._colors[index] = color if isinstance(color, Color) else Color(color)
+            self._colors[index] = color if isinstance(color, Color) else Color.intern(color)
             return True
         return False
 
@@ -330,7 +334,7 @@ class PaletteModel:
         """
         if self.active_palette and 0 <= self._active_color_index < len(self.active_palette):
             palette = self.active_palette
-            palette.update_color(self._active_color_index, color)
+            self._collection.update_color(palette.palette_id, self._active_color_index, color)
 
             # Post message about color update
             self.post_message(
@@ -404,7 +408,7 @@ class PaletteModel:
         """
         if self.active_palette:
             palette = self.active_palette
-            palette.name = name
+            self._collection.rename_palette(palette.palette_id, name)
 
             # Post message about palette update
             self.post_message(PaletteUpdated(palette_id=palette.palette_id))
@@ -442,6 +446,8 @@ class PaletteCollection:
 
     This class provides methods for adding, removing, and retrieving palettes,
     as well as loading and saving palette collections to and from files.
+    A collection opened with ``open_journal`` also appends each change made
+    through its methods to a PaletteJournal.
     """
 
     def __init__(self, palettes: Optional[List[Palette]] = None) -> None:
@@ -452,6 +458,7 @@ class PaletteCollection:
             palettes: Initial list of palettes
         """
         self._palettes: Dict[str, Palette] = {}
+        self._journal: Optional[PaletteJournal] = None
 
         if palettes:
             for palette in palettes:
@@ -483,6 +490,7 @@ class PaletteCollection:
             palette: Palette to add
         """
         self._palettes[palette.palette_id] = palette
+        self._record("add", palette=palette.to_dict())
 
     def remove_palette(self, palette_id: str) -> Optional[Palette]:
         """
@@ -494,7 +502,83 @@ class PaletteCollection:
         Returns:
             The removed palette, or None if the palette was not found
         """
-        return self._palettes.pop(palette_id, None)
+        palette = self._palettes.pop(palette_id, None)
+        if palette is not None:
+            self._record("remove", id=palette_id)
+        return palette
+
+    def update_color(self, palette_id: str, index: int, color: Union[str, Color]) -> bool:
+        """
+        Update a color in one of the palettes.
+
+        Args:
+            palette_id: ID of the palette to update
+            index: Index of the color to update
+            color: New color (hex string or Color instance)
+
+        Returns:
+            True if the color was updated, False otherwise
+        """
+        palette = self._palettes.get(palette_id)
+        if palette is None or not palette.update_color(index, color):
+            return False
+        self._record("update_color", id=palette_id, index=index, color=palette[index].hex)
+        return True
+
+    def add_color(self, palette_id: str, color: Union[str, Color]) -> bool:
+        """
+        Add a color to one of the palettes.
+
+        Args:
+            palette_id: ID of the palette to extend
+            color: Color to add (hex string or Color instance)
+
+        Returns:
+            True if the color was added, False if the palette was not found
+        """
+        palette = self._palettes.get(palette_id)
+        if palette is None:
+            return False
+        palette.add_color(color)
+        self._record("add_color", id=palette_id, color=palette[-1].hex)
+        return True
+
+    def remove_color(self, palette_id: str, index: int) -> Optional[Color]:
+        """
+        Remove a color from one of the palettes.
+
+        Args:
+            palette_id: ID of the palette to shrink
+            index: Index of the color to remove
+
+        Returns:
+            The removed color, or None if the palette or index is invalid
+        """
+        palette = self._palettes.get(palette_id)
+        if palette is None:
+            return None
+        removed = palette.remove_color(index)
+        if removed is not None:
+            self._record("remove_color", id=palette_id, index=index)
+        return removed
+
+    def rename_palette(self, palette_id: str, name: str) -> bool:
+        """
+        Rename one of the palettes.
+
+        Args:
+            palette_id: ID of the palette to rename
+            name: New name for the palette
+
+        Returns:
+            True if the palette was renamed, False if it was not found
+        """
+        palette = self._palettes.get(palette_id)
+        if palette is None:
+            return False
+        palette.name = name
+        self._record("rename", id=palette_id, name=name)
+        return True
 
     def get_palette(self, palette_id: str) -> Optional[Palette]:
         """
@@ -523,6 +607,35 @@ class PaletteCollection:
     def clear(self) -> None:
         """Clear all palettes from the collection."""
         self._palettes.clear()
+        self._record("clear")
+
+    def find_similar_colors(
+        self, threshold: float = 2.3, method: str = "ciede2000"
+    ) -> List[Tuple[Tuple[str, int], Tuple[str, int], float]]:
+        """
+        Find pairs of colors across all palettes that are perceptually similar.
+
+        Args:
+            threshold: Maximum color difference for a pair to be reported
+            method: Difference formula: "cie76", "cie94" or "ciede2000"
+
+        Returns:
+            List of ((palette_id, index), (palette_id, index), difference) tuples,
+            ordered by position in the collection
+
+        Raises:
+            ValueError: If the method is not supported
+        """
+        from ..utils.color_difference import find_similar_pairs
+
+        locations = [
+            (palette.palette_id, index) for palette in self._palettes.values() for index in range(len(palette.colors))
+        ]
+        colors = [color for palette in self._palettes.values() for color in palette.colors]
+        if not colors:
+            return []
+        pairs = sorted(find_similar_pairs(colors, threshold, method))
+        return [(locations[i], locations[j], difference) for i, j, difference in pairs]
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -603,6 +716,102 @@ class PaletteCollection:
             logger.error(f"Failed to load palette collection: {e}")
             return None
 
+    @classmethod
+    def open_journal(cls, file_path: str, compact_every: int = DEFAULT_COMPACT_EVERY) -> "PaletteCollection":
+        """
+        Load a palette collection from a snapshot and journal, and keep journaling changes.
+
+        Later changes made through the collection's methods are appended to
+        the journal instead of rewriting the file, and the journal is folded
+        into a new snapshot every ``compact_every`` records. Files written by
+        ``save_to_file`` can be opened as snapshots; files that fail to load
+        are moved aside with a ``.corrupt`` suffix and a default collection is used.
+
+        Args:
+            file_path: Snapshot file; the journal lives next to it
+            compact_every: Number of journal records after which a new snapshot is written
+
+        Returns:
+            The loaded collection, or a default collection if nothing could be loaded
+        """
+        journal = PaletteJournal(file_path, compact_every)
+        collection = None
+        try:
+            data = journal.load()
+            if data is not None:
+                collection = cls([Palette.from_dict(palette_data) for palette_data in data])
+                logger.info(f"Loaded palette collection from {file_path}")
+        except Exception as e:
+            logger.error(f"Failed to load palette collection: {e}")
+            # Keep the unreadable files for recovery instead of compacting over them
+            try:
+                journal.set_aside()
+            except OSError as move_error:
+                logger.error(f"Failed to move aside unreadable palette data, not journaling: {move_error}")
+                return cls()
+
+        if collection is None:
+            collection = cls()
+        collection._journal = journal
+
+        # Start a new file with a snapshot
+        if not journal.exists():
+            collection.compact_journal()
+        return collection
+
+    @property
+    def journaled(self) -> bool:
+        """Whether changes to the collection are appended to a journal."""
+        return self._journal is not None
+
+    def attach_journal(self, file_path: str, compact_every: int = DEFAULT_COMPACT_EVERY) -> bool:
+        """
+        Start journaling changes, writing the current palettes as the first snapshot.
+
+        Args:
+            file_path: Snapshot file; the journal lives next to it
+            compact_every: Number of journal records after which a new snapshot is written
+
+        Returns:
+            True if the snapshot was written, False otherwise
+        """
+        self._journal = PaletteJournal(file_path, compact_every)
+        return self.compact_journal()
+
+    def compact_journal(self) -> bool:
+        """
+        Write the whole collection as a new snapshot and empty the journal.
+
+        Returns:
+            True if the snapshot was written, False if it failed or no journal is open
+        """
+        if self._journal is None:
+            return False
+        try:
+            self._journal.compact(self.to_dict()["palettes"])
+            return True
+        except Exception as e:
+            logger.error(f"Failed to compact palette journal: {e}")
+            return False
+
+    def _record(self, op: str, **fields: Any) -> None:
+        """
+        Append a change to the open journal, compacting it when due.
+
+        Args:
+            op: Journal operation
+            **fields: Fields of the operation
+        """
+        if self._journal is None:
+            return
+        try:
+            self._journal.append(op, **fields)
+        except Exception as e:
+            logger.error(f"Failed to journal palette change: {e}")
+            return
+        if self._journal.needs_compaction:
+            self.compact_journal()
+
     def __len__(self) -> int:
         """Get the number of palettes in the collection."""
         return len(self._palettes)
@@ -3,6 +3,7 @@ Color accessibility testing screen for the Palette Milker application.
 
 This screen provides tools for checking color accessibility compliance
 with WCAG standards and improving color combinations for better accessibility.
+Contrast can be shown as the WCAG 2.0 ratio or as APCA lightness contrast.
 """
 
 from typing import ClassVar
@@ -28,8 +29,11 @@ from textual.widgets import Static
 
 from ..models.color_model import Color
 from ..models.palette_model import Palette
-from ..utils.color_accessibility import calculate_contrast_ratio
-from ..utils.color_accessibility import get_wcag_compliance
+from ..utils.accessibility_index import AccessibilityIndex
+from ..utils.color_accessibility import CONTRAST_METHODS
+from ..utils.color_accessibility import calculate_contrast
+from ..utils.color_accessibility import format_contrast
+from ..utils.color_accessibility import get_compliance
 from ..utils.color_accessibility import is_color_blind_friendly
 from ..utils.color_accessibility import optimize_text_color
 from ..utils.color_accessibility import suggest_accessible_alternatives
@@ -67,8 +71,16 @@ class AccessibilityScreen(Screen):
         # Suggestions
         Binding("s", "suggest_improvements", "Suggest changes"),
         Binding("o", "optimize_text", "Optimize text"),
+        # Contrast metric
+        Binding("m", "toggle_method", "WCAG/APCA"),
     ]
 
+    # Display labels for each contrast metric: (value label, normal level label, strict level label)
+    METHOD_LABELS: ClassVar[Dict[str, Tuple[str, str, str]]] = {
+        "wcag": ("Contrast Ratio:", "WCAG AA (Normal):", "WCAG AAA (Normal):"),
+        "apca": ("APCA Contrast:", "APCA Lc 60 (Text):", "APCA Lc 75 (Body):"),
+    }
+
     DEFAULT_CSS = """
     AccessibilityScreen {
         background: $surface;
@@ -215,20 +227,36 @@ class AccessibilityScreen(Screen):
     # Reactive properties
     foreground_color: reactive[Color] = reactive(Color("#000000"))
     background_color: reactive[Color] = reactive(Color("#FFFFFF"))
+    contrast_method: reactive[str] = reactive("wcag")
     contrast_ratio: reactive[float] = reactive(21.0)
     wcag_compliance: reactive[Dict[str, bool]] = reactive({})
     color_blind_friendly: reactive[Dict[str, bool]] = reactive({})
     suggestions: reactive[List[Dict]] = reactive([])
 
-    def __init__(self, palette: Optional[Palette] = None):
+    def __init__(
+        self, palette: Optional[Palette] = None, method: str = "wcag", index: Optional[AccessibilityIndex] = None
+    ):
         """
         Initialize the accessibility screen.
 
         Args:
             palette: Optional palette to use for color selection
+            method: Contrast metric to display: "wcag" or "apca"
+            index: Shared accessibility index for the palette; built from the palette if omitted
+
+        Raises:
+            ValueError: If the method is invalid
         """
         super().__init__()
+        if method not in CONTRAST_METHODS:
+            raise ValueError(f"Unsupported contrast method: {method}")
         self.palette = palette
+        self.set_reactive(AccessibilityScreen.contrast_method, method)
+
+        # Contrast between every pair of palette colors, updated one color at a time
+        self._accessibility_index = index
+        if palette and index is None:
+            self._accessibility_index = AccessibilityIndex(palette)
 
         # If a palette is provided, use its first two colors
         if palette and len(palette.colors) >= 2:
@@ -295,6 +323,7 @@ class AccessibilityScreen(Screen):
             with Container(id="contrast-info"):
                 yield Static("Contrast and Compliance", classes="info-label")
 
+                value_label, normal_label, strict_label = self.METHOD_LABELS[self.contrast_method]
                 with Grid(classes="info-grid"):
                     # Foreground color
                     yield Static("Foreground:", classes="info-label info-item")
@@ -305,18 +334,18 @@ class AccessibilityScreen(Screen):
                     yield Static(self.background_color.hex, classes="info-value info-item")
 
                     # Contrast ratio
-                    yield Static("Contrast Ratio:", classes="info-label info-item")
-                    ratio_text = f"{self.contrast_ratio:.2f}:1"
+                    yield Static(value_label, id="contrast-label", classes="info-label info-item")
+                    ratio_text = format_contrast(self.contrast_ratio, self.contrast_method)
                     yield Static(ratio_text, classes="info-value info-item")
 
                     # WCAG AA (normal text)
-                    yield Static("WCAG AA (Normal):", classes="info-label info-item")
+                    yield Static(normal_label, id="normal-label", classes="info-label info-item")
                     aa_class = "pass" if self.wcag_compliance.get("AA_normal", False) else "fail"
                     aa_symbol = "✓" if self.wcag_compliance.get("AA_normal", False) else "✗"
                     yield Static(aa_symbol, classes=f"info-value info-item {aa_class}")
 
                     # WCAG AAA (normal text)
-                    yield Static("WCAG AAA (Normal):", classes="info-label info-item")
+                    yield Static(strict_label, id="strict-label", classes="info-label info-item")
                     aaa_class = "pass" if self.wcag_compliance.get("AAA_normal", False) else "fail"
                     aaa_symbol = "✓" if self.wcag_compliance.get("AAA_normal", False) else "✗"
                     yield Static(aaa_symbol, classes=f"info-value info-item {aaa_class}")
@@ -356,6 +385,13 @@ class AccessibilityScreen(Screen):
         if old_color != new_color:
             self._extracted_from_watch_background_color_4()
 
+    def watch_contrast_method(self, old_method: str, new_method: str) -> None:
+        """React to contrast metric changes."""
+        if old_method != new_method:
+            self._update_accessibility_data()
+            self._update_preview()
+            self._update_suggestions()
+
     # TODO Rename this here and in `watch_foreground_color` and `watch_background_color`
     def _extracted_from_watch_background_color_4(self) -> None:
         """Update data and UI after a color change."""
@@ -365,17 +401,29 @@ class AccessibilityScreen(Screen):
 
     def _update_accessibility_data(self) -> None:
         """Update all accessibility data for the current color pair."""
-        # Calculate contrast ratio
-        self.contrast_ratio = calculate_contrast_ratio(self.foreground_color, self.background_color)
+        # Look up the contrast when both colors come from the palette
+        index = self._accessibility_index
+        fg_index = bg_index = None
+        if index is not None:
+            index.sync()
+            fg_index = index.index_of(self.foreground_color)
+            bg_index = index.index_of(self.background_color)
+        if index is not None and fg_index is not None and bg_index is not None:
+            self.contrast_ratio = index.contrast(fg_index, bg_index, self.contrast_method)
+        else:
+            self.contrast_ratio = calculate_contrast(self.foreground_color, self.background_color, self.contrast_method)
 
-        # Check WCAG compliance
-        self.wcag_compliance = get_wcag_compliance(self.contrast_ratio)
+        # Check compliance with the selected metric
+        self.wcag_compliance = get_compliance(self.contrast_ratio, self.contrast_method)
 
         # Check color blind friendliness
         self.color_blind_friendly = is_color_blind_friendly(self.foreground_color, self.background_color)
 
-        # Generate suggestions
-        self.suggestions = suggest_accessible_alternatives(self.foreground_color, self.background_color, 4.5)
+        # Generate suggestions; they solve for the WCAG ratio, so APCA mode shows none
+        if self.contrast_method == "wcag":
+            self.suggestions = suggest_accessible_alternatives(self.foreground_color, self.background_color, 4.5)
+        else:
+            self.suggestions = []
 
     def _update_preview(self) -> None:
         """Update the preview box with current colors."""
@@ -391,7 +439,12 @@ class AccessibilityScreen(Screen):
             # Update contrast and compliance info
             ratio_value = self.query_one(".info-grid .info-value", Static)
             if ratio_value:
-                ratio_value.update(f"{self.contrast_ratio:.2f}:1")
+                ratio_value.update(format_contrast(self.contrast_ratio, self.contrast_method))
+
+            # Update the labels for the selected metric
+            labels = self.METHOD_LABELS[self.contrast_method]
+            for label_id, label in zip(("#contrast-label", "#normal-label", "#strict-label"), labels, strict=True):
+                self.query_one(label_id, Static).update(label)
 
             # Update WCAG compliance indicators
             info_values = list(self.query(".info-grid .info-value").results(Static))
@@ -401,7 +454,7 @@ class AccessibilityScreen(Screen):
                 info_values[1].update(self.background_color.hex)
 
                 # Contrast ratio
-                info_values[2].update(f"{self.contrast_ratio:.2f}:1")
+                info_values[2].update(format_contrast(self.contrast_ratio, self.contrast_method))
 
                 self._extracted_from__update_preview_28("AA_normal", info_values, 3)
                 self._extracted_from__update_preview_28("AAA_normal", info_values, 4)
@@ -438,7 +491,12 @@ class AccessibilityScreen(Screen):
             # If contrast is already compliant, show a message
             if not self.suggestions:
                 if self.wcag_compliance.get("AA_normal", False):
-                    container.mount(Static("✓ Current contrast meets WCAG AA standards", classes="pass"))
+                    standard = "APCA Lc 60" if self.contrast_method == "apca" else "WCAG AA"
+                    container.mount(Static(f"✓ Current contrast meets {standard} standards", classes="pass"))
+                elif self.contrast_method == "apca":
+                    container.mount(
+                        Static("Suggestions target the WCAG ratio; press m to switch to WCAG", classes="fail")
+                    )
                 else:
                     container.mount(Static("No suggestions available", classes="fail"))
                 return
@@ -590,6 +648,12 @@ class AccessibilityScreen(Screen):
         # Notify user
         self.notify("Swapped foreground and background colors")
 
+    def action_toggle_method(self) -> None:
+        """Switch between the WCAG 2.0 ratio and APCA lightness contrast."""
+        index = CONTRAST_METHODS.index(self.contrast_method)
+        self.contrast_method = CONTRAST_METHODS[(index + 1) % len(CONTRAST_METHODS)]
+        self.notify(f"Showing {self.contrast_method.upper()} contrast")
+
     def action_suggest_improvements(self) -> None:
         """Generate new suggestions for the current color pair."""
         self._update_accessibility_data()
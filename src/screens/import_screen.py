@@ -2,9 +2,15 @@
 Import screen for the Palette Milker application.
 
 This screen provides options for importing palettes from various sources.
+Images are imported progressively in a background worker: a preview from a
+tiny thumbnail is shown first, then refined by a full extraction.
 """
 
 import os
+import uuid
+from datetime import datetime
+from functools import partial
+from pathlib import Path
 from typing import Any
 from typing import ClassVar
 from typing import Dict
@@ -14,6 +20,7 @@ from typing import Tuple
 from typing import Union
 from typing import cast
 
+from PIL import Image
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container
@@ -24,11 +31,27 @@ from textual.widgets import Footer
 from textual.widgets import Header
 from textual.widgets import Label
 from textual.widgets import Static
-
+from textual.worker import Worker
+from textual.worker import WorkerState
+from textual.worker import get_current_worker
+
+from ..utils.color_extraction import DEFAULT_SCENE_THRESHOLD
+from ..utils.color_extraction import extract_colors_streaming
+from ..utils.color_extraction import extract_frame_palettes
+from ..utils.color_extraction import is_multi_frame
+from ..utils.color_extraction import preview_colors
+from ..utils.image_batch import IMAGE_EXTENSIONS
 from ..utils.serialization import import_palette_from_file
 from .base_screen import BaseScreen
 
 
+# Number of colors extracted from an imported image
+IMAGE_COLOR_COUNT = 8
+
+# Worker group of the background image extraction; starting a new one cancels the previous
+IMAGE_WORKER_GROUP = "image-extraction"
+
+
 class ImportFileMessage(Message):
     """Message to request a file import operation."""
 
@@ -86,6 +109,8 @@ class ImportScreen(BaseScreen):
 
         # Initialize variables
         self._imported_palette: Optional[Dict[str, Any]] = None  # Stores the currently imported palette
+        self._refining_image: Optional[str] = None  # Image whose full extraction is still running
+        self._previewed_image: Optional[str] = None  # Image whose preview is on screen while it is refined
 
         # Default UI state
         self._import_status = "Awaiting import"
@@ -114,10 +139,13 @@ class ImportScreen(BaseScreen):
             # Preview area for imported palette
             with Container(id="preview-container"):
                 yield Static("Preview", id="preview-title")
+                yield Static("", id="palette-name")
 
                 with Container(id="palette-preview"):
                     yield Static("No palette imported yet", id="no-palette-message")
 
+                yield Static("", id="palette-info")
+
                 # Import action buttons
                 with Horizontal(id="action-buttons"):
                     yield Button("Add to My Palettes", id="add-palette-button", variant="primary")
@@ -152,7 +180,8 @@ class ImportScreen(BaseScreen):
         """Import a palette from a file."""
         # Define file filters for the dialog
         file_filters = {
-            "All Supported Formats": ["*.json", "*.css", "*.scss", "*.less", "*.gpl", "*.ase", "*.txt"],
+            "All Supported Formats": ["*.json", "*.css", "*.scss", "*.less", "*.gpl", "*.ase", "*.txt"]
+            + [f"*{extension}" for extension in IMAGE_EXTENSIONS],
             "JSON Files": ["*.json"],
             "CSS Files": ["*.css"],
             "SCSS Files": ["*.scss"],
@@ -160,6 +189,7 @@ class ImportScreen(BaseScreen):
             "GIMP Palette": ["*.gpl"],
             "Adobe Swatch Exchange": ["*.ase"],
             "Text Files": ["*.txt"],
+            "Images": [f"*{extension}" for extension in IMAGE_EXTENSIONS],
             "All Files": ["*.*"],
         }
 
@@ -173,6 +203,11 @@ class ImportScreen(BaseScreen):
 
     def _process_import_file(self, file_path: str) -> None:
         """Process the imported file."""
+        # Picking another file abandons any image still being refined
+        self._cancel_image_extraction()
+        if Path(file_path).suffix.lower() in IMAGE_EXTENSIONS:
+            self._process_import_image(file_path)
+            return
 
         def import_operation() -> Dict[str, Any]:
             """
@@ -208,6 +243,144 @@ class ImportScreen(BaseScreen):
             self._display_palette_preview(cast(Dict[str, Any], palette))
             self.show_status(f"Imported palette: {palette.get('name', 'Unnamed')}", "success")
 
+    def _process_import_image(self, file_path: str) -> None:
+        """
+        Import an image progressively.
+
+        A background worker first extracts a preview from a tiny thumbnail and
+        posts it to the screen, then runs a full resolution extraction that
+        replaces the preview when it completes. Only the display updates run
+        on the UI thread.
+
+        Args:
+            file_path: Path to the image file
+        """
+        self.show_status(f"Reading {Path(file_path).name}...", "information")
+
+        # Exclusive workers cancel any earlier extraction in the same group
+        self._refining_image = file_path
+        self._previewed_image = None
+        self.run_worker(
+            partial(self._extract_image_palette, file_path),
+            name=file_path,
+            group=IMAGE_WORKER_GROUP,
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _extract_image_palette(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract a preview and then the full palette of an image, in a worker thread.
+
+        Args:
+            file_path: Path to the image file
+
+        Returns:
+            The refined palette data, or None if the worker was cancelled
+
+        Raises:
+            ValueError: If the image has no opaque pixels
+        """
+        worker = get_current_worker()
+        colors = preview_colors(file_path, IMAGE_COLOR_COUNT)
+        if not colors:
+            raise ValueError("No opaque pixels found in image")
+        if worker.is_cancelled:
+            return None
+
+        preview = {
+            "id": str(uuid.uuid4()),
+            "name": Path(file_path).stem,
+            "colors": [color.hex for color in colors],
+            "createdAt": datetime.now().isoformat(),
+        }
+        self.app.call_from_thread(self._show_image_preview, file_path, preview)
+        return self._refine_image_palette(file_path, preview)
+
+    def _show_image_preview(self, file_path: str, preview: Dict[str, Any]) -> None:
+        """
+        Display the preview palette of an image whose extraction is still running.
+
+        Args:
+            file_path: Path to the image file
+            preview: Preview palette data
+        """
+        if file_path != self._refining_image:
+            return
+        self._previewed_image = file_path
+        self._display_palette_preview(preview)
+        self.show_status(f"Previewing {preview['name']}, refining colors...", "information")
+
+    def _refine_image_palette(self, file_path: str, preview: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Extract the full palette of an image, in a worker thread.
+
+        Animated and multi-page images merge the frames that start a new
+        scene; still images are read band by band.
+
+        Args:
+            file_path: Path to the image file
+            preview: Preview palette to refine; its ID and name are kept
+
+        Returns:
+            The refined palette data, or None if the worker was cancelled
+        """
+        worker = get_current_worker()
+        with Image.open(file_path) as image:
+            multi_frame = is_multi_frame(image)
+        if multi_frame:
+            colors, _ = extract_frame_palettes(
+                file_path,
+                IMAGE_COLOR_COUNT,
+                scene_threshold=DEFAULT_SCENE_THRESHOLD,
+                per_frame=False,
+                cancelled=lambda: worker.is_cancelled,
+            )
+        else:
+            colors = extract_colors_streaming(file_path, IMAGE_COLOR_COUNT, cancelled=lambda: worker.is_cancelled)
+        if worker.is_cancelled or not colors:
+            return None
+        return {**preview, "colors": [color.hex for color in colors]}
+
+    def _cancel_image_extraction(self) -> None:
+        """Cancel the background extraction of the previous image, if any."""
+        self._refining_image = None
+        self._previewed_image = None
+        self.workers.cancel_group(self, IMAGE_WORKER_GROUP)
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """
+        Replace the preview with the refined palette when its extraction completes.
+
+        Args:
+            event: The worker state changed event
+        """
+        worker = event.worker
+        if worker.group != IMAGE_WORKER_GROUP or worker.name != self._refining_image:
+            return
+
+        if event.state == WorkerState.SUCCESS and worker.result is not None:
+            self._refining_image = None
+            self._display_palette_preview(worker.result)
+            self.show_status(f"Imported palette: {worker.result['name']}", "success")
+        elif event.state == WorkerState.ERROR and self._previewed_image == worker.name:
+            # The preview stays usable when the full extraction fails
+            self._refining_image = None
+            self.show_status(f"Could not refine colors, keeping preview: {worker.error}", "warning")
+        elif event.state == WorkerState.ERROR:
+            self._refining_image = None
+            error = worker.error
+            self.handle_error(
+                message=f"Failed to read image {worker.name}: {error!s}",
+                exception=error if isinstance(error, Exception) else None,
+                context={"file_path": worker.name},
+            )
+
+    def on_unmount(self) -> None:
+        """Stop any background extraction when the screen is removed."""
+        self._cancel_image_extraction()
+
     def _process_clipboard_content(self, content: str) -> None:
         """Process clipboard content to extract colors."""
 
@@ -300,8 +473,11 @@ class ImportScreen(BaseScreen):
         palette_name_widget = self.query_one("#palette-name", Static)
         palette_name_widget.update(palette_name)
 
-        # Find the palette preview container
+        # Find the palette preview container and show it with the add button
         preview_container = self.query_one("#palette-preview", Container)
+        preview_container.display = True
+        self.query_one("#no-palette-message", Static).display = False
+        self.query_one("#add-palette-button", Button).display = True
 
         # Clear existing swatches
         for child in list(preview_container.children):
@@ -3,12 +3,15 @@ Palette organization screen for the Palette Milker application.
 
 This screen provides a comprehensive interface for managing palettes,
 including options to create, rename, duplicate, delete, and export palettes.
+Clicking a color swatch locks its slot so the distinctness optimizer keeps it.
 """
 
+from functools import partial
 from typing import ClassVar
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import Union
 
@@ -25,9 +28,20 @@ from textual.widgets import Footer
 from textual.widgets import Header
 from textual.widgets import Input
 from textual.widgets import Static
+from textual.worker import Worker
+from textual.worker import WorkerState
+from textual.worker import get_current_worker
 
+from ..models.color_model import Color
 from ..models.palette_model import Palette
 from ..models.palette_model import PaletteCollection
+from ..utils.color_vision import DISTINGUISHABLE_DELTA_E
+from ..utils.palette_optimizer import min_pairwise_delta_e
+from ..utils.palette_optimizer import optimize_distinctness
+
+
+# Worker group of the background distinctness optimizer
+OPTIMIZE_WORKER_GROUP = "palette-optimization"
 
 
 class PaletteActionRequest(Message):
@@ -65,6 +79,7 @@ class PaletteOrganizationScreen(Screen):
         Binding("r", "rename_palette", "Rename palette"),
         Binding("c", "duplicate_palette", "Duplicate palette"),
         Binding("e", "export_palette", "Export palette"),
+        Binding("o", "optimize_palette", "Optimize distinctness"),
         # Organization
         Binding("up", "move_up", "Move palette up"),
         Binding("down", "move_down", "Move palette down"),
@@ -122,6 +137,10 @@ class PaletteOrganizationScreen(Screen):
         border: solid $background;
     }
 
+    .palette-color-locked {
+        border: heavy $warning;
+    }
+
     .palette-actions {
         width: 100%;
         height: 3;
@@ -182,6 +201,8 @@ class PaletteOrganizationScreen(Screen):
         """
         super().__init__()
         self.palette_collection = palette_collection
+        # Slots the optimizer must keep, by palette ID
+        self._locked_slots: Dict[str, Set[int]] = {}
         # Initialize selected palette to first palette if available
         if palette_collection.palettes:
             self.selected_palette_id = palette_collection.palettes[0].palette_id
@@ -192,14 +213,10 @@ class PaletteOrganizationScreen(Screen):
         yield Header()
         yield Static("PALETTE ORGANIZATION", id="org-header")
 
-        # Main content - scrollable list of palettes
-        palette_list = ScrollableContainer(id="palette-list")
-        yield palette_list
-
-        # Create and mount palette cards
-        for palette in self.palette_collection.palettes:
-            card = self._create_palette_card(palette)
-            palette_list.mount(card)
+        # Main content - scrollable list of palette cards
+        yield ScrollableContainer(
+            *(self._create_palette_card(palette) for palette in self.palette_collection.palettes), id="palette-list"
+        )
 
         # Bottom action buttons
         with Container(id="bottom-actions"):
@@ -232,34 +249,33 @@ class PaletteOrganizationScreen(Screen):
         if is_selected:
             classes += " palette-card-selected"
 
-        # Create the palette card container
-        card = Container(id=f"palette-{palette.palette_id}", classes=classes)
-
         # Palette header with name
         header = Static(palette.name, classes="palette-header")
-        card.mount(header)
-
-        # Color swatches container
-        colors_container = Container(classes="palette-colors")
-        card.mount(colors_container)
 
-        # Add color swatches
-        for color_hex in palette.hex_colors:
-            color_swatch = Static("", classes="palette-color")
+        # Color swatches; clicking one toggles its lock
+        locked = self._locked_slots.get(palette.palette_id, set())
+        swatches = []
+        for index, color_hex in enumerate(palette.hex_colors):
+            swatch_classes = "palette-color palette-color-locked" if index in locked else "palette-color"
+            color_swatch = Static("", id=f"swatch-{index}-{palette.palette_id}", classes=swatch_classes)
             color_swatch.styles.background = color_hex
-            colors_container.mount(color_swatch)
-
-        # Action buttons container
-        actions_container = Container(classes="palette-actions")
-        card.mount(actions_container)
-
-        # Add action buttons
-        actions_container.mount(Button("Rename", id=f"rename-{palette.palette_id}"))
-        actions_container.mount(Button("Duplicate", id=f"duplicate-{palette.palette_id}"))
-        actions_container.mount(Button("Delete", id=f"delete-{palette.palette_id}", variant="error"))
-        actions_container.mount(Button("Export", id=f"export-{palette.palette_id}"))
+            swatches.append(color_swatch)
+        colors_container = Container(*swatches, classes="palette-colors")
+
+        # Action buttons
+        actions_container = Container(
+            Button("Rename", id=f"rename-{palette.palette_id}"),
+            Button("Duplicate", id=f"duplicate-{palette.palette_id}"),
+            Button("Delete", id=f"delete-{palette.palette_id}", variant="error"),
+            Button("Export", id=f"export-{palette.palette_id}"),
+            Button("Optimize", id=f"optimize-{palette.palette_id}"),
+            classes="palette-actions",
+        )
 
-        return card
+        # Children are passed to the card so it can be built before it is mounted
+        return Container(
+            header, colors_container, actions_container, id=f"palette-{palette.palette_id}", classes=classes
+        )
 
     def watch_selected_palette_id(self, old_id: Optional[str], new_id: Optional[str]) -> None:
         """React to changes in the selected palette."""
@@ -297,6 +313,30 @@ class PaletteOrganizationScreen(Screen):
         palette_id = container_id[len("palette-") :]
         self.selected_palette_id = palette_id
 
+    def on_click(self, event: Click) -> None:
+        """
+        Toggle the lock of a color slot when its swatch is clicked.
+
+        Args:
+            event: The click event
+        """
+        swatch = event.widget
+        if swatch is None or not swatch.id or not swatch.id.startswith("swatch-"):
+            return
+
+        # Swatch IDs are "swatch-<index>-<palette ID>"
+        index_text, palette_id = swatch.id[len("swatch-") :].split("-", 1)
+        index = int(index_text)
+        locked = self._locked_slots.setdefault(palette_id, set())
+        if index in locked:
+            locked.discard(index)
+            swatch.remove_class("palette-color-locked")
+            self.notify(f"Unlocked color {index + 1}")
+        else:
+            locked.add(index)
+            swatch.add_class("palette-color-locked")
+            self.notify(f"Locked color {index + 1}; optimizing keeps it")
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
         button_id = event.button.id
@@ -327,6 +367,8 @@ class PaletteOrganizationScreen(Screen):
                 self.action_delete_palette(palette_id)
             elif action == "export":
                 self.action_export_palette(palette_id)
+            elif action == "optimize":
+                self.action_optimize_palette(palette_id)
 
     def _show_rename_dialog(self, palette_id: str) -> None:
         """
@@ -452,6 +494,7 @@ class PaletteOrganizationScreen(Screen):
             return
 
         self.post_message(PaletteActionRequest(action="delete", palette_id=target_id))
+        self._locked_slots.pop(target_id, None)
 
         # Update UI
         self._update_palette_cards()
@@ -498,6 +541,80 @@ class PaletteOrganizationScreen(Screen):
 
         self.post_message(PaletteActionRequest(action="export", palette_id=target_id))
 
+    def action_optimize_palette(self, palette_id: Optional[str] = None) -> None:
+        """
+        Spread the colors of a palette apart in the background.
+
+        Locked slots keep their colors, and the optimizer stops once every
+        pair is distinguishable. Only one palette is optimized at a time;
+        starting another cancels the previous run.
+
+        Args:
+            palette_id: ID of the palette to optimize, uses selected palette if None
+        """
+        target_id = palette_id or self.selected_palette_id
+        palette = self.palette_collection.get_palette(target_id) if target_id else None
+        if not palette:
+            return
+
+        locked = sorted(index for index in self._locked_slots.get(palette.palette_id, ()) if index < len(palette))
+        if len(locked) >= len(palette):
+            self.notify("Every color of this palette is locked", severity="warning")
+            return
+
+        self.run_worker(
+            partial(self._optimize_palette_colors, palette.colors, locked),
+            name=palette.palette_id,
+            group=OPTIMIZE_WORKER_GROUP,
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _optimize_palette_colors(self, colors: List[Color], locked: List[int]) -> Optional[List[Color]]:
+        """
+        Optimize a copy of a palette's colors, in a worker thread.
+
+        Args:
+            colors: Colors of the palette when the optimization was requested
+            locked: Indices of the slots to keep
+
+        Returns:
+            The optimized colors, or None if the worker was cancelled
+        """
+        worker = get_current_worker()
+        optimized = optimize_distinctness(
+            colors, locked=locked, target_delta_e=DISTINGUISHABLE_DELTA_E, cancelled=lambda: worker.is_cancelled
+        )
+        return None if worker.is_cancelled else optimized
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """
+        Apply the optimized colors when an optimization completes.
+
+        Args:
+            event: The worker state changed event
+        """
+        worker = event.worker
+        if worker.group != OPTIMIZE_WORKER_GROUP:
+            return
+
+        palette = self.palette_collection.get_palette(worker.name)
+        if event.state == WorkerState.SUCCESS and worker.result is not None and palette:
+            before = min_pairwise_delta_e(palette)[0]
+            for index, color in enumerate(worker.result):
+                if color != palette.get_color(index):
+                    self.palette_collection.update_color(palette.palette_id, index, color)
+            self._update_palette_card(palette.palette_id)
+            after = min_pairwise_delta_e(palette)[0]
+            self.notify(f"Optimized {palette.name}: closest colors ΔE {before:.1f} → {after:.1f}")
+        elif event.state == WorkerState.ERROR:
+            self.notify(f"Could not optimize palette: {worker.error}", severity="error")
+
+    def on_unmount(self) -> None:
+        """Stop any background optimization when the screen is removed."""
+        self.workers.cancel_group(self, OPTIMIZE_WORKER_GROUP)
+
     def action_move_up(self) -> None:
         """Move the selected palette up in the list."""
         if not self.selected_palette_id:
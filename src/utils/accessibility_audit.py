@@ -0,0 +1,349 @@
+"""
+Headless accessibility audit for whole palette collections.
+
+This module audits every palette of a collection for WCAG contrast, color
+vision deficiency (CVD) distinguishability, and suggested fixes. Palettes
+are split into shards that are processed in a process pool; each shard is
+shipped as packed ARGB arrays rather than pickled Color objects, and the
+per-palette results are streamed to JSON Lines as shards complete.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+
+from ..models.color_array import ColorArray
+from ..models.color_spaces import rgb_to_lab_array
+from ..models.palette_model import PaletteCollection
+from .color_accessibility import WCAG_THRESHOLDS
+from .color_accessibility import get_luminance_array
+from .color_accessibility import pairwise_contrast
+from .color_accessibility import solve_contrast_array
+from .color_difference import delta_e_lab
+from .color_vision import CVD_TYPES
+from .color_vision import DISTINGUISHABLE_DELTA_E
+from .color_vision import simulate_cvd
+
+
+# Palettes sent to a worker at a time; large enough to amortize process overhead
+DEFAULT_SHARD_SIZE = 64
+
+# Called with (palettes audited, total palettes) after each shard completes
+ProgressCallback = Callable[[int, int], None]
+
+# A shard: palette IDs, palette names, packed colors of all its palettes, and each palette's size
+_Shard = Tuple[List[str], List[str], np.ndarray, np.ndarray]
+
+
+def _make_shards(collection: PaletteCollection, shard_size: int) -> List[_Shard]:
+    """
+    Split a collection into shards of packed colors.
+
+    Args:
+        collection: Palette collection to split
+        shard_size: Maximum number of palettes per shard
+
+    Returns:
+        List of shards
+    """
+    palettes = list(collection)
+    packed = ColorArray.from_collection(collection).packed
+    sizes = np.array([len(palette) for palette in palettes], dtype=np.int64)
+    starts = np.concatenate([[0], np.cumsum(sizes)])
+
+    shards: List[_Shard] = []
+    for first in range(0, len(palettes), shard_size):
+        last = min(first + shard_size, len(palettes))
+        shards.append(
+            (
+                [palette.palette_id for palette in palettes[first:last]],
+                [palette.name for palette in palettes[first:last]],
+                packed[starts[first] : starts[last]],
+                sizes[first:last],
+            )
+        )
+    return shards
+
+
+def _pair_indices(sizes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Enumerate every unordered pair of colors within each palette of a shard.
+
+    Args:
+        sizes: (P,) number of colors in each palette
+
+    Returns:
+        Tuple of (first, second, owner) arrays: indices into the shard's colors
+        with first < second, and the palette each pair belongs to
+    """
+    firsts: List[np.ndarray] = []
+    seconds: List[np.ndarray] = []
+    owners: List[np.ndarray] = []
+    triangles: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+    offset = 0
+    for palette, size in enumerate(sizes.tolist()):
+        if size not in triangles:
+            triangles[size] = np.triu_indices(size, 1)
+        first, second = triangles[size]
+        firsts.append(first + offset)
+        seconds.append(second + offset)
+        owners.append(np.full(len(first), palette))
+        offset += size
+    if not firsts:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty
+    return np.concatenate(firsts), np.concatenate(seconds), np.concatenate(owners)
+
+
+def _audit_shard(shard: _Shard, min_ratio: float, severity: float) -> List[Dict[str, Any]]:
+    """
+    Audit every palette of a shard.
+
+    All pairs of the shard are evaluated together, so the cost per palette is
+    a handful of array operations shared with the rest of the shard.
+
+    Args:
+        shard: Shard produced by ``_make_shards``
+        min_ratio: Contrast ratio a pair needs to pass
+        severity: CVD severity from 0.0 (normal vision) to 1.0 (full deficiency)
+
+    Returns:
+        One audit record per palette, in shard order
+    """
+    palette_ids, names, packed, sizes = shard
+    colors = ColorArray(packed)
+    hex_values = colors.to_hex()
+    first, second, owner = _pair_indices(sizes)
+
+    # Repeated colors (such as filler slots) are not a meaningful pair
+    distinct = packed[first] != packed[second]
+    first, second, owner = first[distinct], second[distinct], owner[distinct]
+
+    luminance = get_luminance_array(colors)
+    ratios = pairwise_contrast(luminance[first], luminance[second])
+
+    # Fix every failing pair in one batch by adjusting its first color
+    failing = np.nonzero(ratios < min_ratio)[0]
+    suggestions, suggested_ratios = solve_contrast_array(colors[first[failing]], colors[second[failing]], min_ratio)
+    suggested_hex = suggestions.to_hex()
+
+    # Smallest CVD difference per palette, one simulation of the whole shard per deficiency
+    cvd_minimums: Dict[str, np.ndarray] = {}
+    for deficiency in CVD_TYPES:
+        lab = rgb_to_lab_array(simulate_cvd(colors, deficiency, severity).rgb)
+        differences = delta_e_lab(lab[first], lab[second])
+        minimums = np.full(len(sizes), np.inf)
+        np.minimum.at(minimums, owner, differences)
+        cvd_minimums[deficiency] = minimums
+
+    # Per-palette contrast range and pass counts
+    palette_count = len(sizes)
+    pair_counts = np.bincount(owner, minlength=palette_count).tolist()
+    lowest = np.full(palette_count, np.inf)
+    highest = np.full(palette_count, -np.inf)
+    np.minimum.at(lowest, owner, ratios)
+    np.maximum.at(highest, owner, ratios)
+    passing = {
+        level: np.bincount(owner[ratios >= threshold], minlength=palette_count).tolist()
+        for level, threshold in WCAG_THRESHOLDS.items()
+    }
+
+    records: List[Dict[str, Any]] = []
+    starts = np.concatenate([[0], np.cumsum(sizes)]).tolist()
+    failing_bounds = np.searchsorted(owner[failing], np.arange(palette_count + 1)).tolist()
+    for palette in range(palette_count):
+        start = starts[palette]
+
+        failing_pairs = []
+        for position in range(failing_bounds[palette], failing_bounds[palette + 1]):
+            pair = failing[position]
+            failing_pairs.append(
+                {
+                    "colors": [int(first[pair]) - start, int(second[pair]) - start],
+                    "contrast_ratio": float(ratios[pair]),
+                    "suggestion": {
+                        "foreground": suggested_hex[position],
+                        "background": hex_values[second[pair]],
+                        "contrast_ratio": float(suggested_ratios[position]),
+                    },
+                }
+            )
+
+        cvd = {}
+        for deficiency in CVD_TYPES:
+            minimum = float(cvd_minimums[deficiency][palette])
+            cvd[deficiency] = {
+                "min_delta_e": minimum if np.isfinite(minimum) else None,
+                "friendly": minimum >= DISTINGUISHABLE_DELTA_E,
+            }
+
+        records.append(
+            {
+                "palette_id": palette_ids[palette],
+                "name": names[palette],
+                "colors": hex_values[start : starts[palette + 1]],
+                "pair_count": pair_counts[palette],
+                "min_contrast": float(lowest[palette]) if pair_counts[palette] else None,
+                "max_contrast": float(highest[palette]) if pair_counts[palette] else None,
+                "compliance": {level: counts[palette] for level, counts in passing.items()},
+                "failing_pairs": failing_pairs,
+                "cvd": cvd,
+            }
+        )
+    return records
+
+
+def iter_collection_audit(
+    collection: PaletteCollection,
+    workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    min_ratio: float = 4.5,
+    severity: float = 1.0,
+    progress: Optional[ProgressCallback] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Audit every palette of a collection, yielding results as they complete.
+
+    Each record holds the palette's colors, its contrast range and the number
+    of distinct pairs passing each WCAG level, every pair below ``min_ratio``
+    with a suggested replacement for its first color, and the smallest
+    CIEDE2000 difference between its colors under each color vision deficiency.
+
+    Args:
+        collection: Palette collection to audit
+        workers: Number of worker processes; None uses every CPU, and 0 or 1
+            audits in the calling process
+        shard_size: Maximum number of palettes sent to a worker at a time
+        min_ratio: Contrast ratio a pair needs to pass (default: 4.5 for WCAG AA)
+        severity: CVD severity from 0.0 (normal vision) to 1.0 (full deficiency)
+        progress: Optional callback receiving (palettes audited, total palettes)
+
+    Yields:
+        One audit record per palette; with several workers, shards arrive in
+        completion order
+
+    Raises:
+        ValueError: If the shard size, worker count or severity is invalid
+    """
+    if shard_size < 1:
+        raise ValueError(f"Shard size must be positive, got {shard_size}")
+    if workers is not None and workers < 0:
+        raise ValueError(f"Worker count cannot be negative, got {workers}")
+    if not 0.0 <= severity <= 1.0:
+        raise ValueError(f"Severity must be between 0 and 1, got {severity}")
+
+    shards = _make_shards(collection, shard_size)
+    total = len(collection)
+    done = 0
+
+    worker_count = (os.cpu_count() or 1) if workers is None else workers
+    if worker_count <= 1 or len(shards) <= 1:
+        for shard in shards:
+            records = _audit_shard(shard, min_ratio, severity)
+            done += len(records)
+            if progress:
+                progress(done, total)
+            yield from records
+        return
+
+    with ProcessPoolExecutor(max_workers=min(worker_count, len(shards))) as executor:
+        futures = [executor.submit(_audit_shard, shard, min_ratio, severity) for shard in shards]
+        for future in as_completed(futures):
+            records = future.result()
+            done += len(records)
+            if progress:
+                progress(done, total)
+            yield from records
+
+
+def audit_collection(
+    collection: PaletteCollection,
+    output_path: str,
+    workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    min_ratio: float = 4.5,
+    severity: float = 1.0,
+    progress: Optional[ProgressCallback] = None,
+) -> int:
+    """
+    Audit every palette of a collection and write the results as JSON Lines.
+
+    Records are written and flushed shard by shard, so a partial file is
+    usable while a long audit is still running.
+
+    Args:
+        collection: Palette collection to audit
+        output_path: Path of the JSON Lines file to write
+        workers: Number of worker processes; None uses every CPU, and 0 or 1
+            audits in the calling process
+        shard_size: Maximum number of palettes sent to a worker at a time
+        min_ratio: Contrast ratio a pair needs to pass (default: 4.5 for WCAG AA)
+        severity: CVD severity from 0.0 (normal vision) to 1.0 (full deficiency)
+        progress: Optional callback receiving (palettes audited, total palettes)
+
+    Returns:
+        Number of palettes written
+
+    Raises:
+        ValueError: If the shard size, worker count or severity is invalid
+    """
+    directory = os.path.dirname(output_path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    count = 0
+    with open(output_path, "w", encoding="utf-8") as f:
+        for record in iter_collection_audit(collection, workers, shard_size, min_ratio, severity, progress):
+            f.write(json.dumps(record) + "\n")
+            count += 1
+            if count % shard_size == 0:
+                f.flush()
+    return count
+
+
+def read_audit(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read the records of an audit written by ``audit_collection``.
+
+    Args:
+        file_path: Path of the JSON Lines file
+
+    Yields:
+        One audit record per palette
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def summarize_audit(records: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize audit records across a collection.
+
+    Args:
+        records: Audit records, as yielded by ``iter_collection_audit``
+
+    Returns:
+        Dictionary with the palette count, the number of palettes with failing
+        pairs, and the number of palettes that are not friendly for each deficiency
+    """
+    return {
+        "palettes": len(records),
+        "with_failing_pairs": sum(1 for record in records if record["failing_pairs"]),
+        "not_cvd_friendly": {
+            deficiency: sum(1 for record in records if not record["cvd"][deficiency]["friendly"])
+            for deficiency in CVD_TYPES
+        },
+    }
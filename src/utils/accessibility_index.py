@@ -0,0 +1,298 @@
+"""
+Incremental accessibility index for the Milky Color Suite.
+
+This module caches the luminance of every color in a palette together with
+the contrast between every pair of colors. When a single color changes, only
+its row and column of each contrast matrix are recomputed, so editing a color
+costs O(N) instead of rebuilding the O(N²) matrices.
+"""
+
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from ..models.color_model import Color
+from ..models.palette_model import Palette
+from ..models.palette_model import PaletteColorUpdated
+from .color_accessibility import CONTRAST_METHODS
+from .color_accessibility import apca_contrast
+from .color_accessibility import check_contrast_method
+from .color_accessibility import contrast_from_luminance
+from .color_accessibility import contrast_luminances
+from .color_accessibility import get_apca_compliance_masks
+from .color_accessibility import get_wcag_compliance_masks
+from .color_accessibility import pairwise_contrast
+
+
+class AccessibilityIndex:
+    """
+    Cached contrast matrices for one palette, updated one color at a time.
+
+    The index keeps its own copy of the palette's colors, so it can tell which
+    slots changed even when an update arrives without a message.
+    """
+
+    def __init__(self, palette: Palette, methods: Sequence[str] = CONTRAST_METHODS) -> None:
+        """
+        Initialize the index and compute every contrast matrix once.
+
+        Args:
+            palette: Palette to index
+            methods: Contrast metrics to maintain (default: all of CONTRAST_METHODS)
+
+        Raises:
+            ValueError: If any method is invalid
+        """
+        for method in methods:
+            check_contrast_method(method)
+        self.palette = palette
+        self.methods = tuple(methods)
+        self.rebuild()
+
+    @property
+    def palette_id(self) -> str:
+        """Get the ID of the indexed palette."""
+        return self.palette.palette_id
+
+    @property
+    def colors(self) -> List[Color]:
+        """Get the colors as last indexed."""
+        return self._colors.copy()
+
+    def rebuild(self) -> None:
+        """Recompute every luminance and contrast matrix from the palette."""
+        self._colors: List[Color] = self.palette.colors
+        self._luminance = contrast_luminances(self._colors)
+        self._matrices: Dict[str, np.ndarray] = {
+            method: contrast_from_luminance(self._luminance[:, CONTRAST_METHODS.index(method)], method)[0]
+            for method in self.methods
+        }
+        self._positions: Dict[Color, int] = {}
+        for index, color in enumerate(self._colors):
+            self._positions.setdefault(color, index)
+
+    def update_color(self, index: int, color: Union[str, Color]) -> None:
+        """
+        Replace one color and recompute only its row and column.
+
+        Args:
+            index: Index of the changed color
+            color: New color (hex string or Color instance)
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if not 0 <= index < len(self._colors):
+            raise IndexError(f"Color index {index} out of range")
+        color = color if isinstance(color, Color) else Color(color)
+        if color == self._colors[index]:
+            return
+
+        previous = self._colors[index]
+        self._colors[index] = color
+        self._luminance[index] = contrast_luminances([color])[0]
+
+        for method, matrix in self._matrices.items():
+            luminance = self._luminance[:, CONTRAST_METHODS.index(method)]
+            if method == "apca":
+                matrix[index, :] = apca_contrast(luminance[index], luminance)
+                matrix[:, index] = apca_contrast(luminance, luminance[index])
+            else:
+                ratios = pairwise_contrast(luminance[index], luminance)
+                matrix[index, :] = ratios
+                matrix[:, index] = ratios
+
+        # Only the two affected colors can change their first position
+        for changed in (previous, color):
+            self._positions.pop(changed, None)
+            position = next((i for i, existing in enumerate(self._colors) if existing == changed), None)
+            if position is not None:
+                self._positions[changed] = position
+
+    def sync(self) -> List[int]:
+        """
+        Bring the index up to date with its palette.
+
+        Changed slots are updated incrementally; a change in palette length
+        triggers a full rebuild.
+
+        Returns:
+            Indices of the colors that were updated
+        """
+        current = self.palette.colors
+        if len(current) != len(self._colors):
+            self.rebuild()
+            return list(range(len(current)))
+        changed = [index for index, (old, new) in enumerate(zip(self._colors, current, strict=True)) if old != new]
+        for index in changed:
+            self.update_color(index, current[index])
+        return changed
+
+    def on_palette_color_updated(self, message: PaletteColorUpdated) -> bool:
+        """
+        Apply a color update posted for this palette.
+
+        Args:
+            message: The PaletteColorUpdated message
+
+        Returns:
+            True if the message concerned this palette, False otherwise
+        """
+        if message.palette_id != self.palette_id:
+            return False
+        if 0 <= message.color_index < len(self._colors) and len(self.palette) == len(self._colors):
+            self.update_color(message.color_index, self.palette.colors[message.color_index])
+        else:
+            self.rebuild()
+        return True
+
+    def index_of(self, color: Union[str, Color]) -> Optional[int]:
+        """
+        Find the first slot holding a color.
+
+        Args:
+            color: Color to look up (hex string or Color instance)
+
+        Returns:
+            Index of the color, or None if it is not in the palette
+        """
+        return self._positions.get(color if isinstance(color, Color) else Color(color))
+
+    def contrast(self, foreground: int, background: int, method: str = "wcag") -> float:
+        """
+        Look up the contrast between two slots.
+
+        Args:
+            foreground: Index of the foreground (text) color
+            background: Index of the background color
+            method: Contrast metric: "wcag" or "apca"
+
+        Returns:
+            WCAG contrast ratio or APCA Lc value
+
+        Raises:
+            ValueError: If the method is not maintained by this index
+        """
+        return float(self.matrix(method)[foreground, background])
+
+    def matrix(self, method: str = "wcag") -> np.ndarray:
+        """
+        Get the cached contrast matrix for a metric.
+
+        Args:
+            method: Contrast metric: "wcag" or "apca"
+
+        Returns:
+            (N, N) float64 matrix, as returned by ``contrast_matrix``; treat it as read-only
+
+        Raises:
+            ValueError: If the method is not maintained by this index
+        """
+        if method not in self._matrices:
+            raise ValueError(f"Contrast method not indexed: {method}")
+        return self._matrices[method]
+
+    def compliance(self, method: str = "wcag") -> Dict[str, np.ndarray]:
+        """
+        Get the compliance masks for the cached contrast matrix.
+
+        Args:
+            method: Contrast metric: "wcag" or "apca"
+
+        Returns:
+            Dictionary mapping each level to an (N, N) boolean pass mask
+
+        Raises:
+            ValueError: If the method is not maintained by this index
+        """
+        values = self.matrix(method)
+        return get_apca_compliance_masks(values) if method == "apca" else get_wcag_compliance_masks(values)
+
+    def failing_pairs(self, level: str = "AA_normal", method: str = "wcag") -> Iterator[Tuple[int, int, float]]:
+        """
+        Stream the ordered pairs of distinct slots that fail a compliance level.
+
+        Args:
+            level: Compliance level, as in ``get_wcag_compliance``
+            method: Contrast metric: "wcag" or "apca"
+
+        Yields:
+            (foreground_index, background_index, contrast) for every failing pair
+
+        Raises:
+            ValueError: If the method is not maintained by this index
+            KeyError: If the level is unknown
+        """
+        values = self.matrix(method)
+        failing = ~self.compliance(method)[level]
+        np.fill_diagonal(failing, False)
+        for foreground, background in zip(*np.nonzero(failing), strict=True):
+            yield int(foreground), int(background), float(values[foreground, background])
+
+
+class AccessibilityIndexRegistry:
+    """
+    Lazily built accessibility indices for every palette, kept current by palette messages.
+    """
+
+    def __init__(self, methods: Sequence[str] = CONTRAST_METHODS) -> None:
+        """
+        Initialize an empty registry.
+
+        Args:
+            methods: Contrast metrics maintained by each index
+        """
+        self.methods = tuple(methods)
+        self._indices: Dict[str, AccessibilityIndex] = {}
+
+    def get(self, palette: Palette) -> AccessibilityIndex:
+        """
+        Get the index for a palette, building it on first use.
+
+        Args:
+            palette: Palette to index
+
+        Returns:
+            The palette's AccessibilityIndex, synchronized with the palette
+        """
+        index = self._indices.get(palette.palette_id)
+        if index is None or index.palette is not palette:
+            index = AccessibilityIndex(palette, self.methods)
+            self._indices[palette.palette_id] = index
+        else:
+            index.sync()
+        return index
+
+    def discard(self, palette_id: str) -> None:
+        """
+        Forget the index of a palette.
+
+        Args:
+            palette_id: ID of the palette
+        """
+        self._indices.pop(palette_id, None)
+
+    def on_palette_color_updated(self, message: PaletteColorUpdated) -> None:
+        """
+        Forward a color update to the affected palette's index.
+
+        Args:
+            message: The PaletteColorUpdated message
+        """
+        index = self._indices.get(message.palette_id)
+        if index is not None:
+            index.on_palette_color_updated(message)
+
+    def __contains__(self, palette_id: object) -> bool:
+        """Check whether a palette has been indexed."""
+        return palette_id in self._indices
+
+    def __len__(self) -> int:
+        """Get the number of indexed palettes."""
+        return len(self._indices)
@@ -3,14 +3,84 @@ Color accessibility utilities for checking contrast and WCAG compliance.
 
 This module provides functions for calculating contrast ratios,
 checking WCAG compliance, and suggesting accessible alternatives
-for color combinations.
+for color combinations. Contrast can be measured with the WCAG 2.0
+ratio or with the APCA lightness contrast (Lc) proposed for WCAG 3.
 """
 
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Sequence
+from typing import Tuple
 from typing import Union
 
+import numpy as np
+
+from ..models.color_array import ColorArray
 from ..models.color_model import Color
+from ..models.color_spaces import rgb_to_lab_array
+from ..models.palette_model import Palette
+from ..models.palette_model import PaletteCollection
+from .color_difference import delta_e_lab
+from .color_vision import DISTINGUISHABLE_DELTA_E
+from .color_vision import cvd_delta_e_matrices
+
+
+def _linearize(channel: int) -> float:
+    """Convert an 8-bit channel to linear light using the WCAG 2.0 formula."""
+    value = channel / 255.0
+    return value / 12.92 if value <= 0.03928 else ((value + 0.055) / 1.055) ** 2.4
+
+
+# Linear-light value of every 8-bit channel, as used by the WCAG luminance formula
+LUMINANCE_LUT: Tuple[float, ...] = tuple(_linearize(channel) for channel in range(256))
+LUMINANCE_LUT_ARRAY = np.array(LUMINANCE_LUT)
+
+# APCA estimates screen luminance with a plain 2.4 power curve instead of the piecewise sRGB formula
+APCA_LUT: Tuple[float, ...] = tuple((channel / 255.0) ** 2.4 for channel in range(256))
+APCA_LUT_ARRAY = np.array(APCA_LUT)
+
+# Supported contrast metrics
+CONTRAST_METHODS = ("wcag", "apca")
+
+# Both lookup tables side by side, so one gather yields every metric's channel values
+_CONTRAST_LUT = np.stack([LUMINANCE_LUT_ARRAY, APCA_LUT_ARRAY], axis=-1)
+_CONTRAST_WEIGHTS = np.array(
+    [
+        [0.2126, 0.7152, 0.0722],  # WCAG 2.0 luminance coefficients
+        [0.2126729, 0.7151522, 0.0721750],  # APCA coefficients
+    ]
+).T
+
+# APCA-W3 0.0.98G-4g constants
+_APCA_BLACK_THRESHOLD = 0.022
+_APCA_BLACK_CLAMP = 1.414
+_APCA_DELTA_Y_MIN = 0.0005
+_APCA_SCALE = 1.14
+_APCA_OFFSET = 0.027
+_APCA_LOW_CLIP = 0.1
+
+# Anything the batch functions accept as a set of colors
+ColorSource = Union[ColorArray, Palette, PaletteCollection, Sequence[Union[str, Color]]]
+
+# Bisection steps used by the contrast solver; 24 halvings resolve lightness far below one 8-bit step
+SOLVER_ITERATIONS = 24
+
+# Minimum contrast ratio for each WCAG 2.0 success level
+WCAG_THRESHOLDS: Dict[str, float] = {
+    "AA_large": 3.0,  # WCAG AA for large text (14pt bold or 18pt+)
+    "AA_normal": 4.5,  # WCAG AA for normal text
+    "AAA_large": 4.5,  # WCAG AAA for large text
+    "AAA_normal": 7.0,  # WCAG AAA for normal text
+}
+
+# Minimum absolute APCA Lc for the same levels, following the APCA bronze readability guidance
+APCA_THRESHOLDS: Dict[str, float] = {
+    "AA_large": 45.0,  # Large or bold headlines
+    "AA_normal": 60.0,  # Readable content text
+    "AAA_large": 60.0,  # Large content text
+    "AAA_normal": 75.0,  # Body text
+}
 
 
 def get_luminance(color: Union[str, Color]) -> float:
@@ -26,16 +96,296 @@ def get_luminance(color: Union[str, Color]) -> float:
     # Convert to Color instance if string
     color_obj = color if isinstance(color, Color) else Color(color)
 
-    # Get RGB values
-    r, g, b = [c / 255.0 for c in color_obj.rgb]
+    # Look up the linear value of each channel
+    r, g, b = color_obj.rgb
+    return 0.2126 * LUMINANCE_LUT[r] + 0.7152 * LUMINANCE_LUT[g] + 0.0722 * LUMINANCE_LUT[b]
+
+
+def _as_color_array(colors: ColorSource) -> ColorArray:
+    """
+    Convert any supported batch of colors to a ColorArray.
+
+    Args:
+        colors: ColorArray, Palette, PaletteCollection, or a sequence of hex strings / Color instances
+
+    Returns:
+        A ColorArray instance
+    """
+    if isinstance(colors, ColorArray):
+        return colors
+    if isinstance(colors, Palette):
+        return ColorArray.from_palette(colors)
+    if isinstance(colors, PaletteCollection):
+        return ColorArray.from_collection(colors)
+    return ColorArray.from_colors([color if isinstance(color, Color) else Color(color) for color in colors])
+
+
+def get_luminance_array(colors: ColorSource) -> np.ndarray:
+    """
+    Calculate the relative luminance of a batch of colors.
+
+    Args:
+        colors: ColorArray, Palette, PaletteCollection, or a sequence of hex strings / Color instances
+
+    Returns:
+        (N,) float64 array of luminance values between 0 and 1
+    """
+    linear = LUMINANCE_LUT_ARRAY[_as_color_array(colors).rgb]
+    return linear[:, 0] * 0.2126 + linear[:, 1] * 0.7152 + linear[:, 2] * 0.0722
+
+
+def get_apca_luminance(color: Union[str, Color]) -> float:
+    """
+    Calculate the screen luminance (Y) of a color as used by APCA.
+
+    Args:
+        color: Color to calculate luminance for (hex string or Color instance)
+
+    Returns:
+        Luminance value between 0 and 1
+    """
+    color_obj = color if isinstance(color, Color) else Color(color)
+    r, g, b = color_obj.rgb
+    return 0.2126729 * APCA_LUT[r] + 0.7151522 * APCA_LUT[g] + 0.0721750 * APCA_LUT[b]
+
+
+def check_contrast_method(method: str) -> None:
+    """
+    Validate a contrast metric name.
+
+    Args:
+        method: Contrast metric name
+
+    Raises:
+        ValueError: If the method is not one of CONTRAST_METHODS
+    """
+    if method not in CONTRAST_METHODS:
+        raise ValueError(f"Unsupported contrast method: {method}")
+
+
+def contrast_luminances(colors: ColorSource) -> np.ndarray:
+    """
+    Calculate the luminance of a batch of colors for every contrast metric at once.
+
+    Args:
+        colors: ColorArray, Palette, PaletteCollection, or a sequence of hex strings / Color instances
+
+    Returns:
+        (N, 2) float64 array with one column per entry of CONTRAST_METHODS
+    """
+    linear = _CONTRAST_LUT[_as_color_array(colors).rgb]
+    return np.einsum("ncm,cm->nm", linear, _CONTRAST_WEIGHTS)
+
+
+def apca_contrast(
+    text_luminance: Union[float, np.ndarray], background_luminance: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Calculate APCA lightness contrast from text and background luminances.
+
+    Args:
+        text_luminance: APCA luminance of the text colors, or a single value
+        background_luminance: APCA luminance of the background colors, broadcastable against the text
+
+    Returns:
+        Array of Lc values, positive for dark text on a light background and
+        negative for light text on a dark background
+    """
+    text = np.asarray(text_luminance, dtype=np.float64)
+    background = np.asarray(background_luminance, dtype=np.float64)
+
+    # Soft-clamp near-black luminances to model flare
+    text = text + np.clip(_APCA_BLACK_THRESHOLD - text, 0.0, None) ** _APCA_BLACK_CLAMP
+    background = background + np.clip(_APCA_BLACK_THRESHOLD - background, 0.0, None) ** _APCA_BLACK_CLAMP
+
+    normal = (background**0.56 - text**0.57) * _APCA_SCALE
+    reverse = (background**0.65 - text**0.62) * _APCA_SCALE
+    lc = np.where(
+        background > text,
+        np.where(normal < _APCA_LOW_CLIP, 0.0, normal - _APCA_OFFSET),
+        np.where(reverse > -_APCA_LOW_CLIP, 0.0, reverse + _APCA_OFFSET),
+    )
+    return np.where(np.abs(background - text) < _APCA_DELTA_Y_MIN, 0.0, lc) * 100.0
+
+
+def contrast_matrix(colors: ColorSource, method: str = "wcag") -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Calculate the contrast between every pair of colors at once.
+
+    Args:
+        colors: ColorArray, Palette, PaletteCollection, or a sequence of hex strings / Color instances
+        method: Contrast metric: "wcag" or "apca"
+
+    Returns:
+        Tuple of (values, compliance) where values is an (N, N) float64 matrix
+        and compliance maps each level (as in ``get_wcag_compliance``) to an
+        (N, N) boolean pass mask. WCAG ratios are symmetric; APCA Lc values
+        use row i as the text color and column j as the background.
+
+    Raises:
+        ValueError: If the method is invalid
+    """
+    check_contrast_method(method)
+    return contrast_matrices(colors, (method,))[method]
+
+
+def contrast_matrices(
+    colors: ColorSource, methods: Sequence[str] = CONTRAST_METHODS
+) -> Dict[str, Tuple[np.ndarray, Dict[str, np.ndarray]]]:
+    """
+    Calculate the contrast matrices of several metrics in one pass.
+
+    Colors are converted and looked up in the shared luminance tables once,
+    whatever the number of metrics.
+
+    Args:
+        colors: ColorArray, Palette, PaletteCollection, or a sequence of hex strings / Color instances
+        methods: Contrast metrics to calculate (default: all of CONTRAST_METHODS)
+
+    Returns:
+        Dictionary mapping each method to (values, compliance), as returned by ``contrast_matrix``
+
+    Raises:
+        ValueError: If any method is invalid
+    """
+    for method in methods:
+        check_contrast_method(method)
+    luminance = contrast_luminances(colors)
+    return {
+        method: contrast_from_luminance(luminance[:, CONTRAST_METHODS.index(method)], method) for method in methods
+    }
+
+
+def pairwise_contrast(
+    luminance1: Union[float, np.ndarray], luminance2: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
+    """
+    Calculate element-wise contrast ratios from two luminance arrays or single luminances.
+
+    Args:
+        luminance1: (N,) relative luminance values, or a single value
+        luminance2: (N,) relative luminance values, or a single value
+
+    Returns:
+        (N,) array of contrast ratios between 1 and 21, or a single ratio for single values
+    """
+    shifted1 = luminance1 + 0.05
+    shifted2 = luminance2 + 0.05
+    return np.maximum(shifted1, shifted2) / np.minimum(shifted1, shifted2)
+
+
+def contrast_from_luminance(
+    luminance: np.ndarray, method: str = "wcag"
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Build the contrast matrix and compliance masks from luminances.
+
+    Args:
+        luminance: (N,) array of luminance values for the given method
+        method: Contrast metric: "wcag" or "apca"
+
+    Returns:
+        Tuple of (values, compliance), as returned by ``contrast_matrix``
+    """
+    if method == "apca":
+        values = apca_contrast(luminance[:, None], luminance[None, :])
+        return values, get_apca_compliance_masks(values)
+    shifted = luminance + 0.05
+    ratios = np.maximum.outer(shifted, shifted) / np.minimum.outer(shifted, shifted)
+    return ratios, get_wcag_compliance_masks(ratios)
+
 
-    # Convert RGB values to linear sRGB
-    r = r / 12.92 if r <= 0.03928 else ((r + 0.055) / 1.055) ** 2.4
-    g = g / 12.92 if g <= 0.03928 else ((g + 0.055) / 1.055) ** 2.4
-    b = b / 12.92 if b <= 0.03928 else ((b + 0.055) / 1.055) ** 2.4
+def collection_contrast_matrices(
+    collection: PaletteCollection, method: str = "wcag"
+) -> Dict[str, Tuple[np.ndarray, Dict[str, np.ndarray]]]:
+    """
+    Calculate the contrast matrix of every palette in a collection.
 
-    # Calculate luminance
-    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+    Luminance is computed for the whole collection in one pass and then
+    split per palette.
+
+    Args:
+        collection: Palette collection to audit
+        method: Contrast metric: "wcag" or "apca"
+
+    Returns:
+        Dictionary mapping palette ID to (values, compliance), as returned by ``contrast_matrix``
+
+    Raises:
+        ValueError: If the method is invalid
+    """
+    check_contrast_method(method)
+    luminance = contrast_luminances(ColorArray.from_collection(collection))[:, CONTRAST_METHODS.index(method)]
+    results: Dict[str, Tuple[np.ndarray, Dict[str, np.ndarray]]] = {}
+    start = 0
+    for palette in collection:
+        stop = start + len(palette)
+        results[palette.palette_id] = contrast_from_luminance(luminance[start:stop], method)
+        start = stop
+    return results
+
+
+def find_compliant_pairs(colors: ColorSource, min_ratio: float = 4.5) -> Iterator[Tuple[int, int, float]]:
+    """
+    Stream every pair of colors whose contrast ratio meets a minimum.
+
+    Contrast depends only on the two luminances, so colors are sorted by
+    luminance once and swept with two pointers: for each darker color the
+    first sufficiently light partner only ever moves up, and every lighter
+    color after it also passes. This runs in O(N log N + K) for K results
+    instead of testing all N² pairs.
+
+    Args:
+        colors: ColorArray, Palette, PaletteCollection, or a sequence of hex strings / Color instances
+        min_ratio: Minimum contrast ratio (default: 4.5 for WCAG AA)
+
+    Yields:
+        (dark_index, light_index, ratio) with indices into the input, the
+        first index being the darker color of the pair
+    """
+    luminance = get_luminance_array(colors)
+    order = np.argsort(luminance, kind="stable").tolist()
+    shifted = (luminance[order] + 0.05).tolist()
+    count = len(order)
+
+    partner = 0
+    for dark in range(count):
+        dark_value = shifted[dark]
+        partner = max(partner, dark + 1)
+        while partner < count and shifted[partner] / dark_value < min_ratio:
+            partner += 1
+        if partner == count:
+            # The remaining colors are lighter still, so none of them can reach the ratio either
+            return
+        for light in range(partner, count):
+            yield order[dark], order[light], shifted[light] / dark_value
+
+
+def get_wcag_compliance_masks(contrast_ratios: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Check WCAG 2.0 compliance for an array of contrast ratios.
+
+    Args:
+        contrast_ratios: Array of contrast ratios between 1 and 21
+
+    Returns:
+        Dictionary of boolean arrays with the same keys as ``get_wcag_compliance``
+    """
+    return {level: contrast_ratios >= threshold for level, threshold in WCAG_THRESHOLDS.items()}
+
+
+def get_apca_compliance_masks(lightness_contrast: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Check APCA compliance for an array of Lc values.
+
+    Args:
+        lightness_contrast: Array of APCA Lc values; polarity is ignored
+
+    Returns:
+        Dictionary of boolean arrays with the same keys as ``get_apca_compliance``
+    """
+    magnitude = np.abs(lightness_contrast)
+    return {level: magnitude >= threshold for level, threshold in APCA_THRESHOLDS.items()}
 
 
 def calculate_contrast_ratio(foreground: Union[str, Color], background: Union[str, Color]) -> float:
@@ -71,37 +421,125 @@ def get_wcag_compliance(contrast_ratio: float) -> Dict[str, bool]:
     Returns:
         Dictionary with compliance status for different WCAG levels
     """
-    return {
-        "AA_large": contrast_ratio >= 3.0,  # WCAG AA for large text (14pt bold or 18pt+)
-        "AA_normal": contrast_ratio >= 4.5,  # WCAG AA for normal text
-        "AAA_large": contrast_ratio >= 4.5,  # WCAG AAA for large text
-        "AAA_normal": contrast_ratio >= 7.0,  # WCAG AAA for normal text
-    }
+    return {level: contrast_ratio >= threshold for level, threshold in WCAG_THRESHOLDS.items()}
+
+
+def calculate_apca_contrast(foreground: Union[str, Color], background: Union[str, Color]) -> float:
+    """
+    Calculate the APCA lightness contrast (Lc) of text on a background.
+
+    Unlike the WCAG ratio, APCA is polarity-aware: swapping the colors
+    changes the result.
+
+    Args:
+        foreground: Foreground color (text color)
+        background: Background color
 
+    Returns:
+        Lc value, about 106 for black on white and -108 for white on black
+    """
+    return float(apca_contrast(get_apca_luminance(foreground), get_apca_luminance(background)))
+
+
+def get_apca_compliance(lightness_contrast: float) -> Dict[str, bool]:
+    """
+    Check APCA compliance for a given Lc value.
+
+    Args:
+        lightness_contrast: APCA Lc value; polarity is ignored
+
+    Returns:
+        Dictionary with compliance status for the same levels as ``get_wcag_compliance``
+    """
+    return {level: abs(lightness_contrast) >= threshold for level, threshold in APCA_THRESHOLDS.items()}
+
+
+def calculate_contrast(foreground: Union[str, Color], background: Union[str, Color], method: str = "wcag") -> float:
+    """
+    Calculate the contrast of a color pair with the given metric.
 
-def analyze_color_pair(foreground: Union[str, Color], background: Union[str, Color]) -> Dict:
+    Args:
+        foreground: Foreground color (text color)
+        background: Background color
+        method: Contrast metric: "wcag" for the ratio or "apca" for Lc
+
+    Returns:
+        WCAG contrast ratio or APCA Lc value
+
+    Raises:
+        ValueError: If the method is invalid
+    """
+    check_contrast_method(method)
+    if method == "apca":
+        return calculate_apca_contrast(foreground, background)
+    return calculate_contrast_ratio(foreground, background)
+
+
+def get_compliance(contrast: float, method: str = "wcag") -> Dict[str, bool]:
+    """
+    Check compliance for a contrast value measured with the given metric.
+
+    Args:
+        contrast: WCAG contrast ratio or APCA Lc value
+        method: Contrast metric: "wcag" or "apca"
+
+    Returns:
+        Dictionary with compliance status for different levels
+
+    Raises:
+        ValueError: If the method is invalid
+    """
+    check_contrast_method(method)
+    if method == "apca":
+        return get_apca_compliance(contrast)
+    return get_wcag_compliance(contrast)
+
+
+def format_contrast(contrast: float, method: str = "wcag") -> str:
+    """
+    Format a contrast value for display.
+
+    Args:
+        contrast: WCAG contrast ratio or APCA Lc value
+        method: Contrast metric: "wcag" or "apca"
+
+    Returns:
+        Display string such as "4.50:1" or "Lc 63.1"
+    """
+    return f"Lc {contrast:.1f}" if method == "apca" else f"{contrast:.2f}:1"
+
+
+def analyze_color_pair(
+    foreground: Union[str, Color], background: Union[str, Color], method: str = "wcag"
+) -> Dict:
     """
     Analyze the accessibility of a color pair.
 
     Args:
         foreground: Foreground color (text color)
         background: Background color
+        method: Contrast metric: "wcag" for the WCAG 2.0 ratio or "apca" for APCA Lc
 
     Returns:
-        Dictionary with contrast ratio and compliance status
+        Dictionary with the contrast value and compliance status; with
+        ``method="apca"`` the "contrast_ratio" entry holds the Lc value
+
+    Raises:
+        ValueError: If the method is invalid
     """
-    # Calculate contrast ratio
-    ratio = calculate_contrast_ratio(foreground, background)
+    # Calculate contrast with the requested metric
+    ratio = calculate_contrast(foreground, background, method)
 
     # Check compliance
-    compliance = get_wcag_compliance(ratio)
+    compliance = get_compliance(ratio, method)
 
     # Format ratio for display
-    formatted_ratio = f"{ratio:.2f}:1"
+    formatted_ratio = format_contrast(ratio, method)
 
     return {
         "foreground": str(foreground),
         "background": str(background),
+        "method": method,
         "contrast_ratio": ratio,
         "formatted_ratio": formatted_ratio,
         "compliance": compliance,
@@ -112,12 +550,149 @@ def analyze_color_pair(foreground: Union[str, Color], background: Union[str, Col
     }
 
 
+def _solve_lightness(
+    colors: ColorArray,
+    partner_luminance: np.ndarray,
+    target_ratio: float,
+    space: str,
+    direction: np.ndarray,
+) -> Tuple[np.ndarray, ColorArray, np.ndarray]:
+    """
+    Bisect for the smallest lightness change that reaches a contrast ratio.
+
+    Luminance grows monotonically with lightness, so whether the adjusted
+    color reaches the target is monotonic in the size of the change and
+    bisection converges on the smallest passing change. The test is made on
+    the final 8-bit color, so every returned candidate that is marked
+    feasible really meets the target.
+
+    Args:
+        colors: Colors to adjust
+        partner_luminance: (N,) luminance of the color each one is paired with
+        target_ratio: Contrast ratio to reach
+        space: Color space to adjust lightness in: "hsl" or "oklch"
+        direction: (N,) array of +1 to lighten or -1 to darken
+
+    Returns:
+        Tuple of (amounts, candidates, feasible): the (N,) lightness change,
+        the adjusted colors and whether the target is reachable at all
+    """
+    partner = partner_luminance + 0.05
+
+    def passes(amount: np.ndarray) -> Tuple[ColorArray, np.ndarray]:
+        candidates = colors.lighten(direction * amount, space)
+        shifted = get_luminance_array(candidates) + 0.05
+        ratio = np.where(direction > 0, shifted / partner, partner / shifted)
+        return candidates, ratio >= target_ratio
+
+    low = np.zeros(len(colors))
+    high = np.ones(len(colors))
+    _, feasible = passes(high)
+    for _ in range(SOLVER_ITERATIONS):
+        middle = (low + high) / 2
+        _, ok = passes(middle)
+        high = np.where(ok, middle, high)
+        low = np.where(ok, low, middle)
+
+    candidates, _ = passes(high)
+    return high, candidates, feasible
+
+
+def solve_contrast_array(
+    foregrounds: ColorSource,
+    backgrounds: ColorSource,
+    target_ratio: float = 4.5,
+    space: str = "hsl",
+) -> Tuple[ColorArray, np.ndarray]:
+    """
+    Adjust the lightness of many foreground colors to reach a contrast ratio.
+
+    Each foreground is lightened and darkened by the smallest amount that
+    reaches the target against its background, and whichever result is
+    perceptually closer to the original (by CIEDE2000) is kept. Pairs that
+    already pass are returned unchanged; pairs that cannot reach the target
+    get the extreme with the higher ratio.
+
+    Args:
+        foregrounds: Colors to adjust
+        backgrounds: Background paired with each foreground
+        target_ratio: Contrast ratio to reach (default: 4.5 for WCAG AA)
+        space: Color space to adjust lightness in: "hsl" or the perceptually
+            uniform "oklch"
+
+    Returns:
+        Tuple of (adjusted foregrounds, (N,) achieved contrast ratios)
+
+    Raises:
+        ValueError: If the batches differ in length or the color space is not supported
+    """
+    foreground = _as_color_array(foregrounds)
+    background_luminance = get_luminance_array(backgrounds)
+    if len(foreground) != len(background_luminance):
+        raise ValueError(f"Batches must have the same length, got {len(foreground)} and {len(background_luminance)}")
+
+    up = np.ones(len(foreground))
+    _, lighter, lighter_ok = _solve_lightness(foreground, background_luminance, target_ratio, space, up)
+    _, darker, darker_ok = _solve_lightness(foreground, background_luminance, target_ratio, space, -up)
+
+    lab = rgb_to_lab_array(foreground.rgb)
+    lighter_change = np.where(lighter_ok, delta_e_lab(lab, rgb_to_lab_array(lighter.rgb)), np.inf)
+    darker_change = np.where(darker_ok, delta_e_lab(lab, rgb_to_lab_array(darker.rgb)), np.inf)
+    use_lighter = lighter_change <= darker_change
+
+    # Neither direction reaches the target: keep the one that gets closest
+    neither = ~(lighter_ok | darker_ok)
+    lighter_ratio = pairwise_contrast(get_luminance_array(lighter), background_luminance)
+    darker_ratio = pairwise_contrast(get_luminance_array(darker), background_luminance)
+    use_lighter = np.where(neither, lighter_ratio >= darker_ratio, use_lighter)
+
+    current_ratio = pairwise_contrast(get_luminance_array(foreground), background_luminance)
+    packed = np.where(
+        current_ratio >= target_ratio, foreground.packed, np.where(use_lighter, lighter.packed, darker.packed)
+    )
+
+    # Gamut clipping keeps OKLCH extremes away from pure black and white; retry those pairs in HSL
+    retry = neither & (current_ratio < target_ratio)
+    if space != "hsl" and retry.any():
+        backgrounds = _as_color_array(backgrounds)
+        fallback, _ = solve_contrast_array(foreground[retry], backgrounds[retry], target_ratio, "hsl")
+        packed[retry] = fallback.packed
+
+    result = ColorArray(packed)
+    return result, np.asarray(pairwise_contrast(get_luminance_array(result), background_luminance))
+
+
+def solve_contrast(
+    foreground: Union[str, Color], background: Union[str, Color], target_ratio: float = 4.5, space: str = "hsl"
+) -> Color:
+    """
+    Find the foreground closest to the original that reaches a contrast ratio.
+
+    Args:
+        foreground: Foreground color (text color)
+        background: Background color
+        target_ratio: Contrast ratio to reach (default: 4.5 for WCAG AA)
+        space: Color space to adjust lightness in: "hsl" or "oklch"
+
+    Returns:
+        Adjusted foreground color; check its ratio when the target may be unreachable
+
+    Raises:
+        ValueError: If the color space is not supported
+    """
+    result, _ = solve_contrast_array([foreground], [background], target_ratio, space)
+    return result[0]
+
+
 def suggest_accessible_alternatives(
     foreground: Union[str, Color], background: Union[str, Color], target_ratio: float = 4.5
 ) -> List[Dict]:
     """
     Suggest accessible alternatives for a color pair.
 
+    Each suggestion is the smallest HSL lightness change to either color,
+    in either direction, that reaches the target ratio.
+
     Args:
         foreground: Foreground color (text color)
         background: Background color
@@ -137,71 +712,34 @@ def suggest_accessible_alternatives(
     if current_ratio >= target_ratio:
         return []
 
+    # Solve all four adjustments in one batch: foreground then background, lighter then darker
+    subjects = ColorArray.from_colors([fg, fg, bg, bg])
+    partners = get_luminance_array([bg, bg, fg, fg])
+    directions = np.array([1.0, -1.0, 1.0, -1.0])
+    amounts, candidates, feasible = _solve_lightness(subjects, partners, target_ratio, "hsl", directions)
+
+    adjustments = [
+        ("Lightened", "foreground"),
+        ("Darkened", "foreground"),
+        ("Lightened", "background"),
+        ("Darkened", "background"),
+    ]
     alternatives = []
-
-    # Try lightening the foreground
-    for amount in [0.1, 0.2, 0.3, 0.4]:
-        lighter_fg = fg.lighten(amount)
-        ratio = calculate_contrast_ratio(lighter_fg, bg)
-        if ratio >= target_ratio:
-            alternatives.append(
-                {
-                    "foreground": lighter_fg.hex,
-                    "background": bg.hex,
-                    "contrast_ratio": ratio,
-                    "formatted_ratio": f"{ratio:.2f}:1",
-                    "adjustment": f"Lightened foreground by {amount * 100:.0f}%",
-                }
-            )
-            break
-
-    # Try darkening the foreground
-    for amount in [0.1, 0.2, 0.3, 0.4]:
-        darker_fg = fg.darken(amount)
-        ratio = calculate_contrast_ratio(darker_fg, bg)
-        if ratio >= target_ratio:
-            alternatives.append(
-                {
-                    "foreground": darker_fg.hex,
-                    "background": bg.hex,
-                    "contrast_ratio": ratio,
-                    "formatted_ratio": f"{ratio:.2f}:1",
-                    "adjustment": f"Darkened foreground by {amount * 100:.0f}%",
-                }
-            )
-            break
-
-    # Try lightening the background
-    for amount in [0.1, 0.2, 0.3, 0.4]:
-        lighter_bg = bg.lighten(amount)
-        ratio = calculate_contrast_ratio(fg, lighter_bg)
-        if ratio >= target_ratio:
-            alternatives.append(
-                {
-                    "foreground": fg.hex,
-                    "background": lighter_bg.hex,
-                    "contrast_ratio": ratio,
-                    "formatted_ratio": f"{ratio:.2f}:1",
-                    "adjustment": f"Lightened background by {amount * 100:.0f}%",
-                }
-            )
-            break
-
-    # Try darkening the background
-    for amount in [0.1, 0.2, 0.3, 0.4]:
-        darker_bg = bg.darken(amount)
-        ratio = calculate_contrast_ratio(fg, darker_bg)
-        if ratio >= target_ratio:
-            alternatives.append(
-                {
-                    "foreground": fg.hex,
-                    "background": darker_bg.hex,
-                    "contrast_ratio": ratio,
-                    "formatted_ratio": f"{ratio:.2f}:1",
-                    "adjustment": f"Darkened background by {amount * 100:.0f}%",
-                }
-            )
-            break
+    for index, (verb, role) in enumerate(adjustments):
+        if not feasible[index]:
+            continue
+        adjusted = candidates[index]
+        new_fg, new_bg = (adjusted, bg) if role == "foreground" else (fg, adjusted)
+        ratio = calculate_contrast_ratio(new_fg, new_bg)
+        alternatives.append(
+            {
+                "foreground": new_fg.hex,
+                "background": new_bg.hex,
+                "contrast_ratio": ratio,
+                "formatted_ratio": f"{ratio:.2f}:1",
+                "adjustment": f"{verb} {role} by {amounts[index] * 100:.1f}%",
+            }
+        )
 
     return alternatives
 
@@ -210,7 +748,9 @@ def is_color_blind_friendly(color1: Union[str, Color], color2: Union[str, Color]
     """
     Check if a color pair is friendly for different types of color blindness.
 
-    This is a simplified check based on color differences in different channels.
+    Both colors are simulated for each deficiency and the pair counts as
+    friendly when the simulated colors stay distinguishable (CIEDE2000 of at
+    least DISTINGUISHABLE_DELTA_E).
 
     Args:
         color1: First color
@@ -219,33 +759,8 @@ def is_color_blind_friendly(color1: Union[str, Color], color2: Union[str, Color]
     Returns:
         Dictionary with friendliness status for different types of color blindness
     """
-    # Convert to Color instances
-    c1 = color1 if isinstance(color1, Color) else Color(color1)
-    c2 = color2 if isinstance(color2, Color) else Color(color2)
-
-    # Get RGB values
-    r1, g1, b1 = c1.rgb
-    r2, g2, b2 = c2.rgb
-
-    # Calculate differences
-    r_diff = abs(r1 - r2)
-    g_diff = abs(g1 - g2)
-    b_diff = abs(b1 - b2)
-
-    # Thresholds for "significant difference"
-    threshold = 100
-
-    # Simplified checks for different types of color blindness
-    return {
-        # Protanopia (red-blind) - needs good blue-yellow differences
-        "protanopia": b_diff > threshold or g_diff > threshold,
-        # Deuteranopia (green-blind) - needs good blue-red differences
-        "deuteranopia": b_diff > threshold or r_diff > threshold,
-        # Tritanopia (blue-blind) - needs good red-green differences
-        "tritanopia": r_diff > threshold or g_diff > threshold,
-        # Achromatopsia (total color blindness) - needs good brightness difference
-        "achromatopsia": calculate_contrast_ratio(c1, c2) > 3.0,
-    }
+    differences = cvd_delta_e_matrices([color1, color2])
+    return {deficiency: bool(matrix[0, 1] >= DISTINGUISHABLE_DELTA_E) for deficiency, matrix in differences.items()}
 
 
 def get_brightness(color: Union[str, Color]) -> int:
@@ -0,0 +1,375 @@
+"""
+Color difference utilities for comparing and deduplicating colors.
+
+This module computes CIE color differences (ΔE76, ΔE94 and ΔE2000) between
+single colors, element-wise between two batches, and as full NxM matrices.
+Large comparisons are processed in chunks so memory stays bounded no matter
+how many colors are involved.
+"""
+
+from typing import Iterator
+from typing import List
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from ..models.color_array import ColorArray
+from ..models.color_model import Color
+from ..models.color_spaces import rgb_to_lab_array
+
+
+# Anything that can be turned into a batch of colors
+ColorBatch = Union[ColorArray, Sequence[Union[str, Color]]]
+
+# Supported difference formulas
+DELTA_E_METHODS = ("cie76", "cie94", "ciede2000")
+
+# Default number of pair evaluations per chunk (about 8 MB per float64 temporary)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Differences at or below this are generally imperceptible (one "just noticeable difference")
+JND_THRESHOLD = 2.3
+
+# Upper bound of ΔL / ΔE per formula; ΔE2000 divides ΔL by S_L, which is at most ~1.75
+_LIGHTNESS_BOUND = {"cie76": 1.0, "cie94": 1.0, "ciede2000": 1.75}
+
+_POW25_7 = 25.0**7
+
+
+def check_delta_e_method(method: str) -> None:
+    """
+    Validate a difference formula name.
+
+    Args:
+        method: Formula name
+
+    Raises:
+        ValueError: If the formula is not supported
+    """
+    if method not in DELTA_E_METHODS:
+        raise ValueError(f"Unsupported delta E method: {method}")
+
+
+def to_lab(colors: ColorBatch) -> np.ndarray:
+    """
+    Convert a batch of colors to CIELAB.
+
+    Args:
+        colors: ColorArray, or a sequence of hex strings / Color instances
+
+    Returns:
+        (N, 3) float64 array of (L, a, b)
+    """
+    if not isinstance(colors, ColorArray):
+        colors = ColorArray.from_colors([color if isinstance(color, Color) else Color(color) for color in colors])
+    return rgb_to_lab_array(colors.rgb)
+
+
+def _cie76(lab1: np.ndarray, lab2: np.ndarray) -> np.ndarray:
+    """Euclidean distance in CIELAB."""
+    return np.sqrt(((lab1 - lab2) ** 2).sum(axis=-1))
+
+
+def _cie94(lab1: np.ndarray, lab2: np.ndarray) -> np.ndarray:
+    """CIE94 difference with graphic-arts weights, using lab1 as the reference."""
+    d_l = lab1[..., 0] - lab2[..., 0]
+    c1 = np.hypot(lab1[..., 1], lab1[..., 2])
+    c2 = np.hypot(lab2[..., 1], lab2[..., 2])
+    d_c = c1 - c2
+    d_h_sq = np.maximum((lab1[..., 1] - lab2[..., 1]) ** 2 + (lab1[..., 2] - lab2[..., 2]) ** 2 - d_c**2, 0.0)
+    s_c = 1 + 0.045 * c1
+    s_h = 1 + 0.015 * c1
+    return np.sqrt(d_l**2 + (d_c / s_c) ** 2 + d_h_sq / s_h**2)
+
+
+def _ciede2000(lab1: np.ndarray, lab2: np.ndarray) -> np.ndarray:
+    """CIEDE2000 difference (Sharma, Wu and Dalal formulation)."""
+    l1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    l2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    c_bar7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + _POW25_7)))
+    a1p = (1 + g) * a1
+    a2p = (1 + g) * a2
+    c1p = np.hypot(a1p, b1)
+    c2p = np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+
+    chroma_product = c1p * c2p
+    achromatic = chroma_product == 0
+    dh = h2p - h1p
+    dh = np.where(dh > 180, dh - 360, np.where(dh < -180, dh + 360, dh))
+    dh = np.where(achromatic, 0.0, dh)
+
+    d_lp = l2 - l1
+    d_cp = c2p - c1p
+    d_hp = 2 * np.sqrt(chroma_product) * np.sin(np.radians(dh) / 2)
+
+    l_barp = (l1 + l2) / 2
+    c_barp = (c1p + c2p) / 2
+    h_sum = h1p + h2p
+    h_barp = np.where(
+        np.abs(h1p - h2p) <= 180, h_sum / 2, np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2)
+    )
+    h_barp = np.where(achromatic, h_sum, h_barp)
+
+    t = (
+        1
+        - 0.17 * np.cos(np.radians(h_barp - 30))
+        + 0.24 * np.cos(np.radians(2 * h_barp))
+        + 0.32 * np.cos(np.radians(3 * h_barp + 6))
+        - 0.20 * np.cos(np.radians(4 * h_barp - 63))
+    )
+    d_theta = 30 * np.exp(-(((h_barp - 275) / 25) ** 2))
+    c_barp7 = c_barp**7
+    r_c = 2 * np.sqrt(c_barp7 / (c_barp7 + _POW25_7))
+    l_offset = (l_barp - 50) ** 2
+    s_l = 1 + 0.015 * l_offset / np.sqrt(20 + l_offset)
+    s_c = 1 + 0.045 * c_barp
+    s_h = 1 + 0.015 * c_barp * t
+    r_t = -np.sin(np.radians(2 * d_theta)) * r_c
+
+    term_l = d_lp / s_l
+    term_c = d_cp / s_c
+    term_h = d_hp / s_h
+    return np.sqrt(np.maximum(term_l**2 + term_c**2 + term_h**2 + r_t * term_c * term_h, 0.0))
+
+
+_FORMULAS = {"cie76": _cie76, "cie94": _cie94, "ciede2000": _ciede2000}
+
+
+def delta_e_lab(lab1: np.ndarray, lab2: np.ndarray, method: str = "ciede2000") -> np.ndarray:
+    """
+    Compute color differences between broadcastable arrays of CIELAB values.
+
+    Args:
+        lab1: (..., 3) array of reference (L, a, b) values
+        lab2: (..., 3) array of sample (L, a, b) values
+        method: "cie76", "cie94" or "ciede2000"
+
+    Returns:
+        Array of differences with the broadcast shape of the inputs
+
+    Raises:
+        ValueError: If the method is not supported
+    """
+    check_delta_e_method(method)
+    return _FORMULAS[method](np.asarray(lab1, dtype=np.float64), np.asarray(lab2, dtype=np.float64))
+
+
+def delta_e(color1: Union[str, Color], color2: Union[str, Color], method: str = "ciede2000") -> float:
+    """
+    Compute the color difference between two colors.
+
+    Args:
+        color1: Reference color (hex string or Color instance)
+        color2: Sample color (hex string or Color instance)
+        method: "cie76", "cie94" or "ciede2000"
+
+    Returns:
+        Color difference (0 for identical colors)
+
+    Raises:
+        ValueError: If the method is not supported
+    """
+    c1 = color1 if isinstance(color1, Color) else Color(color1)
+    c2 = color2 if isinstance(color2, Color) else Color(color2)
+    return float(delta_e_lab(np.array(c1.lab), np.array(c2.lab), method))
+
+
+def delta_e_pairwise(colors1: ColorBatch, colors2: ColorBatch, method: str = "ciede2000") -> np.ndarray:
+    """
+    Compute element-wise color differences between two equally sized batches.
+
+    Args:
+        colors1: Reference colors
+        colors2: Sample colors
+        method: "cie76", "cie94" or "ciede2000"
+
+    Returns:
+        (N,) float32 array of differences
+
+    Raises:
+        ValueError: If the batches differ in length or the method is not supported
+    """
+    lab1 = to_lab(colors1)
+    lab2 = to_lab(colors2)
+    if len(lab1) != len(lab2):
+        raise ValueError(f"Batches must have the same length, got {len(lab1)} and {len(lab2)}")
+    return delta_e_lab(lab1, lab2, method).astype(np.float32)
+
+
+def iter_delta_e_matrix(
+    colors1: ColorBatch,
+    colors2: Union[ColorBatch, None] = None,
+    method: str = "ciede2000",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[slice, np.ndarray]]:
+    """
+    Stream an NxM difference matrix one block of rows at a time.
+
+    Each block holds at most ``chunk_size`` entries, so memory is bounded
+    regardless of N and M.
+
+    Args:
+        colors1: Reference colors (rows)
+        colors2: Sample colors (columns); defaults to colors1
+        method: "cie76", "cie94" or "ciede2000"
+        chunk_size: Maximum number of pair evaluations per block
+
+    Returns:
+        Iterator of (row_slice, block) where block is a float32 array of shape (rows, M)
+
+    Raises:
+        ValueError: If the method is not supported
+    """
+    check_delta_e_method(method)
+    lab1 = to_lab(colors1)
+    lab2 = lab1 if colors2 is None else to_lab(colors2)
+    return _iter_lab_blocks(lab1, lab2, method, chunk_size)
+
+
+def _iter_lab_blocks(
+    lab1: np.ndarray, lab2: np.ndarray, method: str, chunk_size: int
+) -> Iterator[Tuple[slice, np.ndarray]]:
+    """
+    Stream blocks of rows of the difference matrix between two CIELAB arrays.
+
+    Args:
+        lab1: (N, 3) reference values
+        lab2: (M, 3) sample values
+        method: Validated formula name
+        chunk_size: Maximum number of pair evaluations per block
+
+    Yields:
+        (row_slice, block) where block is a float32 array of shape (rows, M)
+    """
+    rows_per_chunk = max(1, chunk_size // max(1, len(lab2)))
+    formula = _FORMULAS[method]
+    for start in range(0, len(lab1), rows_per_chunk):
+        rows = slice(start, min(start + rows_per_chunk, len(lab1)))
+        yield rows, formula(lab1[rows, None, :], lab2[None, :, :]).astype(np.float32)
+
+
+def delta_e_matrix(
+    colors1: ColorBatch,
+    colors2: Union[ColorBatch, None] = None,
+    method: str = "ciede2000",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> np.ndarray:
+    """
+    Compute the full NxM color difference matrix.
+
+    The result itself takes NxMx4 bytes; intermediate memory is bounded by
+    ``chunk_size``. Use ``iter_delta_e_matrix`` or ``find_similar_pairs``
+    when the full matrix would not fit in memory.
+
+    Args:
+        colors1: Reference colors (rows)
+        colors2: Sample colors (columns); defaults to colors1
+        method: "cie76", "cie94" or "ciede2000"
+        chunk_size: Maximum number of pair evaluations per block
+
+    Returns:
+        (N, M) float32 array of differences
+
+    Raises:
+        ValueError: If the method is not supported
+    """
+    check_delta_e_method(method)
+    lab1 = to_lab(colors1)
+    lab2 = lab1 if colors2 is None else to_lab(colors2)
+    result = np.empty((len(lab1), len(lab2)), dtype=np.float32)
+    for rows, block in _iter_lab_blocks(lab1, lab2, method, chunk_size):
+        result[rows] = block
+    return result
+
+
+def find_similar_pairs(
+    colors: ColorBatch,
+    threshold: float = JND_THRESHOLD,
+    method: str = "ciede2000",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[int, int, float]]:
+    """
+    Stream every pair of colors whose difference is at or below a threshold.
+
+    Colors are sorted by lightness and each block is only compared with the
+    band of colors whose lightness could still be within the threshold, so
+    far fewer than N² pairs are evaluated for typical collections. Memory is
+    bounded by ``chunk_size``.
+
+    Args:
+        colors: Colors to compare with each other
+        threshold: Maximum difference for a pair to be reported
+        method: "cie76", "cie94" or "ciede2000"
+        chunk_size: Maximum number of pair evaluations per block
+
+    Yields:
+        (i, j, difference) with i < j indexing the input order
+
+    Raises:
+        ValueError: If the method is not supported
+    """
+    check_delta_e_method(method)
+    lab = to_lab(colors)
+    order = np.argsort(lab[:, 0], kind="stable")
+    sorted_lab = lab[order]
+    lightness = sorted_lab[:, 0]
+    band = threshold * _LIGHTNESS_BOUND[method]
+    rows_per_chunk = max(1, min(256, int(chunk_size**0.5)))
+    formula = _FORMULAS[method]
+
+    for start in range(0, len(lab), rows_per_chunk):
+        stop = min(start + rows_per_chunk, len(lab))
+        band_stop = int(np.searchsorted(lightness, lightness[stop - 1] + band, side="right"))
+        cols_per_chunk = max(1, chunk_size // (stop - start))
+
+        for col_start in range(start, band_stop, cols_per_chunk):
+            col_stop = min(col_start + cols_per_chunk, band_stop)
+            block = formula(sorted_lab[start:stop, None, :], sorted_lab[None, col_start:col_stop, :])
+            rows, cols = np.nonzero(block <= threshold)
+            rows += start
+            cols += col_start
+            upper = cols > rows
+            rows, cols = rows[upper], cols[upper]
+            values = block[rows - start, cols - col_start]
+            for row, col, value in zip(rows.tolist(), cols.tolist(), values.tolist(), strict=True):
+                i, j = int(order[row]), int(order[col])
+                yield (i, j, value) if i < j else (j, i, value)
+
+
+def deduplicate_colors(
+    colors: ColorBatch,
+    threshold: float = JND_THRESHOLD,
+    method: str = "ciede2000",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> np.ndarray:
+    """
+    Find which colors to keep when merging near-identical colors.
+
+    The first occurrence of each group of similar colors is kept; a later
+    color is dropped when it is within the threshold of a color that is kept.
+
+    Args:
+        colors: Colors to deduplicate
+        threshold: Maximum difference for two colors to be merged
+        method: "cie76", "cie94" or "ciede2000"
+        chunk_size: Maximum number of pair evaluations per block
+
+    Returns:
+        (N,) boolean mask of colors to keep
+
+    Raises:
+        ValueError: If the method is not supported
+    """
+    keep = np.ones(len(colors), dtype=bool)
+    pairs: List[Tuple[int, int]] = [(i, j) for i, j, _ in find_similar_pairs(colors, threshold, method, chunk_size)]
+    # Pairs sorted by their first index see each earlier color's final status
+    for i, j in sorted(pairs):
+        if keep[i]:
+            keep[j] = False
+    return keep
@@ -0,0 +1,998 @@
+"""
+Image color extraction for the Milky Color Suite.
+
+This module extracts dominant colors from images with a color histogram.
+Pixels are read straight from the image buffer, packed into 15- or 18-bit
+integer keys and counted with ``np.bincount``, so extraction is linear in the
+number of pixels and works on full-resolution images. Histogram bins that are
+perceptually near-duplicates are then merged in CIELAB.
+
+Mini-batch k-means (in OKLab) and median-cut quantization are also provided
+as pure NumPy extractors with deterministic seeds and bounded run time.
+
+Very large images can be streamed: uncompressed images are read from disk
+band by band, JPEGs are decoded at a reduced scale when sampling, and the
+histogram is accumulated incrementally within a fixed memory budget.
+Multi-frame images (animated GIF and PNG, multi-page TIFF) are read one
+frame at a time, with frames sampled at a fixed interval or on scene changes.
+"""
+
+import math
+import time
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+from PIL import Image
+from PIL import ImageSequence
+
+from ..models.color_array import ColorArray
+from ..models.color_model import Color
+from ..models.color_spaces import oklab_to_rgb_array
+from ..models.color_spaces import rgb_to_lab_array
+from ..models.color_spaces import rgb_to_oklab_array
+from .color_difference import DELTA_E_METHODS
+from .color_difference import delta_e_lab
+
+
+# Bits kept per channel: 5 gives 15-bit keys (32768 bins), 6 gives 18-bit keys (262144 bins)
+HISTOGRAM_BITS = (5, 6)
+
+# Color difference below which histogram bins are treated as the same color
+DEFAULT_MERGE_DELTA_E = 10.0
+
+# Pixels whose alpha is below this value are ignored
+ALPHA_CUTOFF = 128
+
+# Pixels counted per bincount pass, bounding temporary memory on large images
+PIXEL_CHUNK_SIZE = 1 << 20
+
+# Decoded pixel memory allowed per band when streaming an image, in bytes
+DEFAULT_MEMORY_BUDGET = 64 << 20
+
+# Bytes per pixel assumed when sizing bands: the decoded band plus its RGBA conversion
+_BAND_PIXEL_BYTES = 8
+
+# Bytes per stored pixel of the raw layouts that can be read from disk band by band
+_RAW_PIXEL_BYTES = {"L": 1, "RGB": 3, "BGR": 3, "RGBA": 4, "RGBX": 4, "BGRA": 4, "BGRX": 4, "CMYK": 4}
+
+# Histogram-based methods, which can be fed incrementally by streaming extraction
+STREAMING_METHODS = ("dominant", "median_cut")
+
+# Longest side, in pixels, of the thumbnail used for instant previews
+PREVIEW_SIZE = 64
+
+# Fraction of pixels that must change histogram bins for a frame to count as a new scene
+DEFAULT_SCENE_THRESHOLD = 0.25
+
+# Histogram bins compared against the leading colors at a time while merging
+_MERGE_BLOCK_SIZE = 4096
+
+# Seed used by the randomized extractors unless another one is given
+DEFAULT_SEED = 0
+
+# Mini-batch k-means defaults: pixels per batch, batches at most, and pixels sampled for seeding and ranking
+KMEANS_BATCH_SIZE = 2048
+KMEANS_MAX_ITERATIONS = 100
+KMEANS_SAMPLE_SIZE = 1 << 16
+
+# Largest OKLab move of any center, below which k-means is considered converged
+KMEANS_TOLERANCE = 1e-4
+
+
+def image_to_pixels(image: Image.Image, step: int = 1) -> np.ndarray:
+    """
+    Get the opaque pixels of an image as an array, without per-pixel Python objects.
+
+    Args:
+        image: Image in any mode; transparent pixels are dropped
+        step: Keep every ``step``-th pixel of every ``step``-th row
+
+    Returns:
+        (N, 3) uint8 array of RGB values
+    """
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info)
+    if has_alpha and image.mode != "RGBA":
+        image = image.convert("RGBA")
+    elif not has_alpha and image.mode != "RGB":
+        image = image.convert("RGB")
+
+    array = np.asarray(image)[::step, ::step]
+    if not has_alpha:
+        return array.reshape(-1, 3)
+    flat = array.reshape(-1, 4)
+    return flat[flat[:, 3] >= ALPHA_CUTOFF, :3]
+
+
+def color_histogram(pixels: np.ndarray, bits: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count pixels per histogram bin.
+
+    Each pixel keeps the top ``bits`` bits of each channel, packed into one
+    integer key. Along with the count, the channel sums of every bin are kept
+    so each bin reports the mean of its pixels rather than its center.
+
+    Args:
+        pixels: (N, 3) uint8 array of RGB values
+        bits: Bits kept per channel, one of HISTOGRAM_BITS
+
+    Returns:
+        Tuple of (sums, counts) for the occupied bins: (B, 3) float64 channel
+        sums and (B,) int64 pixel counts, ordered by key
+
+    Raises:
+        ValueError: If bits is not supported
+    """
+    sums, counts = _empty_histogram(bits)
+    _accumulate_histogram(pixels, bits, sums, counts)
+    occupied = np.nonzero(counts)[0]
+    return sums[occupied], counts[occupied]
+
+
+def _empty_histogram(bits: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Allocate the dense sums and counts of a histogram.
+
+    Args:
+        bits: Bits kept per channel, one of HISTOGRAM_BITS
+
+    Returns:
+        Tuple of (sums, counts) with one zeroed entry per bin
+
+    Raises:
+        ValueError: If bits is not supported
+    """
+    if bits not in HISTOGRAM_BITS:
+        raise ValueError(f"Histogram bits must be one of {HISTOGRAM_BITS}, got {bits}")
+    size = 1 << (3 * bits)
+    return np.zeros((size, 3), dtype=np.float64), np.zeros(size, dtype=np.int64)
+
+
+def _accumulate_histogram(pixels: np.ndarray, bits: int, sums: np.ndarray, counts: np.ndarray) -> None:
+    """
+    Add pixels to dense histogram arrays in place.
+
+    Args:
+        pixels: (N, 3) uint8 array of RGB values
+        bits: Bits kept per channel, matching the arrays
+        sums: Dense channel sums, from ``_empty_histogram``
+        counts: Dense pixel counts, from ``_empty_histogram``
+    """
+    size = len(counts)
+    shift = 8 - bits
+    for start in range(0, len(pixels), PIXEL_CHUNK_SIZE):
+        chunk = pixels[start : start + PIXEL_CHUNK_SIZE]
+        channels = chunk.astype(np.uint32)
+        keys = (channels[:, 0] >> shift) << (2 * bits)
+        keys |= (channels[:, 1] >> shift) << bits
+        keys |= channels[:, 2] >> shift
+        counts += np.bincount(keys, minlength=size)
+        for channel in range(3):
+            sums[:, channel] += np.bincount(keys, weights=chunk[:, channel], minlength=size)
+
+
+def merge_histogram_bins(
+    sums: np.ndarray,
+    counts: np.ndarray,
+    max_colors: int,
+    threshold: float = DEFAULT_MERGE_DELTA_E,
+    method: str = "cie76",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge perceptually similar histogram bins into at most ``max_colors`` colors.
+
+    Bins are visited from most to least frequent; a bin becomes a leading
+    color unless it lies within ``threshold`` of an earlier one. Every bin is
+    then merged into its nearest leading color within the threshold, and the
+    merged colors are the pixel-weighted means of their bins. Merged colors
+    that still end up within the threshold of each other are combined.
+
+    Args:
+        sums: (B, 3) channel sums per bin, as returned by ``color_histogram``
+        counts: (B,) pixel counts per bin
+        max_colors: Maximum number of leading colors to keep
+        threshold: Color difference below which bins are merged
+        method: Difference formula: "cie76", "cie94" or "ciede2000"
+
+    Returns:
+        Tuple of (colors, counts): (K, 3) uint8 merged colors and (K,) int64
+        merged pixel counts, most frequent first
+
+    Raises:
+        ValueError: If the method is not supported or the threshold is negative
+    """
+    if method not in DELTA_E_METHODS:
+        raise ValueError(f"Unsupported color difference method: {method}")
+    if threshold < 0:
+        raise ValueError(f"Merge threshold cannot be negative, got {threshold}")
+    if len(counts) == 0 or max_colors <= 0:
+        return np.zeros((0, 3), dtype=np.uint8), np.zeros(0, dtype=np.int64)
+
+    order = np.argsort(-counts, kind="stable")
+    sums, counts = sums[order], counts[order]
+    lab = rgb_to_lab_array(np.rint(sums / counts[:, None]).astype(np.uint8))
+
+    # Pick leading colors block by block; only survivors of a block are checked one by one
+    leaders: List[int] = []
+    for start in range(0, len(counts), _MERGE_BLOCK_SIZE):
+        candidates = np.arange(start, min(start + _MERGE_BLOCK_SIZE, len(counts)))
+        if leaders:
+            nearest = delta_e_lab(lab[candidates, None, :], lab[None, leaders, :], method).min(axis=1)
+            candidates = candidates[nearest >= threshold]
+        for candidate in candidates.tolist():
+            if leaders and delta_e_lab(lab[candidate], lab[leaders], method).min() < threshold:
+                continue
+            leaders.append(candidate)
+            if len(leaders) == max_colors:
+                break
+        if len(leaders) == max_colors:
+            break
+
+    # Merge every bin into its nearest leading color within the threshold; leaders always keep their own bin
+    leader_slots = np.full(len(counts), -1)
+    leader_slots[leaders] = np.arange(len(leaders))
+    merged_counts = np.zeros(len(leaders), dtype=np.int64)
+    merged_sums = np.zeros((len(leaders), 3), dtype=np.float64)
+    for start in range(0, len(counts), _MERGE_BLOCK_SIZE):
+        block = slice(start, start + _MERGE_BLOCK_SIZE)
+        differences = delta_e_lab(lab[block, None, :], lab[None, leaders, :], method)
+        nearest = differences.argmin(axis=1)
+        own = leader_slots[block]
+        is_leader = own >= 0
+        nearest[is_leader] = own[is_leader]
+        within = is_leader | (differences[np.arange(len(nearest)), nearest] < threshold)
+        members = nearest[within]
+        merged_counts += np.bincount(members, weights=counts[block][within], minlength=len(leaders)).astype(np.int64)
+        np.add.at(merged_sums, members, sums[block][within])
+
+    # Leaders far apart can still average out to near-identical colors; fold those together
+    rank = np.argsort(-merged_counts, kind="stable")
+    merged_sums, merged_counts = merged_sums[rank], merged_counts[rank]
+    merged_lab = rgb_to_lab_array(np.rint(merged_sums / merged_counts[:, None]).astype(np.uint8))
+    kept: List[int] = []
+    for cluster in range(len(merged_counts)):
+        if kept:
+            differences = delta_e_lab(merged_lab[cluster], merged_lab[kept], method)
+            target = int(differences.argmin())
+            if differences[target] < threshold:
+                merged_sums[kept[target]] += merged_sums[cluster]
+                merged_counts[kept[target]] += merged_counts[cluster]
+                continue
+        kept.append(cluster)
+
+    merged_sums, merged_counts = merged_sums[kept], merged_counts[kept]
+    rank = np.argsort(-merged_counts, kind="stable")
+    colors = np.rint(merged_sums[rank] / merged_counts[rank, None]).astype(np.uint8)
+    return colors, merged_counts[rank]
+
+
+def extract_dominant_colors(
+    image: Union[str, Image.Image],
+    count: int = 8,
+    bits: int = 5,
+    threshold: float = DEFAULT_MERGE_DELTA_E,
+    method: str = "cie76",
+) -> List[Color]:
+    """
+    Extract the dominant colors of an image at full resolution.
+
+    Args:
+        image: Image or path to an image file
+        count: Maximum number of colors to extract
+        bits: Histogram precision per channel, one of HISTOGRAM_BITS
+        threshold: Color difference below which colors are merged
+        method: Difference formula: "cie76", "cie94" or "ciede2000"
+
+    Returns:
+        Up to ``count`` colors, most dominant first; fewer if the image has
+        fewer distinct colors
+
+    Raises:
+        ValueError: If bits or method is not supported
+    """
+    return extract_colors(image, count, "dominant", bits=bits, threshold=threshold, delta_e_method=method)
+
+
+def _dominant_colors(
+    pixels: np.ndarray,
+    count: int,
+    bits: int = 5,
+    threshold: float = DEFAULT_MERGE_DELTA_E,
+    delta_e_method: str = "cie76",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract dominant colors with a histogram and perceptual merging.
+
+    Args:
+        pixels: (N, 3) uint8 array of RGB values
+        count: Maximum number of colors
+        bits: Histogram precision per channel, one of HISTOGRAM_BITS
+        threshold: Color difference below which colors are merged
+        delta_e_method: Difference formula: "cie76", "cie94" or "ciede2000"
+
+    Returns:
+        Tuple of (colors, populations), most populous first
+    """
+    sums, counts = color_histogram(pixels, bits)
+    return merge_histogram_bins(sums, counts, count, threshold, delta_e_method)
+
+
+def _kmeans_plus_plus(points: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Choose initial k-means centers with k-means++ seeding.
+
+    Args:
+        points: (N, 3) float32 points
+        count: Number of centers
+        rng: Random generator
+
+    Returns:
+        (K, 3) float32 centers, K being at most the number of distinct points
+    """
+    centers = [points[rng.integers(len(points))]]
+    distances = ((points - centers[0]) ** 2).sum(axis=1)
+    for _ in range(1, count):
+        total = distances.sum()
+        if total <= 0.0:
+            # Every point coincides with a center already
+            break
+        choice = rng.choice(len(points), p=distances / total)
+        centers.append(points[choice])
+        distances = np.minimum(distances, ((points - points[choice]) ** 2).sum(axis=1))
+    return np.array(centers, dtype=np.float32)
+
+
+def _nearest_center(points: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """
+    Assign every point to its nearest center.
+
+    Args:
+        points: (N, 3) points
+        centers: (K, 3) centers
+
+    Returns:
+        (N,) index of the nearest center
+    """
+    distances = (points * points).sum(axis=1)[:, None] - 2.0 * points @ centers.T + (centers * centers).sum(axis=1)
+    return distances.argmin(axis=1)
+
+
+def kmeans_colors(
+    pixels: np.ndarray,
+    count: int,
+    seed: int = DEFAULT_SEED,
+    max_iterations: int = KMEANS_MAX_ITERATIONS,
+    time_budget: Optional[float] = None,
+    batch_size: int = KMEANS_BATCH_SIZE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cluster pixels with mini-batch k-means in OKLab.
+
+    Centers are seeded with k-means++ on a fixed-size sample, then refined
+    with float32 mini-batches using per-center learning rates (Sculley, 2010).
+    The run stops at ``max_iterations`` batches, when no center moves more
+    than KMEANS_TOLERANCE, or once ``time_budget`` seconds have passed, so
+    latency does not depend on image size.
+
+    Args:
+        pixels: (N, 3) uint8 array of RGB values
+        count: Number of clusters
+        seed: Seed for sampling; the same seed always gives the same colors
+        max_iterations: Maximum number of mini-batches
+        time_budget: Optional wall-clock limit in seconds for the refinement
+        batch_size: Pixels per mini-batch
+
+    Returns:
+        Tuple of (colors, populations): (K, 3) uint8 cluster colors and (K,)
+        sample counts, most populous first; empty clusters are dropped
+
+    Raises:
+        ValueError: If count, max_iterations or batch_size is not positive
+    """
+    if count < 1 or max_iterations < 1 or batch_size < 1:
+        raise ValueError("Count, iteration limit and batch size must be positive")
+    if len(pixels) == 0:
+        return np.zeros((0, 3), dtype=np.uint8), np.zeros(0, dtype=np.int64)
+
+    started = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    sample_size = min(len(pixels), KMEANS_SAMPLE_SIZE)
+    sample = pixels[rng.choice(len(pixels), sample_size, replace=False)]
+    points = rgb_to_oklab_array(sample).astype(np.float32)
+
+    centers = _kmeans_plus_plus(points, count, rng)
+    seen = np.zeros(len(centers), dtype=np.float32)
+    for _ in range(max_iterations):
+        batch = rgb_to_oklab_array(pixels[rng.integers(0, len(pixels), batch_size)]).astype(np.float32)
+        labels = _nearest_center(batch, centers)
+        batch_counts = np.bincount(labels, minlength=len(centers)).astype(np.float32)
+        batch_sums = np.zeros_like(centers)
+        np.add.at(batch_sums, labels, batch)
+
+        # Each center moves toward its batch mean with a rate that decays as it sees more points
+        seen += batch_counts
+        active = batch_counts > 0
+        rate = np.zeros_like(seen)
+        rate[active] = batch_counts[active] / seen[active]
+        means = np.divide(batch_sums, batch_counts[:, None], out=centers.copy(), where=active[:, None])
+        shift = rate[:, None] * (means - centers)
+        centers += shift
+
+        if np.abs(shift).max() < KMEANS_TOLERANCE:
+            break
+        if time_budget is not None and time.perf_counter() - started >= time_budget:
+            break
+
+    populations = np.bincount(_nearest_center(points, centers), minlength=len(centers))
+    order = np.argsort(-populations, kind="stable")
+    order = order[populations[order] > 0]
+    return oklab_to_rgb_array(centers[order].astype(np.float64)), populations[order].astype(np.int64)
+
+
+def _squared_error(weights: np.ndarray, sums: np.ndarray, squares: np.ndarray) -> np.ndarray:
+    """
+    Calculate the pixel-weighted squared error of groups from their moments.
+
+    Args:
+        weights: (...,) pixel counts per group
+        sums: (..., 3) channel sums per group
+        squares: (...,) sums of squared channel values per group
+
+    Returns:
+        (...,) squared error of each group around its mean
+    """
+    return squares - (sums * sums).sum(axis=-1) / np.maximum(weights, 1)
+
+
+def _best_cut(box: np.ndarray, counts: np.ndarray, sums: np.ndarray, squares: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Find the axis-aligned cut of a box that removes the most squared error.
+
+    Args:
+        box: Indices of the histogram bins in the box
+        counts: (B,) pixel counts per bin
+        sums: (B, 3) channel sums per bin
+        squares: (B,) sums of squared channel values per bin
+
+    Returns:
+        Tuple of (bins sorted along the chosen channel, cut position); the box
+        splits into the bins before and from the position
+    """
+    best_error = np.inf
+    best_order = box
+    best_position = 0
+    means = sums[box] / counts[box, None]
+    for channel in range(3):
+        order = box[np.argsort(means[:, channel], kind="stable")]
+        weights = np.cumsum(counts[order])
+        moments = np.cumsum(sums[order], axis=0)
+        energy = np.cumsum(squares[order])
+        left = _squared_error(weights[:-1], moments[:-1], energy[:-1])
+        right = _squared_error(weights[-1] - weights[:-1], moments[-1] - moments[:-1], energy[-1] - energy[:-1])
+        errors = left + right
+        if len(errors) and errors.min() < best_error:
+            best_error = float(errors.min())
+            best_order = order
+            best_position = int(errors.argmin()) + 1
+    return best_order, best_position
+
+
+def median_cut_colors(pixels: np.ndarray, count: int, bits: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize pixels by recursive box cuts over the color histogram.
+
+    This is median cut with Wu's variance criterion: the box with the largest
+    squared error is split along whichever channel, and at whichever point,
+    removes the most error, until ``count`` boxes exist. Working on histogram
+    bins rather than pixels keeps every cut proportional to the number of
+    occupied bins, and the result is fully deterministic.
+
+    Args:
+        pixels: (N, 3) uint8 array of RGB values
+        count: Maximum number of colors
+        bits: Histogram precision per channel, one of HISTOGRAM_BITS
+
+    Returns:
+        Tuple of (colors, populations): (K, 3) uint8 box colors and (K,) pixel
+        counts, most populous first
+
+    Raises:
+        ValueError: If count is not positive or bits is not supported
+    """
+    return median_cut_histogram(*color_histogram(pixels, bits), count)
+
+
+def median_cut_histogram(sums: np.ndarray, counts: np.ndarray, count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize a color histogram by recursive box cuts, as in ``median_cut_colors``.
+
+    Args:
+        sums: (B, 3) channel sums per bin, as returned by ``color_histogram``
+        counts: (B,) pixel counts per bin
+        count: Maximum number of colors
+
+    Returns:
+        Tuple of (colors, populations), most populous first
+
+    Raises:
+        ValueError: If count is not positive
+    """
+    if count < 1:
+        raise ValueError(f"Count must be positive, got {count}")
+    if len(counts) == 0:
+        return np.zeros((0, 3), dtype=np.uint8), np.zeros(0, dtype=np.int64)
+
+    # Approximate each bin's second moment from its mean; bins are small enough for this to rank cuts well
+    squares = (sums * sums).sum(axis=1) / counts
+
+    boxes = [np.arange(len(counts))]
+    errors = [float(_squared_error(counts.sum(), sums.sum(axis=0), squares.sum()))]
+    while len(boxes) < count:
+        target = int(np.argmax(errors))
+        if errors[target] <= 0.0 or len(boxes[target]) < 2:
+            break
+        order, position = _best_cut(boxes[target], counts, sums, squares)
+        boxes.pop(target)
+        errors.pop(target)
+        for half in (order[:position], order[position:]):
+            boxes.append(half)
+            error = _squared_error(counts[half].sum(), sums[half].sum(axis=0), squares[half].sum())
+            errors.append(float(error) if len(half) > 1 else 0.0)
+
+    populations = np.array([counts[box].sum() for box in boxes], dtype=np.int64)
+    colors = np.array([sums[box].sum(axis=0) / populations[index] for index, box in enumerate(boxes)])
+    order = np.argsort(-populations, kind="stable")
+    return np.clip(np.rint(colors[order]), 0, 255).astype(np.uint8), populations[order]
+
+
+# Extraction methods by name; each takes (pixels, count, **options) and returns (colors, populations)
+EXTRACTORS: Dict[str, Callable[..., Tuple[np.ndarray, np.ndarray]]] = {
+    "dominant": _dominant_colors,
+    "kmeans": kmeans_colors,
+    "median_cut": median_cut_colors,
+}
+
+
+def extract_colors(
+    image: Union[str, Image.Image], count: int = 8, method: str = "dominant", **options: object
+) -> List[Color]:
+    """
+    Extract a palette from an image with any registered method.
+
+    Args:
+        image: Image or path to an image file
+        count: Maximum number of colors to extract
+        method: One of EXTRACTORS: "dominant", "kmeans" or "median_cut"
+        **options: Method-specific options, such as ``seed``, ``max_iterations``
+            and ``time_budget`` for k-means or ``bits`` for the histogram methods
+
+    Returns:
+        Up to ``count`` colors, most prominent first
+
+    Raises:
+        ValueError: If the method or its options are invalid
+    """
+    if method not in EXTRACTORS:
+        raise ValueError(f"Unsupported extraction method: {method}")
+    if isinstance(image, str):
+        with Image.open(image) as opened:
+            pixels = image_to_pixels(opened)
+    else:
+        pixels = image_to_pixels(image)
+
+    colors, _ = EXTRACTORS[method](pixels, count, **options)
+    return ColorArray.from_rgb(colors).to_colors()
+
+
+def _sampling_step(size: Tuple[int, int], max_pixels: Optional[int]) -> int:
+    """
+    Get the pixel stride that keeps about ``max_pixels`` pixels of an image.
+
+    Args:
+        size: Image (width, height)
+        max_pixels: Pixel budget, or None for full resolution
+
+    Returns:
+        Stride along both axes, at least 1
+    Raises:
+        ValueError: If the pixel budget is not positive
+    """
+    if max_pixels is None:
+        return 1
+    if max_pixels < 1:
+        raise ValueError(f"Pixel budget must be positive, got {max_pixels}")
+    width, height = size
+    return max(1, math.ceil(math.sqrt(width * height / max_pixels)))
+
+
+def _band_height(width: int, step: int, memory_budget: int) -> int:
+    """
+    Get the number of rows decoded at a time for a band of the given width.
+
+    Args:
+        width: Band width in pixels
+        step: Sampling stride; bands are a multiple of it so rows stay evenly sampled
+        memory_budget: Decoded pixel memory allowed per band, in bytes
+
+    Returns:
+        Rows per band, at least ``step``
+    """
+    rows = memory_budget // (max(width, 1) * _BAND_PIXEL_BYTES)
+    return max(step, rows - rows % step)
+
+
+def _raw_tiles(image: Image.Image) -> Optional[List[Tuple[Tuple[int, int, int, int], int, str, int, int]]]:
+    """
+    Describe the stored layout of an image that can be read band by band.
+
+    Only uncompressed layouts qualify (such as BMP, PPM and uncompressed
+    TIFF); their rows sit at fixed offsets, so any band can be read on its own.
+
+    Args:
+        image: Image opened from a file and not yet loaded
+
+    Returns:
+        List of (extents, offset, rawmode, stride, orientation), one per tile,
+        or None if the image must be decoded as a whole
+    """
+    # Only images opened from a file carry a filename and tile layout
+    raw_tiles = getattr(image, "tile", None)
+    if not getattr(image, "filename", None) or not raw_tiles or image.mode not in ("L", "RGB", "RGBA", "CMYK"):
+        return None
+    tiles = []
+    for tile in raw_tiles:
+        codec, extents, offset, args = tile[:4]
+        if isinstance(args, str):
+            args = (args, 0, 1)
+        if codec != "raw" or not isinstance(args, tuple) or len(args) < 3 or args[0] not in _RAW_PIXEL_BYTES:
+            return None
+        rawmode, stride, orientation = args[:3]
+        stride = stride or (extents[2] - extents[0]) * _RAW_PIXEL_BYTES[rawmode]
+        tiles.append((extents, offset, rawmode, stride, orientation))
+    return tiles
+
+
+def _iter_raw_bands(image: Image.Image, step: int, memory_budget: int) -> Iterator[np.ndarray]:
+    """
+    Read the pixels of an uncompressed image from disk, one band at a time.
+
+    Args:
+        image: Image whose ``_raw_tiles`` layout is known
+        step: Sampling stride along both axes
+        memory_budget: Decoded pixel memory allowed per band, in bytes
+
+    Yields:
+        (N, 3) uint8 arrays of opaque RGB values
+    """
+    tiles = _raw_tiles(image) or []
+    # Images with a raw tile layout were opened from a file, so the filename is set
+    with open(getattr(image, "filename", ""), "rb") as f:
+        for (left, top, right, bottom), offset, rawmode, stride, orientation in tiles:
+            width, height = right - left, bottom - top
+            rows = _band_height(width, step, memory_budget)
+            # Keep sampled columns aligned with the image grid across horizontal tiles
+            skip = -left % step
+            for first in range(-top % step, height, rows):
+                last = min(first + rows, height)
+                # Bottom-up layouts store the last row of the band first
+                stored = first if orientation >= 0 else height - last
+                f.seek(offset + stored * stride)
+                data = f.read((last - first) * stride)
+                band = Image.frombuffer(image.mode, (width, last - first), data, "raw", rawmode, stride, orientation)
+                if skip:
+                    band = band.crop((skip, 0, width, last - first))
+                yield image_to_pixels(band, step)
+
+
+def iter_image_pixels(
+    image: Union[str, Image.Image], memory_budget: int = DEFAULT_MEMORY_BUDGET, max_pixels: Optional[int] = None
+) -> Iterator[np.ndarray]:
+    """
+    Stream the opaque pixels of an image in bands of bounded size.
+
+    Uncompressed images are read from disk band by band, so memory stays
+    within ``memory_budget`` however large the image is. When sampling, JPEGs
+    are decoded directly at a reduced scale with ``draft``. Other formats are
+    decoded once and then converted one band at a time, without copying the
+    whole image.
+
+    Args:
+        image: Image or path to an image file
+        memory_budget: Decoded pixel memory allowed per band, in bytes
+        max_pixels: Approximate number of pixels to sample evenly across the
+            image, or None to read every pixel at full resolution
+
+    Yields:
+        (N, 3) uint8 arrays of opaque RGB values
+
+    Raises:
+        ValueError: If the memory or pixel budget is not positive
+    """
+    if memory_budget < 1:
+        raise ValueError(f"Memory budget must be positive, got {memory_budget}")
+    if isinstance(image, str):
+        with Image.open(image) as opened:
+            yield from iter_image_pixels(opened, memory_budget, max_pixels)
+        return
+
+    step = _sampling_step(image.size, max_pixels)
+    if _raw_tiles(image) is not None:
+        yield from _iter_raw_bands(image, step, memory_budget)
+        return
+
+    if step > 1 and image.format == "JPEG":
+        # Let the decoder scale down by up to 8x, then sample what remains
+        width, height = image.size
+        image.draft("RGB", (math.ceil(width / step), math.ceil(height / step)))
+        step = _sampling_step(image.size, max_pixels)
+
+    width, height = image.size
+    rows = _band_height(width, step, memory_budget)
+    for top in range(0, height, rows):
+        yield image_to_pixels(image.crop((0, top, width, min(top + rows, height))), step)
+
+
+def stream_color_histogram(
+    image: Union[str, Image.Image],
+    bits: int = 5,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    max_pixels: Optional[int] = None,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the color histogram of an image incrementally, band by band.
+
+    Args:
+        image: Image or path to an image file
+        bits: Bits kept per channel, one of HISTOGRAM_BITS
+        memory_budget: Decoded pixel memory allowed per band, in bytes
+        max_pixels: Approximate number of pixels to sample, or None for full resolution
+        cancelled: Optional callable checked between bands; once it returns
+            True, reading stops and the histogram so far is returned
+
+    Returns:
+        Tuple of (sums, counts) for the occupied bins, as from ``color_histogram``
+
+    Raises:
+        ValueError: If bits or a budget is invalid
+    """
+    sums, counts = _empty_histogram(bits)
+    for pixels in iter_image_pixels(image, memory_budget, max_pixels):
+        if cancelled is not None and cancelled():
+            break
+        _accumulate_histogram(pixels, bits, sums, counts)
+    occupied = np.nonzero(counts)[0]
+    return sums[occupied], counts[occupied]
+
+
+def extract_colors_streaming(
+    image: Union[str, Image.Image],
+    count: int = 8,
+    method: str = "dominant",
+    bits: int = 5,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    max_pixels: Optional[int] = None,
+    threshold: float = DEFAULT_MERGE_DELTA_E,
+    delta_e_method: str = "cie76",
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> List[Color]:
+    """
+    Extract a palette from a large image with bounded memory.
+
+    Args:
+        image: Image or path to an image file
+        count: Maximum number of colors to extract
+        method: One of STREAMING_METHODS: "dominant" or "median_cut"
+        bits: Histogram precision per channel, one of HISTOGRAM_BITS
+        memory_budget: Decoded pixel memory allowed per band, in bytes
+        max_pixels: Approximate number of pixels to sample, or None for full resolution
+        threshold: Color difference below which dominant colors are merged
+        delta_e_method: Difference formula for merging dominant colors
+        cancelled: Optional callable checked between bands; once it returns
+            True, extraction stops early and the result should be discarded
+
+    Returns:
+        Up to ``count`` colors, most prominent first
+
+    Raises:
+        ValueError: If the method, bits or a budget is invalid
+    """
+    if method not in STREAMING_METHODS:
+        raise ValueError(f"Streaming extraction supports {STREAMING_METHODS}, got {method}")
+    sums, counts = stream_color_histogram(image, bits, memory_budget, max_pixels, cancelled)
+    if method == "median_cut":
+        colors, _ = median_cut_histogram(sums, counts, count)
+    else:
+        colors, _ = merge_histogram_bins(sums, counts, count, threshold, delta_e_method)
+    return ColorArray.from_rgb(colors).to_colors()
+
+
+def preview_colors(image: Union[str, Image.Image], count: int = 8, size: int = PREVIEW_SIZE) -> List[Color]:
+    """
+    Extract approximate dominant colors from a tiny thumbnail, fast enough for interactive use.
+
+    JPEGs are decoded directly at a reduced scale, so the cost barely depends
+    on the image size. The result is meant to be replaced by a full extraction.
+
+    Args:
+        image: Image or path to an image file
+        count: Maximum number of colors to extract
+        size: Longest side of the thumbnail, in pixels
+
+    Returns:
+        Up to ``count`` colors, most dominant first
+
+    Raises:
+        ValueError: If the size is not positive
+    """
+    if size < 1:
+        raise ValueError(f"Preview size must be positive, got {size}")
+    if isinstance(image, str):
+        with Image.open(image) as opened:
+            # Shrinking a freshly opened image in place lets JPEGs decode at a reduced scale
+            opened.thumbnail((size, size))
+            pixels = image_to_pixels(opened)
+    else:
+        width, height = image.size
+        scale = min(1.0, size / max(width, height, 1))
+        small = (max(1, round(width * scale)), max(1, round(height * scale)))
+        pixels = image_to_pixels(image.resize(small, Image.Resampling.BOX) if scale < 1.0 else image)
+
+    colors, _ = _dominant_colors(pixels, count)
+    return ColorArray.from_rgb(colors).to_colors()
+
+
+def is_multi_frame(image: Image.Image) -> bool:
+    """
+    Check whether an image has more than one frame.
+
+    Args:
+        image: Image opened from a file
+
+    Returns:
+        True for animated GIF and PNG, multi-page TIFF and similar images
+    """
+    return getattr(image, "n_frames", 1) > 1
+
+
+def iter_frame_histograms(
+    image: Image.Image,
+    bits: int = 5,
+    every: int = 1,
+    scene_threshold: Optional[float] = None,
+    max_pixels: Optional[int] = None,
+) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    """
+    Stream the dense histograms of the sampled frames of an image.
+
+    Frames are decoded lazily, one at a time. Every ``every``-th frame is a
+    candidate; with a scene threshold, a candidate is only kept when its
+    histogram differs enough from the last kept frame. Memory stays constant
+    however many frames the image has.
+
+    Args:
+        image: Image opened from a file; a single-frame image yields one frame
+        bits: Bits kept per channel, one of HISTOGRAM_BITS
+        every: Sample every ``every``-th frame
+        scene_threshold: Optional fraction of pixels, from 0 to 1, that must
+            change histogram bins since the last kept frame
+        max_pixels: Approximate number of pixels to sample per frame, or None for every pixel
+
+    Yields:
+        Tuples of (frame index, sums, counts) with one entry per bin; the
+        arrays are only valid until the next frame is requested
+
+    Raises:
+        ValueError: If bits, the interval, the threshold or the pixel budget is invalid
+    """
+    if every < 1:
+        raise ValueError(f"Frame interval must be positive, got {every}")
+    if scene_threshold is not None and not 0.0 <= scene_threshold <= 1.0:
+        raise ValueError(f"Scene threshold must be between 0 and 1, got {scene_threshold}")
+
+    sums, counts = _empty_histogram(bits)
+    previous: Optional[np.ndarray] = None
+    try:
+        for index, frame in enumerate(ImageSequence.Iterator(image)):
+            if index % every:
+                continue
+            sums.fill(0.0)
+            counts.fill(0)
+            _accumulate_histogram(image_to_pixels(frame, _sampling_step(frame.size, max_pixels)), bits, sums, counts)
+
+            if scene_threshold is not None:
+                share = counts / max(counts.sum(), 1)
+                # Half the L1 distance is the fraction of pixels that moved to other bins
+                if previous is not None and np.abs(share - previous).sum() / 2 < scene_threshold:
+                    continue
+                previous = share
+            yield index, sums, counts
+    finally:
+        # Leave the image on its first frame, as it was opened
+        image.seek(0)
+
+
+def extract_frame_palettes(
+    image: Union[str, Image.Image],
+    count: int = 8,
+    method: str = "dominant",
+    every: int = 1,
+    scene_threshold: Optional[float] = None,
+    bits: int = 5,
+    max_pixels: Optional[int] = None,
+    threshold: float = DEFAULT_MERGE_DELTA_E,
+    delta_e_method: str = "cie76",
+    per_frame: bool = True,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> Tuple[List[Color], List[Tuple[int, List[Color]]]]:
+    """
+    Extract the combined palette of a multi-frame image, and optionally one palette per sampled frame.
+
+    The combined palette comes from the sum of the sampled frames'
+    histograms, accumulated as frames are read, so every sampled pixel of
+    every frame counts equally.
+
+    Args:
+        image: Image or path to an image file
+        count: Maximum number of colors per palette
+        method: One of STREAMING_METHODS: "dominant" or "median_cut"
+        every: Sample every ``every``-th frame
+        scene_threshold: Optional fraction of pixels that must change bins for
+            a sampled frame to be kept, as in ``iter_frame_histograms``
+        bits: Histogram precision per channel, one of HISTOGRAM_BITS
+        max_pixels: Approximate number of pixels to sample per frame, or None for every pixel
+        threshold: Color difference below which dominant colors are merged
+        delta_e_method: Difference formula for merging dominant colors
+        per_frame: Whether to also extract each sampled frame's palette
+        cancelled: Optional callable checked between frames; once it returns
+            True, extraction stops early and the result should be discarded
+
+    Returns:
+        Tuple of (combined palette, [(frame index, frame palette), ...]); the
+        list is empty when ``per_frame`` is False
+
+    Raises:
+        ValueError: If the method or any sampling option is invalid
+    """
+    if method not in STREAMING_METHODS:
+        raise ValueError(f"Frame extraction supports {STREAMING_METHODS}, got {method}")
+    if isinstance(image, str):
+        with Image.open(image) as opened:
+            return extract_frame_palettes(
+                opened,
+                count,
+                method,
+                every,
+                scene_threshold,
+                bits,
+                max_pixels,
+                threshold,
+                delta_e_method,
+                per_frame,
+                cancelled,
+            )
+
+    def palette(sums: np.ndarray, counts: np.ndarray) -> List[Color]:
+        """Extract a palette from the occupied bins of a dense histogram."""
+        occupied = np.nonzero(counts)[0]
+        if method == "median_cut":
+            colors, _ = median_cut_histogram(sums[occupied], counts[occupied], count)
+        else:
+            colors, _ = merge_histogram_bins(sums[occupied], counts[occupied], count, threshold, delta_e_method)
+        return ColorArray.from_rgb(colors).to_colors()
+
+    total_sums, total_counts = _empty_histogram(bits)
+    frames: List[Tuple[int, List[Color]]] = []
+    for index, sums, counts in iter_frame_histograms(image, bits, every, scene_threshold, max_pixels):
+        if cancelled is not None and cancelled():
+            break
+        total_sums += sums
+        total_counts += counts
+        if per_frame:
+            frames.append((index, palette(sums, counts)))
+    return palette(total_sums, total_counts), frames
@@ -0,0 +1,491 @@
+"""
+Vectorized color harmony engine for the Milky Color Suite.
+
+This module computes every harmony of a base color (complementary, analogous,
+triadic, tetradic, split-complementary, monochromatic, shades and tints) in a
+single pass: the HSL rows of all harmonies are stacked into one array and
+converted to RGB together. Results are kept in a bounded LRU cache keyed by
+(packed color, harmony type, count), shared by ``generate_harmonic_palette``
+and the harmony generator widget. The same vectorized core generates one
+harmony for thousands of seed colors at once, in chunks and optionally in a
+process pool.
+"""
+
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from ..models.color_array import ColorArray
+from ..models.color_model import OPAQUE
+from ..models.color_model import Color
+from ..models.palette_model import Palette
+from ..models.palette_model import PaletteCollection
+
+
+# Supported harmony types, in display order
+HARMONY_TYPES = (
+    "complementary",
+    "analogous",
+    "triadic",
+    "tetradic",
+    "split_complementary",
+    "monochromatic",
+    "shades",
+    "tints",
+)
+
+# Hue rotations in degrees that define the rotation-based harmonies, base first
+HARMONY_ROTATIONS: Dict[str, Tuple[int, ...]] = {
+    "complementary": (0, 180),
+    "triadic": (0, 120, 240),
+    "tetradic": (0, 90, 180, 270),
+    "split_complementary": (0, 150, 210),
+}
+
+# Number of colors computed for default-size lookups; smaller harmonies are a prefix of it
+DEFAULT_HARMONY_COUNT = 8
+
+# Number of colors each harmony has on its own, used when no count is given
+HARMONY_SIZES: Dict[str, int] = {
+    "complementary": 2,
+    "analogous": 5,
+    "triadic": 3,
+    "tetradic": 4,
+    "split_complementary": 3,
+    "monochromatic": 8,
+    "shades": 8,
+    "tints": 8,
+}
+
+# Angle between neighbouring analogous colors in degrees
+ANALOGOUS_ANGLE = 30
+
+# Largest lightness change of the darkest shade and the lightest tint
+SHADE_RANGE = 0.7
+
+# Lightness range of monochromatic colors, in percent
+MONOCHROMATIC_LIGHTNESS = (10, 90)
+
+# Seeds converted per vectorized pass (and per worker task) by the batch API
+DEFAULT_BATCH_CHUNK_SIZE = 4096
+
+# Maximum number of (color, type, count) entries kept in the harmony cache
+HARMONY_CACHE_SIZE = 2048
+
+# Least recently used harmonies, keyed by (packed color, harmony type, count)
+_harmony_cache: "OrderedDict[Tuple[int, str, int], Tuple[Color, ...]]" = OrderedDict()
+
+# Cache hits and misses since the cache was last cleared
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _check_count(count: int) -> None:
+    """
+    Validate the number of colors in a harmony.
+
+    Args:
+        count: Number of colors to check
+
+    Raises:
+        ValueError: If the count is not positive
+    """
+    if count < 1:
+        raise ValueError(f"Color count must be positive, got {count}")
+
+
+def _check_harmony(harmony_type: str, count: int) -> None:
+    """
+    Validate a harmony type and color count.
+
+    Args:
+        harmony_type: Harmony type to check
+        count: Number of colors to check
+
+    Raises:
+        ValueError: If the type is unsupported or the count is not positive
+    """
+    if harmony_type not in HARMONY_TYPES:
+        raise ValueError(f"Unsupported harmony type: {harmony_type}")
+    _check_count(count)
+
+
+def _normalize_components(values: np.ndarray, scale: float) -> np.ndarray:
+    """
+    Normalize HSL components the way a Color dictionary does.
+
+    Components above 1 are taken to be on the given scale; others are already
+    normalized. Matching this keeps rotations identical to ``Color.complementary``.
+
+    Args:
+        values: Array of raw components
+        scale: Full-scale value of the components
+
+    Returns:
+        Array of normalized components
+    """
+    return np.where(values > 1, values / scale, values)
+
+
+def _hsl_rows_to_rgb(hsl: np.ndarray) -> np.ndarray:
+    """
+    Convert normalized HSL rows to normalized RGB rows.
+
+    This follows the scalar conversion of the color model operation for
+    operation, so every row quantizes to exactly the color Color would build.
+
+    Args:
+        hsl: (N, 3) float64 array of hue, saturation and lightness
+
+    Returns:
+        (N, 3) float64 array with values in range 0.0-1.0
+    """
+    hue = hsl[:, 0:1]
+    saturation = np.clip(hsl[:, 1:2], 0.0, 1.0)
+    lightness = np.clip(hsl[:, 2:3], 0.0, 1.0)
+
+    v2 = np.where(lightness < 0.5, lightness * (1.0 + saturation), (lightness + saturation) - (saturation * lightness))
+    v1 = 2.0 * lightness - v2
+
+    offsets = (hue + np.array([1.0 / 3, 0.0, -1.0 / 3])) % 1.0
+    rgb = np.select(
+        [6 * offsets < 1, 2 * offsets < 1, 3 * offsets < 2],
+        [v1 + (v2 - v1) * 6 * offsets, np.broadcast_to(v2, offsets.shape), v1 + (v2 - v1) * ((2.0 / 3) - offsets) * 6],
+        np.broadcast_to(v1, offsets.shape),
+    )
+    return np.where(saturation == 0, lightness, rgb)
+
+
+def _analogous_offsets(count: int) -> List[int]:
+    """
+    Get the hue offsets of an analogous harmony, base first.
+
+    Args:
+        count: Number of colors
+
+    Returns:
+        Offsets in degrees: 0, then alternating steps below and above the base hue
+    """
+    return [((step + 1) // 2) * ANALOGOUS_ANGLE * (-1 if step % 2 else 1) for step in range(count)]
+
+
+def _harmony_hsl(harmony_type: str, count: int, hsl: np.ndarray, hsl_float: np.ndarray) -> np.ndarray:
+    """
+    Build the normalized HSL rows of one harmony for many base colors.
+
+    Args:
+        harmony_type: One of HARMONY_TYPES
+        count: Number of colors in the harmony, base included
+        hsl: (N, 3) integer HSL of the base colors, as ``Color.hsl``
+        hsl_float: (N, 3) float HSL of the base colors, as ``Color.hsl_float``
+
+    Returns:
+        (N, count - 1, 3) float64 HSL of every color after the base
+    """
+    h, s, lightness = (hsl[:, channel : channel + 1] for channel in range(3))
+    slots = count - 1
+
+    if harmony_type in ("shades", "tints"):
+        # Adjust the base's own float HSL, like Color.darken and Color.lighten
+        amounts = np.linspace(0.0, SHADE_RANGE, count)[1:]
+        rows = np.empty((len(hsl), slots, 3))
+        rows[:, :, 0:2] = hsl_float[:, None, 0:2]
+        rows[:, :, 2] = hsl_float[:, 2:3] + (-amounts if harmony_type == "shades" else amounts)
+        return rows
+
+    # Everything else is built like a Color dictionary, in degrees and percent
+    offsets = np.zeros(slots)
+    shifts = np.zeros(slots)
+    new_lightness = np.broadcast_to(lightness, (len(hsl), slots))
+    if harmony_type in HARMONY_ROTATIONS:
+        rotations = np.array(HARMONY_ROTATIONS[harmony_type][:count])
+        remaining = count - len(rotations)
+        fill = np.arange(remaining)
+        offsets = np.concatenate([rotations[1:], rotations[fill % len(rotations)]])
+        shifts = np.concatenate([np.zeros(len(rotations) - 1), 0.1 + (fill / remaining) * 0.6])
+    elif harmony_type == "analogous":
+        offsets = np.array(_analogous_offsets(count)[1:])
+    elif harmony_type == "monochromatic":
+        low, high = MONOCHROMATIC_LIGHTNESS
+        new_lightness = np.broadcast_to(low + (np.arange(slots) * (high - low)) / slots, (len(hsl), slots))
+
+    rows = np.empty((len(hsl), slots, 3))
+    rows[:, :, 0] = _normalize_components((h + offsets) % 360, 360)
+    rows[:, :, 1] = _normalize_components(np.broadcast_to(s, (len(hsl), slots)), 100)
+    rows[:, :, 2] = _normalize_components(new_lightness, 100) + shifts
+    return rows
+
+
+def _harmony_packed(packed: np.ndarray, harmony_types: Sequence[str], count: int) -> Dict[str, np.ndarray]:
+    """
+    Compute harmonies for many base colors with a single HSL-to-RGB conversion.
+
+    Args:
+        packed: (N,) packed ARGB base colors
+        harmony_types: Harmony types to compute
+        count: Number of colors in each harmony, base included
+
+    Returns:
+        Dictionary mapping each harmony type to an (N, count) array of packed
+        colors, the base color first
+    """
+    seeds = ColorArray(packed)
+    hsl_float = seeds._hsl64()
+    hsl = np.column_stack(
+        [np.round(hsl_float[:, 0] * 360) % 360, np.round(hsl_float[:, 1] * 100), np.round(hsl_float[:, 2] * 100)]
+    )
+
+    rows = [_harmony_hsl(harmony_type, count, hsl, hsl_float) for harmony_type in harmony_types]
+    alpha = [
+        np.broadcast_to(seeds.alpha[:, None] if harmony_type in ("shades", "tints") else OPAQUE, block.shape[:2])
+        for harmony_type, block in zip(harmony_types, rows, strict=True)
+    ]
+    converted = ColorArray.from_rgb(
+        _hsl_rows_to_rgb(np.concatenate([block.reshape(-1, 3) for block in rows])),
+        np.concatenate([block.reshape(-1) for block in alpha]),
+    ).packed
+
+    harmonies: Dict[str, np.ndarray] = {}
+    start = 0
+    for harmony_type, block in zip(harmony_types, rows, strict=True):
+        size = block.shape[0] * block.shape[1]
+        colors = converted[start : start + size].reshape(block.shape[:2])
+        harmonies[harmony_type] = np.column_stack([seeds.packed, colors])
+        start += size
+    return harmonies
+
+
+def compute_harmonies(base_color: Union[str, Color], count: int) -> Dict[str, List[Color]]:
+    """
+    Compute every harmony of a base color in one vectorized pass.
+
+    Every harmony starts with the base color. Rotation-based harmonies with
+    fewer colors than ``count`` are filled with lighter variations of their
+    colors; analogous harmonies keep rotating, monochromatic harmonies spread
+    the lightness evenly, and shades and tints darken or lighten the base by
+    up to ``SHADE_RANGE``.
+
+    Args:
+        base_color: The base color (hex string or Color instance)
+        count: Number of colors in each harmony
+
+    Returns:
+        Dictionary mapping each harmony type to its colors
+
+    Raises:
+        ValueError: If the count is not positive
+    """
+    _check_count(count)
+    base = base_color if isinstance(base_color, Color) else Color(base_color)
+    harmonies = _harmony_packed(np.array([base.packed], dtype=np.uint32), HARMONY_TYPES, count)
+    return {harmony_type: [base, *ColorArray(packed[0, 1:]).to_colors()] for harmony_type, packed in harmonies.items()}
+
+
+def harmony_colors(base_color: Union[str, Color], harmony_type: str, count: Optional[int] = None) -> List[Color]:
+    """
+    Get one harmony of a base color, computing and caching all of them on a miss.
+
+    A miss computes every harmony type for the color and count at once, so
+    switching between harmony types of the same color is served from the cache.
+    Default-size lookups all share the ``DEFAULT_HARMONY_COUNT`` entries and
+    truncate them, since a smaller harmony is a prefix of the larger one.
+
+    Args:
+        base_color: The base color (hex string or Color instance)
+        harmony_type: One of HARMONY_TYPES
+        count: Number of colors; None uses the harmony's own size from HARMONY_SIZES
+
+    Returns:
+        List of colors, starting with the base color
+
+    Raises:
+        ValueError: If the harmony type is unsupported or the count is not positive
+    """
+    size = HARMONY_SIZES.get(harmony_type, 1) if count is None else count
+    _check_harmony(harmony_type, size)
+    base = base_color if isinstance(base_color, Color) else Color(base_color)
+    computed = DEFAULT_HARMONY_COUNT if count is None else count
+
+    key = (base.packed, harmony_type, computed)
+    cached = _harmony_cache.get(key)
+    if cached is not None:
+        _cache_stats["hits"] += 1
+        _harmony_cache.move_to_end(key)
+        return list(cached[:size])
+
+    _cache_stats["misses"] += 1
+    for other_type, colors in compute_harmonies(base, computed).items():
+        _harmony_cache[base.packed, other_type, computed] = tuple(colors)
+        _harmony_cache.move_to_end((base.packed, other_type, computed))
+    while len(_harmony_cache) > HARMONY_CACHE_SIZE:
+        _harmony_cache.popitem(last=False)
+    return list(_harmony_cache[key][:size])
+
+
+def harmony_cache_info() -> Tuple[int, int, int, int]:
+    """
+    Get statistics for the harmony cache.
+
+    Returns:
+        Tuple of (hits, misses, maxsize, currsize)
+    """
+    return (_cache_stats["hits"], _cache_stats["misses"], HARMONY_CACHE_SIZE, len(_harmony_cache))
+
+
+def clear_harmony_cache() -> None:
+    """Clear the harmony cache and reset its statistics."""
+    _harmony_cache.clear()
+    _cache_stats["hits"] = 0
+    _cache_stats["misses"] = 0
+
+
+def _seed_packed(seeds: Union[ColorArray, Sequence[str]]) -> np.ndarray:
+    """
+    Get the packed colors of batch seeds.
+
+    Args:
+        seeds: ColorArray or hex strings
+
+    Returns:
+        (N,) packed ARGB array
+    """
+    return (seeds if isinstance(seeds, ColorArray) else ColorArray.from_hex(list(seeds))).packed
+
+
+def _harmony_chunk(packed: np.ndarray, harmony_type: str, count: int) -> np.ndarray:
+    """
+    Compute one harmony for a chunk of seeds.
+
+    Args:
+        packed: (N,) packed ARGB seeds
+        harmony_type: One of HARMONY_TYPES
+        count: Number of colors in each harmony
+
+    Returns:
+        (N, count) packed ARGB array
+    """
+    return _harmony_packed(packed, (harmony_type,), count)[harmony_type]
+
+
+def _batch_packed(
+    seeds: Union[ColorArray, Sequence[str]],
+    harmony_type: str,
+    count: int,
+    chunk_size: int,
+    workers: Optional[int],
+) -> np.ndarray:
+    """
+    Compute one harmony for every seed, chunk by chunk.
+
+    Args:
+        seeds: ColorArray or hex strings
+        harmony_type: One of HARMONY_TYPES
+        count: Number of colors in each harmony
+        chunk_size: Maximum number of seeds per vectorized pass
+        workers: Number of worker processes; None uses every CPU, and 0 or 1
+            computes in the calling process
+
+    Returns:
+        (N, count) packed ARGB array, in seed order
+
+    Raises:
+        ValueError: If any option is invalid
+    """
+    _check_harmony(harmony_type, count)
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+    if workers is not None and workers < 0:
+        raise ValueError(f"Worker count cannot be negative, got {workers}")
+
+    packed = _seed_packed(seeds)
+    chunks = [packed[start : start + chunk_size] for start in range(0, len(packed), chunk_size)]
+    if not chunks:
+        return np.zeros((0, count), dtype=np.uint32)
+
+    worker_count = (os.cpu_count() or 1) if workers is None else workers
+    if worker_count <= 1 or len(chunks) <= 1:
+        results = [_harmony_chunk(chunk, harmony_type, count) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(worker_count, len(chunks))) as executor:
+            results = list(executor.map(_harmony_chunk, chunks, repeat(harmony_type), repeat(count)))
+    return np.concatenate(results)
+
+
+def batch_harmonies(
+    seeds: Union[ColorArray, Sequence[str]],
+    harmony_type: str,
+    count: int = DEFAULT_HARMONY_COUNT,
+    chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    workers: Optional[int] = 1,
+) -> np.ndarray:
+    """
+    Compute one harmony for many seed colors without building Color objects.
+
+    Each row holds the same colors as ``harmony_colors(seed, harmony_type, count)``.
+
+    Args:
+        seeds: Seed colors, as a ColorArray or hex strings
+        harmony_type: One of HARMONY_TYPES
+        count: Number of colors in each harmony (default: 8)
+        chunk_size: Maximum number of seeds per vectorized pass
+        workers: Number of worker processes; None uses every CPU, and 0 or 1
+            (the default) computes in the calling process
+
+    Returns:
+        (N, count, 3) uint8 array of RGB values, the seed first in each row
+
+    Raises:
+        ValueError: If the harmony type, count, chunk size or worker count is invalid
+    """
+    packed = _batch_packed(seeds, harmony_type, count, chunk_size, workers)
+    return ColorArray(packed.reshape(-1)).rgb.reshape(len(packed), count, 3)
+
+
+def batch_harmony_collection(
+    seeds: Union[ColorArray, Sequence[str]],
+    harmony_type: str,
+    count: int = DEFAULT_HARMONY_COUNT,
+    collection: Optional[PaletteCollection] = None,
+    chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    workers: Optional[int] = 1,
+) -> PaletteCollection:
+    """
+    Compute one harmony for many seed colors as a collection of palettes.
+
+    Palettes are named after their harmony type and seed, e.g. "Triadic #ff5500".
+
+    Args:
+        seeds: Seed colors, as a ColorArray or hex strings
+        harmony_type: One of HARMONY_TYPES
+        count: Number of colors in each harmony (default: 8)
+        collection: Collection to add the palettes to; a new one is created if None
+        chunk_size: Maximum number of seeds per vectorized pass
+        workers: Number of worker processes; None uses every CPU, and 0 or 1
+            (the default) computes in the calling process
+
+    Returns:
+        The collection holding one palette per seed, in seed order
+
+    Raises:
+        ValueError: If the harmony type, count, chunk size or worker count is invalid
+    """
+    packed = _batch_packed(seeds, harmony_type, count, chunk_size, workers)
+    label = harmony_type.replace("_", " ").title()
+    colors = ColorArray(packed.reshape(-1)).to_colors()
+    palettes = [
+        Palette(f"{label} {colors[start].hex}", colors[start : start + count])
+        for start in range(0, len(colors), count)
+    ]
+    if collection is None:
+        return PaletteCollection(palettes)
+    for palette in palettes:
+        collection.add_palette(palette)
+    return collection
@@ -0,0 +1,408 @@
+"""
+Named color lookup for the Milky Color Suite.
+
+This module bundles the CSS named color table and a spatial index over it in
+OKLab, so the perceptually nearest name for any color can be found in a few
+microseconds and for whole batches of colors at once.
+"""
+
+from functools import lru_cache
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from ..models.color_array import ColorArray
+from ..models.color_model import Color
+from ..models.color_spaces import rgb_to_oklab_array
+from .color_difference import ColorBatch
+
+
+# CSS Color Module Level 4 named colors
+CSS_COLOR_NAMES: Dict[str, str] = {
+    "aliceblue": "#f0f8ff",
+    "antiquewhite": "#faebd7",
+    "aqua": "#00ffff",
+    "aquamarine": "#7fffd4",
+    "azure": "#f0ffff",
+    "beige": "#f5f5dc",
+    "bisque": "#ffe4c4",
+    "black": "#000000",
+    "blanchedalmond": "#ffebcd",
+    "blue": "#0000ff",
+    "blueviolet": "#8a2be2",
+    "brown": "#a52a2a",
+    "burlywood": "#deb887",
+    "cadetblue": "#5f9ea0",
+    "chartreuse": "#7fff00",
+    "chocolate": "#d2691e",
+    "coral": "#ff7f50",
+    "cornflowerblue": "#6495ed",
+    "cornsilk": "#fff8dc",
+    "crimson": "#dc143c",
+    "cyan": "#00ffff",
+    "darkblue": "#00008b",
+    "darkcyan": "#008b8b",
+    "darkgoldenrod": "#b8860b",
+    "darkgray": "#a9a9a9",
+    "darkgreen": "#006400",
+    "darkgrey": "#a9a9a9",
+    "darkkhaki": "#bdb76b",
+    "darkmagenta": "#8b008b",
+    "darkolivegreen": "#556b2f",
+    "darkorange": "#ff8c00",
+    "darkorchid": "#9932cc",
+    "darkred": "#8b0000",
+    "darksalmon": "#e9967a",
+    "darkseagreen": "#8fbc8f",
+    "darkslateblue": "#483d8b",
+    "darkslategray": "#2f4f4f",
+    "darkslategrey": "#2f4f4f",
+    "darkturquoise": "#00ced1",
+    "darkviolet": "#9400d3",
+    "deeppink": "#ff1493",
+    "deepskyblue": "#00bfff",
+    "dimgray": "#696969",
+    "dimgrey": "#696969",
+    "dodgerblue": "#1e90ff",
+    "firebrick": "#b22222",
+    "floralwhite": "#fffaf0",
+    "forestgreen": "#228b22",
+    "fuchsia": "#ff00ff",
+    "gainsboro": "#dcdcdc",
+    "ghostwhite": "#f8f8ff",
+    "gold": "#ffd700",
+    "goldenrod": "#daa520",
+    "gray": "#808080",
+    "green": "#008000",
+    "greenyellow": "#adff2f",
+    "grey": "#808080",
+    "honeydew": "#f0fff0",
+    "hotpink": "#ff69b4",
+    "indianred": "#cd5c5c",
+    "indigo": "#4b0082",
+    "ivory": "#fffff0",
+    "khaki": "#f0e68c",
+    "lavender": "#e6e6fa",
+    "lavenderblush": "#fff0f5",
+    "lawngreen": "#7cfc00",
+    "lemonchiffon": "#fffacd",
+    "lightblue": "#add8e6",
+    "lightcoral": "#f08080",
+    "lightcyan": "#e0ffff",
+    "lightgoldenrodyellow": "#fafad2",
+    "lightgray": "#d3d3d3",
+    "lightgreen": "#90ee90",
+    "lightgrey": "#d3d3d3",
+    "lightpink": "#ffb6c1",
+    "lightsalmon": "#ffa07a",
+    "lightseagreen": "#20b2aa",
+    "lightskyblue": "#87cefa",
+    "lightslategray": "#778899",
+    "lightslategrey": "#778899",
+    "lightsteelblue": "#b0c4de",
+    "lightyellow": "#ffffe0",
+    "lime": "#00ff00",
+    "limegreen": "#32cd32",
+    "linen": "#faf0e6",
+    "magenta": "#ff00ff",
+    "maroon": "#800000",
+    "mediumaquamarine": "#66cdaa",
+    "mediumblue": "#0000cd",
+    "mediumorchid": "#ba55d3",
+    "mediumpurple": "#9370db",
+    "mediumseagreen": "#3cb371",
+    "mediumslateblue": "#7b68ee",
+    "mediumspringgreen": "#00fa9a",
+    "mediumturquoise": "#48d1cc",
+    "mediumvioletred": "#c71585",
+    "midnightblue": "#191970",
+    "mintcream": "#f5fffa",
+    "mistyrose": "#ffe4e1",
+    "moccasin": "#ffe4b5",
+    "navajowhite": "#ffdead",
+    "navy": "#000080",
+    "oldlace": "#fdf5e6",
+    "olive": "#808000",
+    "olivedrab": "#6b8e23",
+    "orange": "#ffa500",
+    "orangered": "#ff4500",
+    "orchid": "#da70d6",
+    "palegoldenrod": "#eee8aa",
+    "palegreen": "#98fb98",
+    "paleturquoise": "#afeeee",
+    "palevioletred": "#db7093",
+    "papayawhip": "#ffefd5",
+    "peachpuff": "#ffdab9",
+    "peru": "#cd853f",
+    "pink": "#ffc0cb",
+    "plum": "#dda0dd",
+    "powderblue": "#b0e0e6",
+    "purple": "#800080",
+    "rebeccapurple": "#663399",
+    "red": "#ff0000",
+    "rosybrown": "#bc8f8f",
+    "royalblue": "#4169e1",
+    "saddlebrown": "#8b4513",
+    "salmon": "#fa8072",
+    "sandybrown": "#f4a460",
+    "seagreen": "#2e8b57",
+    "seashell": "#fff5ee",
+    "sienna": "#a0522d",
+    "silver": "#c0c0c0",
+    "skyblue": "#87ceeb",
+    "slateblue": "#6a5acd",
+    "slategray": "#708090",
+    "slategrey": "#708090",
+    "snow": "#fffafa",
+    "springgreen": "#00ff7f",
+    "steelblue": "#4682b4",
+    "tan": "#d2b48c",
+    "teal": "#008080",
+    "thistle": "#d8bfd8",
+    "tomato": "#ff6347",
+    "turquoise": "#40e0d0",
+    "violet": "#ee82ee",
+    "wheat": "#f5deb3",
+    "white": "#ffffff",
+    "whitesmoke": "#f5f5f5",
+    "yellow": "#ffff00",
+    "yellowgreen": "#9acd32",
+}
+
+# OKLab bounds of the sRGB gamut, with a small margin; colors outside fall back to a full scan
+GRID_MIN = (-0.01, -0.25, -0.33)
+GRID_MAX = (1.01, 0.29, 0.21)
+
+# Default edge length of a grid cell in OKLab units
+DEFAULT_CELL_SIZE = 0.05
+
+
+class NamedColorIndex:
+    """
+    Nearest-name index over a table of named colors.
+
+    The OKLab cube is split into a uniform grid and every cell stores the few
+    named colors that can be the nearest neighbour of some point inside it,
+    so a query only measures distances to that short candidate list.
+    Names sharing a color value collapse onto the first name in the table.
+    """
+
+    def __init__(
+        self, named_colors: Mapping[str, str] = CSS_COLOR_NAMES, cell_size: float = DEFAULT_CELL_SIZE
+    ) -> None:
+        """
+        Build the index.
+
+        Args:
+            named_colors: Mapping of name to color string
+            cell_size: Edge length of a grid cell in OKLab units
+
+        Raises:
+            ValueError: If the table is empty or the cell size is not positive
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+
+        names: List[str] = []
+        values: List[Color] = []
+        seen = set()
+        for name, value in named_colors.items():
+            color = Color(value)
+            if color.packed not in seen:
+                seen.add(color.packed)
+                names.append(name)
+                values.append(color)
+        if not names:
+            raise ValueError("Named color table is empty")
+
+        self._names: Tuple[str, ...] = tuple(names)
+        self._points = rgb_to_oklab_array(ColorArray.from_colors(values).rgb)
+        self._point_tuples = [tuple(point) for point in self._points.tolist()]
+        self._cell_size = cell_size
+        self._origin = np.array(GRID_MIN)
+        self._shape = tuple(
+            int(np.ceil((high - low) / cell_size)) for low, high in zip(GRID_MIN, GRID_MAX, strict=True)
+        )
+        self._all = np.arange(len(names))
+        self._candidates = self._build_candidates()
+        self._candidate_tuples = [tuple(candidates.tolist()) for candidates in self._candidates]
+
+    def _build_candidates(self) -> List[np.ndarray]:
+        """
+        Find, for every grid cell, the entries that can be nearest to a point in it.
+
+        An entry is a candidate when its smallest possible distance to the cell
+        does not exceed the largest possible distance of the best entry.
+
+        Returns:
+            List of candidate index arrays, one per flattened cell
+        """
+        grid = np.indices(self._shape).reshape(3, -1).T
+        low = self._origin + grid * self._cell_size
+        high = low + self._cell_size
+        points = self._points[None, :, :]
+
+        gap = np.maximum(np.maximum(low[:, None, :] - points, points - high[:, None, :]), 0.0)
+        nearest_sq = (gap**2).sum(axis=-1)
+        reach = np.maximum(np.abs(points - low[:, None, :]), np.abs(points - high[:, None, :]))
+        farthest_sq = (reach**2).sum(axis=-1)
+
+        bound = farthest_sq.min(axis=1, keepdims=True)
+        return [np.flatnonzero(row) for row in nearest_sq <= bound]
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Get the distinct names held by the index, in table order."""
+        return self._names
+
+    def __len__(self) -> int:
+        """Get the number of distinct named colors."""
+        return len(self._names)
+
+    def _cell(self, lightness: float, a: float, b: float) -> int:
+        """
+        Get the flattened cell of an OKLab point.
+
+        Args:
+            lightness: L component
+            a: a component
+            b: b component
+
+        Returns:
+            Flattened cell index, or -1 if the point is outside the grid
+        """
+        size = self._cell_size
+        i = int((lightness - GRID_MIN[0]) // size)
+        j = int((a - GRID_MIN[1]) // size)
+        k = int((b - GRID_MIN[2]) // size)
+        ni, nj, nk = self._shape
+        if not (0 <= i < ni and 0 <= j < nj and 0 <= k < nk):
+            return -1
+        return (i * nj + j) * nk + k
+
+    def nearest_index(self, color: Union[str, Color]) -> int:
+        """
+        Find the position of the nearest named color.
+
+        Args:
+            color: Color to look up (hex string or Color instance)
+
+        Returns:
+            Index into ``names``
+        """
+        if not isinstance(color, Color):
+            color = Color(color)
+        lightness, a, b = color.oklab
+        cell = self._cell(lightness, a, b)
+        candidates = self._candidate_tuples[cell] if cell >= 0 else range(len(self._names))
+
+        best, best_distance = -1, float("inf")
+        for index in candidates:
+            point = self._point_tuples[index]
+            distance = (point[0] - lightness) ** 2 + (point[1] - a) ** 2 + (point[2] - b) ** 2
+            if distance < best_distance:
+                best, best_distance = index, distance
+        return best
+
+    def nearest(self, color: Union[str, Color]) -> str:
+        """
+        Find the name of the nearest named color.
+
+        Args:
+            color: Color to look up (hex string or Color instance)
+
+        Returns:
+            Nearest color name
+        """
+        return self._names[self.nearest_index(color)]
+
+    def nearest_indices(self, colors: ColorBatch) -> np.ndarray:
+        """
+        Find the positions of the nearest named colors for a batch.
+
+        Duplicate colors are looked up once, and queries are grouped by grid
+        cell so each group is compared against its candidates in one step.
+
+        Args:
+            colors: ColorArray, or a sequence of hex strings / Color instances
+
+        Returns:
+            (N,) int array of indices into ``names``
+        """
+        if not isinstance(colors, ColorArray):
+            colors = ColorArray.from_colors([color if isinstance(color, Color) else Color(color) for color in colors])
+        if len(colors) == 0:
+            return np.empty(0, dtype=np.intp)
+
+        # Alpha does not affect the name, so drop it before deduplicating
+        unique, inverse = np.unique(colors.packed | 0xFF000000, return_inverse=True)
+        oklab = rgb_to_oklab_array(ColorArray(unique).rgb)
+
+        shape = np.array(self._shape)
+        cells = np.floor((oklab - self._origin) / self._cell_size).astype(np.intp)
+        inside = np.all((cells >= 0) & (cells < shape), axis=1)
+        flat = np.ravel_multi_index(tuple(np.clip(cells, 0, shape - 1).T), self._shape)
+        flat = np.where(inside, flat, -1)
+
+        result = np.empty(len(unique), dtype=np.intp)
+        order = np.argsort(flat, kind="stable")
+        boundaries = np.flatnonzero(np.diff(flat[order])) + 1
+        for group in np.split(order, boundaries):
+            cell = int(flat[group[0]])
+            candidates = self._candidates[cell] if cell >= 0 else self._all
+            distances = ((oklab[group, None, :] - self._points[None, candidates, :]) ** 2).sum(axis=-1)
+            result[group] = candidates[distances.argmin(axis=1)]
+        return result[inverse.reshape(-1)]
+
+    def nearest_names(self, colors: ColorBatch) -> List[str]:
+        """
+        Find the names of the nearest named colors for a batch.
+
+        Args:
+            colors: ColorArray, or a sequence of hex strings / Color instances
+
+        Returns:
+            List of color names, one per input color
+        """
+        return [self._names[index] for index in self.nearest_indices(colors).tolist()]
+
+
+@lru_cache(maxsize=None)
+def get_named_color_index() -> NamedColorIndex:
+    """
+    Get the shared index over the CSS named colors, building it on first use.
+
+    Returns:
+        NamedColorIndex over CSS_COLOR_NAMES
+    """
+    return NamedColorIndex()
+
+
+def nearest_color_name(color: Union[str, Color]) -> str:
+    """
+    Get the CSS name nearest to a color.
+
+    Args:
+        color: Color to name (hex string or Color instance)
+
+    Returns:
+        Nearest CSS color name
+    """
+    return get_named_color_index().nearest(color)
+
+
+def nearest_color_names(colors: ColorBatch) -> List[str]:
+    """
+    Get the CSS names nearest to a batch of colors.
+
+    Args:
+        colors: ColorArray, or a sequence of hex strings / Color instances
+
+    Returns:
+        List of CSS color names, one per input color
+    """
+    return get_named_color_index().nearest_names(colors)
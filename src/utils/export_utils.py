@@ -16,9 +16,14 @@ from typing import Optional
 from typing import Union
 
 from ..models.color_model import Color
+from .color_names import nearest_color_names
 from .utter import UTTER
 
 
+# Formats whose handlers accept a ``names`` argument for labelling colors
+NAMED_EXPORT_FORMATS = {"CSS", "SCSS", "LESS", "ASE", "GPL", "ACO"}
+
+
 def export_palette_to_utter(palette_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Export a palette to the UTTER format.
@@ -87,7 +92,11 @@ def export_palette_to_utter(palette_data: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def export_palette(
-    colors: List[Union[str, Color]], palette_name: str, format_name: str, output_path: Optional[str] = None
+    colors: List[Union[str, Color]],
+    palette_name: str,
+    format_name: str,
+    output_path: Optional[str] = None,
+    use_color_names: bool = False,
 ) -> str:
     """
     Export a color palette in the specified format.
@@ -97,6 +106,8 @@ def export_palette(
         palette_name: Name of the palette
         format_name: Format to export in (e.g., "CSS", "JSON")
         output_path: Path to save the exported palette to (if None, returns content)
+        use_color_names: Label colors with their nearest CSS color name in formats
+            that support swatch or variable names
 
     Returns:
         The exported palette as a string if output_path is None,
@@ -121,7 +132,10 @@ def export_palette(
     formatter = handlers[format_name]
 
     # Generate content
-    content = formatter(color_objects, palette_name)
+    if use_color_names and format_name in NAMED_EXPORT_FORMATS:
+        content = formatter(color_objects, palette_name, names=get_swatch_names(color_objects))
+    else:
+        content = formatter(color_objects, palette_name)
 
     # Save to file if path is provided
     if output_path:
@@ -137,6 +151,27 @@ def export_palette(
     return content
 
 
+def get_swatch_names(colors: List[Color]) -> List[str]:
+    """
+    Get a unique, identifier-safe name for each color.
+
+    Colors are named after the nearest CSS color; repeated names get a
+    numeric suffix ("navy", "navy-2", ...).
+
+    Args:
+        colors: List of colors to name
+
+    Returns:
+        List of names, one per color
+    """
+    counts: Dict[str, int] = {}
+    names: List[str] = []
+    for name in nearest_color_names(colors):
+        counts[name] = counts.get(name, 0) + 1
+        names.append(name if counts[name] == 1 else f"{name}-{counts[name]}")
+    return names
+
+
 def get_export_format_handlers() -> Dict[str, Callable]:
     """
     Get a dictionary of export format handlers.
@@ -157,13 +192,14 @@ def get_export_format_handlers() -> Dict[str, Callable]:
     }
 
 
-def export_css(colors: List[Color], palette_name: str) -> str:
+def export_css(colors: List[Color], palette_name: str, names: Optional[List[str]] = None) -> str:
     """
     Export palette as CSS variables.
 
     Args:
         colors: List of colors to export
         palette_name: Name of the palette
+        names: Optional variable name suffix per color (defaults to the position)
 
     Returns:
         CSS content as a string
@@ -171,19 +207,21 @@ def export_css(colors: List[Color], palette_name: str) -> str:
     content = f"/* Palette: {palette_name} */\n:root {{\n"
 
     for i, color in enumerate(colors):
-        content += f"  --color-{i + 1}: {color.hex};\n"
+        suffix = names[i] if names else i + 1
+        content += f"  --color-{suffix}: {color.hex};\n"
 
     content += "}\n"
     return content
 
 
-def export_scss(colors: List[Color], palette_name: str) -> str:
+def export_scss(colors: List[Color], palette_name: str, names: Optional[List[str]] = None) -> str:
     """
     Export palette as SCSS variables.
 
     Args:
         colors: List of colors to export
         palette_name: Name of the palette
+        names: Optional variable name suffix per color (defaults to the position)
 
     Returns:
         SCSS content as a string
@@ -191,18 +229,20 @@ def export_scss(colors: List[Color], palette_name: str) -> str:
     content = f"// Palette: {palette_name}\n"
 
     for i, color in enumerate(colors):
-        content += f"$color-{i + 1}: {color.hex};\n"
+        suffix = names[i] if names else i + 1
+        content += f"$color-{suffix}: {color.hex};\n"
 
     return content
 
 
-def export_less(colors: List[Color], palette_name: str) -> str:
+def export_less(colors: List[Color], palette_name: str, names: Optional[List[str]] = None) -> str:
     """
     Export palette as LESS variables.
 
     Args:
         colors: List of colors to export
         palette_name: Name of the palette
+        names: Optional variable name suffix per color (defaults to the position)
 
     Returns:
         LESS content as a string
@@ -210,7 +250,8 @@ def export_less(colors: List[Color], palette_name: str) -> str:
     content = f"// Palette: {palette_name}\n"
 
     for i, color in enumerate(colors):
-        content += f"@color-{i + 1}: {color.hex};\n"
+        suffix = names[i] if names else i + 1
+        content += f"@color-{suffix}: {color.hex};\n"
 
     return content
 
@@ -255,13 +296,14 @@ def export_txt(colors: List[Color], palette_name: str) -> str:
     return content
 
 
-def export_ase(colors: List[Color], palette_name: str) -> bytes:
+def export_ase(colors: List[Color], palette_name: str, names: Optional[List[str]] = None) -> bytes:
     """
     Export palette as Adobe Swatch Exchange (ASE) file.
 
     Args:
         colors: List of colors to export
         palette_name: Name of the palette
+        names: Optional swatch label per color (defaults to the hex value)
 
     Returns:
         ASE file content as bytes
@@ -280,7 +322,7 @@ def export_ase(colors: List[Color], palette_name: str) -> bytes:
     content = ase_signature + ase_version + block_count
 
     # Add each color block
-    for color in colors:
+    for i, color in enumerate(colors):
         # No need to store block type, just include it directly in the content
         content += struct.pack(">H", 1)  # Block type (1 = color)
 
@@ -292,7 +334,7 @@ def export_ase(colors: List[Color], palette_name: str) -> bytes:
         block_start = len(content)
 
         # Color name (Pascal string - 2 bytes length + name in UTF-16)
-        name = f"{palette_name} - {color.hex}"
+        name = f"{palette_name} - {names[i] if names else color.hex}"
         name_utf16 = name.encode("utf-16-be")
         content += struct.pack(">H", len(name)) + name_utf16
 
@@ -315,13 +357,14 @@ def export_ase(colors: List[Color], palette_name: str) -> bytes:
     return content
 
 
-def export_gpl(colors: List[Color], palette_name: str) -> str:
+def export_gpl(colors: List[Color], palette_name: str, names: Optional[List[str]] = None) -> str:
     """
     Export palette as GIMP Palette (GPL) file.
 
     Args:
         colors: List of colors to export
         palette_name: Name of the palette
+        names: Optional swatch label per color (defaults to the hex value)
 
     Returns:
         GPL file content as a string
@@ -331,20 +374,21 @@ def export_gpl(colors: List[Color], palette_name: str) -> str:
     content += "Columns: 8\n"
     content += "#\n"
 
-    for color in colors:
+    for i, color in enumerate(colors):
         r, g, b = color.rgb
-        content += f"{r} {g} {b} {color.hex}\n"
+        content += f"{r} {g} {b} {names[i] if names else color.hex}\n"
 
     return content
 
 
-def export_aco(colors: List[Color], palette_name: str) -> bytes:
+def export_aco(colors: List[Color], palette_name: str, names: Optional[List[str]] = None) -> bytes:
     """
     Export palette as Adobe Color (ACO) file.
 
     Args:
         colors: List of colors to export
         palette_name: Name of the palette
+        names: Optional swatch label per color (defaults to the position)
 
     Returns:
         ACO file content as bytes
@@ -382,7 +426,7 @@ def export_aco(colors: List[Color], palette_name: str) -> bytes:
         zero = struct.pack(">H", 0)
 
         # Color name (Pascal string - 4 bytes length + name in UTF-16)
-        name = f"{palette_name} - {i + 1}"
+        name = f"{palette_name} - {names[i] if names else i + 1}"
         name_utf16 = name.encode("utf-16-be")
         name_length = struct.pack(">I", len(name) + 1)  # +1 for null terminator
 
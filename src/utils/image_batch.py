@@ -0,0 +1,435 @@
+"""
+Batch image-to-palette extraction for the Milky Color Suite.
+
+This module turns many images into palettes at once. Files are hashed by
+content and looked up in an on-disk cache keyed by (content hash, method,
+count, options, cache version), so unchanged files are skipped on re-runs;
+the remaining files are decoded and extracted across a process pool. Results
+are emitted as Palette objects into a PaletteCollection, or as JSON Lines.
+
+Usage:
+    python -m src.utils.image_batch photos/ "scans/**/*.tif" --output palettes.jsonl
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from functools import partial
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+from ..constants.paths import Paths
+from ..models.palette_model import Palette
+from ..models.palette_model import PaletteCollection
+from .color_utils import import_colors_from_image
+
+
+# Bump whenever extraction results change, so stale cache entries are ignored
+CACHE_VERSION = 1
+
+# File extensions picked up when a directory is given
+IMAGE_EXTENSIONS = (".bmp", ".gif", ".jpeg", ".jpg", ".png", ".ppm", ".tif", ".tiff", ".webp")
+
+# Extraction methods accepted by the batch pipeline, as in import_colors_from_image
+BATCH_METHODS = ("dominant", "kmeans", "median_cut", "quantize")
+
+# Bytes read at a time while hashing file contents
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Called with (files done, total files) after each file completes
+ProgressCallback = Callable[[int, int], None]
+
+
+def find_images(sources: Union[str, Sequence[str]], recursive: bool = False) -> List[str]:
+    """
+    Expand directories and glob patterns into a sorted list of image files.
+
+    Args:
+        sources: Directories, glob patterns or file paths
+        recursive: Whether to descend into subdirectories of given directories
+
+    Returns:
+        Sorted, de-duplicated list of image file paths
+    """
+    if isinstance(sources, str):
+        sources = [sources]
+
+    found = set()
+    for source in sources:
+        if os.path.isdir(source):
+            pattern = os.path.join(source, "**", "*") if recursive else os.path.join(source, "*")
+            candidates = glob.glob(pattern, recursive=recursive)
+        elif os.path.isfile(source):
+            found.add(source)
+            continue
+        else:
+            candidates = glob.glob(source, recursive=True)
+        found.update(
+            path for path in candidates if os.path.isfile(path) and path.lower().endswith(IMAGE_EXTENSIONS)
+        )
+    return sorted(found)
+
+
+def file_digest(file_path: str) -> str:
+    """
+    Hash a file's contents.
+
+    Args:
+        file_path: Path of the file
+
+    Returns:
+        Hex SHA-256 digest of the contents
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImageCache:
+    """
+    On-disk cache of extracted palettes, keyed by image content and extraction settings.
+
+    Each entry is a small JSON file, so the cache can be shared between runs
+    and processes, and cleared by deleting the directory.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache entries; created on first write
+        """
+        self.directory = Path(directory)
+
+    @classmethod
+    def default_directory(cls) -> Path:
+        """Get the default cache directory, inside the application data directory."""
+        return Paths.get_data_dir() / "image_cache"
+
+    @staticmethod
+    def key(digest: str, method: str, count: int, max_pixels: Optional[int] = None) -> str:
+        """
+        Build the cache key of an extraction.
+
+        Args:
+            digest: Content hash of the image, from ``file_digest``
+            method: Extraction method
+            count: Number of colors extracted
+            max_pixels: Pixel budget used for sampling, or None for full resolution
+
+        Returns:
+            Hex key that changes with any input or with CACHE_VERSION
+        """
+        return hashlib.sha256(f"{digest}:{method}:{count}:{max_pixels}:{CACHE_VERSION}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Get the file of a cache entry, sharded by key prefix."""
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """
+        Look up cached colors.
+
+        Args:
+            key: Cache key, from ``key``
+
+        Returns:
+            Hex colors, or None on a miss or an unreadable entry
+        """
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        colors = entry.get("colors") if isinstance(entry, dict) else None
+        return colors if isinstance(colors, list) else None
+
+    def put(self, key: str, colors: List[str]) -> None:
+        """
+        Store extracted colors.
+
+        The entry is written to a temporary file and moved into place, so
+        concurrent runs never see a partial entry.
+
+        Args:
+            key: Cache key, from ``key``
+            colors: Hex colors to store
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "colors": colors}, f)
+        os.replace(temporary, path)
+
+
+def _extract_file(file_path: str, method: str, count: int, max_pixels: Optional[int]) -> List[str]:
+    """
+    Extract the colors of one image, in a worker process.
+
+    Args:
+        file_path: Path of the image
+        method: Extraction method
+        count: Number of colors to extract
+        max_pixels: Pixel budget for sampling, or None for full resolution
+
+    Returns:
+        Hex colors; strings rather than Color objects keep results cheap to send back
+    """
+    colors = import_colors_from_image(file_path, count, method, max_pixels=max_pixels)
+    return [color.hex for color in colors]
+
+
+def _record(file_path: str, digest: Optional[str], colors: Optional[List[str]], **fields: Any) -> Dict[str, Any]:
+    """Build the result record of one file."""
+    return {"path": file_path, "digest": digest, "colors": colors, "cached": False, "error": None, **fields}
+
+
+def iter_batch_extract(
+    paths: Sequence[str],
+    method: str = "dominant",
+    count: int = 8,
+    workers: Optional[int] = None,
+    cache: Optional[ImageCache] = None,
+    max_pixels: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Extract palettes from many images, yielding results as they complete.
+
+    Cached files are yielded first, without being decoded. A file that fails
+    to decode yields a record with an error message instead of stopping the batch.
+
+    Args:
+        paths: Image file paths, as from ``find_images``
+        method: One of BATCH_METHODS
+        count: Number of colors to extract per image
+        workers: Number of worker processes; None uses every CPU, and 0 or 1
+            extracts in the calling process
+        cache: Optional cache to read from and write to
+        max_pixels: Pixel budget for sampling, or None for full resolution
+        progress: Optional callback receiving (files done, total files)
+
+    Yields:
+        One record per file with its path, content digest, hex colors, whether
+        it came from the cache, and an error message or None
+
+    Raises:
+        ValueError: If the method, count or worker count is invalid
+    """
+    if method not in BATCH_METHODS:
+        raise ValueError(f"Unsupported extraction method: {method}")
+    if count < 1:
+        raise ValueError(f"Count must be positive, got {count}")
+    if workers is not None and workers < 0:
+        raise ValueError(f"Worker count cannot be negative, got {workers}")
+
+    total = len(paths)
+    done = 0
+    pending: Dict[str, str] = {}
+    for file_path in paths:
+        try:
+            digest = file_digest(file_path)
+        except OSError as e:
+            done += 1
+            if progress:
+                progress(done, total)
+            yield _record(file_path, None, None, error=str(e))
+            continue
+        colors = cache.get(ImageCache.key(digest, method, count, max_pixels)) if cache else None
+        if colors is None:
+            pending[file_path] = digest
+            continue
+        done += 1
+        if progress:
+            progress(done, total)
+        yield _record(file_path, digest, colors, cached=True)
+
+    def finish(file_path: str, run: Callable[[], List[str]]) -> Dict[str, Any]:
+        """Run one extraction, cache its colors and build its record."""
+        digest = pending[file_path]
+        try:
+            colors = run()
+        except Exception as e:
+            return _record(file_path, digest, None, error=str(e))
+        if cache:
+            cache.put(ImageCache.key(digest, method, count, max_pixels), colors)
+        return _record(file_path, digest, colors)
+
+    worker_count = (os.cpu_count() or 1) if workers is None else workers
+    if worker_count <= 1 or len(pending) <= 1:
+        for file_path in pending:
+            record = finish(file_path, partial(_extract_file, file_path, method, count, max_pixels))
+            done += 1
+            if progress:
+                progress(done, total)
+            yield record
+        return
+
+    with ProcessPoolExecutor(max_workers=min(worker_count, len(pending))) as executor:
+        futures = {
+            executor.submit(_extract_file, file_path, method, count, max_pixels): file_path for file_path in pending
+        }
+        for future in as_completed(futures):
+            record = finish(futures[future], future.result)
+            done += 1
+            if progress:
+                progress(done, total)
+            yield record
+
+
+def record_to_palette(record: Dict[str, Any]) -> Palette:
+    """
+    Build a palette from a successful batch record.
+
+    Args:
+        record: Record yielded by ``iter_batch_extract``
+
+    Returns:
+        Palette named after the image file
+
+    Raises:
+        ValueError: If the record holds an error instead of colors
+    """
+    if record["colors"] is None:
+        raise ValueError(f"No colors for {record['path']}: {record['error']}")
+    return Palette(name=Path(record["path"]).stem, colors=record["colors"])
+
+
+def batch_extract_to_collection(
+    paths: Sequence[str], collection: Optional[PaletteCollection] = None, **options: Any
+) -> PaletteCollection:
+    """
+    Extract palettes from many images into a palette collection.
+
+    Files that fail to decode are skipped.
+
+    Args:
+        paths: Image file paths, as from ``find_images``
+        collection: Collection to add the palettes to; a new one is created if None
+        **options: Options for ``iter_batch_extract``
+
+    Returns:
+        The collection holding the new palettes, in input order
+
+    Raises:
+        ValueError: If the options are invalid
+    """
+    records = {record["path"]: record for record in iter_batch_extract(paths, **options)}
+    palettes = [record_to_palette(records[path]) for path in paths if records[path]["colors"] is not None]
+    if collection is None:
+        return PaletteCollection(palettes)
+    for palette in palettes:
+        collection.add_palette(palette)
+    return collection
+
+
+def batch_extract_to_jsonl(paths: Sequence[str], output_path: str, **options: Any) -> int:
+    """
+    Extract palettes from many images and write them as JSON Lines.
+
+    Each line holds the file path, content digest, whether the result came
+    from the cache, and either the palette (as ``Palette.to_dict``) or an error.
+
+    Args:
+        paths: Image file paths, as from ``find_images``
+        output_path: Path of the JSON Lines file to write
+        **options: Options for ``iter_batch_extract``
+
+    Returns:
+        Number of palettes written
+
+    Raises:
+        ValueError: If the options are invalid
+    """
+    directory = os.path.dirname(output_path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    written = 0
+    with open(output_path, "w", encoding="utf-8") as f:
+        for record in iter_batch_extract(paths, **options):
+            line = {"path": record["path"], "digest": record["digest"], "cached": record["cached"]}
+            if record["colors"] is None:
+                line["error"] = record["error"]
+            else:
+                line["palette"] = record_to_palette(record).to_dict()
+                written += 1
+            f.write(json.dumps(line) + "\n")
+    return written
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the batch extraction command line.
+
+    Args:
+        argv: Command line arguments; defaults to ``sys.argv[1:]``
+
+    Returns:
+        Exit status: 0 on success, 1 if any file failed or no images were found
+    """
+    parser = argparse.ArgumentParser(description="Extract palettes from many images")
+    parser.add_argument("sources", nargs="+", help="Image files, directories or glob patterns")
+    parser.add_argument("--method", choices=BATCH_METHODS, default="dominant", help="Extraction method")
+    parser.add_argument("--count", type=int, default=8, help="Number of colors per palette")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: every CPU)")
+    parser.add_argument("--max-pixels", type=int, default=None, help="Sample about this many pixels per image")
+    parser.add_argument("--recursive", action="store_true", help="Descend into subdirectories")
+    parser.add_argument("--cache-dir", default=None, help="Cache directory (default: the application data directory)")
+    parser.add_argument("--no-cache", action="store_true", help="Extract every file, ignoring the cache")
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--output", help="Write palettes to this JSON Lines file")
+    output.add_argument("--collection", help="Write palettes to this palette collection file")
+    args = parser.parse_args(argv)
+
+    paths = find_images(args.sources, args.recursive)
+    if not paths:
+        print("No images found", file=sys.stderr)
+        return 1
+
+    cache = None if args.no_cache else ImageCache(args.cache_dir or ImageCache.default_directory())
+
+    def progress(done: int, total: int) -> None:
+        """Report progress on one updating line."""
+        print(f"\r{done}/{total} images", end="", file=sys.stderr, flush=True)
+
+    options = {
+        "method": args.method,
+        "count": args.count,
+        "workers": args.workers,
+        "cache": cache,
+        "max_pixels": args.max_pixels,
+        "progress": progress,
+    }
+    if args.output:
+        written = batch_extract_to_jsonl(paths, args.output, **options)
+    else:
+        collection = PaletteCollection()
+        # Start empty rather than with the default palette
+        collection.clear()
+        written = len(batch_extract_to_collection(paths, collection, **options))
+        if not collection.save_to_file(args.collection):
+            print(f"\nFailed to write {args.collection}", file=sys.stderr)
+            return 1
+    print(f"\nExtracted {written} of {len(paths)} palettes", file=sys.stderr)
+    return 0 if written == len(paths) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,421 @@
+"""
+Constraint-driven palette generation for the Milky Color Suite.
+
+This module searches for palettes that satisfy explicit constraints: a
+minimum color difference between every pair of slots, WCAG contrast ratios
+between specific slots, hue, saturation and lightness ranges, and colors
+pinned to given slots. Candidates are scored for a whole slot at once with
+NumPy; palettes are built by greedy farthest-point sampling and repaired
+with min-conflicts moves, restarting from a fresh candidate pool until a
+compliant palette is found or the time budget runs out.
+"""
+
+import time
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from ..models.color_array import ColorArray
+from ..models.color_array import hsl_to_rgb
+from ..models.color_model import Color
+from ..models.color_spaces import rgb_to_lab_array
+from .color_accessibility import get_luminance_array
+from .color_accessibility import pairwise_contrast
+from .color_difference import check_delta_e_method
+from .color_difference import delta_e_lab
+
+
+# Number of color slots in an application palette
+PALETTE_SIZE = 8
+
+# Default minimum difference between any two slots; clearly distinct at a glance
+DEFAULT_MIN_DELTA_E = 15.0
+
+# Candidate colors sampled for each search attempt
+DEFAULT_POOL_SIZE = 2048
+
+# Default wall-clock limit in seconds for finding one palette
+DEFAULT_TIME_BUDGET = 1.0
+
+# Min-conflicts moves tried before restarting from a fresh pool
+REPAIR_STEPS = 48
+
+# Farthest candidates a slot picks from at random, so repeated searches give different palettes
+_FARTHEST_CHOICES = 4
+
+# A required contrast: (slot, other slot, minimum WCAG ratio)
+ContrastRequirement = Tuple[int, int, float]
+
+
+def _check_range(name: str, bounds: Tuple[float, float], limit: float) -> None:
+    """
+    Validate a (low, high) range of HSL values.
+
+    Args:
+        name: Name of the range, for error messages
+        bounds: (low, high) bounds
+        limit: Largest allowed value
+
+    Raises:
+        ValueError: If a bound is outside 0-limit or low exceeds high
+    """
+    low, high = bounds
+    if not 0 <= low <= high <= limit:
+        raise ValueError(f"{name} range must satisfy 0 <= low <= high <= {limit}, got {bounds}")
+
+
+class PaletteConstraints:
+    """
+    Constraints a generated palette has to satisfy.
+
+    Hue, saturation and lightness ranges apply to generated slots only;
+    fixed slots keep their given colors. A hue range whose low bound is
+    above its high bound wraps around red, e.g. (300, 60).
+    """
+
+    def __init__(
+        self,
+        count: int = PALETTE_SIZE,
+        min_delta_e: float = DEFAULT_MIN_DELTA_E,
+        contrast: Optional[Sequence[ContrastRequirement]] = None,
+        hue_range: Tuple[float, float] = (0, 360),
+        saturation_range: Tuple[float, float] = (0, 100),
+        lightness_range: Tuple[float, float] = (0, 100),
+        fixed: Optional[Dict[int, Union[str, Color]]] = None,
+        delta_e_method: str = "ciede2000",
+    ) -> None:
+        """
+        Initialize and validate the constraints.
+
+        Args:
+            count: Number of slots (default: 8, the application's palette size)
+            min_delta_e: Minimum color difference between any two slots; 0 disables the check
+            contrast: Required WCAG contrast ratios as (slot, other slot, ratio)
+            hue_range: Hue range of generated slots in degrees
+            saturation_range: HSL saturation range of generated slots in percent
+            lightness_range: HSL lightness range of generated slots in percent
+            fixed: Colors pinned to slots, by slot index
+            delta_e_method: "cie76", "cie94" or "ciede2000"
+
+        Raises:
+            ValueError: If any constraint is invalid, or the fixed colors alone violate one
+        """
+        if count < 1:
+            raise ValueError(f"Slot count must be positive, got {count}")
+        if min_delta_e < 0:
+            raise ValueError(f"Minimum delta E cannot be negative, got {min_delta_e}")
+        check_delta_e_method(delta_e_method)
+        hue_low, hue_high = hue_range
+        if not (0 <= hue_low <= 360 and 0 <= hue_high <= 360):
+            raise ValueError(f"Hue range must lie within 0-360, got {hue_range}")
+        _check_range("Saturation", saturation_range, 100)
+        _check_range("Lightness", lightness_range, 100)
+
+        self.contrast: List[ContrastRequirement] = []
+        for slot, other, ratio in contrast or ():
+            if not (0 <= slot < count and 0 <= other < count) or slot == other:
+                raise ValueError(f"Contrast requirement needs two different slots below {count}, got {slot}, {other}")
+            if not 1.0 <= ratio <= 21.0:
+                raise ValueError(f"Contrast ratio must be between 1 and 21, got {ratio}")
+            self.contrast.append((slot, other, float(ratio)))
+
+        self.fixed: Dict[int, Color] = {}
+        for slot, color in (fixed or {}).items():
+            if not 0 <= slot < count:
+                raise ValueError(f"Fixed slot {slot} out of range for {count} slots")
+            self.fixed[slot] = color if isinstance(color, Color) else Color(color)
+
+        self.count = count
+        self.min_delta_e = float(min_delta_e)
+        self.hue_range = (float(hue_low), float(hue_high))
+        self.saturation_range = (float(saturation_range[0]), float(saturation_range[1]))
+        self.lightness_range = (float(lightness_range[0]), float(lightness_range[1]))
+        self.delta_e_method = delta_e_method
+
+        pinned = sorted(self.fixed)
+        if pinned and self.violation([self.fixed[slot] for slot in pinned], pinned) > 0:
+            raise ValueError("The fixed colors violate the difference or contrast constraints")
+
+    def violation(self, colors: Sequence[Union[str, Color]], slots: Optional[Sequence[int]] = None) -> float:
+        """
+        Measure how far colors are from satisfying the difference and contrast constraints.
+
+        Each pair closer than ``min_delta_e`` and each contrast requirement
+        below its ratio adds its relative shortfall.
+
+        Args:
+            colors: Colors to check
+            slots: Slot index of each color; defaults to 0, 1, 2, ...
+
+        Returns:
+            Total relative shortfall, 0.0 if every constraint among the given slots holds
+        """
+        slots = list(range(len(colors))) if slots is None else list(slots)
+        array = ColorArray.from_colors([color if isinstance(color, Color) else Color(color) for color in colors])
+        lab = rgb_to_lab_array(array.rgb)
+        total = 0.0
+        if self.min_delta_e > 0 and len(colors) > 1:
+            first, second = np.triu_indices(len(colors), 1)
+            differences = delta_e_lab(lab[first], lab[second], self.delta_e_method)
+            total += float(np.clip(1.0 - differences / self.min_delta_e, 0.0, None).sum())
+
+        luminance = get_luminance_array(array)
+        position = {slot: index for index, slot in enumerate(slots)}
+        for slot, other, ratio in self.contrast:
+            if slot in position and other in position:
+                actual = pairwise_contrast(luminance[position[slot]], luminance[position[other]])
+                total += max(0.0, 1.0 - float(actual) / ratio)
+        return total
+
+    def is_satisfied(self, colors: Sequence[Union[str, Color]]) -> bool:
+        """
+        Check whether a full palette satisfies the difference and contrast constraints.
+
+        Args:
+            colors: One color per slot
+
+        Returns:
+            True if every constraint holds, False otherwise
+        """
+        return len(colors) == self.count and self.violation(colors) <= 0.0
+
+
+class _PaletteSearch:
+    """
+    One attempt at a palette: a candidate pool and an assignment of pool colors to slots.
+
+    The fixed colors are appended to the pool, so every slot is an index into
+    the same Lab and luminance arrays.
+    """
+
+    def __init__(self, constraints: PaletteConstraints, rng: np.random.Generator, pool_size: int) -> None:
+        """
+        Sample a candidate pool within the constraint ranges.
+
+        Args:
+            constraints: Constraints to satisfy
+            rng: Random generator
+            pool_size: Number of candidate colors
+        """
+        self.constraints = constraints
+        self.rng = rng
+        self.pool_size = pool_size
+
+        hue_low, hue_high = constraints.hue_range
+        if hue_low > hue_high:
+            hue_high += 360
+        hsl = np.column_stack(
+            [
+                rng.uniform(hue_low, hue_high, pool_size) / 360,
+                rng.uniform(*constraints.saturation_range, pool_size) / 100,
+                rng.uniform(*constraints.lightness_range, pool_size) / 100,
+            ]
+        )
+        candidates = ColorArray.from_rgb(hsl_to_rgb(hsl))
+        pinned = ColorArray.from_colors(list(constraints.fixed.values()))
+        self.colors = ColorArray(np.concatenate([candidates.packed, pinned.packed]))
+        self.lab = rgb_to_lab_array(self.colors.rgb)
+        self.luminance = get_luminance_array(self.colors)
+
+        self.chosen = np.full(constraints.count, -1)
+        for offset, slot in enumerate(constraints.fixed):
+            self.chosen[slot] = pool_size + offset
+        self.free = [slot for slot in range(constraints.count) if slot not in constraints.fixed]
+
+        # Contrast requirements seen from each slot: (other slot, ratio)
+        self.requirements: Dict[int, List[Tuple[int, float]]] = {slot: [] for slot in range(constraints.count)}
+        for slot, other, ratio in constraints.contrast:
+            self.requirements[slot].append((other, ratio))
+            self.requirements[other].append((slot, ratio))
+
+    def score_slot(self, slot: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score every candidate for one slot against the other assigned slots.
+
+        Args:
+            slot: Slot to score
+
+        Returns:
+            Tuple of (violation, spread): each candidate's relative shortfall and
+            its smallest difference to the other assigned slots (inf if there are none)
+        """
+        constraints = self.constraints
+        others = [other for other in range(constraints.count) if other != slot and self.chosen[other] >= 0]
+        violation = np.zeros(self.pool_size)
+        spread = np.full(self.pool_size, np.inf)
+        if others:
+            candidates = self.lab[: self.pool_size, None, :]
+            differences = delta_e_lab(candidates, self.lab[self.chosen[others]][None, :, :], constraints.delta_e_method)
+            spread = differences.min(axis=1)
+            if constraints.min_delta_e > 0:
+                violation += np.clip(1.0 - differences / constraints.min_delta_e, 0.0, None).sum(axis=1)
+
+        for other, ratio in self.requirements[slot]:
+            if self.chosen[other] >= 0:
+                actual = pairwise_contrast(self.luminance[: self.pool_size], self.luminance[self.chosen[other]])
+                violation += np.clip(1.0 - actual / ratio, 0.0, None)
+        return violation, spread
+
+    def _pick(self, violation: np.ndarray, spread: np.ndarray) -> int:
+        """
+        Pick a candidate: one of the farthest among the least violating.
+
+        Args:
+            violation: Each candidate's relative shortfall
+            spread: Each candidate's smallest difference to the assigned slots
+
+        Returns:
+            Index of the chosen candidate
+        """
+        best = np.flatnonzero(violation <= violation.min() + 1e-12)
+        if len(best) > _FARTHEST_CHOICES:
+            best = best[np.argpartition(-spread[best], _FARTHEST_CHOICES - 1)[:_FARTHEST_CHOICES]]
+        return int(self.rng.choice(best))
+
+    def fill(self) -> None:
+        """Assign every free slot by greedy farthest-point sampling, most constrained slots first."""
+        for slot in sorted(self.free, key=lambda free_slot: -len(self.requirements[free_slot])):
+            self.chosen[slot] = self._pick(*self.score_slot(slot))
+
+    def slot_violations(self) -> np.ndarray:
+        """
+        Get the shortfall each slot is involved in under the current assignment.
+
+        Returns:
+            (count,) array of relative shortfalls per slot; fixed slots are always 0
+        """
+        constraints = self.constraints
+        lab = self.lab[self.chosen]
+        luminance = self.luminance[self.chosen]
+        violations = np.zeros(constraints.count)
+        if constraints.min_delta_e > 0:
+            differences = delta_e_lab(lab[:, None, :], lab[None, :, :], constraints.delta_e_method)
+            shortfall = np.clip(1.0 - differences / constraints.min_delta_e, 0.0, None)
+            np.fill_diagonal(shortfall, 0.0)
+            violations += shortfall.sum(axis=1)
+        for slot, other, ratio in constraints.contrast:
+            contrast_shortfall = max(0.0, 1.0 - float(pairwise_contrast(luminance[slot], luminance[other])) / ratio)
+            violations[slot] += contrast_shortfall
+            violations[other] += contrast_shortfall
+        violations[list(constraints.fixed)] = 0.0
+        return violations
+
+    def repair(self, deadline: float) -> bool:
+        """
+        Move violating slots to their least violating candidates until the palette complies.
+
+        Args:
+            deadline: ``time.perf_counter()`` value to stop at
+
+        Returns:
+            True if the assignment satisfies every constraint
+        """
+        for _ in range(REPAIR_STEPS):
+            violations = self.slot_violations()
+            offending = np.flatnonzero(violations > 0)
+            if len(offending) == 0:
+                return True
+            if time.perf_counter() >= deadline:
+                return False
+            slot = int(self.rng.choice(offending))
+            self.chosen[slot] = self._pick(*self.score_slot(slot))
+        return not self.slot_violations().any()
+
+    def palette(self) -> List[Color]:
+        """
+        Get the assigned colors, fixed slots keeping their given Color instances.
+
+        Returns:
+            One color per slot
+        """
+        colors = self.colors[self.chosen].to_colors()
+        for slot, color in self.constraints.fixed.items():
+            colors[slot] = color
+        return colors
+
+
+def generate_constrained_palette(
+    constraints: PaletteConstraints,
+    seed: Optional[int] = None,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+    pool_size: int = DEFAULT_POOL_SIZE,
+) -> Optional[List[Color]]:
+    """
+    Search for one palette that satisfies a set of constraints.
+
+    Each attempt samples a fresh pool of candidates within the hue,
+    saturation and lightness ranges, fills the free slots by greedy
+    farthest-point sampling, then repeatedly moves a violating slot to its
+    least violating candidate. Attempts restart until one complies or the
+    time budget runs out.
+
+    Args:
+        constraints: Constraints to satisfy
+        seed: Optional seed; the same seed gives the same palette when the budget is not hit
+        time_budget: Wall-clock limit in seconds
+        pool_size: Number of candidate colors per attempt
+
+    Returns:
+        One color per slot, or None if no compliant palette was found in time
+
+    Raises:
+        ValueError: If the time budget or pool size is not positive
+    """
+    if time_budget <= 0 or pool_size < 1:
+        raise ValueError("Time budget and pool size must be positive")
+    deadline = time.perf_counter() + time_budget
+    rng = np.random.default_rng(seed)
+    while True:
+        search = _PaletteSearch(constraints, rng, pool_size)
+        search.fill()
+        if search.repair(deadline):
+            return search.palette()
+        if time.perf_counter() >= deadline:
+            return None
+
+
+def iter_constrained_palettes(
+    constraints: PaletteConstraints,
+    limit: Optional[int] = None,
+    seed: Optional[int] = None,
+    time_budget: float = 60.0,
+    pool_size: int = DEFAULT_POOL_SIZE,
+) -> Iterator[List[Color]]:
+    """
+    Generate compliant palettes until a limit or a time budget is reached.
+
+    Args:
+        constraints: Constraints every palette satisfies
+        limit: Maximum number of palettes; None stops only at the time budget
+        seed: Optional seed for the whole run
+        time_budget: Wall-clock limit in seconds for the whole run
+        pool_size: Number of candidate colors per attempt
+
+    Yields:
+        Palettes as lists of one color per slot
+
+    Raises:
+        ValueError: If the limit is negative, or the time budget or pool size is not positive
+    """
+    if limit is not None and limit < 0:
+        raise ValueError(f"Palette limit cannot be negative, got {limit}")
+    if time_budget <= 0 or pool_size < 1:
+        raise ValueError("Time budget and pool size must be positive")
+    deadline = time.perf_counter() + time_budget
+    rng = np.random.default_rng(seed)
+    produced = 0
+    while limit is None or produced < limit:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return
+        palette = generate_constrained_palette(constraints, int(rng.integers(1 << 63)), remaining, pool_size)
+        if palette is None:
+            return
+        produced += 1
+        yield palette
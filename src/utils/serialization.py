@@ -154,12 +154,16 @@ def _extracted_from_load_palette_collection_23(file_path: Path) -> Tuple[bool, U
     return True, valid_palettes
 
 
-def import_palette_from_file(file_path: Union[str, Path]) -> Tuple[bool, Union[Dict[str, Any], str]]:
+def import_palette_from_file(
+    file_path: Union[str, Path], min_delta_e: float = 0.0
+) -> Tuple[bool, Union[Dict[str, Any], str]]:
     """
     Import a single palette from various file formats.
 
     Args:
         file_path: Path to the file to import
+        min_delta_e: Merge colors whose CIEDE2000 difference is at or below this
+            value, keeping the first occurrence (0 keeps every color)
 
     Returns:
         Tuple of (success, palette_or_error_message)
@@ -178,22 +182,67 @@ def import_palette_from_file(file_path: Union[str, Path]) -> Tuple[bool, Union[D
     try:
         # Handle different file formats
         if file_ext == ".json":
-            return _import_from_json(file_path)
+            result = _import_from_json(file_path)
         elif file_ext in [".css", ".scss", ".less"]:
-            return _import_from_css_like(file_path)
+            result = _import_from_css_like(file_path)
         elif file_ext == ".gpl":
-            return _import_from_gpl(file_path)
+            result = _import_from_gpl(file_path)
         elif file_ext == ".ase":
-            return _import_from_ase(file_path)
+            result = _import_from_ase(file_path)
         elif file_ext in [".txt", ".text"]:
-            return _import_from_txt(file_path)
+            result = _import_from_txt(file_path)
         else:
             return False, f"Unsupported file format: {file_ext}"
 
+        success, palette = result
+        if success and min_delta_e > 0:
+            _merge_similar_colors(palette, min_delta_e)
+        return result
+
     except Exception as e:
         return False, f"Error importing palette: {e!s}"
 
 
+def _merge_similar_colors(palette: Dict[str, Any], threshold: float) -> None:
+    """
+    Drop colors that are perceptually indistinguishable from an earlier color.
+
+    Args:
+        palette: Palette dictionary, modified in place
+        threshold: Maximum CIEDE2000 difference for two colors to be merged
+    """
+    from .color_difference import deduplicate_colors
+
+    colors = palette["colors"]
+    if len(colors) < 2:
+        return
+    keep = deduplicate_colors(colors, threshold)
+    palette["colors"] = [color for color, kept in zip(colors, keep, strict=True) if kept]
+
+
+def _unique_colors(colors: List[str]) -> List[str]:
+    """
+    Remove duplicate colors, keeping the first spelling of each.
+
+    Colors are compared by value, so "#FFF", "#ffffff" and "rgb(255, 255, 255)"
+    count as one color. Strings that do not parse are compared as written.
+
+    Args:
+        colors: Color strings in file order
+
+    Returns:
+        Color strings with duplicates removed
+    """
+    unique: Dict[Union[Color, str], str] = {}
+    for value in colors:
+        try:
+            key: Union[Color, str] = Color(value)
+        except (ValueError, AttributeError):
+            key = value
+        unique.setdefault(key, value)
+    return list(unique.values())
+
+
 def _import_from_json(file_path: Path) -> Tuple[bool, Union[Dict[str, Any], str]]:
     """Import a palette from a JSON file."""
     try:
@@ -263,7 +312,7 @@ def _import_from_css_like(file_path: Path) -> Tuple[bool, Union[Dict[str, Any],
             colors.append(f"{color.hex}{alpha_hex}")
 
         # Remove duplicates
-        colors = list(dict.fromkeys(colors))
+        colors = _unique_colors(colors)
 
         if not colors:
             return False, "No valid colors found in file"
@@ -464,7 +513,7 @@ def _import_from_txt(file_path: Path) -> Tuple[bool, Union[Dict[str, Any], str]]
             colors.append(color.hex)
 
         # Remove duplicates
-        colors = list(dict.fromkeys(colors))
+        colors = _unique_colors(colors)
 
         if not colors:
             return False, "No valid colors found in text file"
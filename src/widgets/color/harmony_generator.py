@@ -26,6 +26,7 @@ from textual.widgets import Static
 
 from ...models.color_model import Color
 from ...utils.color_accessibility import analyze_color_pair
+from ...utils.color_harmony import harmony_colors
 
 
 class HarmonyType(Enum):
@@ -212,70 +213,8 @@ class HarmonyGenerator(Container):
 
     def _generate_harmony_colors(self) -> None:
         """Generate the harmony colors based on the selected harmony type."""
-        harmony_type = self.selected_harmony
-        base = self.base_color
-
-        if harmony_type == HarmonyType.COMPLEMENTARY:
-            # Base color + complementary
-            comp = base.complementary()
-            self.harmony_colors = [base, comp]
-
-        elif harmony_type == HarmonyType.ANALOGOUS:
-            # Base color + 2 analogous colors on each side
-            analogous = base.analogous(5, 30)  # 5 colors, 30° apart
-            self.harmony_colors = analogous
-
-        elif harmony_type == HarmonyType.TRIADIC:
-            # Base color + 2 colors 120° apart
-            triadic = base.triadic()
-            self.harmony_colors = triadic
-
-        elif harmony_type == HarmonyType.TETRADIC:
-            # Base color + 3 colors 90° apart (rectangle on color wheel)
-            tetradic = base.tetradic()
-            self.harmony_colors = tetradic
-
-        elif harmony_type == HarmonyType.SPLIT_COMPLEMENTARY:
-            self._extracted_from__generate_harmony_colors_28(base)
-        elif harmony_type == HarmonyType.MONOCHROMATIC:
-            # Base color + variations of saturation and lightness
-            h, s, lightness = base.hsl
-            colors = [base]
-
-            # Add 3 variations with different saturation
-            for s_mod in [-20, -10, 10]:
-                new_s = max(0, min(100, s + s_mod))
-                colors.append(Color({"h": h, "s": new_s, "l": lightness}))
-
-            # Add 4 variations with different lightness
-            for lightness_mod in [-20, -10, 10, 20]:
-                new_lightness = max(0, min(100, lightness + lightness_mod))
-                colors.append(Color({"h": h, "s": s, "l": new_lightness}))
-
-            self.harmony_colors = colors[:8]  # Limit to 8 colors for display
-
-        elif harmony_type == HarmonyType.SHADES:
-            # Base color + progressively darker versions
-            colors = [base]
-            colors.extend(base.darken(amount) for amount in [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7])
-            self.harmony_colors = colors
-
-        elif harmony_type == HarmonyType.TINTS:
-            # Base color + progressively lighter versions
-            colors = [base]
-            colors.extend(base.lighten(amount) for amount in [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7])
-            self.harmony_colors = colors
-
-    # TODO Rename this here and in `_generate_harmony_colors`
-    def _extracted_from__generate_harmony_colors_28(self, base: Color) -> None:
-        # Base color + 2 colors on either side of complementary
-        comp = base.complementary()
-        h, s, lightness = comp.hsl
-        h1 = (h - 30) % 360
-        h2 = (h + 30) % 360
-        split1 = Color({"h": h1, "s": s, "l": lightness})
-        split2 = Color({"h": h2, "s": s, "l": lightness})
-        self.harmony_colors = [base, split1, split2]
+        # Enum names match the engine's harmony types (e.g. SPLIT_COMPLEMENTARY -> "split_complementary")
+        self.harmony_colors = harmony_colors(self.base_color, self.selected_harmony.name.lower())
 
     def _update_display(self) -> None:
         """Update the color harmony display with current colors."""
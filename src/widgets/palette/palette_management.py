@@ -5,7 +5,6 @@ This module provides UI components for managing color palettes, including
 adding, renaming, and organizing color palettes.
 """
 
-import json
 import uuid
 from datetime import datetime
 
@@ -29,6 +28,7 @@ from textual.reactive import reactive
 from textual.widgets import Static
 
 from constants.paths import Paths
+from models.palette_journal import PaletteJournal
 
 
 if TYPE_CHECKING:
@@ -65,6 +65,12 @@ class PaletteManager(App):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Palettes are persisted as a snapshot plus a journal of edits
+        self._journal = PaletteJournal(PALETTES_FILE)
+        # Copies of the palettes as last written, to find what each change touched
+        self._persisted: Dict[str, Dict[str, Any]] = {}
+        # Set when a change was journaled where it was made, so the watcher skips the full diff
+        self._change_journaled = False
         self._ensure_data_dir()
         self._load_palettes()
 
@@ -91,6 +97,7 @@ class PaletteManager(App):
         # Create a copy of the current palettes list
         updated_palettes = self.palettes.copy()
         updated_palettes.append(palette)
+        self._journal_added(palette)
         # Set the entire list to trigger the watcher
         self.palettes = updated_palettes
 
@@ -169,20 +176,19 @@ class PaletteManager(App):
         return 0.299 * r + 0.587 * g + 0.114 * b < 127.5
 
     def _load_palettes(self) -> None:
-        """Load palettes from JSON file."""
-        if PALETTES_FILE.exists():
-            try:
-                with open(PALETTES_FILE, "r") as f:
-                    loaded_palettes = json.load(f)
-                    # Basic validation could be added here
-                    self.palettes = loaded_palettes
-                    if self.palettes:
-                        self.active_palette_id = self.palettes[0]["id"]
-                    else:
-                        self._create_default_palette()
-            except (json.JSONDecodeError, IOError) as e:
-                self.log.error(f"Failed to load palettes: {e}")
-                self._create_default_palette()
+        """Load palettes from the snapshot file and replay its journal."""
+        try:
+            loaded_palettes = self._journal.load()
+        except (ValueError, IOError) as e:
+            self.log.error(f"Failed to load palettes: {e}")
+            self._create_default_palette()
+            return
+
+        if loaded_palettes:
+            # Remember what is on disk first, so assigning writes nothing back
+            self._remember_persisted(loaded_palettes)
+            self.palettes = loaded_palettes
+            self.active_palette_id = self.palettes[0]["id"]
         else:
             self._create_default_palette()
 
@@ -191,20 +197,138 @@ class PaletteManager(App):
         default_palette = create_empty_palette()
         self.palettes = [default_palette]
         self.active_palette_id = default_palette["id"]
-        self._save_palettes()  # Save the initial default
+        self._compact_palettes()  # Save the initial default as a fresh snapshot
 
-    def _save_palettes(self) -> None:
-        """Save palettes to JSON file."""
+    def _remember_persisted(self, palettes: List[Dict[str, Any]]) -> None:
+        """Keep copies of the palettes as they are on disk."""
+        self._persisted = {p["id"]: {**p, "colors": list(p.get("colors", []))} for p in palettes}
+
+    def _journal_added(self, palette: Dict[str, Any]) -> None:
+        """Append a palette added at the end of the collection to the journal.
+
+        Args:
+            palette: The new palette
+        """
+        if palette["id"] in self._persisted:
+            # Re-adding an ID keeps its old position; leave it to the full diff
+            return
+        try:
+            self._journal.add(palette)
+        except (ValueError, IOError) as e:
+            self.log.error(f"Failed to save palettes: {e}")
+            return
+        self._persisted[palette["id"]] = {**palette, "colors": list(palette.get("colors", []))}
+        self._change_journaled = True
+
+    def _journal_removed(self, palette_id: str) -> None:
+        """Append the removal of a palette to the journal.
+
+        Args:
+            palette_id: ID of the removed palette
+        """
+        try:
+            self._journal.remove(palette_id)
+        except (ValueError, IOError) as e:
+            self.log.error(f"Failed to save palettes: {e}")
+            return
+        self._persisted.pop(palette_id, None)
+        self._change_journaled = True
+
+    def _journal_updated(self, palette: Dict[str, Any]) -> None:
+        """Append the changes to one palette since it was last written to the journal.
+
+        Args:
+            palette: The palette as it is now
+        """
+        old_palette = self._persisted.get(palette["id"])
+        if old_palette is None:
+            return
         try:
-            with open(PALETTES_FILE, "w") as f:
-                json.dump(self.palettes, f, indent=2)
+            self._journal_palette_changes(old_palette, palette)
+        except (ValueError, IOError) as e:
+            self.log.error(f"Failed to save palettes: {e}")
+            return
+        self._persisted[palette["id"]] = {**palette, "colors": list(palette.get("colors", []))}
+        self._change_journaled = True
+
+    def _compact_palettes(self) -> None:
+        """Write all palettes as a new snapshot and empty the journal."""
+        try:
+            self._journal.compact(self.palettes)
         except IOError as e:
             self.log.error(f"Failed to save palettes: {e}")
+            return
+        self._remember_persisted(self.palettes)
+
+    def _save_palettes(self) -> None:
+        """Append the palette changes since the last save to the journal.
+
+        This diffs the whole collection, so the manager's own methods journal
+        their changes directly and this only runs for other assignments, such
+        as reordering, which is written as a new snapshot.
+        """
+        current = {p["id"]: p for p in self.palettes}
+        kept = [palette_id for palette_id in self._persisted if palette_id in current]
+        if kept != [palette_id for palette_id in current if palette_id in self._persisted]:
+            # Reordering cannot be expressed as journal records
+            self._compact_palettes()
+            return
+
+        try:
+            for palette_id in self._persisted:
+                if palette_id not in current:
+                    self._journal.remove(palette_id)
+            for palette_id, palette in current.items():
+                old_palette = self._persisted.get(palette_id)
+                if old_palette is None:
+                    self._journal.add(palette)
+                elif palette != old_palette:
+                    self._journal_palette_changes(old_palette, palette)
+        except (ValueError, IOError) as e:
+            self.log.error(f"Failed to save palettes: {e}")
+            return
+
+        if self._journal.needs_compaction:
+            self._compact_palettes()
+        else:
+            self._remember_persisted(self.palettes)
+
+    def _journal_palette_changes(self, old_palette: Dict[str, Any], palette: Dict[str, Any]) -> None:
+        """Append the smallest records that turn one version of a palette into another.
+
+        Args:
+            old_palette: The palette as last written
+            palette: The palette as it is now
+        """
+        old_colors = old_palette.get("colors", [])
+        colors = palette.get("colors", [])
+        if old_palette.keys() - palette.keys() or len(old_colors) != len(colors):
+            # Removed fields and resized palettes are written whole
+            self._journal.add(palette)
+            return
+
+        if palette.get("name") != old_palette.get("name"):
+            self._journal.rename(palette["id"], palette["name"])
+        for index, (old_color, color) in enumerate(zip(old_colors, colors, strict=True)):
+            if color != old_color:
+                self._journal.update_color(palette["id"], index, color)
+        fields = {
+            key: value
+            for key, value in palette.items()
+            if key not in ("id", "name", "colors") and old_palette.get(key) != value
+        }
+        if fields:
+            self._journal.update(palette["id"], fields)
 
     # --- Watchers to trigger saves and UI updates ---
     def watch_palettes(self, old_palettes: List[Dict[str, Any]], new_palettes: List[Dict[str, Any]]) -> None:
         """React when palettes change."""
-        self._save_palettes()
+        if self._change_journaled:
+            self._change_journaled = False
+            if self._journal.needs_compaction:
+                self._compact_palettes()
+        else:
+            self._save_palettes()
         # Notify UI elements that might need refreshing
         self.post_message(PalettesChanged())
 
@@ -266,18 +390,18 @@ class PaletteManager(App):
             return
 
         updated_palettes = []
-        found = False
+        updated_palette: Optional[Dict[str, Any]] = None
         for p in self.palettes:
             if p["id"] == palette_id:
                 # Create a new dictionary with updated values
                 updated_palette = {**p, **updates}
                 updated_palettes.append(updated_palette)
-                found = True
             else:
                 # Keep original unchanged palettes
                 updated_palettes.append(p.copy())
 
-        if found:
+        if updated_palette is not None:
+            self._journal_updated(updated_palette)
             # Set the entire list to trigger the watcher
             self.palettes = updated_palettes
 
@@ -293,6 +417,8 @@ class PaletteManager(App):
 
         # Filter out the palette and create a new list
         updated_palettes = [p.copy() for p in self.palettes if p["id"] != palette_id]
+        if len(updated_palettes) < len(self.palettes):
+            self._journal_removed(palette_id)
 
         # If the deleted was active, select the first remaining one
         if palette_id == self.active_palette_id:
@@ -356,6 +482,7 @@ class PaletteManager(App):
 
         # Add the new palette
         updated_palettes.append(new_palette)
+        self._journal_added(new_palette)
 
         # Update both reactive properties
         self.palettes = updated_palettes
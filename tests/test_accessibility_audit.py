@@ -0,0 +1,111 @@
+"""
+Unit tests for the accessibility_audit module.
+
+This module tests the collection-wide accessibility audit and its JSON Lines output.
+"""
+
+from pathlib import Path
+from typing import List
+from typing import Tuple
+
+import pytest
+
+from src.models.palette_model import Palette
+from src.models.palette_model import PaletteCollection
+from src.utils.accessibility_audit import audit_collection
+from src.utils.accessibility_audit import iter_collection_audit
+from src.utils.accessibility_audit import read_audit
+from src.utils.accessibility_audit import summarize_audit
+from src.utils.color_accessibility import calculate_contrast_ratio
+from src.utils.color_accessibility import get_wcag_compliance
+from src.utils.color_accessibility import is_color_blind_friendly
+
+
+@pytest.fixture
+def collection() -> PaletteCollection:
+    """Return a collection mixing accessible, inaccessible and repeated colors."""
+    palettes = [
+        Palette("Mono", ["#000000", "#ffffff", "#777777"], palette_id="mono"),
+        Palette("Red green", ["#d62728", "#2ca02c", "#ffffff", "#000000"], palette_id="red-green"),
+        Palette("Flat", ["#336699"] * 8, palette_id="flat"),
+    ]
+    palettes.extend(
+        Palette(f"Ramp {i}", [f"#{i * 20:02x}{j * 30:02x}80" for j in range(8)], palette_id=f"ramp-{i}")
+        for i in range(10)
+    )
+    return PaletteCollection(palettes)
+
+
+class TestAuditCollection:
+    """Test suite for the collection audit."""
+
+    def test_matches_pairwise_analysis(self, collection: PaletteCollection) -> None:
+        """Test records against per-pair scalar checks."""
+        records = {record["palette_id"]: record for record in iter_collection_audit(collection, workers=0)}
+        assert len(records) == len(collection)
+
+        for palette in collection:
+            record = records[palette.palette_id]
+            assert record["colors"] == palette.hex_colors
+            pairs = [
+                (i, j)
+                for i in range(len(palette))
+                for j in range(i + 1, len(palette))
+                if palette.colors[i] != palette.colors[j]
+            ]
+            assert record["pair_count"] == len(pairs)
+            failing = {(i, j) for i, j in pairs if calculate_contrast_ratio(palette[i], palette[j]) < 4.5}
+            assert {tuple(pair["colors"]) for pair in record["failing_pairs"]} == failing
+            compliance = [get_wcag_compliance(calculate_contrast_ratio(palette[i], palette[j])) for i, j in pairs]
+            for level in ("AA_large", "AAA_normal"):
+                assert record["compliance"][level] == sum(result[level] for result in compliance)
+
+            for deficiency, result in record["cvd"].items():
+                expected = all(is_color_blind_friendly(palette[i], palette[j])[deficiency] for i, j in pairs)
+                assert result["friendly"] == expected
+
+    def test_suggestions_reach_target(self, collection: PaletteCollection) -> None:
+        """Test that every suggested fix reaches the requested ratio."""
+        for record in iter_collection_audit(collection, workers=0, min_ratio=3.0):
+            for pair in record["failing_pairs"]:
+                assert pair["contrast_ratio"] < 3.0
+                suggestion = pair["suggestion"]
+                assert suggestion["background"] == record["colors"][pair["colors"][1]]
+                ratio = calculate_contrast_ratio(suggestion["foreground"], suggestion["background"])
+                assert ratio == pytest.approx(suggestion["contrast_ratio"])
+                assert ratio >= 3.0
+
+    def test_repeated_colors(self, collection: PaletteCollection) -> None:
+        """Test that a palette of one repeated color has no pairs to report."""
+        record = next(record for record in iter_collection_audit(collection, 0) if record["palette_id"] == "flat")
+        assert record["pair_count"] == 0
+        assert record["min_contrast"] is None
+        assert record["cvd"]["protanopia"] == {"min_delta_e": None, "friendly": True}
+
+    def test_process_pool_and_progress(self, collection: PaletteCollection, tmp_path: Path) -> None:
+        """Test that sharded pool output matches the in-process audit."""
+        calls: List[Tuple[int, int]] = []
+        output = tmp_path / "audit" / "results.jsonl"
+        count = audit_collection(
+            collection, str(output), workers=2, shard_size=4, progress=lambda done, total: calls.append((done, total))
+        )
+        assert count == len(collection)
+        assert [total for _, total in calls] == [len(collection)] * 4
+        assert calls[-1][0] == len(collection)
+
+        pooled = sorted(read_audit(str(output)), key=lambda record: record["palette_id"])
+        inline = sorted(iter_collection_audit(collection, workers=0), key=lambda record: record["palette_id"])
+        assert pooled == inline
+
+        summary = summarize_audit(pooled)
+        assert summary["palettes"] == len(collection)
+        assert summary["not_cvd_friendly"]["deuteranopia"] >= 1
+
+    def test_invalid_arguments(self, collection: PaletteCollection) -> None:
+        """Test that invalid settings are rejected before any work starts."""
+        with pytest.raises(ValueError):
+            next(iter_collection_audit(collection, shard_size=0))
+        with pytest.raises(ValueError):
+            next(iter_collection_audit(collection, workers=-1))
+        with pytest.raises(ValueError):
+            next(iter_collection_audit(collection, severity=2.0))
@@ -0,0 +1,115 @@
+"""
+Unit tests for the accessibility_index module.
+
+This module tests incremental updates of cached palette contrast matrices.
+"""
+
+import numpy as np
+import pytest
+
+from src.models.palette_model import Palette
+from src.models.palette_model import PaletteColorUpdated
+from src.utils.accessibility_index import AccessibilityIndex
+from src.utils.accessibility_index import AccessibilityIndexRegistry
+from src.utils.color_accessibility import contrast_matrices
+
+
+@pytest.fixture
+def palette() -> Palette:
+    """Return a palette with a spread of luminances."""
+    return Palette(
+        "Test", ["#000000", "#ffffff", "#777777", "#ff0000", "#0000ff", "#336699", "#c0ffee", "#0a0a0a"], "test"
+    )
+
+
+def assert_matches_full_rebuild(index: AccessibilityIndex, palette: Palette) -> None:
+    """Check every cached matrix against a from-scratch calculation."""
+    for method, (values, compliance) in contrast_matrices(palette).items():
+        assert np.allclose(index.matrix(method), values, rtol=1e-12, atol=1e-9)
+        for level, mask in compliance.items():
+            assert np.array_equal(index.compliance(method)[level], mask)
+
+
+class TestAccessibilityIndex:
+    """Test suite for AccessibilityIndex."""
+
+    def test_initial_matrices(self, palette: Palette) -> None:
+        """Test that a new index matches contrast_matrices."""
+        index = AccessibilityIndex(palette)
+        assert_matches_full_rebuild(index, palette)
+        assert index.contrast(0, 1) == pytest.approx(21.0)
+        assert index.contrast(0, 1, "apca") == pytest.approx(106.04, abs=0.01)
+        assert index.contrast(1, 0, "apca") == pytest.approx(-107.88, abs=0.01)
+
+    def test_incremental_updates(self, palette: Palette) -> None:
+        """Test that repeated single-color edits stay equal to a full rebuild."""
+        index = AccessibilityIndex(palette)
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            slot = int(rng.integers(len(palette)))
+            value = "#%02x%02x%02x" % tuple(int(channel) for channel in rng.integers(0, 256, 3))
+            palette.update_color(slot, value)
+            index.update_color(slot, value)
+        assert_matches_full_rebuild(index, palette)
+
+    def test_message_and_sync(self, palette: Palette) -> None:
+        """Test updates arriving as messages or found by sync."""
+        index = AccessibilityIndex(palette)
+        palette.update_color(2, "#123456")
+        assert index.on_palette_color_updated(PaletteColorUpdated("test", 2, "#123456"))
+        assert not index.on_palette_color_updated(PaletteColorUpdated("other", 2, "#123456"))
+        assert index.index_of("#123456") == 2
+        assert index.index_of("#777777") is None
+
+        palette.update_color(5, "#fedcba")
+        assert index.sync() == [5]
+        assert index.sync() == []
+        palette.add_color("#00ff00")
+        assert len(index.sync()) == 9
+        assert_matches_full_rebuild(index, palette)
+
+    def test_duplicate_positions(self) -> None:
+        """Test that index_of tracks the first slot of repeated colors."""
+        palette = Palette("Dupes", ["#ff0000", "#00ff00", "#ff0000"])
+        index = AccessibilityIndex(palette)
+        assert index.index_of("#ff0000") == 0
+        index.update_color(0, "#0000ff")
+        assert index.index_of("#ff0000") == 2
+        assert index.index_of("#0000ff") == 0
+
+    def test_failing_pairs(self, palette: Palette) -> None:
+        """Test streaming the pairs below a compliance level."""
+        index = AccessibilityIndex(palette)
+        failing = list(index.failing_pairs("AA_normal"))
+        ratios = index.matrix("wcag")
+        expected = {(i, j) for i in range(8) for j in range(8) if i != j and ratios[i, j] < 4.5}
+        assert {(i, j) for i, j, _ in failing} == expected
+        assert all(ratio < 4.5 for _, _, ratio in failing)
+
+    def test_invalid_arguments(self, palette: Palette) -> None:
+        """Test that unknown metrics and indices are rejected."""
+        with pytest.raises(ValueError):
+            AccessibilityIndex(palette, methods=("wcag3",))
+        index = AccessibilityIndex(palette, methods=("wcag",))
+        with pytest.raises(ValueError):
+            index.matrix("apca")
+        with pytest.raises(IndexError):
+            index.update_color(99, "#000000")
+
+
+class TestAccessibilityIndexRegistry:
+    """Test suite for AccessibilityIndexRegistry."""
+
+    def test_get_and_forward(self, palette: Palette) -> None:
+        """Test that the registry caches indices and forwards messages."""
+        registry = AccessibilityIndexRegistry()
+        index = registry.get(palette)
+        assert registry.get(palette) is index
+        assert "test" in registry and len(registry) == 1
+
+        palette.update_color(0, "#444444")
+        registry.on_palette_color_updated(PaletteColorUpdated("test", 0, "#444444"))
+        assert index.colors[0].hex.lower() == "#444444"
+
+        registry.discard("test")
+        assert "test" not in registry
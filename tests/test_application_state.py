@@ -4,6 +4,7 @@ Unit tests for the application_state module.
 This module contains tests for the ApplicationState class.
 """
 
+from pathlib import Path
 from typing import Any
 from typing import Dict
 from unittest.mock import MagicMock
@@ -336,6 +337,25 @@ class TestApplicationState:
         assert current_state["dark_mode"] is True
         assert current_state["show_hex"] is False
 
+    def test_palettes_are_journaled(self, tmp_path: Path) -> None:
+        """Test that palette edits are journaled and saving does not rewrite the snapshot."""
+        palettes_file = tmp_path / "data" / "palettes.json"
+        with patch.object(ApplicationState, "_palettes_file", return_value=palettes_file):
+            state = ApplicationState()
+            assert state.palette_collection.journaled
+            assert [palette.name for palette in state.palette_collection] == ["Default", "Monochrome", "Sunset"]
+
+            snapshot = palettes_file.read_text()
+            state.palette_model.set_active_palette(state.palette_collection.palettes[0].palette_id)
+            state.palette_model.update_active_color("#123456")
+            state.palette_model.rename_active_palette("Edited")
+            assert state.save_palettes()
+            assert palettes_file.read_text() == snapshot
+
+            reloaded = ApplicationState()
+            assert reloaded.palette_collection.palettes[0].name == "Edited"
+            assert reloaded.palette_collection.palettes[0].hex_colors[0] == "#123456"
+
 
 if __name__ == "__main__":
     pytest.main(["-v", "test_application_state.py"])
@@ -0,0 +1,273 @@
+"""
+Unit tests for the color_accessibility module.
+
+This module tests luminance, contrast ratio, APCA and WCAG compliance calculations.
+"""
+
+from typing import List
+
+import numpy as np
+import pytest
+
+from src.models.color_array import ColorArray
+from src.models.color_model import Color
+from src.models.palette_model import Palette
+from src.models.palette_model import PaletteCollection
+from src.utils.color_accessibility import CONTRAST_METHODS
+from src.utils.color_accessibility import analyze_color_pair
+from src.utils.color_accessibility import apca_contrast
+from src.utils.color_accessibility import calculate_apca_contrast
+from src.utils.color_accessibility import calculate_contrast_ratio
+from src.utils.color_accessibility import check_contrast_method
+from src.utils.color_accessibility import collection_contrast_matrices
+from src.utils.color_accessibility import contrast_from_luminance
+from src.utils.color_accessibility import contrast_luminances
+from src.utils.color_accessibility import contrast_matrices
+from src.utils.color_accessibility import contrast_matrix
+from src.utils.color_accessibility import find_compliant_pairs
+from src.utils.color_accessibility import get_luminance
+from src.utils.color_accessibility import get_luminance_array
+from src.utils.color_accessibility import get_apca_compliance
+from src.utils.color_accessibility import get_wcag_compliance
+from src.utils.color_accessibility import pairwise_contrast
+from src.utils.color_accessibility import solve_contrast
+from src.utils.color_accessibility import solve_contrast_array
+from src.utils.color_accessibility import suggest_accessible_alternatives
+
+
+@pytest.fixture
+def sample_hex() -> List[str]:
+    """Return a list of hex colors spanning the luminance range."""
+    return ["#000000", "#ffffff", "#777777", "#ff0000", "#0000ff", "#336699", "#c0ffee", "#0a0a0a"]
+
+
+class TestLuminance:
+    """Test suite for relative luminance."""
+
+    def test_reference_values(self) -> None:
+        """Test luminance of black, white and the primaries."""
+        assert get_luminance("#000000") == 0.0
+        assert get_luminance("#ffffff") == pytest.approx(1.0)
+        assert get_luminance(Color("#ff0000")) == pytest.approx(0.2126)
+        assert get_luminance("#00ff00") == pytest.approx(0.7152)
+
+    def test_array_matches_scalar(self) -> None:
+        """Test that batch luminance equals the scalar function exactly."""
+        rng = np.random.default_rng(0)
+        colors = ColorArray.from_rgb(rng.integers(0, 256, (1000, 3), dtype=np.uint8))
+        expected = [get_luminance(color) for color in colors]
+        assert get_luminance_array(colors).tolist() == expected
+
+
+class TestContrastMatrix:
+    """Test suite for vectorized contrast ratios."""
+
+    def test_matches_pairwise(self, sample_hex: List[str]) -> None:
+        """Test every matrix entry against calculate_contrast_ratio."""
+        ratios, compliance = contrast_matrix(sample_hex)
+        assert ratios.shape == (len(sample_hex), len(sample_hex))
+        assert ratios[0, 1] == pytest.approx(21.0)
+        assert np.allclose(np.diag(ratios), 1.0)
+        assert np.array_equal(ratios, ratios.T)
+
+        for i, fg in enumerate(sample_hex):
+            for j, bg in enumerate(sample_hex):
+                ratio = calculate_contrast_ratio(fg, bg)
+                assert ratios[i, j] == pytest.approx(ratio, rel=1e-12)
+                expected = get_wcag_compliance(ratio)
+                assert {level: bool(mask[i, j]) for level, mask in compliance.items()} == expected
+
+    def test_palette_and_collection(self, sample_hex: List[str]) -> None:
+        """Test building matrices from palettes and whole collections."""
+        first = Palette("First", sample_hex, palette_id="first")
+        second = Palette("Second", ["#123456", "#fedcba"], palette_id="second")
+        collection = PaletteCollection([first, second])
+
+        results = collection_contrast_matrices(collection)
+        assert set(results) == {"first", "second"}
+        assert np.array_equal(results["first"][0], contrast_matrix(first)[0])
+        assert results["second"][0].shape == (8, 8)
+        assert results["second"][1]["AA_normal"].dtype == bool
+
+    def test_from_luminance(self, sample_hex: List[str]) -> None:
+        """Test building the matrix from precomputed luminances."""
+        ratios, compliance = contrast_from_luminance(get_luminance_array(sample_hex))
+        expected, expected_compliance = contrast_matrix(sample_hex)
+        assert np.array_equal(ratios, expected)
+        assert np.array_equal(compliance["AA_normal"], expected_compliance["AA_normal"])
+
+
+class TestAPCA:
+    """Test suite for APCA lightness contrast."""
+
+    @pytest.mark.parametrize(
+        "text, background, expected",
+        [
+            ("#888888", "#ffffff", 63.056469930209424),
+            ("#ffffff", "#888888", -68.54146436644962),
+            ("#000000", "#aaaaaa", 58.146262578561334),
+            ("#aaaaaa", "#000000", -56.24113336839742),
+            ("#112233", "#ddeeff", 91.66830811481631),
+            ("#ddeeff", "#112233", -93.06770049484275),
+        ],
+    )
+    def test_reference_values(self, text: str, background: str, expected: float) -> None:
+        """Test Lc against the APCA-W3 reference implementation."""
+        assert calculate_apca_contrast(text, background) == pytest.approx(expected, abs=1e-9)
+
+    def test_low_contrast_clips_to_zero(self) -> None:
+        """Test that near-identical colors report no contrast."""
+        assert calculate_apca_contrast("#777777", "#777777") == 0.0
+        assert calculate_apca_contrast("#777777", "#7a7a7a") == 0.0
+
+    def test_matrix_matches_scalar(self, sample_hex: List[str]) -> None:
+        """Test the APCA matrix uses rows as text and columns as background."""
+        values, compliance = contrast_matrix(sample_hex, method="apca")
+        for i, text in enumerate(sample_hex):
+            for j, background in enumerate(sample_hex):
+                lc = calculate_apca_contrast(text, background)
+                assert values[i, j] == pytest.approx(lc, abs=1e-9)
+                assert {level: bool(mask[i, j]) for level, mask in compliance.items()} == get_apca_compliance(lc)
+
+    def test_both_methods_in_one_pass(self, sample_hex: List[str]) -> None:
+        """Test that contrast_matrices agrees with the single-metric calls."""
+        results = contrast_matrices(sample_hex)
+        assert set(results) == {"wcag", "apca"}
+        for method, (values, _) in results.items():
+            assert np.array_equal(values, contrast_matrix(sample_hex, method)[0])
+
+        collection = PaletteCollection([Palette("First", sample_hex, palette_id="first")])
+        apca = collection_contrast_matrices(collection, method="apca")
+        assert np.array_equal(apca["first"][0], results["apca"][0])
+
+    def test_analyze_color_pair(self) -> None:
+        """Test switching the metric used by analyze_color_pair."""
+        wcag = analyze_color_pair("#888888", "#ffffff")
+        assert wcag["method"] == "wcag"
+        assert wcag["formatted_ratio"] == "3.54:1"
+        assert not wcag["passes_aa_normal"]
+
+        apca = analyze_color_pair("#888888", "#ffffff", method="apca")
+        assert apca["contrast_ratio"] == pytest.approx(63.056, abs=1e-3)
+        assert apca["formatted_ratio"] == "Lc 63.1"
+        assert apca["passes_aa_normal"] and not apca["passes_aaa_normal"]
+
+    def test_invalid_method(self, sample_hex: List[str]) -> None:
+        """Test that unknown metrics are rejected."""
+        with pytest.raises(ValueError):
+            analyze_color_pair("#000000", "#ffffff", method="wcag3")
+        with pytest.raises(ValueError):
+            contrast_matrix(sample_hex, method="wcag3")
+        with pytest.raises(ValueError):
+            check_contrast_method("wcag3")
+        check_contrast_method("apca")
+
+    def test_luminance_helpers(self, sample_hex: List[str]) -> None:
+        """Test the per-metric luminances and APCA contrast from luminances."""
+        luminance = contrast_luminances(sample_hex)
+        assert luminance.shape == (len(sample_hex), len(CONTRAST_METHODS))
+        assert np.allclose(luminance[:, CONTRAST_METHODS.index("wcag")], get_luminance_array(sample_hex))
+        apca = luminance[:, CONTRAST_METHODS.index("apca")]
+        assert float(apca_contrast(apca[0], apca[1])) == pytest.approx(calculate_apca_contrast("#000000", "#ffffff"))
+
+
+class TestFindCompliantPairs:
+    """Test suite for the sort-and-sweep pair search."""
+
+    @pytest.mark.parametrize("min_ratio", [1.0, 3.0, 4.5, 7.0, 21.0])
+    def test_matches_brute_force(self, min_ratio: float) -> None:
+        """Test the sweep against testing every pair."""
+        rng = np.random.default_rng(2)
+        colors = ColorArray.from_rgb(rng.integers(0, 256, (200, 3), dtype=np.uint8))
+        ratios, _ = contrast_matrix(colors)
+        rows, cols = np.nonzero(np.triu(ratios >= min_ratio, k=1))
+        expected = set(zip(rows.tolist(), cols.tolist()))
+
+        found = list(find_compliant_pairs(colors, min_ratio))
+        assert len(found) == len(expected)
+        assert {(min(i, j), max(i, j)) for i, j, _ in found} == expected
+
+    def test_darker_color_first(self, sample_hex: List[str]) -> None:
+        """Test that each pair lists the darker color first with the exact ratio."""
+        for dark, light, ratio in find_compliant_pairs(sample_hex, 4.5):
+            assert get_luminance(sample_hex[dark]) <= get_luminance(sample_hex[light])
+            assert ratio == calculate_contrast_ratio(sample_hex[dark], sample_hex[light])
+            assert ratio >= 4.5
+
+    def test_across_collection(self) -> None:
+        """Test searching pairs across every palette of a collection."""
+        collection = PaletteCollection([Palette("Dark", ["#000000"] * 8), Palette("Light", ["#ffffff"] * 8)])
+        pairs = list(find_compliant_pairs(collection, 7.0))
+        assert len(pairs) == 64
+        assert all(dark < 8 <= light for dark, light, _ in pairs)
+
+    def test_is_lazy(self) -> None:
+        """Test that results are streamed rather than collected up front."""
+        pairs = find_compliant_pairs(["#000000", "#ffffff", "#eeeeee"], 4.5)
+        assert next(pairs)[:2] == (0, 2)
+        assert next(pairs)[:2] == (0, 1)
+        assert list(find_compliant_pairs([], 4.5)) == []
+
+
+class TestContrastSolver:
+    """Test suite for the continuous contrast solver."""
+
+    @pytest.fixture
+    def random_pairs(self) -> tuple:
+        """Return reproducible random foreground and background batches."""
+        rng = np.random.default_rng(4)
+        foregrounds = ColorArray.from_rgb(rng.integers(0, 256, (500, 3), dtype=np.uint8))
+        backgrounds = ColorArray.from_rgb(rng.integers(0, 256, (500, 3), dtype=np.uint8))
+        return foregrounds, backgrounds
+
+    def test_pairwise_contrast(self, random_pairs: tuple) -> None:
+        """Test element-wise ratios against the scalar contrast ratio."""
+        foregrounds, backgrounds = random_pairs
+        ratios = pairwise_contrast(get_luminance_array(foregrounds), get_luminance_array(backgrounds))
+        for fg, bg, ratio in zip(foregrounds[:20], backgrounds[:20], ratios[:20], strict=True):
+            assert ratio == pytest.approx(calculate_contrast_ratio(fg.hex, bg.hex))
+
+    @pytest.mark.parametrize("space", ["hsl", "oklch"])
+    def test_reaches_target(self, random_pairs: tuple, space: str) -> None:
+        """Test that every adjusted pair meets the target and reports its ratio."""
+        foregrounds, backgrounds = random_pairs
+        adjusted, ratios = solve_contrast_array(foregrounds, backgrounds, 4.5, space)
+        assert len(adjusted) == len(foregrounds)
+        assert np.all(ratios >= 4.5)
+        for index in range(0, 500, 50):
+            assert ratios[index] == calculate_contrast_ratio(adjusted[index], backgrounds[index])
+
+    def test_minimal_change(self) -> None:
+        """Test that the solver stops at the first passing lightness step."""
+        adjusted = solve_contrast("#777777", "#ffffff")
+        assert calculate_contrast_ratio(adjusted, "#ffffff") >= 4.5
+        # One 8-bit step lighter no longer passes
+        r, g, b = adjusted.rgb
+        assert calculate_contrast_ratio(Color((r + 1, g + 1, b + 1)), "#ffffff") < 4.5
+
+    def test_passing_pairs_unchanged(self) -> None:
+        """Test that compliant pairs are returned as they are."""
+        adjusted, ratios = solve_contrast_array(["#000000", "#336699"], ["#ffffff", "#ffffff"], 4.5)
+        assert adjusted.to_hex() == ["#000000", "#336699"]
+        assert ratios[0] == pytest.approx(21.0)
+
+    def test_unreachable_target(self) -> None:
+        """Test that unreachable targets return the best extreme."""
+        adjusted = solve_contrast("#808080", "#777777", 21.0)
+        assert adjusted.hex in ("#000000", "#ffffff")
+
+    def test_invalid_arguments(self) -> None:
+        """Test that mismatched batches and unknown spaces are rejected."""
+        with pytest.raises(ValueError):
+            solve_contrast_array(["#000000"], ["#ffffff", "#000000"])
+        with pytest.raises(ValueError):
+            solve_contrast("#777777", "#888888", space="cmyk")
+
+    def test_suggestions(self) -> None:
+        """Test that suggestions reach the target with the smallest change per direction."""
+        suggestions = suggest_accessible_alternatives("#777777", "#888888", 4.5)
+        assert suggestions
+        for suggestion in suggestions:
+            assert suggestion["contrast_ratio"] >= 4.5
+            assert suggestion["adjustment"].endswith("%")
+        assert suggest_accessible_alternatives("#000000", "#ffffff") == []
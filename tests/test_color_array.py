@@ -0,0 +1,129 @@
+"""
+Unit tests for the color_array module.
+
+This module contains tests for the ColorArray class and its vectorized conversions.
+"""
+
+from typing import List
+
+import numpy as np
+import pytest
+
+from src.models.color_array import ColorArray
+from src.models.color_model import Color
+from src.models.palette_model import Palette
+from src.models.palette_model import PaletteCollection
+
+
+@pytest.fixture
+def sample_hex() -> List[str]:
+    """Return a list of hex colors covering grays, primaries and mixed hues."""
+    return ["#000000", "#ffffff", "#808080", "#ff0000", "#00ff00", "#0000ff", "#ff5500", "#336699", "#c0ffee"]
+
+
+class TestColorArrayConstruction:
+    """Test suite for ColorArray constructors."""
+
+    def test_from_hex_round_trip(self, sample_hex: List[str]) -> None:
+        """Test that hex strings survive a round trip."""
+        colors = ColorArray.from_hex(sample_hex)
+        assert len(colors) == len(sample_hex)
+        assert colors.to_hex() == sample_hex
+
+    def test_from_hex_mixed_formats(self) -> None:
+        """Test hex input that needs the full Color parser."""
+        colors = ColorArray.from_hex(["#fff", "red", "#123456"])
+        assert colors.to_hex() == ["#ffffff", "#ff0000", "#123456"]
+
+    def test_from_hex_invalid(self) -> None:
+        """Test that invalid hex strings are rejected."""
+        with pytest.raises((ValueError, AttributeError)):
+            ColorArray.from_hex(["#zzzzzz"])
+
+    def test_from_colors_matches_packed(self, sample_hex: List[str]) -> None:
+        """Test that Color instances map onto the same packed values."""
+        colors = [Color(value) for value in sample_hex]
+        array = ColorArray.from_colors(colors)
+        assert array.packed.tolist() == [color.packed for color in colors]
+        assert array.to_colors() == colors
+
+    def test_from_rgb(self) -> None:
+        """Test building from uint8 and float RGB arrays."""
+        from_bytes = ColorArray.from_rgb(np.array([[255, 85, 0]], dtype=np.uint8))
+        from_floats = ColorArray.from_rgb(np.array([[1.0, 1 / 3, 0.0]]))
+        assert from_bytes.to_hex() == ["#ff5500"]
+        assert from_floats == from_bytes
+
+        with pytest.raises(ValueError):
+            ColorArray.from_rgb(np.zeros((2, 4)))
+
+    def test_from_palette_and_collection(self) -> None:
+        """Test building from palettes and collections."""
+        first = Palette("First", ["#FF0000", "#00FF00"])
+        second = Palette("Second", ["#0000FF"])
+        collection = PaletteCollection([first, second])
+
+        assert ColorArray.from_palette(first).to_hex() == first.hex_colors
+        assert ColorArray.from_collection(collection).to_hex() == first.hex_colors + second.hex_colors
+
+    def test_rgb_is_a_view(self) -> None:
+        """Test that the RGB channels share memory with the packed buffer."""
+        colors = ColorArray.from_hex(["#102030", "#405060"])
+        assert np.shares_memory(colors.rgb, colors.packed)
+        assert colors.rgb.tolist() == [[0x10, 0x20, 0x30], [0x40, 0x50, 0x60]]
+        assert colors.alpha.tolist() == [255, 255]
+
+    def test_indexing(self, sample_hex: List[str]) -> None:
+        """Test integer indexing, slicing and iteration."""
+        colors = ColorArray.from_hex(sample_hex)
+        assert colors[3] == Color("#ff0000")
+        assert colors[1:3].to_hex() == sample_hex[1:3]
+        assert colors[np.array([0, 3])].to_hex() == [sample_hex[0], sample_hex[3]]
+        assert colors[colors.rgb[:, 0] == 0xFF].to_hex() == ["#ffffff", "#ff0000", "#ff5500"]
+        assert [color.hex for color in colors] == sample_hex
+
+    def test_strided_slice(self, sample_hex: List[str]) -> None:
+        """Test that strided slices and reversed arrays support channel access and conversions."""
+        colors = ColorArray.from_hex(sample_hex)
+        for sliced, expected in ((colors[::2], sample_hex[::2]), (ColorArray(colors.packed[::-1]), sample_hex[::-1])):
+            assert sliced.to_hex() == expected
+            assert sliced.rgb.tolist() == [list(Color(value).rgb) for value in expected]
+            assert sliced.alpha.tolist() == [255] * len(expected)
+            assert np.allclose(sliced.to_hsl(), [Color(value).hsl_float for value in expected], atol=1e-5)
+        assert np.shares_memory(colors[1:3].packed, colors.packed)
+
+
+class TestColorArrayConversions:
+    """Test suite for vectorized ColorArray conversions."""
+
+    def test_to_hsl_matches_color(self, sample_hex: List[str]) -> None:
+        """Test HSL conversion against the scalar Color model."""
+        hsl = ColorArray.from_hex(sample_hex).to_hsl()
+        assert hsl.dtype == np.float32
+        expected = np.array([Color(value).hsl_float for value in sample_hex])
+        assert np.allclose(hsl, expected, atol=1e-5)
+
+    def test_to_hsv_matches_color(self, sample_hex: List[str]) -> None:
+        """Test HSV conversion against the scalar Color model."""
+        hsv = ColorArray.from_hex(sample_hex).to_hsv()
+        expected = np.array([Color(value).hsv for value in sample_hex])
+        assert np.allclose(hsv * [360, 100, 100], expected, atol=0.5)
+
+    def test_to_cmyk_matches_color(self, sample_hex: List[str]) -> None:
+        """Test CMYK conversion against the scalar Color model."""
+        cmyk = ColorArray.from_hex(sample_hex).to_cmyk()
+        assert cmyk.shape == (len(sample_hex), 4)
+        expected = np.array([Color(value).cmyk for value in sample_hex])
+        assert np.allclose(cmyk * 100, expected, atol=0.5)
+
+    @pytest.mark.parametrize("method", ["lighten", "darken", "saturate", "desaturate"])
+    def test_adjustments_match_color(self, sample_hex: List[str], method: str) -> None:
+        """Test that batch adjustments agree with the scalar Color methods."""
+        adjusted = getattr(ColorArray.from_hex(sample_hex), method)(0.2)
+        expected = [getattr(Color(value), method)(0.2).hex for value in sample_hex]
+        assert adjusted.to_hex() == expected
+
+    def test_adjustments_keep_alpha(self) -> None:
+        """Test that adjustments preserve the alpha channel."""
+        colors = ColorArray.from_colors([Color((255, 85, 0, 128))])
+        assert colors.lighten(0.1).alpha.tolist() == [128]
@@ -0,0 +1,151 @@
+"""
+Unit tests for the color_difference module.
+
+This module tests the ΔE formulas, the chunked matrix computation and
+similarity-based deduplication.
+"""
+
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from src.models.color_array import ColorArray
+from src.models.color_model import Color
+from src.models.palette_model import Palette
+from src.models.palette_model import PaletteCollection
+from src.utils.color_difference import check_delta_e_method
+from src.utils.color_difference import deduplicate_colors
+from src.utils.color_difference import delta_e
+from src.utils.color_difference import delta_e_lab
+from src.utils.color_difference import delta_e_matrix
+from src.utils.color_difference import delta_e_pairwise
+from src.utils.color_difference import find_similar_pairs
+from src.utils.color_difference import iter_delta_e_matrix
+from src.utils.serialization import import_palette_from_file
+
+
+@pytest.fixture
+def random_colors() -> ColorArray:
+    """Return a reproducible batch of random colors."""
+    rng = np.random.default_rng(1)
+    return ColorArray.from_rgb(rng.integers(0, 256, (300, 3), dtype=np.uint8))
+
+
+class TestDeltaEFormulas:
+    """Test suite for the individual difference formulas."""
+
+    @pytest.mark.parametrize(
+        ("lab1", "lab2", "expected"),
+        [
+            ((50, 2.6772, -79.7751), (50, 0, -82.7485), 2.0425),
+            ((50, 0, 0), (50, -1, 2), 2.3669),
+            ((50, 2.5, 0), (73, 25, -18), 27.1492),
+            ((50, 2.5, 0), (50, 3.1736, 0.5854), 1.0000),
+            ((50, -0.001, 2.49), (50, 0.0009, -2.49), 4.8045),
+        ],
+    )
+    def test_ciede2000_reference_pairs(self, lab1: tuple, lab2: tuple, expected: float) -> None:
+        """Test CIEDE2000 against the Sharma, Wu and Dalal reference data."""
+        assert float(delta_e_lab(np.array(lab1), np.array(lab2))) == pytest.approx(expected, abs=1e-4)
+        assert float(delta_e_lab(np.array(lab2), np.array(lab1))) == pytest.approx(expected, abs=1e-4)
+
+    def test_cie76_and_cie94(self) -> None:
+        """Test the cheaper formulas on simple CIELAB offsets."""
+        assert float(delta_e_lab(np.array([50, 0, 0]), np.array([53, 4, 0]), "cie76")) == pytest.approx(5.0)
+        # Pure lightness differences are unweighted in CIE94
+        assert float(delta_e_lab(np.array([50, 0, 0]), np.array([55, 0, 0]), "cie94")) == pytest.approx(5.0)
+
+    def test_identical_colors(self) -> None:
+        """Test that identical colors have zero difference for every formula."""
+        for method in ("cie76", "cie94", "ciede2000"):
+            assert delta_e("#336699", Color("#336699"), method) == 0.0
+
+    def test_unsupported_method(self) -> None:
+        """Test that unknown formulas are rejected."""
+        with pytest.raises(ValueError):
+            delta_e("#000000", "#ffffff", "cmc")
+        with pytest.raises(ValueError):
+            delta_e_matrix(["#000000"], method="cmc")
+        with pytest.raises(ValueError):
+            check_delta_e_method("cmc")
+        check_delta_e_method("cie94")
+
+
+class TestBatchDifferences:
+    """Test suite for pairwise and matrix computations."""
+
+    def test_pairwise_matches_scalar(self, random_colors: ColorArray) -> None:
+        """Test element-wise differences against the scalar function."""
+        first, second = random_colors[:20], random_colors[20:40]
+        result = delta_e_pairwise(first, second)
+        assert result.dtype == np.float32
+        expected = [delta_e(a, b) for a, b in zip(first, second)]
+        assert np.allclose(result, expected, atol=1e-4)
+
+        with pytest.raises(ValueError):
+            delta_e_pairwise(first, second[:5])
+
+    def test_matrix_is_chunk_independent(self, random_colors: ColorArray) -> None:
+        """Test that the chunk size does not change the matrix."""
+        full = delta_e_matrix(random_colors, random_colors[:50])
+        assert full.shape == (300, 50)
+        assert np.array_equal(full, delta_e_matrix(random_colors, random_colors[:50], chunk_size=77))
+        assert np.allclose(np.diag(delta_e_matrix(random_colors)), 0.0)
+
+    def test_iter_matrix_bounds_blocks(self, random_colors: ColorArray) -> None:
+        """Test that streamed blocks respect the chunk size and cover every row."""
+        covered = 0
+        for rows, block in iter_delta_e_matrix(random_colors, method="cie76", chunk_size=1000):
+            assert block.size <= 1000
+            assert block.shape == (rows.stop - rows.start, 300)
+            covered += block.shape[0]
+        assert covered == 300
+
+
+class TestSimilarity:
+    """Test suite for similar-pair search and deduplication."""
+
+    @pytest.mark.parametrize("method", ["cie76", "cie94", "ciede2000"])
+    def test_similar_pairs_match_brute_force(self, random_colors: ColorArray, method: str) -> None:
+        """Test the lightness-banded search against the full matrix."""
+        matrix = delta_e_matrix(random_colors, method=method)
+        threshold = 12.0
+        rows, cols = np.nonzero(np.triu(matrix <= threshold, k=1))
+        # CIE94 is asymmetric, so compare unordered pairs only
+        expected = set(zip(rows.tolist(), cols.tolist()))
+        if method == "cie94":
+            rows, cols = np.nonzero(np.tril(matrix <= threshold, k=-1))
+            expected |= set(zip(cols.tolist(), rows.tolist()))
+        found = {(i, j) for i, j, _ in find_similar_pairs(random_colors, threshold, method, chunk_size=500)}
+        assert found <= expected
+        if method != "cie94":
+            assert found == expected
+
+    def test_deduplicate_keeps_first(self) -> None:
+        """Test that near-identical colors collapse onto the first occurrence."""
+        colors: List[str] = ["#ff0000", "#0000ff", "#fe0101", "#ff0000", "#0000fe", "#00ff00"]
+        keep = deduplicate_colors(colors, threshold=1.0)
+        assert keep.tolist() == [True, True, False, False, False, True]
+
+    def test_collection_find_similar_colors(self) -> None:
+        """Test similar-color search across the palettes of a collection."""
+        first = Palette("First", ["#336699"] + ["#000000"] * 7, palette_id="a")
+        second = Palette("Second", ["#336698"] + ["#ffffff"] * 7, palette_id="b")
+        collection = PaletteCollection([first, second])
+
+        pairs = collection.find_similar_colors(threshold=1.0)
+        assert (("a", 0), ("b", 0)) in [(left, right) for left, right, _ in pairs]
+        assert all(difference <= 1.0 for _, _, difference in pairs)
+
+    def test_import_merges_similar_colors(self, tmp_path: Path) -> None:
+        """Test that importing can merge perceptually identical colors."""
+        file_path = tmp_path / "palette.txt"
+        file_path.write_text("#336699\n#336698\n#ff0000\n")
+
+        success, palette = import_palette_from_file(file_path)
+        assert success and palette["colors"] == ["#336699", "#336698", "#ff0000"]
+
+        success, palette = import_palette_from_file(file_path, min_delta_e=1.0)
+        assert success and palette["colors"] == ["#336699", "#ff0000"]
@@ -0,0 +1,296 @@
+"""
+Unit tests for the color_extraction module.
+
+This module tests histogram, k-means, median-cut and streaming color extraction from images.
+"""
+
+import warnings
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.models.color_model import Color
+from src.utils.color_extraction import color_histogram
+from src.utils.color_extraction import extract_colors
+from src.utils.color_extraction import extract_colors_streaming
+from src.utils.color_extraction import extract_dominant_colors
+from src.utils.color_extraction import extract_frame_palettes
+from src.utils.color_extraction import image_to_pixels
+from src.utils.color_extraction import iter_frame_histograms
+from src.utils.color_extraction import iter_image_pixels
+from src.utils.color_extraction import kmeans_colors
+from src.utils.color_extraction import median_cut_colors
+from src.utils.color_extraction import merge_histogram_bins
+from src.utils.color_extraction import preview_colors
+from src.utils.color_extraction import stream_color_histogram
+from src.utils.color_utils import import_colors_from_image
+
+
+@pytest.fixture
+def striped_image() -> Image.Image:
+    """Return a noisy image with red, blue and white stripes covering 50%, 30% and 20%."""
+    rng = np.random.default_rng(0)
+    base = np.array([[200, 30, 40]] * 5 + [[20, 120, 200]] * 3 + [[240, 240, 230]] * 2, dtype=np.int16)
+    rows = np.repeat(base, 20, axis=0)[:, None, :].repeat(150, axis=1)
+    noisy = np.clip(rows + rng.integers(-5, 6, rows.shape), 0, 255).astype(np.uint8)
+    return Image.fromarray(noisy)
+
+
+class TestHistogram:
+    """Test suite for packed-key color histograms."""
+
+    def test_counts_and_means(self) -> None:
+        """Test that bins count pixels and keep their mean color."""
+        pixels = np.array([[0, 0, 0], [7, 7, 7], [255, 0, 0], [255, 0, 0], [248, 0, 0]], dtype=np.uint8)
+        sums, counts = color_histogram(pixels, bits=5)
+        assert counts.tolist() == [2, 3]
+        assert (sums / counts[:, None]).tolist() == [[3.5, 3.5, 3.5], [(255 * 2 + 248) / 3, 0.0, 0.0]]
+
+        _, fine_counts = color_histogram(pixels, bits=6)
+        assert fine_counts.tolist() == [1, 1, 1, 2]
+        assert color_histogram(pixels[:0])[1].tolist() == []
+
+    def test_invalid_bits(self) -> None:
+        """Test that unsupported precisions are rejected."""
+        with pytest.raises(ValueError):
+            color_histogram(np.zeros((1, 3), dtype=np.uint8), bits=8)
+
+    def test_image_modes(self) -> None:
+        """Test reading pixels from grayscale, palette and transparent images."""
+        gray = Image.new("L", (4, 2), 128)
+        assert image_to_pixels(gray).tolist() == [[128, 128, 128]] * 8
+
+        rgba = np.zeros((2, 2, 4), dtype=np.uint8)
+        rgba[0, 0] = [255, 0, 0, 255]
+        rgba[1, 1] = [0, 255, 0, 10]
+        assert image_to_pixels(Image.fromarray(rgba, "RGBA")).tolist() == [[255, 0, 0]]
+
+        palette_image = Image.new("RGB", (3, 3), "#336699").convert("P")
+        assert image_to_pixels(palette_image).tolist() == [[0x33, 0x66, 0x99]] * 9
+
+
+class TestMerging:
+    """Test suite for perceptual merging of histogram bins."""
+
+    def test_merges_near_duplicates(self) -> None:
+        """Test that neighbouring bins merge into their weighted mean."""
+        rgb = np.array([[200, 30, 40], [204, 32, 44], [20, 120, 200]], dtype=np.float64)
+        counts = np.array([3, 1, 2])
+        colors, merged = merge_histogram_bins(rgb * counts[:, None], counts, max_colors=8)
+        assert merged.tolist() == [4, 2]
+        assert colors.tolist() == [[201, 30, 41], [20, 120, 200]]
+
+    def test_limits_and_validation(self) -> None:
+        """Test the color limit and method validation."""
+        rgb = np.array([[0, 0, 0], [255, 255, 255], [255, 0, 0]], dtype=np.float64)
+        colors, merged = merge_histogram_bins(rgb, np.ones(3, dtype=np.int64), max_colors=2)
+        assert len(colors) == 2 and merged.tolist() == [1, 1]
+        with pytest.raises(ValueError):
+            merge_histogram_bins(rgb, np.ones(3, dtype=np.int64), 2, method="cmc")
+        with pytest.raises(ValueError):
+            merge_histogram_bins(rgb, np.ones(3, dtype=np.int64), 2, threshold=-1.0)
+
+    def test_zero_threshold(self) -> None:
+        """Test that a zero threshold keeps every bin as its own color without dividing by zero."""
+        rgb = np.array([[200, 30, 40], [204, 32, 44], [20, 120, 200], [20, 120, 200]], dtype=np.float64)
+        counts = np.array([3, 1, 2, 5])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            colors, merged = merge_histogram_bins(rgb * counts[:, None], counts, max_colors=8, threshold=0.0)
+        assert merged.tolist() == [5, 3, 2, 1]
+        assert colors.tolist() == [[20, 120, 200], [200, 30, 40], [20, 120, 200], [204, 32, 44]]
+
+
+class TestExtraction:
+    """Test suite for dominant color extraction."""
+
+    @pytest.mark.parametrize("bits", [5, 6])
+    def test_dominant_colors(self, striped_image: Image.Image, bits: int) -> None:
+        """Test that each stripe yields one color, largest area first."""
+        colors = extract_dominant_colors(striped_image, count=8, bits=bits)
+        assert len(colors) == 3
+        for color, expected in zip(colors, ("#c81e28", "#1478c8", "#f0f0e6")):
+            assert all(abs(a - b) <= 2 for a, b in zip(color.rgb, Color(expected).rgb))
+
+    def test_from_file(self, striped_image: Image.Image, tmp_path: Path) -> None:
+        """Test extraction from a path and through import_colors_from_image."""
+        path = tmp_path / "stripes.png"
+        striped_image.save(path)
+        assert extract_dominant_colors(str(path), count=2) == extract_dominant_colors(striped_image, count=2)
+
+        colors = import_colors_from_image(str(path), count=5, method="dominant")
+        assert len(colors) == 5
+        assert colors[:3] == extract_dominant_colors(striped_image, count=5)
+
+
+class TestClusteringExtractors:
+    """Test suite for the k-means and median-cut extractors."""
+
+    @pytest.mark.parametrize("method", ["kmeans", "median_cut"])
+    def test_recovers_stripes(self, striped_image: Image.Image, method: str) -> None:
+        """Test that three clusters find the three stripes, largest first."""
+        colors = extract_colors(striped_image, count=3, method=method)
+        for color, expected in zip(colors, ("#c81e28", "#1478c8", "#f0f0e6")):
+            assert all(abs(a - b) <= 3 for a, b in zip(color.rgb, Color(expected).rgb))
+
+    def test_kmeans_is_deterministic(self, striped_image: Image.Image) -> None:
+        """Test that a seed fixes the k-means result."""
+        pixels = image_to_pixels(striped_image)
+        first, first_sizes = kmeans_colors(pixels, 5, seed=3)
+        second, second_sizes = kmeans_colors(pixels, 5, seed=3)
+        assert np.array_equal(first, second)
+        assert np.array_equal(first_sizes, second_sizes)
+
+    def test_kmeans_budget(self, striped_image: Image.Image) -> None:
+        """Test that iteration and time limits still return usable centers."""
+        pixels = image_to_pixels(striped_image)
+        colors, sizes = kmeans_colors(pixels, 3, max_iterations=1)
+        assert len(colors) == 3 and sizes.sum() == len(pixels)
+        colors, _ = kmeans_colors(pixels, 3, time_budget=0.0)
+        assert len(colors) == 3
+        with pytest.raises(ValueError):
+            kmeans_colors(pixels, 0)
+
+    def test_fewer_colors_than_requested(self) -> None:
+        """Test images with fewer distinct colors than clusters."""
+        pixels = np.array([[255, 0, 0]] * 10 + [[0, 0, 255]] * 5, dtype=np.uint8)
+        colors, sizes = kmeans_colors(pixels, 8)
+        assert colors.tolist() == [[255, 0, 0], [0, 0, 255]]
+        assert sizes.tolist() == [10, 5]
+
+        colors, sizes = median_cut_colors(pixels, 8)
+        assert colors.tolist() == [[255, 0, 0], [0, 0, 255]]
+        assert sizes.tolist() == [10, 5]
+
+    def test_unknown_method(self, striped_image: Image.Image) -> None:
+        """Test that unknown methods are rejected."""
+        with pytest.raises(ValueError):
+            extract_colors(striped_image, method="octree")
+
+
+class TestStreaming:
+    """Test suite for band-by-band extraction of large images."""
+
+    @pytest.mark.parametrize("extension", ["bmp", "tif", "ppm", "png", "jpg"])
+    def test_matches_full_histogram(self, striped_image: Image.Image, tmp_path: Path, extension: str) -> None:
+        """Test that small bands add up to the histogram of the whole image."""
+        image_path = tmp_path / f"stripes.{extension}"
+        striped_image.save(image_path)
+        with Image.open(image_path) as image:
+            expected_sums, expected_counts = color_histogram(image_to_pixels(image))
+
+        # Room for only a few rows per band
+        budget = striped_image.width * 8 * 7
+        assert len(list(iter_image_pixels(str(image_path), memory_budget=budget))) > 10
+        sums, counts = stream_color_histogram(str(image_path), memory_budget=budget)
+        assert counts.tolist() == expected_counts.tolist()
+        assert np.allclose(sums, expected_sums)
+
+    @pytest.mark.parametrize("extension", ["bmp", "png"])
+    def test_sampling(self, striped_image: Image.Image, tmp_path: Path, extension: str) -> None:
+        """Test that a pixel budget samples the image evenly."""
+        image_path = tmp_path / f"stripes.{extension}"
+        striped_image.save(image_path)
+        _, counts = stream_color_histogram(str(image_path), memory_budget=4096, max_pixels=3400)
+        # 150x200 pixels at a stride of 3
+        assert counts.sum() == 50 * 67
+
+        colors = extract_colors_streaming(str(image_path), 3, memory_budget=4096, max_pixels=3400)
+        full = extract_colors_streaming(str(image_path), 3)
+        for sampled, expected in zip(colors, full):
+            assert np.abs(np.array(sampled.rgb) - np.array(expected.rgb)).max() <= 3
+
+    def test_median_cut_and_validation(self, striped_image: Image.Image) -> None:
+        """Test streaming median cut, and rejection of invalid methods and budgets."""
+        colors = extract_colors_streaming(striped_image, 3, method="median_cut", memory_budget=4096)
+        assert colors == extract_colors(striped_image, 3, "median_cut")
+
+        with pytest.raises(ValueError):
+            extract_colors_streaming(striped_image, method="kmeans")
+        with pytest.raises(ValueError):
+            stream_color_histogram(striped_image, memory_budget=0)
+        with pytest.raises(ValueError):
+            stream_color_histogram(striped_image, max_pixels=0)
+
+
+class TestProgressiveExtraction:
+    """Test suite for instant previews and cancellable full extraction."""
+
+    def test_preview_matches_full_extraction(self, striped_image: Image.Image, tmp_path: Path) -> None:
+        """Test that the thumbnail preview finds the same leading colors as the full extraction."""
+        image_path = tmp_path / "stripes.jpg"
+        striped_image.resize((1500, 2000)).save(image_path, quality=95)
+        full = extract_colors_streaming(str(image_path), 3)
+        for preview in (preview_colors(str(image_path), 3), preview_colors(striped_image, 3, size=16)):
+            assert len(preview) == 3
+            for sampled, expected in zip(preview, full):
+                assert np.abs(np.array(sampled.rgb) - np.array(expected.rgb)).max() <= 12
+
+        # The caller's image is left untouched
+        assert striped_image.size == (150, 200)
+        with pytest.raises(ValueError):
+            preview_colors(striped_image, size=0)
+
+    def test_cancellation(self, striped_image: Image.Image) -> None:
+        """Test that extraction stops reading once cancelled."""
+        checks: List[int] = []
+
+        def cancelled() -> bool:
+            checks.append(1)
+            return len(checks) > 2
+
+        _, counts = stream_color_histogram(striped_image, memory_budget=150 * 8 * 10, cancelled=cancelled)
+        assert counts.sum() == 150 * 10 * 2
+        assert extract_colors_streaming(striped_image, cancelled=lambda: True) == []
+
+
+@pytest.fixture
+def animation_path(tmp_path: Path) -> Path:
+    """Return an animated PNG with two red frames, two blue frames and one green frame."""
+    frames = [Image.new("RGB", (20, 10), color) for color in ("#FF0000", "#FF0000", "#0000FF", "#0000FF", "#00FF00")]
+    path = tmp_path / "animation.png"
+    frames[0].save(path, save_all=True, append_images=frames[1:])
+    return path
+
+
+class TestFrameExtraction:
+    """Test suite for multi-frame extraction."""
+
+    def test_combined_and_per_frame(self, animation_path: Path) -> None:
+        """Test that every frame contributes to the combined palette and gets its own palette."""
+        combined, frames = extract_frame_palettes(str(animation_path), 3)
+        assert sorted(color.hex.upper() for color in combined) == ["#0000FF", "#00FF00", "#FF0000"]
+        assert [index for index, _ in frames] == [0, 1, 2, 3, 4]
+        assert [palette[0].hex.upper() for _, palette in frames] == ["#FF0000"] * 2 + ["#0000FF"] * 2 + ["#00FF00"]
+
+        combined, frames = extract_frame_palettes(str(animation_path), 3, method="median_cut", per_frame=False)
+        assert len(combined) == 3
+        assert frames == []
+        assert extract_frame_palettes(str(animation_path), 3, cancelled=lambda: True) == ([], [])
+
+    def test_frame_sampling(self, animation_path: Path) -> None:
+        """Test sampling every Nth frame and on scene changes."""
+        with Image.open(animation_path) as image:
+            assert [index for index, _, _ in iter_frame_histograms(image, every=2)] == [0, 2, 4]
+            assert [index for index, _, _ in iter_frame_histograms(image, every=3)] == [0, 3]
+            assert [index for index, _, _ in iter_frame_histograms(image, scene_threshold=0.25)] == [0, 2, 4]
+            counts = [int(counts.sum()) for _, _, counts in iter_frame_histograms(image, max_pixels=50)]
+            assert counts == [50] * 5
+            assert image.tell() == 0
+
+            with pytest.raises(ValueError):
+                list(iter_frame_histograms(image, every=0))
+            with pytest.raises(ValueError):
+                list(iter_frame_histograms(image, scene_threshold=1.5))
+
+    def test_single_frame_and_import(self, striped_image: Image.Image, animation_path: Path) -> None:
+        """Test that still images have one frame and that imports use every scene."""
+        combined, frames = extract_frame_palettes(striped_image, 3)
+        assert [index for index, _ in frames] == [0]
+        assert combined == extract_colors_streaming(striped_image, 3)
+
+        colors = import_colors_from_image(str(animation_path), count=3)
+        assert sorted(color.hex.upper() for color in colors) == ["#0000FF", "#00FF00", "#FF0000"]
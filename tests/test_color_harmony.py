@@ -0,0 +1,172 @@
+"""
+Unit tests for the color_harmony module.
+
+This module tests the vectorized harmony engine, its shared LRU cache and batch generation.
+"""
+
+from typing import Iterator
+
+import numpy as np
+import pytest
+
+from src.models.color_array import ColorArray
+from src.models.color_model import Color
+from src.models.palette_model import Palette
+from src.models.palette_model import PaletteCollection
+from src.utils import color_harmony
+from src.utils.color_harmony import HARMONY_SIZES
+from src.utils.color_harmony import HARMONY_TYPES
+from src.utils.color_harmony import batch_harmonies
+from src.utils.color_harmony import batch_harmony_collection
+from src.utils.color_harmony import clear_harmony_cache
+from src.utils.color_harmony import compute_harmonies
+from src.utils.color_harmony import harmony_cache_info
+from src.utils.color_harmony import harmony_colors
+from src.utils.color_utils import generate_harmonic_palette
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> Iterator[None]:
+    """Start and finish every test with an empty harmony cache."""
+    clear_harmony_cache()
+    yield
+    clear_harmony_cache()
+
+
+def _random_colors(count: int) -> Iterator[Color]:
+    """Yield reproducible random colors, including translucent ones."""
+    for value in np.random.default_rng(7).integers(0, 1 << 32, count):
+        yield Color.from_packed(int(value))
+
+
+class TestComputeHarmonies:
+    """Test suite for computing every harmony in one pass."""
+
+    def test_matches_color_methods(self) -> None:
+        """Test that rotations, shades and tints equal the scalar Color methods exactly."""
+        for base in _random_colors(500):
+            harmonies = compute_harmonies(base, 8)
+            assert harmonies["complementary"][1] == base.complementary()
+            assert harmonies["triadic"][:3] == base.triadic()
+            assert harmonies["tetradic"][:4] == base.tetradic()
+            assert harmonies["shades"][1:] == [base.darken(amount) for amount in np.linspace(0.0, 0.7, 8)[1:]]
+            assert harmonies["tints"][1:] == [base.lighten(amount) for amount in np.linspace(0.0, 0.7, 8)[1:]]
+
+    def test_shapes_and_hues(self) -> None:
+        """Test that every harmony starts with the base and has the requested length."""
+        base = Color("#FF5500")
+        for count in (1, 2, 3, 5, 12):
+            harmonies = compute_harmonies(base, count)
+            assert list(harmonies) == list(HARMONY_TYPES)
+            assert all(len(colors) == count and colors[0] is base for colors in harmonies.values())
+
+        harmonies = compute_harmonies(base, 5)
+        hue = base.hsl[0]
+        assert [color.hsl[0] for color in harmonies["analogous"]] == [(hue + d) % 360 for d in (0, -30, 30, -60, 60)]
+        assert [color.hsl[0] for color in harmonies["split_complementary"][:3]] == [hue, hue + 150, hue + 210]
+        assert all(abs(color.hsl[0] - hue) < 1 for color in harmonies["monochromatic"])
+
+    def test_invalid_count(self) -> None:
+        """Test that a non-positive count is rejected."""
+        with pytest.raises(ValueError):
+            compute_harmonies("#FF5500", 0)
+
+
+class TestHarmonyCache:
+    """Test suite for the shared harmony cache."""
+
+    def test_miss_fills_every_type(self) -> None:
+        """Test that one miss caches every harmony type of the color and count."""
+        first = harmony_colors("#FF5500", "triadic")
+        assert len(first) == HARMONY_SIZES["triadic"]
+        assert harmony_cache_info()[:2] == (0, 1)
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(color_harmony, "compute_harmonies", None)
+            assert harmony_colors(Color("#ff5500"), "triadic") == first
+            assert harmony_colors("#FF5500", "shades") == harmony_colors("#FF5500", "shades", 8)
+            assert harmony_colors("#FF5500", "analogous") == harmony_colors("#FF5500", "analogous", 8)[:5]
+        assert harmony_cache_info()[:2] == (5, 1)
+        assert harmony_colors("#FF5500", "shades", 8) == compute_harmonies("#FF5500", 8)["shades"]
+
+        # Callers get their own list
+        first.append(Color("#000000"))
+        assert len(harmony_colors("#FF5500", "triadic")) == 3
+
+    def test_bounded_lru(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the cache keeps its size and evicts the least recently used entries."""
+        monkeypatch.setattr(color_harmony, "HARMONY_CACHE_SIZE", 2 * len(HARMONY_TYPES))
+        harmony_colors("#FF0000", "tints", 4)
+        harmony_colors("#00FF00", "tints", 4)
+        harmony_colors("#FF0000", "tints", 4)
+        harmony_colors("#0000FF", "tints", 4)
+        hits, misses, maxsize, size = harmony_cache_info()
+        assert (hits, misses, size) == (1, 3, maxsize)
+
+        # Entries are evicted one at a time: the recently used tints of red survive, its other types do not
+        harmony_colors("#FF0000", "tints", 4)
+        assert harmony_cache_info()[0] == 2
+        harmony_colors("#FF0000", "analogous", 4)
+        assert harmony_cache_info()[1] == 4
+
+    def test_validation(self) -> None:
+        """Test that unknown harmony types and invalid counts are rejected."""
+        with pytest.raises(ValueError):
+            harmony_colors("#FF5500", "pentadic")
+        with pytest.raises(ValueError):
+            harmony_colors("#FF5500", "triadic", 0)
+        with pytest.raises(ValueError):
+            generate_harmonic_palette("#FF5500", "pentadic")
+
+    def test_shared_with_palette_generation(self) -> None:
+        """Test that generate_harmonic_palette is served by the same cache."""
+        palette = generate_harmonic_palette("#FF5500", "split_complementary", count=6)
+        assert palette == harmony_colors("#FF5500", "split_complementary", 6)
+        assert harmony_cache_info()[:2] == (1, 1)
+        assert generate_harmonic_palette("#FF5500", "tints", count=4, include_base=False) == harmony_colors(
+            "#FF5500", "tints", 5
+        )[1:]
+
+
+class TestBatchHarmonies:
+    """Test suite for harmonies of many seed colors."""
+
+    def test_matches_single_color_harmonies(self) -> None:
+        """Test that every batch row equals the cached single-color harmony."""
+        seeds = ColorArray(np.array([color.packed for color in _random_colors(50)], dtype=np.uint32))
+        for harmony_type in HARMONY_TYPES:
+            rgb = batch_harmonies(seeds, harmony_type, 6, chunk_size=16)
+            assert rgb.shape == (50, 6, 3)
+            assert rgb.dtype == np.uint8
+            for seed, row in zip(seeds, rgb.tolist()):
+                assert [list(color.rgb) for color in harmony_colors(seed, harmony_type, 6)] == row
+
+    def test_hex_seeds_and_process_pool(self) -> None:
+        """Test that hex seeds work and a process pool gives the same result."""
+        seeds = ["#FF5500", "#123456", "#00FF00", "#808080"]
+        inline = batch_harmonies(seeds, "triadic", 3, chunk_size=1, workers=0)
+        assert inline[0].tolist() == [list(color.rgb) for color in Color("#FF5500").triadic()]
+        assert np.array_equal(batch_harmonies(seeds, "triadic", 3, chunk_size=1, workers=2), inline)
+        assert batch_harmonies([], "triadic", 3).shape == (0, 3, 3)
+
+    def test_collection(self) -> None:
+        """Test that each seed becomes one named palette, in seed order."""
+        collection = batch_harmony_collection(["#FF5500", "#123456"], "split_complementary", 8)
+        names = [palette.name for palette in collection]
+        assert names == ["Split Complementary #ff5500", "Split Complementary #123456"]
+        assert collection.palettes[0].colors == harmony_colors("#FF5500", "split_complementary", 8)
+
+        existing = PaletteCollection([Palette("Existing", ["#000000"])])
+        assert batch_harmony_collection(["#FF5500"], "tints", 8, collection=existing) is existing
+        assert len(existing) == 2
+
+    def test_validation(self) -> None:
+        """Test that invalid options are rejected."""
+        with pytest.raises(ValueError):
+            batch_harmonies(["#FF5500"], "pentadic")
+        with pytest.raises(ValueError):
+            batch_harmonies(["#FF5500"], "triadic", 0)
+        with pytest.raises(ValueError):
+            batch_harmonies(["#FF5500"], "triadic", chunk_size=0)
+        with pytest.raises(ValueError):
+            batch_harmonies(["#FF5500"], "triadic", workers=-1)
@@ -4,9 +4,19 @@ Unit tests for the color_model module.
 This module contains tests for the Color class and related color manipulation functions.
 """
 
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import pytest
 
 from src.models.color_model import Color
+from src.models.color_model import clear_intern_table
+from src.models.color_model import clear_parse_cache
+from src.models.color_model import intern_table_size
+from src.models.color_model import parse_cache_info
+from src.models.color_model import parse_hex
 
 
 class TestColorModel:
@@ -228,5 +238,175 @@ class TestColorModel:
         assert cmyk[2] > 0   # Yellow
 
 
+class TestColorPackedRepresentation:
+    """Test suite for the packed integer representation of Color."""
+
+    def test_color_uses_slots(self) -> None:
+        """Test that Color instances carry no per-instance dict."""
+        color = Color("#FF5500")
+        assert not hasattr(color, "__dict__")
+        with pytest.raises(AttributeError):
+            color.extra = 1  # type: ignore[attr-defined]
+
+    def test_packed_value(self) -> None:
+        """Test the canonical packed ARGB value."""
+        assert Color("#FF5500").packed == 0xFFFF5500
+        assert Color((0, 0, 0)).packed == 0xFF000000
+        assert Color("red").packed == 0xFFFF0000
+
+    def test_from_packed_round_trip(self) -> None:
+        """Test creating a color from a packed value."""
+        color = Color.from_packed(0xFF336699)
+        assert color.hex == "#336699"
+        assert color.rgb == (0x33, 0x66, 0x99)
+        assert color == Color("#336699")
+        assert Color.from_packed(color.packed) == color
+
+        with pytest.raises(ValueError):
+            Color.from_packed(1 << 32)
+
+    def test_alpha_channel(self) -> None:
+        """Test alpha handling for RGBA tuples."""
+        assert Color("#FF5500").alpha == 1.0
+        translucent = Color((255, 85, 0, 128))
+        assert translucent.hex == "#ff5500"
+        assert translucent.packed >> 24 == 128
+        assert translucent != Color("#FF5500")
+        assert translucent.lighten(0.1).packed >> 24 == 128
+
+    def test_exact_channel_values(self) -> None:
+        """Test that channels survive hex and RGB conversions exactly."""
+        for value in (0x000000, 0x010203, 0x7F7F7F, 0xFF5500, 0xFFFFFF):
+            color = Color(f"#{value:06x}")
+            assert Color(color.rgb).packed == color.packed
+            assert Color(color.rgb_float).packed == color.packed
+
+    def test_lighten_darken_clamp(self) -> None:
+        """Test that lightening white or darkening black stays in range."""
+        assert Color("#FFFFFF").lighten(0.2).hex == "#ffffff"
+        assert Color("#000000").darken(0.2).hex == "#000000"
+        assert Color("#808080").saturate(2.0).hsl[1] == 100
+        assert Color("#FF0000").desaturate(2.0).hsl[1] == 0
+
+
+class TestColorStringParsing:
+    """Test suite for the hex fast path and the parse cache."""
+
+    @pytest.mark.parametrize(
+        ("value", "packed"),
+        [
+            ("#fff", 0xFFFFFFFF),
+            ("#F50", 0xFFFF5500),
+            ("#ff5500", 0xFFFF5500),
+            ("#FF5500", 0xFFFF5500),
+            ("#ff550080", 0x80FF5500),
+            ("#00000000", 0x00000000),
+        ],
+    )
+    def test_parse_hex(self, value: str, packed: int) -> None:
+        """Test the supported hex notations."""
+        assert parse_hex(value) == packed
+        assert Color(value).packed == packed
+
+    @pytest.mark.parametrize(
+        "value", ["#", "#ff", "#ffff", "#fffff", "#ff55000", "#gg5500", "#+f5500", "#f_f500", "ff5500#"]
+    )
+    def test_parse_hex_invalid(self, value: str) -> None:
+        """Test that malformed hex strings are rejected."""
+        with pytest.raises(AttributeError):
+            parse_hex(value)
+
+    def test_functional_and_named_notations(self) -> None:
+        """Test the rgb(), hsl() and named color notations."""
+        assert Color("rgb(255, 85, 0)").hex == "#ff5500"
+        assert Color("hsl(120, 100%, 50%)").hex == "#00ff00"
+        assert Color("red").hex == "#ff0000"
+
+        with pytest.raises(ValueError):
+            Color("not-a-color")
+
+    def test_parse_cache_counters(self) -> None:
+        """Test that repeated parses of the same string hit the cache."""
+        clear_parse_cache()
+        for _ in range(3):
+            Color("#123456")
+        Color("#654321")
+
+        info = parse_cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+        assert info.currsize == 2
+
+        clear_parse_cache()
+        assert parse_cache_info().currsize == 0
+
+
+
+class TestColorHashing:
+    """Test suite for hashing, immutability and interning."""
+
+    def test_hash_matches_equality(self) -> None:
+        """Test that equal colors hash alike and collapse in sets and dicts."""
+        colors = {Color("#FFF"), Color("#ffffff"), Color((255, 255, 255)), Color("#000000")}
+        assert len(colors) == 2
+        assert {Color("#ff0000"): "red"}[Color("rgb(255, 0, 0)")] == "red"
+        # Alpha is part of the value
+        assert Color((255, 0, 0, 128)) not in {Color("#ff0000")}
+
+    def test_immutable(self) -> None:
+        """Test that colors reject attribute assignment and deletion."""
+        color = Color("#336699")
+        with pytest.raises(AttributeError):
+            color._value = 0  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            del color._value
+        assert color.hex == "#336699"
+
+    def test_copy_and_pickle(self) -> None:
+        """Test that copying returns the same color and pickling round-trips."""
+        color = Color((16, 32, 48, 64))
+        assert copy.copy(color) is color
+        assert copy.deepcopy(color) is color
+        assert pickle.loads(pickle.dumps(color)) == color
+
+    def test_intern_shares_instances(self) -> None:
+        """Test that interned colors with the same value are one object."""
+        clear_intern_table()
+        first = Color.intern("#FFFFFF")
+        assert Color.intern("#fff") is first
+        assert Color.intern(Color((255, 255, 255))) is first
+        assert Color.intern("#000000") is not first
+        assert intern_table_size() == 2
+
+        clear_intern_table()
+        assert intern_table_size() == 0
+        assert Color.intern("#ffffff") is not first
+
+    def test_intern_table_is_bounded(self) -> None:
+        """Test that the intern table drops the least recently used colors once full."""
+        clear_intern_table()
+        with patch("src.models.color_model.INTERN_TABLE_SIZE", 3):
+            first = Color.intern("#000001")
+            second = Color.intern("#000002")
+            Color.intern("#000003")
+            assert Color.intern("#000001") is first
+            Color.intern("#000004")
+            assert intern_table_size() == 3
+            assert Color.intern("#000001") is first
+            assert Color.intern("#000002") is not second
+        clear_intern_table()
+
+    def test_intern_is_thread_safe(self) -> None:
+        """Test that threads interning overlapping colors through a full table share instances."""
+        clear_intern_table()
+        values = [f"#{index % 64:06x}" for index in range(20000)]
+        with patch("src.models.color_model.INTERN_TABLE_SIZE", 32):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(Color.intern, values))
+            assert intern_table_size() == 32
+        assert [color.hex for color in results] == [Color(value).hex for value in values]
+        clear_intern_table()
+
+
 if __name__ == "__main__":
     pytest.main(["-v", "test_color_model.py"])
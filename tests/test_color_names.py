@@ -0,0 +1,67 @@
+"""
+Unit tests for the color_names module.
+
+This module tests the bundled CSS color table and the nearest-name index.
+"""
+
+import numpy as np
+import pytest
+
+from src.models.color_array import ColorArray
+from src.models.color_model import Color
+from src.models.color_spaces import rgb_to_oklab_array
+from src.utils.color_names import CSS_COLOR_NAMES
+from src.utils.color_names import NamedColorIndex
+from src.utils.color_names import get_named_color_index
+from src.utils.color_names import nearest_color_name
+from src.utils.color_names import nearest_color_names
+
+
+class TestNamedColorIndex:
+    """Test suite for NamedColorIndex."""
+
+    def test_exact_names(self) -> None:
+        """Test that every named color maps back to a name with the same value."""
+        for name, value in CSS_COLOR_NAMES.items():
+            assert CSS_COLOR_NAMES[nearest_color_name(value)] == value, name
+
+    def test_aliases_collapse(self) -> None:
+        """Test that aliases share one entry, keeping the first name."""
+        index = get_named_color_index()
+        assert len(index) == len(set(CSS_COLOR_NAMES.values()))
+        assert nearest_color_name("#808080") == "gray"
+        assert nearest_color_name(Color("#00ffff")) == "aqua"
+
+    def test_matches_brute_force(self) -> None:
+        """Test batch and scalar lookups against an exhaustive OKLab scan."""
+        index = get_named_color_index()
+        rng = np.random.default_rng(3)
+        colors = ColorArray.from_rgb(rng.integers(0, 256, (20000, 3), dtype=np.uint8))
+
+        table = rgb_to_oklab_array(ColorArray.from_hex([CSS_COLOR_NAMES[name] for name in index.names]).rgb)
+        lab = rgb_to_oklab_array(colors.rgb)
+        expected = ((lab[:, None, :] - table[None, :, :]) ** 2).sum(axis=-1).argmin(axis=1)
+
+        assert np.array_equal(index.nearest_indices(colors), expected)
+        assert [index.nearest_index(color) for color in colors[:500]] == expected[:500].tolist()
+
+    def test_batch_names(self) -> None:
+        """Test batch lookups from strings, duplicates and alpha."""
+        assert nearest_color_names(["#ff0001", "#ff0001", "#000081"]) == ["red", "red", "navy"]
+        translucent = ColorArray.from_colors([Color((255, 0, 1, 10)), Color((255, 0, 1))])
+        assert nearest_color_names(translucent) == ["red", "red"]
+        assert nearest_color_names([]) == []
+
+    def test_custom_table(self) -> None:
+        """Test building an index over a custom table."""
+        index = NamedColorIndex({"ink": "#101010", "paper": "#f0f0f0"}, cell_size=0.2)
+        assert index.names == ("ink", "paper")
+        assert index.nearest("#333333") == "ink"
+        assert index.nearest_names(["#cccccc"]) == ["paper"]
+
+    def test_invalid_arguments(self) -> None:
+        """Test that empty tables and bad cell sizes are rejected."""
+        with pytest.raises(ValueError):
+            NamedColorIndex({})
+        with pytest.raises(ValueError):
+            NamedColorIndex(cell_size=0)
@@ -0,0 +1,113 @@
+"""
+Unit tests for the color_spaces module.
+
+This module tests the CIELAB, OKLab and OKLCH conversions and the sRGB lookup tables.
+"""
+
+import numpy as np
+import pytest
+
+from src.models.color_array import ColorArray
+from src.models.color_model import Color
+from src.models.color_model import ColorFormat
+from src.models.color_spaces import SRGB_TO_LINEAR
+from src.models.color_spaces import lab_to_rgb_array
+from src.models.color_spaces import linear_to_byte
+from src.models.color_spaces import linear_to_rgb_array
+from src.models.color_spaces import oklab_to_rgb_array
+from src.models.color_spaces import rgb_to_lab_array
+from src.models.color_spaces import rgb_to_oklab_array
+
+
+@pytest.fixture
+def all_levels() -> np.ndarray:
+    """Return every 8-bit gray level plus a spread of saturated colors."""
+    rng = np.random.default_rng(0)
+    grays = np.repeat(np.arange(256, dtype=np.uint8)[:, None], 3, axis=1)
+    return np.concatenate([grays, rng.integers(0, 256, (5000, 3), dtype=np.uint8)])
+
+
+class TestTransferTables:
+    """Test suite for the sRGB transfer lookup tables."""
+
+    def test_lookup_table_endpoints(self) -> None:
+        """Test the decoding table at black, mid gray and white."""
+        assert len(SRGB_TO_LINEAR) == 256
+        assert SRGB_TO_LINEAR[0] == 0.0
+        assert SRGB_TO_LINEAR[255] == pytest.approx(1.0)
+        assert SRGB_TO_LINEAR[128] == pytest.approx(0.2158605, abs=1e-6)
+
+    def test_encoding_inverts_decoding(self) -> None:
+        """Test that every 8-bit code survives a linear round trip."""
+        codes = np.arange(256)
+        assert linear_to_rgb_array(np.array(SRGB_TO_LINEAR)).tolist() == codes.tolist()
+        assert [linear_to_byte(value) for value in SRGB_TO_LINEAR] == codes.tolist()
+
+    def test_encoding_clips(self) -> None:
+        """Test that out-of-range linear values clip to the sRGB cube."""
+        assert linear_to_byte(-0.5) == 0
+        assert linear_to_byte(1.5) == 255
+
+
+class TestPerceptualConversions:
+    """Test suite for CIELAB, OKLab and OKLCH conversions."""
+
+    def test_reference_values(self) -> None:
+        """Test known reference values for pure red and white."""
+        red = Color("#ff0000")
+        assert red.lab == pytest.approx((53.2408, 80.0925, 67.2032), abs=1e-3)
+        assert red.oklab == pytest.approx((0.627955, 0.224863, 0.125846), abs=1e-5)
+        assert red.oklch == pytest.approx((0.627955, 0.257683, 29.2339), abs=1e-3)
+
+        white = Color("#ffffff")
+        assert white.lab[0] == pytest.approx(100.0, abs=1e-3)
+        assert white.oklab == pytest.approx((1.0, 0.0, 0.0), abs=1e-6)
+
+    def test_get_format(self) -> None:
+        """Test that the perceptual formats are available through get_format."""
+        color = Color("#336699")
+        assert color.get_format(ColorFormat.LAB) == color.lab
+        assert color.get_format(ColorFormat.OKLAB) == color.oklab
+        assert color.get_format(ColorFormat.OKLCH) == color.oklch
+
+    def test_scalar_round_trip(self) -> None:
+        """Test that scalar conversions round-trip 8-bit colors exactly."""
+        for value in ("#000000", "#ffffff", "#ff5500", "#336699", "#c0ffee", "#010203"):
+            color = Color(value)
+            assert Color.from_lab(*color.lab) == color
+            assert Color.from_oklab(*color.oklab) == color
+            assert Color.from_oklch(*color.oklch) == color
+
+    def test_batch_round_trip(self, all_levels: np.ndarray) -> None:
+        """Test that batch conversions round-trip 8-bit colors exactly."""
+        assert np.array_equal(oklab_to_rgb_array(rgb_to_oklab_array(all_levels)), all_levels)
+        assert np.array_equal(lab_to_rgb_array(rgb_to_lab_array(all_levels)), all_levels)
+
+        colors = ColorArray.from_rgb(all_levels)
+        assert ColorArray.from_oklch(colors.to_oklch().astype(np.float64)) == colors
+
+    def test_batch_matches_scalar(self, all_levels: np.ndarray) -> None:
+        """Test that ColorArray conversions agree with the scalar Color properties."""
+        colors = ColorArray.from_rgb(all_levels[:500])
+        scalar = colors.to_colors()
+        assert np.allclose(colors.to_lab(), [color.lab for color in scalar], atol=1e-3)
+        assert np.allclose(colors.to_oklab(), [color.oklab for color in scalar], atol=1e-5)
+
+    def test_oklch_lighten(self) -> None:
+        """Test lightening in OKLCH keeps hue and matches the batch path."""
+        color = Color("#336699")
+        lighter = color.lighten(0.1, space="oklch")
+        assert lighter.oklch[0] == pytest.approx(color.oklch[0] + 0.1, abs=0.01)
+        assert lighter.oklch[2] == pytest.approx(color.oklch[2], abs=1.0)
+        assert color.darken(0.1, space="oklch").oklch[0] < color.oklch[0]
+
+        colors = ColorArray.from_hex(["#336699", "#ff5500", "#ffffff"])
+        expected = [Color(value).lighten(0.1, space="oklch").hex for value in colors.to_hex()]
+        assert colors.lighten(0.1, space="oklch").to_hex() == expected
+
+    def test_unsupported_space(self) -> None:
+        """Test that unknown adjustment spaces are rejected."""
+        with pytest.raises(ValueError):
+            Color("#336699").lighten(0.1, space="cmyk")
+        with pytest.raises(ValueError):
+            ColorArray.from_hex(["#336699"]).darken(0.1, space="cmyk")
@@ -10,6 +10,7 @@ from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from PIL import Image
 
 from src.models.color_model import Color
 from src.utils.color_utils import _extracted_from_import_colors_from_image_64
@@ -62,8 +63,8 @@ class TestGenerateHarmonicPalette:
         # Triadic palette should have colors approximately 120 degrees apart in hue
         base = Color(base_color)
         triadic = base.triadic()
-        assert palette[1].hex.upper() == triadic[0].hex.upper()
-        assert palette[2].hex.upper() == triadic[1].hex.upper()
+        assert palette[1].hex.upper() == triadic[1].hex.upper()
+        assert palette[2].hex.upper() == triadic[2].hex.upper()
 
     def test_tetradic_palette(self) -> None:
         """Test generating a tetradic color palette."""
@@ -80,9 +81,9 @@ class TestGenerateHarmonicPalette:
         # Tetradic palette should have colors approximately 90 degrees apart in hue
         base = Color(base_color)
         tetradic = base.tetradic()
-        assert palette[1].hex.upper() == tetradic[0].hex.upper()
-        assert palette[2].hex.upper() == tetradic[1].hex.upper()
-        assert palette[3].hex.upper() == tetradic[2].hex.upper()
+        assert palette[1].hex.upper() == tetradic[1].hex.upper()
+        assert palette[2].hex.upper() == tetradic[2].hex.upper()
+        assert palette[3].hex.upper() == tetradic[3].hex.upper()
 
     def test_monochromatic_palette(self) -> None:
         """Test generating a monochromatic color palette."""
@@ -170,36 +171,20 @@ class TestImportColorsFromImage:
         with patch('PIL.Image.open', return_value=mock_image) as mock_open:
             yield mock_open
 
-    @pytest.fixture
-    def mock_numpy(self) -> Generator[Any, None, None]:
-        """Mock numpy for testing."""
-        with patch.dict('sys.modules', {'numpy': MagicMock()}) as mock_np:
-            mock_np['numpy'].array.return_value = [
-                [255, 0, 0],  # Red
-                [0, 255, 0],  # Green
-                [0, 0, 255],  # Blue
-                [255, 255, 255],  # White
-                [0, 0, 0],  # Black
-            ]
-            mock_np['numpy'].unique.return_value = (
-                [[255, 0, 0], [0, 255, 0], [0, 0, 255], [255, 255, 255], [0, 0, 0]],  # unique colors
-                [1, 1, 1, 1, 1]  # counts
-            )
-            mock_np['numpy'].argsort.return_value = [0, 1, 2, 3, 4]
-            yield mock_np
-
-    def test_import_dominant_colors(self, mock_image_open: MagicMock, mock_numpy: MagicMock) -> None:
-        """Test importing dominant colors from an image."""
-        # Mock implementation for _extracted_from_import_colors_from_image_37
-        with patch('src.utils.color_utils._extracted_from_import_colors_from_image_37') as mock_extract:
-            mock_extract.return_value = [Color("#FF0000"), Color("#00FF00"), Color("#0000FF")]
+    def test_import_dominant_colors(self, tmp_path: Any) -> None:
+        """Test importing dominant colors from an image, streamed at full resolution or sampled."""
+        image_path = tmp_path / "colors.bmp"
+        image = Image.new("RGB", (8, 8), "#FF0000")
+        image.paste((0, 0, 255), (0, 0, 8, 2))
+        image.save(image_path)
 
-            colors = import_colors_from_image("test.png", count=3, method="dominant")
+        colors = import_colors_from_image(str(image_path), count=3, method="dominant")
+        assert len(colors) == 3
+        assert isinstance(colors[0], Color)
+        assert colors[:2] == [Color("#FF0000"), Color("#0000FF")]
 
-            assert len(colors) == 3
-            assert isinstance(colors[0], Color)
-            mock_image_open.assert_called_once_with("test.png")
-            mock_extract.assert_called_once()
+        sampled = import_colors_from_image(str(image_path), count=2, method="dominant", max_pixels=16, memory_budget=64)
+        assert sampled[0] == Color("#FF0000")
 
     def test_import_quantize_colors(self, mock_image_open: MagicMock) -> None:
         """Test importing colors using quantize method."""
@@ -214,30 +199,18 @@ class TestImportColorsFromImage:
             mock_image_open.assert_called_once_with("test.png")
             mock_extract.assert_called_once()
 
-    def test_import_kmeans_colors(self, mock_image_open: MagicMock) -> None:
-        """Test importing colors using kmeans method.
-
-        Note: This is a simplified test that doesn't try to test the actual
-        kmeans implementation, just that the function doesn't fail.
-        """
-        # Skip this test if scikit-learn is not available
-        try:
-            # Skip module-level import and only import when needed
-            pass
-        except ImportError:
-            pytest.skip("scikit-learn not available")
-
-        # Test with mock Image
-        with patch('src.utils.color_utils._extracted_from_import_colors_from_image_64',
-                  return_value=[Color("#FF0000"), Color("#00FF00"), Color("#0000FF")]):
+    def test_import_kmeans_colors(self, tmp_path: Any) -> None:
+        """Test importing colors using the built-in kmeans and median_cut methods."""
+        image_path = tmp_path / "colors.png"
+        Image.new("RGB", (4, 4), "#FF0000").save(image_path)
 
-            # Call the function with kmeans method
-            colors = import_colors_from_image("test.png", count=3, method="kmeans")
+        for method in ("kmeans", "median_cut"):
+            colors = import_colors_from_image(str(image_path), count=3, method=method)
 
             # Basic verification of results
-            assert len(colors) > 0
+            assert len(colors) == 3
             assert all(isinstance(color, Color) for color in colors)
-            mock_image_open.assert_called_once_with("test.png")
+            assert colors[0].hex.upper() == "#FF0000"
 
     def test_file_not_found(self) -> None:
         """Test handling of file not found error."""
@@ -0,0 +1,92 @@
+"""
+Unit tests for the color_vision module.
+
+This module tests color vision deficiency simulation and the distinguishability audits.
+"""
+
+import numpy as np
+import pytest
+
+from src.models.color_array import ColorArray
+from src.models.color_model import Color
+from src.models.palette_model import Palette
+from src.models.palette_model import PaletteCollection
+from src.utils.color_accessibility import is_color_blind_friendly
+from src.utils.color_vision import CVD_MATRICES
+from src.utils.color_vision import CVD_TYPES
+from src.utils.color_vision import audit_collection_cvd
+from src.utils.color_vision import cvd_delta_e_matrices
+from src.utils.color_vision import simulate_cvd
+from src.utils.color_vision import simulate_cvd_color
+
+
+class TestSimulation:
+    """Test suite for CVD simulation."""
+
+    def test_matrices_preserve_white(self) -> None:
+        """Test that every simulation maps neutral colors onto themselves."""
+        for deficiency, matrix in CVD_MATRICES.items():
+            assert np.allclose(matrix.sum(axis=1), 1.0, atol=1e-5), deficiency
+            for value in ("#000000", "#ffffff", "#808080"):
+                assert simulate_cvd_color(value, deficiency) == Color(value)
+
+    def test_known_simulations(self) -> None:
+        """Test that red loses its hue for protanopes and all hue for achromats."""
+        protan = simulate_cvd_color("#ff0000", "protanopia")
+        r, g, b = protan.rgb
+        assert abs(r - g) < 32 and b < r
+        r, g, b = simulate_cvd_color("#ff0000", "achromatopsia").rgb
+        assert r == g == b
+
+    def test_severity(self) -> None:
+        """Test that zero severity is normal vision and severity is validated."""
+        colors = ColorArray.from_hex(["#ff0000", "#00ff00", "#336699"])
+        assert simulate_cvd(colors, "deuteranopia", severity=0.0) == colors
+        partial = simulate_cvd(colors, "deuteranopia", severity=0.5)
+        full = simulate_cvd(colors, "deuteranopia")
+        assert partial != colors and partial != full
+
+        with pytest.raises(ValueError):
+            simulate_cvd(colors, "deuteranopia", severity=1.5)
+        with pytest.raises(ValueError):
+            simulate_cvd(colors, "monochromacy")
+
+    def test_keeps_alpha(self) -> None:
+        """Test that simulation preserves the alpha channel."""
+        colors = ColorArray.from_colors([Color((255, 0, 0, 64))])
+        assert simulate_cvd(colors, "tritanopia").alpha.tolist() == [64]
+
+
+class TestDistinguishability:
+    """Test suite for ΔE-based distinguishability under CVD."""
+
+    def test_red_green_confusion(self) -> None:
+        """Test that a classic red/green pair is flagged for deuteranopia only."""
+        friendly = is_color_blind_friendly("#d62728", "#2ca02c")
+        assert set(friendly) == set(CVD_TYPES)
+        assert friendly["deuteranopia"] is False
+        assert friendly["tritanopia"] is True
+        assert all(is_color_blind_friendly("#000000", "#ffffff").values())
+
+    def test_matrices(self) -> None:
+        """Test the per-deficiency difference matrices."""
+        matrices = cvd_delta_e_matrices(["#d62728", "#2ca02c", "#1f77b4"])
+        assert set(matrices) == set(CVD_TYPES)
+        for matrix in matrices.values():
+            assert matrix.shape == (3, 3)
+            assert np.allclose(np.diag(matrix), 0.0)
+
+    def test_collection_audit(self) -> None:
+        """Test auditing every palette of a collection at once."""
+        risky = Palette("Risky", ["#d62728", "#2ca02c", "#000000"], palette_id="risky")
+        safe = Palette("Safe", ["#000000", "#ffffff"] * 4, palette_id="safe")
+        short = Palette("Short", ["#ff0000"] * 8, palette_id="short")
+        results = audit_collection_cvd(PaletteCollection([risky, safe, short]))
+
+        matrices = cvd_delta_e_matrices(risky.colors)
+        for deficiency in CVD_TYPES:
+            matrix = matrices[deficiency]
+            distinct = ~np.eye(len(matrix), dtype=bool) & (matrix > 0)
+            assert results["risky"][deficiency] == pytest.approx(matrix[distinct].min())
+        assert results["risky"]["deuteranopia"] < 10 < results["safe"]["deuteranopia"]
+        assert results["short"]["protanopia"] == float("inf")
@@ -181,6 +181,23 @@ class TestExportPalette:
         with pytest.raises(ValueError, match="Unsupported export format"):
             export_palette(colors, "Test Palette", "UNSUPPORTED")
 
+    def test_export_with_color_names(self, sample_colors: List[Color]) -> None:
+        """Test labelling exported colors with their nearest CSS names."""
+        colors = cast(List[Union[str, Color]], [*sample_colors, Color("#fe0000")])
+
+        css = export_palette(colors, "Test Palette", "CSS", use_color_names=True)
+        assert "--color-red: #ff0000;" in css
+        assert "--color-lime: #00ff00;" in css
+        assert "--color-red-2: #fe0000;" in css
+
+        ase = export_palette(colors, "Test Palette", "ASE", use_color_names=True)
+        assert "Test Palette - blue".encode("utf-16-be") in ase
+
+        # Formats without swatch names ignore the option
+        assert export_palette(colors, "Test Palette", "JSON", use_color_names=True) == export_palette(
+            colors, "Test Palette", "JSON"
+        )
+
     def test_get_export_format_handlers(self) -> None:
         """Test getting the dictionary of export format handlers."""
         handlers = get_export_format_handlers()
@@ -0,0 +1,148 @@
+"""
+Unit tests for the image_batch module.
+
+This module tests batch image-to-palette extraction, its content-hash cache and command line.
+"""
+
+import json
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from src.models.palette_model import Palette
+from src.models.palette_model import PaletteCollection
+from src.utils.image_batch import ImageCache
+from src.utils.image_batch import batch_extract_to_collection
+from src.utils.image_batch import batch_extract_to_jsonl
+from src.utils.image_batch import find_images
+from src.utils.image_batch import iter_batch_extract
+from src.utils.image_batch import main
+
+
+@pytest.fixture
+def image_dir(tmp_path: Path) -> Path:
+    """Return a directory with three solid images, a nested image, a broken image and a text file."""
+    for name, color in (("red", "#FF0000"), ("green", "#00FF00"), ("blue", "#0000FF")):
+        Image.new("RGB", (16, 16), color).save(tmp_path / f"{name}.png")
+    (tmp_path / "nested").mkdir()
+    Image.new("RGB", (16, 16), "#FFFF00").save(tmp_path / "nested" / "yellow.bmp")
+    (tmp_path / "broken.jpg").write_text("not an image")
+    (tmp_path / "notes.txt").write_text("not an image either")
+    return tmp_path
+
+
+def _names(paths: List[str]) -> List[str]:
+    """Return the file names of paths."""
+    return [Path(path).name for path in paths]
+
+
+class TestFindImages:
+    """Test suite for expanding batch sources."""
+
+    def test_directories_and_globs(self, image_dir: Path) -> None:
+        """Test that directories, globs and files expand to sorted image paths."""
+        assert _names(find_images(str(image_dir))) == ["blue.png", "broken.jpg", "green.png", "red.png"]
+        assert "yellow.bmp" in _names(find_images(str(image_dir), recursive=True))
+        assert _names(find_images(str(image_dir / "*.png"))) == ["blue.png", "green.png", "red.png"]
+        assert _names(find_images([str(image_dir / "red.png"), str(image_dir / "r*.png")])) == ["red.png"]
+
+
+class TestBatchExtract:
+    """Test suite for batch extraction and caching."""
+
+    def test_extracts_and_reports_errors(self, image_dir: Path) -> None:
+        """Test that every file yields a record and broken files do not stop the batch."""
+        progress: List[int] = []
+        records = {
+            Path(record["path"]).name: record
+            for record in iter_batch_extract(
+                find_images(str(image_dir)), count=3, workers=0, progress=lambda done, total: progress.append(done)
+            )
+        }
+        assert records["red.png"]["colors"][0] == "#ff0000"
+        assert records["red.png"]["error"] is None
+        assert records["broken.jpg"]["colors"] is None
+        assert "broken.jpg" in records["broken.jpg"]["error"]
+        assert progress == [1, 2, 3, 4]
+
+    def test_cache_skips_unchanged_files(self, image_dir: Path, tmp_path: Path) -> None:
+        """Test that cached files are not decoded again, and that changes invalidate the cache."""
+        paths = find_images(str(image_dir / "*.png"))
+        cache = ImageCache(tmp_path / "cache")
+        first = list(iter_batch_extract(paths, count=3, workers=0, cache=cache))
+        assert not any(record["cached"] for record in first)
+
+        with patch("src.utils.image_batch.import_colors_from_image") as extract:
+            second = list(iter_batch_extract(paths, count=3, workers=0, cache=cache))
+            extract.assert_not_called()
+        assert all(record["cached"] for record in second)
+        assert sorted(record["colors"][0] for record in second) == sorted(record["colors"][0] for record in first)
+
+        # A different count or changed contents miss the cache
+        assert not any(record["cached"] for record in iter_batch_extract(paths, count=4, workers=0, cache=cache))
+        Image.new("RGB", (16, 16), "#800080").save(image_dir / "red.png")
+        changed = {Path(r["path"]).name: r for r in iter_batch_extract(paths, count=3, workers=0, cache=cache)}
+        assert not changed["red.png"]["cached"]
+        assert changed["red.png"]["colors"][0] == "#800080"
+        assert changed["blue.png"]["cached"]
+
+    def test_process_pool(self, image_dir: Path) -> None:
+        """Test that extraction in worker processes matches inline extraction."""
+        paths = find_images(str(image_dir))
+        inline = {record["path"]: record["colors"] for record in iter_batch_extract(paths, workers=0)}
+        pooled = {record["path"]: record["colors"] for record in iter_batch_extract(paths, workers=2)}
+        assert pooled == inline
+
+    def test_validation(self) -> None:
+        """Test that invalid options are rejected."""
+        with pytest.raises(ValueError):
+            list(iter_batch_extract([], method="octree"))
+        with pytest.raises(ValueError):
+            list(iter_batch_extract([], count=0))
+        with pytest.raises(ValueError):
+            list(iter_batch_extract([], workers=-1))
+
+
+class TestBatchOutput:
+    """Test suite for collection and JSON Lines output."""
+
+    def test_to_collection(self, image_dir: Path) -> None:
+        """Test that palettes are added to a collection in input order, skipping broken files."""
+        paths = find_images(str(image_dir))
+        collection = batch_extract_to_collection(paths, count=3, workers=0)
+        assert [palette.name for palette in collection] == ["blue", "green", "red"]
+        assert collection.get_palette_by_name("green").colors[0].hex.upper() == "#00FF00"
+
+        existing = PaletteCollection([Palette("Existing", ["#123456"])])
+        batch_extract_to_collection(paths, existing, count=3, workers=0)
+        assert len(existing) == 4
+
+    def test_to_jsonl(self, image_dir: Path, tmp_path: Path) -> None:
+        """Test that each file becomes one JSON line with a palette or an error."""
+        output = tmp_path / "out" / "palettes.jsonl"
+        written = batch_extract_to_jsonl(find_images(str(image_dir)), str(output), count=3, workers=0)
+        lines = [json.loads(line) for line in output.read_text().splitlines()]
+        assert written == 3
+        assert len(lines) == 4
+        palettes = [Palette.from_dict(line["palette"]) for line in lines if "palette" in line]
+        assert sorted(palette.name for palette in palettes) == ["blue", "green", "red"]
+        assert [line for line in lines if "error" in line][0]["path"].endswith("broken.jpg")
+
+    def test_command_line(self, image_dir: Path, tmp_path: Path) -> None:
+        """Test the command line with both output kinds."""
+        output = tmp_path / "palettes.jsonl"
+        cache = tmp_path / "cache"
+        arguments = [str(image_dir / "*.png"), "--count", "3", "--workers", "0", "--cache-dir", str(cache)]
+        assert main([*arguments, "--output", str(output)]) == 0
+        assert main([*arguments, "--output", str(output)]) == 0
+        assert all(json.loads(line)["cached"] for line in output.read_text().splitlines())
+
+        collection_file = tmp_path / "collection.json"
+        assert main([str(image_dir), "--no-cache", "--workers", "0", "--collection", str(collection_file)]) == 1
+        loaded = PaletteCollection.load_from_file(str(collection_file))
+        assert sorted(palette.name for palette in loaded) == ["blue", "green", "red"]
+
+        assert main([str(tmp_path / "missing" / "*.png"), "--output", str(output)]) == 1
@@ -0,0 +1,111 @@
+"""
+Unit tests for the palette_generator module.
+
+This module tests constraint validation and the constrained palette search.
+"""
+
+import pytest
+
+from src.models.color_model import Color
+from src.utils.color_accessibility import calculate_contrast_ratio
+from src.utils.color_difference import delta_e
+from src.utils.palette_generator import PALETTE_SIZE
+from src.utils.palette_generator import PaletteConstraints
+from src.utils.palette_generator import generate_constrained_palette
+from src.utils.palette_generator import iter_constrained_palettes
+
+
+@pytest.fixture
+def theme_constraints() -> PaletteConstraints:
+    """Return constraints for a dark theme: readable text slots on a fixed background."""
+    return PaletteConstraints(
+        min_delta_e=20.0,
+        contrast=[(1, 0, 7.0), (2, 0, 4.5), (3, 0, 4.5), (4, 0, 3.0)],
+        saturation_range=(30, 90),
+        lightness_range=(10, 90),
+        fixed={0: "#1E1E2E"},
+    )
+
+
+class TestPaletteConstraints:
+    """Test suite for constraint validation and checking."""
+
+    def test_violation(self) -> None:
+        """Test that close pairs and low contrast add to the violation."""
+        constraints = PaletteConstraints(count=3, min_delta_e=10.0, contrast=[(0, 2, 4.5)])
+        assert constraints.violation(["#000000", "#FF0000", "#FFFFFF"]) == 0.0
+        assert constraints.is_satisfied(["#000000", "#FF0000", "#FFFFFF"])
+        assert constraints.violation(["#000000", "#010101", "#FFFFFF"]) > 0.0
+        assert constraints.violation(["#000000", "#FF0000", "#333333"]) > 0.0
+        assert not constraints.is_satisfied(["#000000", "#FFFFFF"])
+
+    def test_validation(self) -> None:
+        """Test that invalid or contradictory constraints are rejected."""
+        with pytest.raises(ValueError):
+            PaletteConstraints(count=0)
+        with pytest.raises(ValueError):
+            PaletteConstraints(min_delta_e=-1.0)
+        with pytest.raises(ValueError):
+            PaletteConstraints(contrast=[(0, 0, 4.5)])
+        with pytest.raises(ValueError):
+            PaletteConstraints(contrast=[(0, 8, 4.5)])
+        with pytest.raises(ValueError):
+            PaletteConstraints(contrast=[(0, 1, 30.0)])
+        with pytest.raises(ValueError):
+            PaletteConstraints(lightness_range=(80, 20))
+        with pytest.raises(ValueError):
+            PaletteConstraints(hue_range=(0, 400))
+        with pytest.raises(ValueError):
+            PaletteConstraints(fixed={9: "#000000"})
+        with pytest.raises(ValueError):
+            PaletteConstraints(delta_e_method="cie2077")
+        with pytest.raises(ValueError):
+            PaletteConstraints(contrast=[(0, 1, 4.5)], fixed={0: "#000000", 1: "#111111"})
+
+
+class TestConstrainedPalette:
+    """Test suite for the constrained palette search."""
+
+    def test_satisfies_constraints(self, theme_constraints: PaletteConstraints) -> None:
+        """Test that a generated palette meets every difference and contrast constraint."""
+        palette = generate_constrained_palette(theme_constraints, seed=1)
+        assert palette is not None
+        assert len(palette) == PALETTE_SIZE
+        assert palette[0].hex.upper() == "#1E1E2E"
+        assert theme_constraints.is_satisfied(palette)
+        assert calculate_contrast_ratio(palette[1], palette[0]) >= 7.0
+        assert min(delta_e(a, b) for i, a in enumerate(palette) for b in palette[i + 1 :]) >= 20.0
+
+    def test_ranges(self) -> None:
+        """Test that generated slots stay within the hue, saturation and lightness ranges."""
+        constraints = PaletteConstraints(
+            count=5, min_delta_e=5.0, hue_range=(330, 30), saturation_range=(50, 100), lightness_range=(30, 70)
+        )
+        palette = generate_constrained_palette(constraints, seed=3)
+        assert palette is not None
+        for color in palette:
+            h, s, lightness = color.hsl
+            assert h >= 329 or h <= 31
+            assert 49 <= s <= 100
+            assert 29 <= lightness <= 71
+
+    def test_seed_and_infeasible(self) -> None:
+        """Test that seeds are reproducible and impossible constraints give None."""
+        constraints = PaletteConstraints(count=4, min_delta_e=25.0)
+        assert generate_constrained_palette(constraints, seed=5) == generate_constrained_palette(constraints, seed=5)
+
+        # Twenty grays cannot all be 15 apart
+        grays = PaletteConstraints(count=20, min_delta_e=15.0, saturation_range=(0, 0))
+        assert generate_constrained_palette(grays, seed=1, time_budget=0.2) is None
+
+        with pytest.raises(ValueError):
+            generate_constrained_palette(constraints, time_budget=0)
+
+    def test_iter_palettes(self, theme_constraints: PaletteConstraints) -> None:
+        """Test that the generator yields distinct compliant palettes up to the limit."""
+        palettes = list(iter_constrained_palettes(theme_constraints, limit=5, seed=2))
+        assert len(palettes) == 5
+        assert all(theme_constraints.is_satisfied(palette) for palette in palettes)
+        assert len({tuple(color.hex for color in palette) for palette in palettes}) == 5
+        assert all(isinstance(color, Color) for color in palettes[0])
+        assert list(iter_constrained_palettes(theme_constraints, limit=0)) == []
@@ -0,0 +1,146 @@
+"""
+Unit tests for the palette_journal module.
+
+This module tests journal records, replay on load, crash recovery and compaction.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+from typing import Dict
+
+import pytest
+
+from src.models.palette_journal import PaletteJournal
+from src.models.palette_journal import apply_record
+
+
+def _palette(palette_id: str, name: str = "Palette") -> Dict[str, Any]:
+    """Return a palette dictionary with eight white slots."""
+    return {"id": palette_id, "name": name, "colors": ["#ffffff"] * 8}
+
+
+class TestApplyRecord:
+    """Test suite for applying single journal records."""
+
+    def test_operations(self) -> None:
+        """Test every operation, including edits to missing palettes and slots."""
+        palettes: Dict[str, Dict[str, Any]] = {}
+        apply_record(palettes, {"seq": 1, "op": "add", "palette": _palette("a")})
+        apply_record(palettes, {"seq": 2, "op": "add", "palette": _palette("b")})
+        apply_record(palettes, {"seq": 3, "op": "update_color", "id": "a", "index": 1, "color": "#000000"})
+        apply_record(palettes, {"seq": 4, "op": "update_color", "id": "a", "index": 8, "color": "#000000"})
+        apply_record(palettes, {"seq": 5, "op": "rename", "id": "b", "name": "Renamed"})
+        apply_record(palettes, {"seq": 6, "op": "update", "id": "b", "fields": {"createdAt": "today"}})
+        apply_record(palettes, {"seq": 7, "op": "rename", "id": "missing", "name": "Ignored"})
+        apply_record(palettes, {"seq": 8, "op": "add_color", "id": "a", "color": "#ff0000"})
+        apply_record(palettes, {"seq": 9, "op": "remove_color", "id": "a", "index": 0})
+        apply_record(palettes, {"seq": 10, "op": "remove_color", "id": "a", "index": 9})
+        assert palettes["a"]["colors"][:1] == ["#000000"]
+        assert palettes["a"]["colors"][-1] == "#ff0000"
+        assert len(palettes["a"]["colors"]) == 8
+        assert palettes["b"]["name"] == "Renamed"
+        assert palettes["b"]["createdAt"] == "today"
+
+        apply_record(palettes, {"seq": 11, "op": "remove", "id": "a"})
+        assert list(palettes) == ["b"]
+        apply_record(palettes, {"seq": 12, "op": "clear"})
+        assert palettes == {}
+
+    def test_invalid_records(self) -> None:
+        """Test that malformed records are rejected."""
+        for record in (
+            {"seq": 1, "op": "delete", "id": "a"},
+            {"seq": 1, "op": "rename", "id": "a"},
+            {"seq": 1, "op": "remove_color", "id": "a"},
+            {"op": "clear"},
+            {"seq": 1, "op": "add", "palette": {"name": "No id"}},
+        ):
+            with pytest.raises(ValueError):
+                apply_record({}, record)
+
+
+class TestPaletteJournal:
+    """Test suite for the snapshot and journal files."""
+
+    def test_append_and_load(self, tmp_path: Path) -> None:
+        """Test that appended records are replayed on top of the snapshot."""
+        journal = PaletteJournal(tmp_path / "palettes.json")
+        assert journal.load() is None
+        journal.compact([_palette("a", "First")])
+        journal.add(_palette("b", "Second"))
+        journal.update_color("a", 0, "#ff0000")
+        journal.rename("b", "Renamed")
+
+        reloaded = PaletteJournal(tmp_path / "palettes.json")
+        palettes = reloaded.load()
+        assert [palette["name"] for palette in palettes] == ["First", "Renamed"]
+        assert palettes[0]["colors"][0] == "#ff0000"
+        assert reloaded.pending == 3
+
+    def test_records_stay_small(self, tmp_path: Path) -> None:
+        """Test that an edit appends the same amount regardless of collection size."""
+        journal = PaletteJournal(tmp_path / "palettes.json")
+        journal.compact([_palette(str(index)) for index in range(5000)])
+        journal.update_color("4999", 3, "#123456")
+        assert journal.journal_path.stat().st_size < 200
+
+    def test_torn_and_bad_records(self, tmp_path: Path) -> None:
+        """Test that replay stops at a bad record and the journal is cut back to stay appendable."""
+        journal = PaletteJournal(tmp_path / "palettes.json")
+        journal.add(_palette("a"))
+        good_size = journal.journal_path.stat().st_size
+        with open(journal.journal_path, "a") as f:
+            f.write('{"seq":2,"op":"rename","id":"a","na')
+
+        reloaded = PaletteJournal(tmp_path / "palettes.json")
+        assert [palette["id"] for palette in reloaded.load()] == ["a"]
+        assert reloaded.journal_path.stat().st_size == good_size
+        reloaded.rename("a", "After crash")
+        assert PaletteJournal(tmp_path / "palettes.json").load()[0]["name"] == "After crash"
+
+        with open(journal.journal_path, "a") as f:
+            f.write('{"seq":4,"op":"explode"}\n{"seq":5,"op":"rename","id":"a","name":"Lost"}\n')
+        assert PaletteJournal(tmp_path / "palettes.json").load()[0]["name"] == "After crash"
+
+    def test_interrupted_compaction(self, tmp_path: Path) -> None:
+        """Test that records already in the snapshot are not replayed twice."""
+        journal = PaletteJournal(tmp_path / "palettes.json")
+        journal.add(_palette("a"))
+        journal.remove("a")
+        records = journal.journal_path.read_text()
+        journal.compact([])
+
+        # Simulate a crash after the snapshot was replaced but before the journal was emptied
+        journal.journal_path.write_text(records)
+        journal.add(_palette("b"))
+        assert [palette["id"] for palette in PaletteJournal(tmp_path / "palettes.json").load()] == ["b"]
+
+    def test_compaction(self, tmp_path: Path) -> None:
+        """Test that compaction is due after enough records and writes a readable snapshot."""
+        journal = PaletteJournal(tmp_path / "data" / "palettes.json", compact_every=2)
+        journal.add(_palette("a"))
+        assert not journal.needs_compaction
+        journal.rename("a", "Compacted")
+        assert journal.needs_compaction
+
+        journal.compact([dict(_palette("a"), name="Compacted")])
+        assert journal.pending == 0
+        assert journal.journal_path.read_text() == ""
+        snapshot = json.loads(journal.file_path.read_text())
+        assert snapshot["sequence"] == 2
+        assert snapshot["palettes"][0]["name"] == "Compacted"
+
+    def test_legacy_snapshot(self, tmp_path: Path) -> None:
+        """Test that a bare list of palettes loads as a snapshot, and that bad snapshots raise."""
+        file_path = tmp_path / "palettes.json"
+        file_path.write_text(json.dumps([_palette("a", "Legacy")]))
+        journal = PaletteJournal(file_path)
+        journal.rename("a", "Journaled")
+        assert PaletteJournal(file_path).load()[0]["name"] == "Journaled"
+
+        file_path.write_text(json.dumps({"palettes": "nope"}))
+        with pytest.raises(ValueError):
+            PaletteJournal(file_path).load()
+        with pytest.raises(ValueError):
+            PaletteJournal(file_path, compact_every=0)
@@ -4,6 +4,7 @@ Unit tests for the palette_model module.
 This module contains tests for the Palette and PaletteCollection classes.
 """
 
+import json
 import os
 import tempfile
 from typing import List
@@ -128,6 +129,14 @@ class TestPalette:
         result = palette.update_color(100, "#FFFFFF")
         assert result is False
 
+    def test_filler_colors_are_shared(self) -> None:
+        """Test that repeated colors across palettes share interned instances."""
+        first = Palette("First", ["#FF0000"])
+        second = Palette("Second", ["#ff0000", "#00FF00"])
+
+        assert first.colors[0] is second.colors[0]
+        assert len({id(color) for color in first.colors[1:] + second.colors[2:]}) == 1
+
     def test_to_dict(self) -> None:
         """Test converting a palette to a dictionary."""
         palette = Palette("Test", cast(List[Union[str, Color]], ["#FF0000", "#00FF00", "#0000FF"]))
@@ -292,6 +301,61 @@ class TestPaletteCollection:
         collection = PaletteCollection.load_from_file("non_existent_file.json")
         assert collection is None
 
+    def test_journaled_changes(self, tmp_path) -> None:
+        """Test that changes to a journaled collection are appended and survive reopening."""
+        file_path = str(tmp_path / "palettes.json")
+        collection = PaletteCollection.open_journal(file_path)
+        assert [palette.name for palette in collection] == ["Default"]
+        snapshot = os.path.getsize(file_path)
+
+        palette = Palette("Journaled", ["#FF0000"])
+        collection.add_palette(palette)
+        assert collection.update_color(palette.palette_id, 1, "#00FF00")
+        assert collection.rename_palette(palette.palette_id, "Renamed")
+        assert collection.add_color(palette.palette_id, "#0000FF")
+        assert collection.remove_color(palette.palette_id, 2) is not None
+        assert collection.remove_color("missing", 0) is None
+        assert not collection.update_color("missing", 0, "#000000")
+        assert not collection.rename_palette("missing", "Name")
+        collection.remove_palette(collection.get_palette_by_name("Default").palette_id)
+        assert os.path.getsize(file_path) == snapshot
+        with open(file_path + ".journal") as f:
+            ops = [json.loads(line)["op"] for line in f]
+        assert ops == ["add", "update_color", "rename", "add_color", "remove_color", "remove"]
+
+        reopened = PaletteCollection.open_journal(file_path)
+        assert [palette.name for palette in reopened] == ["Renamed"]
+        assert reopened.palettes[0].hex_colors[:2] == ["#ff0000", "#00ff00"]
+        assert len(reopened.palettes[0]) == 8
+        assert reopened.palettes[0].hex_colors[-1] == "#0000ff"
+
+    def test_corrupt_snapshot_set_aside(self, tmp_path) -> None:
+        """Test that an unreadable snapshot is moved aside instead of being compacted over."""
+        file_path = str(tmp_path / "palettes.json")
+        with open(file_path, "w") as f:
+            f.write("{not json")
+        with open(file_path + ".journal", "w") as f:
+            f.write('{"seq":1,"op":"clear"}\n')
+
+        collection = PaletteCollection.open_journal(file_path, compact_every=1)
+        assert [palette.name for palette in collection] == ["Default"]
+        collection.rename_palette(collection.palettes[0].palette_id, "Fresh")
+        with open(file_path + ".corrupt") as f:
+            assert f.read() == "{not json"
+        assert os.path.exists(file_path + ".journal.corrupt")
+        assert [palette.name for palette in PaletteCollection.open_journal(file_path)] == ["Fresh"]
+
+    def test_journal_compaction(self, tmp_path) -> None:
+        """Test that the journal is folded into the snapshot every few records."""
+        file_path = str(tmp_path / "palettes.json")
+        collection = PaletteCollection.open_journal(file_path, compact_every=3)
+        palette_id = collection.palettes[0].palette_id
+        for index in range(4):
+            collection.update_color(palette_id, index, "#123456")
+        assert len(open(file_path + ".journal").readlines()) == 1
+        assert PaletteCollection.load_from_file(file_path).palettes[0].hex_colors[:3] == ["#123456"] * 3
+        assert PaletteCollection.open_journal(file_path).palettes[0].hex_colors[:4] == ["#123456"] * 4
+
 
 class TestPaletteModel:
     """Test suite for the PaletteModel class."""
@@ -0,0 +1,94 @@
+"""
+Unit tests for the palette_optimizer module.
+
+This module tests the closest-pair search and the distinctness optimizer.
+"""
+
+import time
+
+import pytest
+
+from src.models.color_model import Color
+from src.models.palette_model import Palette
+from src.utils.color_difference import delta_e
+from src.utils.palette_optimizer import min_pairwise_delta_e
+from src.utils.palette_optimizer import optimize_distinctness
+
+# Pairs of nearly identical colors
+CLOSE_COLORS = ["#ff0000", "#fe0101", "#00ff00", "#01fe01", "#0000ff", "#0101fe", "#808080", "#818181"]
+
+
+class TestMinPairwiseDeltaE:
+    """Test suite for finding the closest pair of colors."""
+
+    def test_closest_pair(self) -> None:
+        """Test that the closest pair and its difference are returned."""
+        difference, i, j = min_pairwise_delta_e(["#000000", "#ffffff", "#010101"])
+        assert (i, j) == (0, 2)
+        assert 0 < difference < 1
+
+    def test_palette_and_short_inputs(self) -> None:
+        """Test palettes as input and inputs without pairs."""
+        assert min_pairwise_delta_e(Palette("Close", CLOSE_COLORS))[0] < 1
+        assert min_pairwise_delta_e(["#000000"]) == (float("inf"), -1, -1)
+        with pytest.raises(ValueError):
+            min_pairwise_delta_e(CLOSE_COLORS, method="cmc")
+
+
+class TestOptimizeDistinctness:
+    """Test suite for the distinctness optimizer."""
+
+    def test_improves_closest_pair(self) -> None:
+        """Test that the smallest difference grows well within a second."""
+        started = time.perf_counter()
+        optimized = optimize_distinctness(CLOSE_COLORS, time_budget=None)
+        assert time.perf_counter() - started < 1.0
+        assert len(optimized) == len(CLOSE_COLORS)
+        assert all(isinstance(color, Color) for color in optimized)
+        assert min_pairwise_delta_e(optimized)[0] > 20
+
+    def test_locked_slots_unchanged(self) -> None:
+        """Test that locked slots keep their exact colors."""
+        original = [Color(color) for color in CLOSE_COLORS]
+        optimized = optimize_distinctness(original, locked=[0, 1, 4])
+        for slot in (0, 1, 4):
+            assert optimized[slot] is original[slot]
+        assert min_pairwise_delta_e(optimized)[0] <= min_pairwise_delta_e(original[:2])[0] + 1e-9
+
+    def test_target_and_displacement(self) -> None:
+        """Test that a target stops early with smaller moves and distinct palettes stay untouched."""
+        optimized = optimize_distinctness(CLOSE_COLORS, target_delta_e=5.0, time_budget=None)
+        assert min_pairwise_delta_e(optimized)[0] >= 5.0
+        moved = optimize_distinctness(CLOSE_COLORS, time_budget=None)
+        assert sum(delta_e(a, b) for a, b in zip(optimized, CLOSE_COLORS)) < sum(
+            delta_e(a, b) for a, b in zip(moved, CLOSE_COLORS)
+        )
+
+        distinct = ["#000000", "#ffffff"]
+        assert [color.hex for color in optimize_distinctness(distinct, target_delta_e=50.0)] == distinct
+
+    def test_seeded_and_cancellable(self) -> None:
+        """Test that the same seed gives the same result and cancellation stops at once."""
+        first = optimize_distinctness(CLOSE_COLORS, seed=3, time_budget=None)
+        second = optimize_distinctness(CLOSE_COLORS, seed=3, time_budget=None)
+        assert [color.hex for color in first] == [color.hex for color in second]
+        cancelled = optimize_distinctness(CLOSE_COLORS, cancelled=lambda: True)
+        assert [color.hex for color in cancelled] == CLOSE_COLORS
+
+    def test_keeps_alpha(self) -> None:
+        """Test that moved colors keep their alpha."""
+        original = [Color((255, 0, 0, 0.5)), Color((254, 1, 1, 0.25))]
+        optimized = optimize_distinctness(original)
+        assert optimized != original
+        assert [color.alpha for color in optimized] == [color.alpha for color in original]
+
+    def test_validation(self) -> None:
+        """Test that invalid options are rejected."""
+        with pytest.raises(ValueError):
+            optimize_distinctness(CLOSE_COLORS, locked=[8])
+        with pytest.raises(ValueError):
+            optimize_distinctness(CLOSE_COLORS, target_delta_e=0)
+        with pytest.raises(ValueError):
+            optimize_distinctness(CLOSE_COLORS, displacement_weight=-1)
+        with pytest.raises(ValueError):
+            optimize_distinctness(CLOSE_COLORS, method="cmc")
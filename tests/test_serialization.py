@@ -408,6 +408,20 @@ class TestImportPaletteFromFile:
         assert arg1 in message
 
 
+class TestImportDeduplication:
+    """Test suite for duplicate removal during import."""
+
+    def test_txt_duplicates_compared_by_value(self, tmp_path: Path) -> None:
+        """Test that different spellings of one color are merged on import."""
+        file_path = tmp_path / "palette.txt"
+        file_path.write_text("#FFF #ffffff #FF0000 rgb(255, 0, 0) #00ff00\n")
+
+        success, palette = import_palette_from_file(file_path)
+        assert success is True
+        assert isinstance(palette, dict)
+        assert palette["colors"] == ["#FFF", "#FF0000", "#00ff00"]
+
+
 class TestHelperFunctions:
     """Test suite for helper functions in serialization module."""
 
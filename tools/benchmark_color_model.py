@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Color Model Benchmark
+
+Compares the per-instance memory and conversion cost of the packed-integer
+Color model against the previous implementation, which wrapped a colour.Color
+object per instance and recomputed float tuples on every access.
+
+Usage:
+    python tools/benchmark_color_model.py [options]
+
+Options:
+    --count N       Number of colors to create (default: 200000)
+    --repeat N      Number of timing repetitions, best is reported (default: 3)
+"""
+
+import argparse
+import random
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from colour import Color as ColourColor
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.color_model import Color  # noqa: E402
+from src.models.color_model import clear_parse_cache  # noqa: E402
+from src.models.color_model import parse_cache_info  # noqa: E402
+
+
+class LegacyColor:
+    """Minimal reproduction of the previous colour.Color-backed model."""
+
+    def __init__(self, value: str) -> None:
+        """Wrap a colour.Color parsed from a hex string."""
+        self._color = ColourColor(value)
+
+    @property
+    def hex(self) -> str:
+        """Get the color as a hex string."""
+        return self._color.hex_l
+
+    @property
+    def rgb(self) -> Tuple[int, int, int]:
+        """Get the color as RGB values."""
+        r, g, b = self._color.rgb
+        return (int(r * 255), int(g * 255), int(b * 255))
+
+    @property
+    def hsl(self) -> Tuple[int, int, int]:
+        """Get the color as HSL values."""
+        h, s, lightness = self._color.hsl
+        return (int(h * 360), int(s * 100), int(lightness * 100))
+
+    def lighten(self, amount: float = 0.1) -> "LegacyColor":
+        """Get a lighter version of the color."""
+        new_color = ColourColor(self.hex)
+        new_color.luminance = min(1.0, new_color.luminance + amount)
+        return LegacyColor(new_color.hex_l)
+
+
+def measure_memory(factory: Callable[[str], object], values: List[str]) -> float:
+    """
+    Measure the average number of bytes retained per instance.
+
+    The factory is run once before tracing so shared caches are already
+    populated and only the instances themselves are counted.
+
+    Args:
+        factory: Callable building one color from a hex string
+        values: Hex strings to build
+
+    Returns:
+        Average bytes allocated per retained instance
+    """
+    warm = [factory(value) for value in values]
+    del warm
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [factory(value) for value in values]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list itself is not part of the per-instance cost
+    list_overhead = sys.getsizeof(instances)
+    return (after - before - list_overhead) / len(instances)
+
+
+def measure_time(
+    statement: Callable[[], object], repeat: int, number: int, setup: Callable[[], object] = lambda: None
+) -> float:
+    """
+    Measure the best average time of a statement in microseconds.
+
+    Args:
+        statement: Callable to time
+        repeat: Number of repetitions
+        number: Number of calls per repetition
+        setup: Callable run before each repetition, outside the timing
+
+    Returns:
+        Best average time per call in microseconds
+    """
+    return min(timeit.repeat(statement, setup=setup, repeat=repeat, number=number)) / number * 1e6
+
+
+def run_benchmark(count: int, repeat: int) -> Dict[str, Tuple[float, float]]:
+    """
+    Run all benchmarks for the legacy and current color models.
+
+    Args:
+        count: Number of colors to create
+        repeat: Number of timing repetitions
+
+    Returns:
+        Mapping of benchmark name to (legacy, current) results
+    """
+    rng = random.Random(0)
+    values = [f"#{rng.randrange(1 << 24):06x}" for _ in range(count)]
+    sample = values[: min(count, 10000)]
+    legacy = [LegacyColor(value) for value in sample]
+    current = [Color(value) for value in sample]
+
+    def convert(colors: List) -> Callable[[], None]:
+        def run() -> None:
+            for color in colors:
+                _ = color.hex, color.rgb, color.hsl
+
+        return run
+
+    def lighten(colors: List) -> Callable[[], None]:
+        def run() -> None:
+            for color in colors:
+                color.lighten(0.1)
+
+        return run
+
+    return {
+        "bytes per instance": (measure_memory(LegacyColor, values), measure_memory(Color, values)),
+        "parse cold (us)": (
+            measure_time(lambda: [LegacyColor(value) for value in sample], repeat, 1) / len(sample),
+            measure_time(lambda: [Color(value) for value in sample], repeat, 1, setup=clear_parse_cache)
+            / len(sample),
+        ),
+        "parse cached (us)": (
+            measure_time(lambda: [LegacyColor(value) for value in sample], repeat, 1) / len(sample),
+            measure_time(lambda: [Color(value) for value in sample], repeat, 1) / len(sample),
+        ),
+        "hex+rgb+hsl (us)": (
+            measure_time(convert(legacy), repeat, 1) / len(sample),
+            measure_time(convert(current), repeat, 1) / len(sample),
+        ),
+        "lighten (us)": (
+            measure_time(lighten(legacy), repeat, 1) / len(sample),
+            measure_time(lighten(current), repeat, 1) / len(sample),
+        ),
+    }
+
+
+def main() -> None:
+    """Parse arguments and print the benchmark table."""
+    parser = argparse.ArgumentParser(description="Benchmark the Color model")
+    parser.add_argument("--count", type=int, default=200000, help="Number of colors to create")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timing repetitions")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.count, args.repeat)
+
+    print(f"{'benchmark':<22}{'before':>12}{'after':>12}{'speedup':>10}")
+    for name, (before, after) in results.items():
+        print(f"{name:<22}{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x")
+    print(f"parse cache: {parse_cache_info()}")
+
+
+if __name__ == "__main__":
+    main()